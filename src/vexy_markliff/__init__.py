@@ -57,12 +57,14 @@ class VexyMarkliff:
         ...     # Handle error appropriately
     """
 
-    def __init__(self, config=None):
+    def __init__(self, config=None, translation_memory=None):
         """Initialize the converter with minimal overhead.
 
         Args:
             config: Optional ConversionConfig instance for customizing behavior.
                    If None, default configuration will be used when needed.
+            translation_memory: Optional TranslationMemory used to pre-fill
+                   targets of exact matches during extraction.
 
         Note:
             The config parameter accepts a ConversionConfig instance, but the
@@ -70,6 +72,7 @@ class VexyMarkliff:
             maximum performance.
         """
         self._config = config
+        self._translation_memory = translation_memory
         self._full_converter = None
 
     def _get_full_converter(self):
@@ -84,7 +87,7 @@ class VexyMarkliff:
         if self._full_converter is None:
             from vexy_markliff.core.converter import VexyMarkliff as VexyMarkliffFull
 
-            self._full_converter = VexyMarkliffFull(self._config)
+            self._full_converter = VexyMarkliffFull(self._config, self._translation_memory)
         return self._full_converter
 
     def markdown_to_xliff(self, content, source_lang="en", target_lang="es"):
@@ -7,7 +7,98 @@ from pathlib import Path
 
 import fire
 
-from vexy_markliff.core.converter import VexyMarkliff
+from vexy_markliff.core.converter import EXCHANGE_FORMATS, VexyMarkliff
+from vexy_markliff.utils import atomic_open, atomic_write_text
+
+
+class TMCommands:
+    """Translation memory commands (``vexy-markliff tm ...``)."""
+
+    def import_(
+        self,
+        *paths: str,
+        db: str,
+        on_conflict: str = "replace",
+        batch_size: int = 50000,
+        exclude_states: str | None = None,
+    ) -> dict:
+        """Harvest source/target pairs from translated XLIFF files into a TM database.
+
+        Args:
+            *paths: XLIFF files to import
+            db: Path to the TM database (created if missing)
+            on_conflict: replace (newest wins) or keep (existing wins)
+            batch_size: Pairs per database transaction
+            exclude_states: Comma-separated unit states to skip (e.g. initial)
+
+        Returns:
+            Import counters
+        """
+        from vexy_markliff.tm.harvest import import_xliff
+
+        excluded = [state.strip() for state in exclude_states.split(",")] if exclude_states else []
+        try:
+            stats = import_xliff(paths, db, on_conflict=on_conflict, batch_size=batch_size, exclude_states=excluded)
+        except Exception:
+            sys.exit(1)
+        return vars(stats)
+
+    def import_tmx(
+        self,
+        *paths: str,
+        db: str,
+        source_lang: str | None = None,
+        on_conflict: str = "replace",
+        batch_size: int = 50000,
+        parallel: int = 1,
+    ) -> dict:
+        """Stream TMX files into a TM database.
+
+        Args:
+            *paths: TMX files to import
+            db: Path to the TM database (created if missing)
+            source_lang: Source language for TMX files with srclang="*all*"
+            on_conflict: replace (newest wins) or keep (existing wins)
+            batch_size: Pairs per database transaction
+            parallel: Worker processes parsing byte ranges of each file
+
+        Returns:
+            Import counters
+        """
+        from vexy_markliff.tm.tmx import import_tmx
+
+        try:
+            stats = import_tmx(
+                paths, db, source_lang=source_lang, on_conflict=on_conflict, batch_size=batch_size, parallel=parallel
+            )
+        except Exception:
+            sys.exit(1)
+        return vars(stats)
+
+    def export_tmx(
+        self, db: str, output_file: str, source_lang: str | None = None, target_lang: str | None = None
+    ) -> int:
+        """Export a TM database to a TMX 1.4 file.
+
+        Args:
+            db: Path to the TM database
+            output_file: Path to the output TMX file
+            source_lang: Only export entries with this source language
+            target_lang: Only export entries with this target language
+
+        Returns:
+            Number of translation units written
+        """
+        from vexy_markliff.tm.tmx import export_tmx
+
+        try:
+            return export_tmx(db, output_file, source_lang=source_lang, target_lang=target_lang)
+        except Exception:
+            sys.exit(1)
+
+
+# "import" is a Python keyword, so expose the command under that name explicitly
+setattr(TMCommands, "import", TMCommands.import_)
 
 
 class VexyMarkliffCLI:
@@ -19,8 +110,21 @@ class VexyMarkliffCLI:
     def __init__(self):
         """Initialize CLI with converter."""
         self.converter = VexyMarkliff()
+        self.tm = TMCommands()
 
-    def md2xliff(self, input_file: str, output_file: str, source_lang: str = "en", target_lang: str = "es") -> None:
+    def md2xliff(
+        self,
+        input_file: str,
+        output_file: str,
+        source_lang: str = "en",
+        target_lang: str = "es",
+        *,
+        tm: str | None = None,
+        fuzzy: float | None = None,
+        ids: str = "position",
+        storage: str = "source",
+        skip_classes: str | tuple[str, ...] = (),
+    ) -> None:
         """Convert Markdown file to XLIFF format.
 
         Args:
@@ -28,10 +132,31 @@ class VexyMarkliffCLI:
             output_file: Path to output XLIFF file
             source_lang: Source language code (default: en)
             target_lang: Target language code (default: es)
+            tm: Optional translation memory database used to pre-fill exact matches
+            fuzzy: Minimum similarity (0-100) for attaching fuzzy TM candidates
+            ids: Unit ID strategy: position (unit_1...) or content (stable hashes)
+            storage: Write the text as source (default), target, or both
+            skip_classes: Comma-separated CSS classes of elements whose content is not extracted
         """
+        self._use_translation_memory(tm, fuzzy)
+        self._use_id_strategy(ids)
+        self._use_storage(storage)
+        self._use_skip_classes(skip_classes)
         self._convert_file(input_file, output_file, "markdown", source_lang, target_lang)
 
-    def html2xliff(self, input_file: str, output_file: str, source_lang: str = "en", target_lang: str = "es") -> None:
+    def html2xliff(
+        self,
+        input_file: str,
+        output_file: str,
+        source_lang: str = "en",
+        target_lang: str = "es",
+        *,
+        tm: str | None = None,
+        fuzzy: float | None = None,
+        ids: str = "position",
+        storage: str = "source",
+        skip_classes: str | tuple[str, ...] = (),
+    ) -> None:
         """Convert HTML file to XLIFF format.
 
         Args:
@@ -39,7 +164,16 @@ class VexyMarkliffCLI:
             output_file: Path to output XLIFF file
             source_lang: Source language code (default: en)
             target_lang: Target language code (default: es)
+            tm: Optional translation memory database used to pre-fill exact matches
+            fuzzy: Minimum similarity (0-100) for attaching fuzzy TM candidates
+            ids: Unit ID strategy: position (unit_1...) or content (stable hashes)
+            storage: Write the text as source (default), target, or both
+            skip_classes: Comma-separated CSS classes of elements whose content is not extracted
         """
+        self._use_translation_memory(tm, fuzzy)
+        self._use_id_strategy(ids)
+        self._use_storage(storage)
+        self._use_skip_classes(skip_classes)
         self._convert_file(input_file, output_file, "html", source_lang, target_lang)
 
     def xliff2md(self, input_file: str, output_file: str) -> None:
@@ -60,6 +194,716 @@ class VexyMarkliffCLI:
         """
         self._convert_file(input_file, output_file, "xliff_to_html")
 
+    def align(
+        self,
+        source_file: str,
+        target_file: str,
+        output_file: str,
+        source_lang: str = "en",
+        target_lang: str = "es",
+        *,
+        ids: str = "position",
+        parallel: int = 1,
+    ) -> dict:
+        """Align a Markdown/HTML document with its existing translation into XLIFF.
+
+        Args:
+            source_file: Source document (.md or .html)
+            target_file: Translated document (.md or .html)
+            output_file: Path to output XLIFF file
+            source_lang: Source language code (default: en)
+            target_lang: Target language code (default: es)
+            ids: Unit ID strategy: position (unit_1...) or content (stable hashes)
+            parallel: Number of worker processes aligning document sections (default: 1)
+
+        Returns:
+            Number of aligned pairs per alignment type, and structural warnings
+        """
+        from vexy_markliff.core.align import pair_to_xliff
+        from vexy_markliff.core.align_batch import AlignmentRunner, read_pair
+
+        try:
+            runner = AlignmentRunner(parallel=parallel, id_strategy=ids)
+            pair = runner.align(read_pair(source_file, target_file, source_lang, target_lang))
+            atomic_write_text(output_file, pair_to_xliff(pair, ids))
+        except Exception:
+            sys.exit(1)
+        return pair.get_alignment_summary()
+
+    def align_batch(
+        self,
+        source_dir: str,
+        target_dir: str,
+        output_dir: str,
+        pattern: str = "*.md",
+        *,
+        source_lang: str = "en",
+        target_lang: str = "es",
+        ids: str = "position",
+        parallel: int = 1,
+    ) -> dict:
+        """Align every document in a directory tree with its translation in a mirrored tree.
+
+        Args:
+            source_dir: Directory searched recursively for source documents
+            target_dir: Directory holding translations at the same relative paths
+            output_dir: Directory receiving ``<name>.xlf`` per pair
+            pattern: Glob pattern for source documents (default: *.md)
+            source_lang: Source language code (default: en)
+            target_lang: Target language code (default: es)
+            ids: Unit ID strategy: position (unit_1...) or content (stable hashes)
+            parallel: Number of worker processes (default: 1)
+
+        Returns:
+            Summary with aligned pair, unit and warning counts, and failures
+        """
+        from vexy_markliff.core.align_batch import AlignmentRunner
+
+        try:
+            runner = AlignmentRunner(parallel=parallel, id_strategy=ids)
+            result = runner.run_dirs(
+                source_dir, target_dir, output_dir, pattern, source_lang=source_lang, target_lang=target_lang
+            )
+        except Exception:
+            sys.exit(1)
+        if result.failed:
+            sys.exit(1)
+        return result.to_dict()
+
+    def update(
+        self,
+        xliff_file: str,
+        source_file: str,
+        output_file: str,
+        *,
+        details: bool = False,
+        ids: str = "position",
+    ) -> dict:
+        """Re-extract a changed Markdown/HTML document, keeping an XLIFF's translations.
+
+        Args:
+            xliff_file: XLIFF with the existing translations
+            source_file: Changed source document (.md or .html)
+            output_file: Path to the updated XLIFF file
+            details: Also list every added, moved, changed and removed unit
+            ids: Unit ID strategy used for the re-extraction (match the original)
+
+        Returns:
+            Number of units per status: unchanged, moved, changed, added, removed
+        """
+        from vexy_markliff.core.update import update_file
+
+        self._use_id_strategy(ids)
+        try:
+            report = update_file(xliff_file, source_file, output_file, converter=self.converter)
+        except Exception:
+            sys.exit(1)
+        return report.to_dict(details=details)
+
+    def diff(
+        self, file_a: str, file_b: str, output_file: str | None = None, key: str = "id", *, details: bool = False
+    ) -> dict:
+        """Compare two XLIFF files unit by unit, e.g. a sent file and the vendor's return.
+
+        Args:
+            file_a: Reference XLIFF file
+            file_b: XLIFF file compared against it
+            output_file: Optional JSON Lines file receiving one line per differing unit
+            key: Align units by id (default) or by content (source text)
+            details: Also list every differing unit
+
+        Returns:
+            Unit totals and counts of added, removed and changed units
+        """
+        from vexy_markliff.core.diff import diff_files
+
+        try:
+            report = diff_files(file_a, file_b, output_file, key)
+        except Exception:
+            sys.exit(1)
+        return report.to_dict(details=details)
+
+    def validate(
+        self, *inputs: str, schema: str | None = None, rules: str | tuple[str, ...] | None = None, details: bool = False
+    ) -> list[dict]:
+        """Validate XLIFF files unit by unit, e.g. before handing them to a vendor.
+
+        Args:
+            *inputs: XLIFF files to validate
+            schema: Optional XML Schema (e.g. the XLIFF 2.1 core schema) each unit is checked against
+            rules: Comma-separated built-in rules (default: structure, data-ref, format-style)
+            details: Also list the issues found
+
+        Returns:
+            Per file: validity, file and unit counts and the number of issues
+        """
+        from vexy_markliff.core.validate import validate
+
+        names = [name.strip() for name in rules.split(",")] if isinstance(rules, str) else rules
+        try:
+            reports = [validate(path, schema, names) for path in inputs]
+        except Exception:
+            sys.exit(1)
+        return [report.to_dict(details=details) for report in reports]
+
+    def qa(
+        self,
+        input_file: str,
+        output_file: str | None = None,
+        checks: str | tuple[str, ...] | None = None,
+        *,
+        parallel: int = 1,
+        min_ratio: float = 0.5,
+        max_ratio: float = 2.0,
+        details: bool = False,
+    ) -> dict:
+        """Check a translated XLIFF file for tag, number, URL, whitespace and length problems.
+
+        Args:
+            input_file: XLIFF file to check
+            output_file: Optional JSON Lines file receiving one line per finding
+            checks: Comma-separated checks (default: all; see vexy_markliff.core.qa.CHECKS)
+            parallel: Number of worker processes (default: 1)
+            min_ratio: Lowest accepted target/source length ratio (default: 0.5)
+            max_ratio: Highest accepted target/source length ratio (default: 2.0)
+            details: Also list every finding
+
+        Returns:
+            Unit total, number of flagged units and findings per check
+        """
+        from vexy_markliff.core.qa import QAChecker, qa_file
+
+        names = [name.strip() for name in checks.split(",")] if isinstance(checks, str) else checks
+        try:
+            checker = QAChecker(names, parallel=parallel, min_ratio=min_ratio, max_ratio=max_ratio)
+            report = qa_file(input_file, output_file, checker)
+        except Exception:
+            sys.exit(1)
+        return report.to_dict(details=details)
+
+    def pretranslate(
+        self,
+        input_file: str,
+        output_file: str,
+        endpoint: str,
+        *,
+        api_key: str | None = None,
+        batch_size: int = 50,
+        concurrency: int = 4,
+        retries: int = 3,
+        timeout: float = 30.0,
+        details: bool = False,
+    ) -> dict:
+        """Fill untranslated units of an XLIFF file from a machine-translation service.
+
+        Args:
+            input_file: XLIFF file to pre-translate
+            output_file: Path of the pre-translated XLIFF
+            endpoint: URL of the MT service (see vexy_markliff.mt.provider for the protocol)
+            api_key: Key sent as a bearer token (default: $VEXY_MARKLIFF_MT_API_KEY)
+            batch_size: Segments per request (default: 50)
+            concurrency: Requests in flight at a time (default: 4)
+            retries: Retries of a failed request (default: 3)
+            timeout: Socket timeout in seconds (default: 30)
+            details: Also list the errors of failed requests
+
+        Returns:
+            Units without a target, units translated, requests made and units left untranslated
+        """
+        import os
+
+        from vexy_markliff.mt.pretranslate import MTPretranslator, pretranslate_file
+        from vexy_markliff.mt.provider import HTTPProvider
+
+        try:
+            provider = HTTPProvider(
+                endpoint,
+                api_key=api_key or os.environ.get("VEXY_MARKLIFF_MT_API_KEY"),
+                max_batch=batch_size,
+                pool_size=concurrency,
+                timeout=timeout,
+                retries=retries,
+            )
+            try:
+                report = pretranslate_file(input_file, output_file, MTPretranslator(provider, concurrency=concurrency))
+            finally:
+                provider.close()
+        except Exception:
+            sys.exit(1)
+        return report.to_dict(details=details)
+
+    def transcode(self, input_file: str, output_file: str, to_version: str = "2.1") -> dict:
+        """Convert an XLIFF file between versions 1.2 and 2.x.
+
+        Args:
+            input_file: Path to input XLIFF file
+            output_file: Path to output XLIFF file
+            to_version: Target version: 1.2, 2.0 or 2.1 (default: 2.1)
+
+        Returns:
+            Number of files, units and skipped binary units
+        """
+        from vexy_markliff.core.transcode import transcode_file
+
+        try:
+            stats = transcode_file(input_file, output_file, str(to_version))
+        except Exception:
+            sys.exit(1)
+        return vars(stats)
+
+    def split(
+        self, input_file: str, output_dir: str, parts: int | None = None, max_words: int | None = None
+    ) -> list[str]:
+        """Split an XLIFF file at unit boundaries into parts of balanced word counts.
+
+        Args:
+            input_file: Path to input XLIFF file
+            output_dir: Directory receiving the parts
+            parts: Number of roughly equal parts
+            max_words: Alternatively, the source word budget per part
+
+        Returns:
+            Paths of the written parts
+        """
+        from vexy_markliff.core.split import split_xliff
+
+        try:
+            paths = split_xliff(input_file, output_dir, parts=parts, max_words=max_words)
+        except Exception:
+            sys.exit(1)
+        return [str(path) for path in paths]
+
+    def join(self, *inputs: str, output_file: str) -> dict:
+        """Reassemble parts written by split into the original XLIFF.
+
+        Args:
+            *inputs: Part files, in any order
+            output_file: Path to the joined XLIFF file
+
+        Returns:
+            Number of parts, units and source words joined
+        """
+        from vexy_markliff.core.split import join_files
+
+        try:
+            stats = join_files(inputs, output_file)
+        except Exception:
+            sys.exit(1)
+        return vars(stats)
+
+    def md2po(
+        self,
+        input_file: str,
+        output_file: str,
+        source_lang: str = "en",
+        target_lang: str = "es",
+        *,
+        tm: str | None = None,
+        fuzzy: float | None = None,
+        ids: str = "position",
+    ) -> None:
+        """Convert Markdown file to a gettext PO catalog.
+
+        Args:
+            input_file: Path to input Markdown file
+            output_file: Path to output PO file
+            source_lang: Source language code (default: en)
+            target_lang: Target language code (default: es)
+            tm: Optional translation memory database used to pre-fill exact matches
+            fuzzy: Minimum similarity (0-100) for fuzzy TM suggestions (written as #, fuzzy)
+            ids: Unit ID strategy: position (unit_1...) or content (stable hashes)
+        """
+        self._use_translation_memory(tm, fuzzy)
+        self._use_id_strategy(ids)
+        self._convert_file(input_file, output_file, "markdown_to_po", source_lang, target_lang)
+
+    def html2po(
+        self,
+        input_file: str,
+        output_file: str,
+        source_lang: str = "en",
+        target_lang: str = "es",
+        *,
+        tm: str | None = None,
+        fuzzy: float | None = None,
+        ids: str = "position",
+    ) -> None:
+        """Convert HTML file to a gettext PO catalog.
+
+        Args:
+            input_file: Path to input HTML file
+            output_file: Path to output PO file
+            source_lang: Source language code (default: en)
+            target_lang: Target language code (default: es)
+            tm: Optional translation memory database used to pre-fill exact matches
+            fuzzy: Minimum similarity (0-100) for fuzzy TM suggestions (written as #, fuzzy)
+            ids: Unit ID strategy: position (unit_1...) or content (stable hashes)
+        """
+        self._use_translation_memory(tm, fuzzy)
+        self._use_id_strategy(ids)
+        self._convert_file(input_file, output_file, "html_to_po", source_lang, target_lang)
+
+    def po2md(self, input_file: str, output_file: str) -> None:
+        """Merge a translated PO catalog back into Markdown.
+
+        Args:
+            input_file: Path to input PO file
+            output_file: Path to output Markdown file
+        """
+        self._convert_file(input_file, output_file, "po_to_markdown")
+
+    def po2html(self, input_file: str, output_file: str) -> None:
+        """Merge a translated PO catalog back into HTML.
+
+        Args:
+            input_file: Path to input PO file
+            output_file: Path to output HTML file
+        """
+        self._convert_file(input_file, output_file, "po_to_html")
+
+    def md2ts(
+        self,
+        input_file: str,
+        output_file: str,
+        source_lang: str = "en",
+        target_lang: str = "es",
+        tm: str | None = None,
+    ) -> None:
+        """Convert Markdown file to a Qt Linguist TS file.
+
+        Args:
+            input_file: Path to input Markdown file
+            output_file: Path to output TS file
+            source_lang: Source language code (default: en)
+            target_lang: Target language code (default: es)
+            tm: Optional translation memory database used to pre-fill exact matches
+        """
+        self._use_translation_memory(tm)
+        self._convert_file(input_file, output_file, "markdown_to_ts", source_lang, target_lang)
+
+    def html2ts(
+        self,
+        input_file: str,
+        output_file: str,
+        source_lang: str = "en",
+        target_lang: str = "es",
+        tm: str | None = None,
+    ) -> None:
+        """Convert HTML file to a Qt Linguist TS file.
+
+        Args:
+            input_file: Path to input HTML file
+            output_file: Path to output TS file
+            source_lang: Source language code (default: en)
+            target_lang: Target language code (default: es)
+            tm: Optional translation memory database used to pre-fill exact matches
+        """
+        self._use_translation_memory(tm)
+        self._convert_file(input_file, output_file, "html_to_ts", source_lang, target_lang)
+
+    def ts2md(self, input_file: str, output_file: str) -> None:
+        """Merge a translated Qt Linguist TS file back into Markdown.
+
+        Args:
+            input_file: Path to input TS file
+            output_file: Path to output Markdown file
+        """
+        self._convert_file(input_file, output_file, "ts_to_markdown")
+
+    def ts2html(self, input_file: str, output_file: str) -> None:
+        """Merge a translated Qt Linguist TS file back into HTML.
+
+        Args:
+            input_file: Path to input TS file
+            output_file: Path to output HTML file
+        """
+        self._convert_file(input_file, output_file, "ts_to_html")
+
+    def md2resx(
+        self,
+        input_file: str,
+        output_file: str,
+        source_lang: str = "en",
+        target_lang: str = "es",
+        tm: str | None = None,
+    ) -> None:
+        """Convert Markdown file to a .NET resx file.
+
+        Args:
+            input_file: Path to input Markdown file
+            output_file: Path to output resx file
+            source_lang: Source language code (default: en)
+            target_lang: Target language code (default: es)
+            tm: Optional translation memory database used to pre-fill exact matches
+        """
+        self._use_translation_memory(tm)
+        self._convert_file(input_file, output_file, "markdown_to_resx", source_lang, target_lang)
+
+    def html2resx(
+        self,
+        input_file: str,
+        output_file: str,
+        source_lang: str = "en",
+        target_lang: str = "es",
+        tm: str | None = None,
+    ) -> None:
+        """Convert HTML file to a .NET resx file.
+
+        Args:
+            input_file: Path to input HTML file
+            output_file: Path to output resx file
+            source_lang: Source language code (default: en)
+            target_lang: Target language code (default: es)
+            tm: Optional translation memory database used to pre-fill exact matches
+        """
+        self._use_translation_memory(tm)
+        self._convert_file(input_file, output_file, "html_to_resx", source_lang, target_lang)
+
+    def resx2md(self, input_file: str, output_file: str) -> None:
+        """Merge a translated .NET resx file back into Markdown.
+
+        Args:
+            input_file: Path to input resx file
+            output_file: Path to output Markdown file
+        """
+        self._convert_file(input_file, output_file, "resx_to_markdown")
+
+    def resx2html(self, input_file: str, output_file: str) -> None:
+        """Merge a translated .NET resx file back into HTML.
+
+        Args:
+            input_file: Path to input resx file
+            output_file: Path to output HTML file
+        """
+        self._convert_file(input_file, output_file, "resx_to_html")
+
+    def pack(
+        self,
+        *inputs: str,
+        output_file: str,
+        pattern: str = "*.md",
+        source_lang: str = "en",
+        target_lang: str = "es",
+        tm: str | None = None,
+        fuzzy: float | None = None,
+        ids: str = "position",
+        storage: str = "source",
+        skip_classes: str | tuple[str, ...] = (),
+    ) -> dict:
+        """Pack Markdown/HTML documents into one XLIFF with a <file> per document.
+
+        Args:
+            *inputs: Input files and directories (searched recursively)
+            output_file: Path to the output XLIFF package
+            pattern: Glob pattern used inside directories (default: *.md)
+            source_lang: Source language code (default: en)
+            target_lang: Target language code (default: es)
+            tm: Optional translation memory database used to pre-fill exact matches
+            fuzzy: Minimum similarity (0-100) for attaching fuzzy TM candidates
+            ids: Unit ID strategy: position (unit_1...) or content (stable hashes)
+            storage: Write the text as source (default), target, or both
+            skip_classes: Comma-separated CSS classes of elements whose content is not extracted
+
+        Returns:
+            Number of documents and units packed, and failed documents
+        """
+        from vexy_markliff.core.package import pack_files
+
+        self._use_translation_memory(tm, fuzzy)
+        self._use_id_strategy(ids)
+        self._use_storage(storage)
+        self._use_skip_classes(skip_classes)
+        try:
+            stats = pack_files(inputs, output_file, pattern, source_lang, target_lang, converter=self.converter)
+        except Exception:
+            sys.exit(1)
+        return vars(stats)
+
+    def unpack(self, input_file: str, output_dir: str) -> dict:
+        """Rebuild the documents of an XLIFF package into a directory.
+
+        Args:
+            input_file: Path to the XLIFF package
+            output_dir: Directory receiving one document per <file>
+
+        Returns:
+            Number of documents and units written
+        """
+        from vexy_markliff.core.package import unpack_package
+
+        try:
+            stats = unpack_package(Path(input_file), output_dir, converter=self.converter)
+        except Exception:
+            sys.exit(1)
+        return {"files": stats.files, "units": stats.units}
+
+    def export_columns(
+        self,
+        input_dir: str,
+        output_file: str,
+        pattern: str = "*.md",
+        source_lang: str = "en",
+        target_lang: str = "es",
+        *,
+        fmt: str | None = None,
+        tm: str | None = None,
+        batch_size: int = 10_000,
+    ) -> dict:
+        """Export extracted units of a directory as JSON Lines, Parquet or Arrow.
+
+        Args:
+            input_dir: Directory searched recursively for input files
+            output_file: Output file; .parquet and .arrow select those formats
+            pattern: Glob pattern for input files (default: *.md)
+            source_lang: Source language code (default: en)
+            target_lang: Target language code (default: es)
+            fmt: jsonl, parquet or arrow (default: from the output suffix)
+            tm: Optional translation memory database to pre-fill targets
+            batch_size: Records per batch (default: 10000)
+
+        Returns:
+            Number of files and units exported, and failed files
+        """
+        from vexy_markliff.formats.columnar import export_corpus
+
+        self._use_translation_memory(tm)
+        try:
+            stats = export_corpus(
+                input_dir,
+                output_file,
+                pattern,
+                source_lang,
+                target_lang,
+                fmt=fmt,
+                converter=self.converter,
+                batch_size=batch_size,
+            )
+        except Exception:
+            sys.exit(1)
+        return vars(stats)
+
+    def batch_convert(
+        self,
+        input_dir: str,
+        output_dir: str,
+        pattern: str = "*.md",
+        source_lang: str = "en",
+        target_lang: str = "es",
+        *,
+        parallel: int = 1,
+        resume: bool = False,
+        checkpoint_interval: int = 100,
+    ) -> dict:
+        """Convert every matching Markdown/HTML file in a directory tree to XLIFF.
+
+        Outputs are written atomically as ``<name>.xlf`` and progress is
+        checkpointed, so an interrupted run can continue with ``--resume``.
+
+        Args:
+            input_dir: Directory searched recursively for input files
+            output_dir: Directory receiving XLIFF outputs
+            pattern: Glob pattern for input files (default: *.md)
+            source_lang: Source language code (default: en)
+            target_lang: Target language code (default: es)
+            parallel: Number of worker processes (default: 1)
+            resume: Skip files completed by a previous interrupted run
+            checkpoint_interval: Completed files between checkpoint writes
+
+        Returns:
+            Summary with converted, skipped and failed counts
+        """
+        from vexy_markliff.core.batch import BatchConverter
+
+        try:
+            batch = BatchConverter(checkpoint_interval=checkpoint_interval, parallel=parallel)
+            result = batch.run(input_dir, output_dir, pattern, source_lang, target_lang, resume=resume)
+        except Exception:
+            sys.exit(1)
+        if result.failed:
+            sys.exit(1)
+        return result.to_dict()
+
+    def analyze(
+        self,
+        input_dir: str,
+        pattern: str = "*.md",
+        source_lang: str = "en",
+        target_lang: str = "es",
+        *,
+        tm: str | None = None,
+        parallel: int = 1,
+    ) -> dict:
+        """Report word counts, repetitions and TM match bands for a directory.
+
+        Args:
+            input_dir: Directory searched recursively for input files
+            pattern: Glob pattern for input files (default: *.md)
+            source_lang: Source language code (default: en)
+            target_lang: Target language code (default: es)
+            tm: Optional translation memory database for match bands
+            parallel: Number of worker processes (default: 1)
+
+        Returns:
+            Per-category segment, word and character counts
+        """
+        from vexy_markliff.core.analysis import CorpusAnalyzer
+
+        try:
+            report = CorpusAnalyzer(tm=tm, parallel=parallel).run(input_dir, pattern, source_lang, target_lang)
+        except Exception:
+            sys.exit(1)
+        return report.to_dict()
+
+    def _use_translation_memory(self, tm: str | None, fuzzy: float | None = None) -> None:
+        """Attach a translation memory database to the converter.
+
+        Args:
+            tm: Path to a translation memory database, or None to disable
+            fuzzy: Minimum similarity for fuzzy candidates, or None for exact only
+        """
+        if tm is None:
+            self.converter.translation_memory = None
+            return
+        try:
+            from vexy_markliff.tm.memory import TranslationMemory
+
+            self.converter.translation_memory = TranslationMemory.load(tm, fuzzy_threshold=fuzzy)
+        except Exception:
+            sys.exit(1)
+
+    def _use_id_strategy(self, ids: str) -> None:
+        """Select how the converter assigns unit IDs.
+
+        Args:
+            ids: ``position`` or ``content``
+        """
+        from vexy_markliff.core.ids import ID_STRATEGIES
+
+        if ids not in ID_STRATEGIES:
+            sys.exit(1)
+        self.converter.id_strategy = ids
+
+    def _use_storage(self, storage: str) -> None:
+        """Select which XLIFF element carries the extracted text.
+
+        Args:
+            storage: ``source``, ``target`` or ``both``
+        """
+        from vexy_markliff.config import STORAGE_MODES
+
+        if storage not in STORAGE_MODES:
+            sys.exit(1)
+        self.converter.storage = storage
+
+    def _use_skip_classes(self, skip_classes: str | tuple[str, ...]) -> None:
+        """Select the CSS classes of elements left out of extraction.
+
+        Args:
+            skip_classes: Comma-separated class names (Fire passes several as a tuple)
+        """
+        names = skip_classes.split(",") if isinstance(skip_classes, str) else skip_classes
+        self.converter.skip_classes = tuple(str(name).strip() for name in names if str(name).strip())
+
     def _convert_file(
         self,
         input_file: str,
@@ -83,6 +927,21 @@ class VexyMarkliffCLI:
             if not input_path.exists():
                 sys.exit(1)
 
+            # Exchange formats stream entries instead of building the output in memory
+            source_kind, _, target_kind = conversion_type.partition("_to_")
+            if target_kind in EXCHANGE_FORMATS:
+                content = input_path.read_text(encoding="utf-8")
+                with atomic_open(output_file, "wb") as out:
+                    self.converter.export_units(
+                        content, out, source_kind, target_kind, source_lang=source_lang, target_lang=target_lang
+                    )
+                return
+            if source_kind in EXCHANGE_FORMATS:
+                with open(input_file, "rb") as f:
+                    output_content = self.converter.merge_units(f, source_kind, target_kind)
+                atomic_write_text(output_file, output_content)
+                return
+
             # Read input file
             with open(input_file, encoding="utf-8") as f:
                 content = f.read()
@@ -100,13 +959,8 @@ class VexyMarkliffCLI:
                 msg = f"Unknown conversion type: {conversion_type}"
                 raise ValueError(msg)
 
-            # Ensure output directory exists
-            output_path = Path(output_file)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Write output file
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write(output_content)
+            # Write output file atomically (creates the output directory)
+            atomic_write_text(output_file, output_content)
 
         except Exception:
             sys.exit(1)
@@ -4,6 +4,9 @@
 from pathlib import Path
 from typing import Optional
 
+# One-document storage modes: which of <source>/<target> carries the extracted text
+STORAGE_MODES = ("source", "target", "both")
+
 
 class ConversionConfig:
     """Simple configuration for conversion operations.
@@ -11,13 +14,27 @@ class ConversionConfig:
     Simplified to avoid heavy Pydantic imports for better startup performance.
     """
 
-    def __init__(self, source_language: str = "en", target_language: str = "es", split_sentences: bool = True):
+    def __init__(
+        self,
+        source_language: str = "en",
+        target_language: str = "es",
+        split_sentences: bool = True,
+        *,
+        id_strategy: str = "position",
+        id_collision: str = "suffix",
+        storage: str = "source",
+        skip_classes: list[str] | tuple[str, ...] = (),
+    ):
         """Initialize configuration with validation.
 
         Args:
             source_language: Source language code (2-letter lowercase)
             target_language: Target language code (2-letter lowercase)
             split_sentences: Whether to split sentences for translation units
+            id_strategy: Unit IDs by ``position`` or by ``content`` hash
+            id_collision: Content ID collision policy, ``suffix`` or ``error``
+            storage: Where extracted text is written: ``source``, ``target`` or ``both``
+            skip_classes: CSS classes marking HTML elements whose content is not extracted
         """
         # Validate language codes
         for lang_code, field_name in [(source_language, "source_language"), (target_language, "target_language")]:
@@ -25,9 +42,26 @@ class ConversionConfig:
                 msg = f"Invalid {field_name}: {lang_code}. Must be 2-letter lowercase code."
                 raise ValueError(msg)
 
+        # Imported here: the core package imports this module
+        from vexy_markliff.core.ids import COLLISION_POLICIES, ID_STRATEGIES  # noqa: PLC0415
+
+        if id_strategy not in ID_STRATEGIES:
+            msg = f"Invalid id_strategy: {id_strategy}. Must be one of {', '.join(ID_STRATEGIES)}."
+            raise ValueError(msg)
+        if id_collision not in COLLISION_POLICIES:
+            msg = f"Invalid id_collision: {id_collision}. Must be one of {', '.join(COLLISION_POLICIES)}."
+            raise ValueError(msg)
+        if storage not in STORAGE_MODES:
+            msg = f"Invalid storage: {storage}. Must be 'source', 'target' or 'both'."
+            raise ValueError(msg)
+
         self.source_language = source_language
         self.target_language = target_language
         self.split_sentences = split_sentences
+        self.id_strategy = id_strategy
+        self.id_collision = id_collision
+        self.storage = storage
+        self.skip_classes = tuple(skip_classes)
 
     @classmethod
     def load(cls, config_path: str | None = None) -> "ConversionConfig":
@@ -3,14 +3,52 @@
 This module contains the main conversion functionality including:
 - VexyMarkliff: Main converter class
 - Parsers: HTML and Markdown parsing
+- BatchConverter: Checkpointed directory conversion
+- CorpusAnalyzer: Word count, repetition and TM match statistics
+- pack_files/unpack_package: Multi-document XLIFF packages
+- split_xliff/join_files: Word-count-balanced splitting and joining
 """
 # this_file: src/vexy_markliff/core/__init__.py
 
+from typing import TYPE_CHECKING
+
 from vexy_markliff.core.converter import VexyMarkliff
 from vexy_markliff.core.parser import HTMLParser, MarkdownParser
 
+# Use lazy imports so streaming and packaging are only loaded when used
+if TYPE_CHECKING:
+    from vexy_markliff.core.analysis import CorpusAnalyzer
+    from vexy_markliff.core.batch import BatchConverter
+    from vexy_markliff.core.package import pack_files, unpack_package
+    from vexy_markliff.core.split import join_files, split_xliff
+
+_LAZY_IMPORTS = {
+    "BatchConverter": "vexy_markliff.core.batch",
+    "CorpusAnalyzer": "vexy_markliff.core.analysis",
+    "join_files": "vexy_markliff.core.split",
+    "pack_files": "vexy_markliff.core.package",
+    "split_xliff": "vexy_markliff.core.split",
+    "unpack_package": "vexy_markliff.core.package",
+}
+
+
+def __getattr__(name: str):
+    """Lazy import attributes to avoid performance bottlenecks."""
+    if name in _LAZY_IMPORTS:
+        module = __import__(_LAZY_IMPORTS[name], fromlist=[name])
+        return getattr(module, name)
+    msg = f"module '{__name__}' has no attribute '{name}'"
+    raise AttributeError(msg)
+
+
 __all__ = [
+    "BatchConverter",
+    "CorpusAnalyzer",
     "HTMLParser",
     "MarkdownParser",
     "VexyMarkliff",
+    "join_files",
+    "pack_files",
+    "split_xliff",
+    "unpack_package",
 ]
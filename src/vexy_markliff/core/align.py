@@ -0,0 +1,404 @@
+"""Two-document alignment of a source document and its existing translation.
+
+Alignment runs in two stages:
+
+1. **Structure**: both documents are cut into blocks (headings, list items,
+   table cells, paragraphs). When their heading outlines match, headings
+   are paired one to one and each section is aligned on its own; inside a
+   section the same is done for list items. Diverging outlines add a
+   warning and fall back to aligning the whole span by length.
+2. **Sentences**: within each structural span, sentences are aligned with
+   the length-based dynamic programme of Gale & Church (1993), allowing
+   1-1, 1-0, 0-1, 2-1, 1-2 and 2-2 beads. The programme only visits cells
+   within a band around the diagonal, so a span of n sentences costs
+   O(n * band) instead of O(n²).
+"""
+# this_file: src/vexy_markliff/core/align.py
+
+import math
+import re
+from collections.abc import Callable, Iterable
+
+from lxml import etree, html
+
+from vexy_markliff.core.format_style import fs_name
+from vexy_markliff.core.ids import UnitIdAllocator
+from vexy_markliff.core.parser import MarkdownParser
+from vexy_markliff.exceptions import ValidationError
+from vexy_markliff.models.document_pair import DocumentSegment, TwoDocumentPair
+from vexy_markliff.models.xliff import TranslationUnit, XLIFFDocument, XLIFFFile
+from vexy_markliff.utils import get_logger, normalize_whitespace
+
+logger = get_logger(__name__)
+
+HEADING_TAGS = frozenset(f"h{level}" for level in range(1, 7))
+BLOCK_TAGS = HEADING_TAGS | {"p", "li", "td", "th", "dt", "dd", "pre", "blockquote", "caption", "figcaption"}
+_LIST_TAGS = frozenset({"ul", "ol"})
+
+# Prior probability of each bead (source sentences, target sentences), from Gale & Church
+BEAD_PRIORS = {(1, 1): 0.89, (1, 0): 0.0099, (0, 1): 0.0099, (2, 1): 0.0445, (1, 2): 0.0445, (2, 2): 0.011}
+_BEAD_PENALTIES = {bead: -math.log(prior) for bead, prior in BEAD_PRIORS.items()}
+
+# Variance of the target length per source character
+LENGTH_VARIANCE = 6.8
+
+# Minimum half-width of the band of DP cells around the diagonal
+MIN_BAND = 10
+
+_SENTENCE_END = re.compile(r"(?<=[.!?。！？])\s+")  # noqa: RUF001 - CJK full stops end sentences too
+
+# (source start, source end, target start, target end, cost) of one bead
+Bead = tuple[int, int, int, int, float]
+
+# Sentences of one structural span: ([(source sentence, path)], [target sentence], length ratio, band)
+SpanTask = tuple[list[tuple[str, str]], list[str], float, int]
+
+# (source, target, alignment type, cost, path) of one aligned bead
+AlignedRow = tuple[str, str | None, str, float, str]
+
+
+def split_sentences(text: str) -> list[str]:
+    """Split text after sentence-final punctuation, keeping the punctuation.
+
+    Args:
+        text: Block text
+
+    Returns:
+        Non-empty sentences
+    """
+    return [sentence for sentence in _SENTENCE_END.split(text) if sentence.strip()]
+
+
+def _own_text(elem: etree._Element) -> str:
+    """Text of a block without the blocks nested inside it."""
+    parts = [elem.text or ""]
+    for child in elem:
+        if isinstance(child.tag, str) and next(child.iter(*BLOCK_TAGS), None) is None:
+            parts.append(child.text_content())
+        parts.append(child.tail or "")
+    return normalize_whitespace("".join(parts))
+
+
+def document_segments(content: str, fmt: str) -> list[DocumentSegment]:
+    """Cut a Markdown or HTML document into typed blocks in document order.
+
+    Args:
+        content: Document text
+        fmt: ``markdown`` or ``html``
+
+    Returns:
+        Blocks with their type, level and tag path
+
+    Raises:
+        ValidationError: If the format is unknown
+    """
+    if fmt not in ("markdown", "html"):
+        msg = f"Unsupported document format: {fmt}. Use markdown or html"
+        raise ValidationError(msg)
+    if not content.strip():
+        return []
+    if fmt == "markdown":
+        content = MarkdownParser().md.render(content)
+    root = html.fromstring(content)
+
+    segments = []
+    for elem in root.iter(*BLOCK_TAGS):
+        text = _own_text(elem)
+        if not text:
+            continue
+        ancestors = []
+        for ancestor in elem.iterancestors():
+            ancestors.append(ancestor.tag)
+            if ancestor is root:
+                break
+        parent = elem.getparent()
+        if elem.tag in HEADING_TAGS:
+            kind, level = "heading", int(elem.tag[1])
+        elif elem.tag == "li" or (parent is not None and parent.tag == "li"):
+            kind, level = "list_item", sum(tag in _LIST_TAGS for tag in ancestors)
+        elif elem.tag in ("td", "th"):
+            kind, level = "cell", 0
+        else:
+            kind, level = "paragraph", 0
+        segments.append(
+            DocumentSegment(
+                id=f"s{len(segments) + 1}",
+                content=text,
+                type=kind,
+                level=level,
+                metadata={"path": "/".join([*reversed(ancestors), elem.tag])},
+            )
+        )
+    return segments
+
+
+def _is_heading(segment: DocumentSegment) -> bool:
+    return segment.type == "heading"
+
+
+def _is_list_item(segment: DocumentSegment) -> bool:
+    return segment.type == "list_item"
+
+
+def _cut(segments: list[DocumentSegment], is_anchor: Callable[[DocumentSegment], bool]) -> list[list[DocumentSegment]]:
+    """Split segments into gap, anchor, gap, anchor, ..., gap."""
+    spans: list[list[DocumentSegment]] = [[]]
+    for segment in segments:
+        if is_anchor(segment):
+            spans.extend(([segment], []))
+        else:
+            spans[-1].append(segment)
+    return spans
+
+
+def _pair_spans(
+    source: list[DocumentSegment],
+    target: list[DocumentSegment],
+    is_anchor: Callable[[DocumentSegment], bool],
+    label: str,
+    warnings: list[str],
+) -> list[tuple[list[DocumentSegment], list[DocumentSegment]]]:
+    """Pair anchors one to one when both sides have the same anchor outline."""
+    source_outline = [(s.type, s.level) for s in source if is_anchor(s)]
+    target_outline = [(s.type, s.level) for s in target if is_anchor(s)]
+    if source_outline == target_outline:
+        return list(zip(_cut(source, is_anchor), _cut(target, is_anchor), strict=True))
+    warnings.append(
+        f"{label} structure differs ({len(source_outline)} in source, {len(target_outline)} in target); "
+        "aligned by sentence length"
+    )
+    return [(source, target)]
+
+
+def structural_spans(
+    source: list[DocumentSegment], target: list[DocumentSegment], warnings: list[str]
+) -> list[tuple[list[DocumentSegment], list[DocumentSegment]]]:
+    """Pair the spans of both documents by headings, then by list items.
+
+    Args:
+        source: Source blocks
+        target: Target blocks
+        warnings: Receives a warning for each structure that diverges
+
+    Returns:
+        (source blocks, target blocks) spans to align by sentences, in order
+    """
+    spans = []
+    for source_section, target_section in _pair_spans(source, target, _is_heading, "Heading", warnings):
+        for pair in _pair_spans(source_section, target_section, _is_list_item, "List", warnings):
+            if pair[0] or pair[1]:
+                spans.append(pair)
+    return spans
+
+
+def _bead_cost(source_length: int, target_length: int, penalty: float, ratio: float) -> float:
+    """Negative log probability of a bead given its lengths and its prior's penalty."""
+    mean = (source_length + target_length / ratio) / 2
+    delta = (target_length - source_length * ratio) / math.sqrt(mean * LENGTH_VARIANCE) if mean else 0.0
+    probability = math.erfc(abs(delta) / math.sqrt(2))
+    return penalty - math.log(max(probability, 1e-300))
+
+
+def align_lengths(source: list[int], target: list[int], ratio: float = 1.0, band: int = MIN_BAND) -> list[Bead]:
+    """Align two sequences of sentence lengths with a banded Gale-Church DP.
+
+    Args:
+        source: Character length of each source sentence
+        target: Character length of each target sentence
+        ratio: Expected target characters per source character
+        band: Minimum half-width of the band of cells around the diagonal
+
+    Returns:
+        Beads covering both sequences in order
+    """
+    n, m = len(source), len(target)
+    source_prefix = [0]
+    for length in source:
+        source_prefix.append(source_prefix[-1] + length)
+    target_prefix = [0]
+    for length in target:
+        target_prefix.append(target_prefix[-1] + length)
+
+    # Wide enough that neighbouring rows overlap however steep the diagonal is
+    width = max(band, math.ceil(max(n, m) / max(min(n, m), 1)))
+    cost: dict[tuple[int, int], float] = {(0, 0): 0.0}
+    back: dict[tuple[int, int], tuple[int, int]] = {}
+    for i in range(n + 1):
+        center = i * m / n if n else 0
+        low = 0 if not n else max(0, math.floor(center - width))
+        high = m if not n else min(m, math.ceil(center + width))
+        for j in range(low, high + 1):
+            if i == j == 0:
+                continue
+            best, move = math.inf, None
+            for (di, dj), penalty in _BEAD_PENALTIES.items():
+                previous = cost.get((i - di, j - dj))
+                if previous is None:
+                    continue
+                total = previous + _bead_cost(
+                    source_prefix[i] - source_prefix[i - di], target_prefix[j] - target_prefix[j - dj], penalty, ratio
+                )
+                if total < best:
+                    best, move = total, (di, dj)
+            if move is not None:
+                cost[i, j] = best
+                back[i, j] = move
+
+    beads: list[Bead] = []
+    i, j = n, m
+    while i or j:
+        di, dj = back[i, j]
+        beads.append((i - di, i, j - dj, j, cost[i, j] - cost[i - di, j - dj]))
+        i, j = i - di, j - dj
+    beads.reverse()
+    return beads
+
+
+def span_tasks(pair: TwoDocumentPair, band: int = MIN_BAND) -> list[SpanTask]:
+    """Cut a pair into independent spans, recording structural warnings on the pair.
+
+    Args:
+        pair: Source document and its translation
+        band: Minimum half-width of the DP band
+
+    Returns:
+        One sentence alignment task per structural span, in document order
+
+    Raises:
+        ValidationError: If a format is unknown or the source has no text
+    """
+    source = document_segments(pair.source_content, pair.source_format)
+    target = document_segments(pair.target_content, pair.target_format)
+    if not source:
+        msg = "Source document has no text to align"
+        raise ValidationError(msg)
+    pair.aligned_pairs, pair.warnings = [], []
+
+    source_chars = sum(len(s.content) for s in source)
+    ratio = (sum(len(s.content) for s in target) / source_chars) or 1.0
+    return [
+        (
+            [(text, s.metadata.get("path", "")) for s in source_span for text in split_sentences(s.content)],
+            [text for s in target_span for text in split_sentences(s.content)],
+            ratio,
+            band,
+        )
+        for source_span, target_span in structural_spans(source, target, pair.warnings)
+    ]
+
+
+def align_span(task: SpanTask) -> list[AlignedRow]:
+    """Align the sentences of one span.
+
+    Args:
+        task: (source sentences with their paths, target sentences, length ratio, band)
+
+    Returns:
+        (source, target, alignment type, cost, path) per bead
+    """
+    source_sentences, target_sentences, ratio, band = task
+    beads = align_lengths(
+        [len(text) for text, _ in source_sentences], [len(text) for text in target_sentences], ratio, band
+    )
+    return [
+        (
+            " ".join(text for text, _ in source_sentences[i0:i1]),
+            " ".join(target_sentences[j0:j1]) or None,
+            f"{i1 - i0}-{j1 - j0}",
+            round(cost, 3),
+            source_sentences[i0][1] if i1 > i0 else "",
+        )
+        for i0, i1, j0, j1, cost in beads
+    ]
+
+
+def align_pair(
+    pair: TwoDocumentPair, band: int = MIN_BAND, map_spans: Callable[..., Iterable[list[AlignedRow]]] = map
+) -> TwoDocumentPair:
+    """Align a document pair, filling its ``aligned_pairs`` and ``warnings``.
+
+    Args:
+        pair: Source document and its translation
+        band: Minimum half-width of the DP band
+        map_spans: ``map``-like callable applying ``align_span`` to the spans in
+            order, e.g. a process pool's ``map`` to align sections in parallel
+
+    Returns:
+        The same pair, aligned
+
+    Raises:
+        ValidationError: If a format is unknown or the source has no text
+    """
+    tasks = span_tasks(pair, band)
+    for rows in map_spans(align_span, tasks):
+        for source, target, alignment_type, cost, path in rows:
+            pair.add_aligned_pair(source, target, alignment_type, cost, path)
+    logger.debug(f"Aligned {len(tasks)} spans: {pair.get_alignment_summary()}")
+    return pair
+
+
+def pair_units(pair: TwoDocumentPair, allocate: Callable[[str, str], str]) -> list[TranslationUnit]:
+    """Turn an aligned pair into translation units.
+
+    Units with both sides are ``translated``; source without a translation
+    stays ``new``. Target text without a source is recorded as a note on the
+    neighbouring unit, and structural warnings as notes on the first unit.
+
+    Args:
+        pair: Aligned document pair
+        allocate: Returns the ID of the next unit from (source, path)
+
+    Returns:
+        Units in source order
+    """
+    units: list[TranslationUnit] = []
+    orphans: list[str] = []
+    for aligned in pair.aligned_pairs:
+        if not aligned.source:
+            orphan = f"Unaligned target text: {aligned.target}"
+            if units:
+                units[-1].notes.append(orphan)
+            else:
+                orphans.append(orphan)
+            continue
+        unit = TranslationUnit(
+            id=allocate(aligned.source, aligned.path),
+            source=aligned.source,
+            target=aligned.target,
+            state="translated" if aligned.target else "new",
+            fs=fs_name(aligned.path.rsplit("/", 1)[-1]) if aligned.path else None,
+        )
+        if not aligned.target:
+            unit.notes.append("No target text aligned")
+        elif aligned.alignment_type != "1-1":
+            unit.notes.append(f"Aligned {aligned.alignment_type} sentences")
+        unit.notes.extend(orphans)
+        orphans = []
+        units.append(unit)
+    if units:
+        units[0].notes[:0] = pair.warnings
+    return units
+
+
+def pair_to_xliff(pair: TwoDocumentPair, id_strategy: str = "position", id_collision: str = "suffix") -> str:
+    """Serialize an aligned pair as XLIFF.
+
+    Args:
+        pair: Aligned document pair
+        id_strategy: Unit ID strategy, ``position`` or ``content``
+        id_collision: Content ID collision policy
+
+    Returns:
+        XLIFF with one unit per aligned sentence group
+    """
+    ids = UnitIdAllocator(id_strategy, id_collision)
+    document = XLIFFDocument()
+    document.files = [
+        XLIFFFile(
+            id="file_1",
+            source_language=pair.source_lang,
+            target_language=pair.target_lang,
+            units=pair_units(pair, ids.allocate),
+        )
+    ]
+    return document.to_xml()
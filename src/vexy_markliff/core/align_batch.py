@@ -0,0 +1,227 @@
+"""Parallel two-document alignment of many document pairs.
+
+Work is spread over a process pool at the coarsest grain that keeps every
+worker busy: with at least as many pairs as workers, whole pairs are
+aligned by workers; otherwise each pair is cut into its structural spans
+(sections between matching headings and list items) in this process and
+the spans are aligned by workers. ``map`` returns results in submission
+order, so outputs are identical to a serial run.
+"""
+# this_file: src/vexy_markliff/core/align_batch.py
+
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from vexy_markliff.core.align import MIN_BAND, align_pair, pair_to_xliff
+from vexy_markliff.core.batch import output_path_for
+from vexy_markliff.core.converter import DOCUMENT_KINDS
+from vexy_markliff.core.ids import ID_STRATEGIES
+from vexy_markliff.exceptions import FileOperationError, ValidationError
+from vexy_markliff.models.document_pair import TwoDocumentPair
+from vexy_markliff.utils import InProcessPool, atomic_write_text, get_logger, validate_language_code
+
+logger = get_logger(__name__)
+
+# (source path, target path, output path, source language, target language, band, ID strategy)
+_PairTask = tuple[str, str, str, str, str, int, str]
+
+
+@dataclass
+class AlignResult:
+    """Summary of an alignment run."""
+
+    aligned: int = 0
+    units: int = 0
+    warnings: int = 0
+    failed: dict[str, str] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the summary as a plain dict."""
+        return {"aligned": self.aligned, "units": self.units, "warnings": self.warnings, "failed": dict(self.failed)}
+
+
+def read_pair(source_file: str | Path, target_file: str | Path, source_lang: str, target_lang: str) -> TwoDocumentPair:
+    """Load a source document and its translation, with formats from their suffixes.
+
+    Args:
+        source_file: Source Markdown/HTML document
+        target_file: Translated document
+        source_lang: Source language code
+        target_lang: Target language code
+
+    Returns:
+        Unaligned document pair
+
+    Raises:
+        ValidationError: If a language code is invalid
+    """
+    for code in (source_lang, target_lang):
+        if not validate_language_code(code):
+            msg = f"Invalid language code: {code}"
+            raise ValidationError(msg)
+    source_path, target_path = Path(source_file), Path(target_file)
+    return TwoDocumentPair(
+        source_lang=source_lang,
+        target_lang=target_lang,
+        source_content=source_path.read_text(encoding="utf-8"),
+        target_content=target_path.read_text(encoding="utf-8"),
+        source_format=DOCUMENT_KINDS.get(source_path.suffix.lower(), "markdown"),
+        target_format=DOCUMENT_KINDS.get(target_path.suffix.lower(), "markdown"),
+    )
+
+
+def _write(pair: TwoDocumentPair, output_file: str | Path, id_strategy: str) -> tuple[int, int]:
+    """Write an aligned pair as XLIFF; return its pair and warning counts."""
+    atomic_write_text(output_file, pair_to_xliff(pair, id_strategy))
+    return len(pair.aligned_pairs), len(pair.warnings)
+
+
+def _align_file(task: _PairTask) -> tuple[tuple[int, int] | None, str | None]:
+    """Align one document pair and write its XLIFF.
+
+    Args:
+        task: Tuple of (source, target, output, source language, target language, band, ID strategy)
+
+    Returns:
+        ((aligned pairs, warnings), None) on success, or (None, error message)
+    """
+    source_file, target_file, output_file, source_lang, target_lang, band, id_strategy = task
+    try:
+        pair = align_pair(read_pair(source_file, target_file, source_lang, target_lang), band)
+        return _write(pair, output_file, id_strategy), None
+    except Exception as e:
+        return None, str(e) or type(e).__name__
+
+
+class AlignmentRunner:
+    """Align document pairs in parallel with deterministic output."""
+
+    def __init__(self, parallel: int = 1, band: int = MIN_BAND, id_strategy: str = "position") -> None:
+        """Initialize the runner.
+
+        Args:
+            parallel: Number of worker processes (1 aligns in-process)
+            band: Minimum half-width of the sentence DP band
+            id_strategy: Unit ID strategy of the written XLIFF
+
+        Raises:
+            ValidationError: If the ID strategy is unknown
+        """
+        if id_strategy not in ID_STRATEGIES:
+            msg = f"Unknown ID strategy: {id_strategy}. Use one of {', '.join(ID_STRATEGIES)}"
+            raise ValidationError(msg)
+        self.parallel = max(1, parallel)
+        self.band = band
+        self.id_strategy = id_strategy
+
+    def align(self, pair: TwoDocumentPair) -> TwoDocumentPair:
+        """Align one pair, spreading its structural spans over the workers.
+
+        Args:
+            pair: Source document and its translation
+
+        Returns:
+            The same pair, aligned
+        """
+        with self._pool() as pool:
+            return align_pair(pair, self.band, lambda fn, tasks: pool.map(fn, tasks, chunksize=4))
+
+    def run(
+        self,
+        pairs: Iterable[tuple[str | Path, str | Path, str | Path]],
+        source_lang: str = "en",
+        target_lang: str = "es",
+    ) -> AlignResult:
+        """Align (source, target, output) file triples and write one XLIFF per pair.
+
+        Args:
+            pairs: Source document, translated document and output XLIFF paths
+            source_lang: Source language code
+            target_lang: Target language code
+
+        Returns:
+            AlignResult with counts and per-pair failures, keyed by source path
+        """
+        tasks = [
+            (str(source), str(target), str(output), source_lang, target_lang, self.band, self.id_strategy)
+            for source, target, output in pairs
+        ]
+        result = AlignResult()
+        for task, (counts, error) in zip(tasks, self._results(tasks), strict=True):
+            if error is not None:
+                logger.error(f"Failed to align {task[0]}: {error}")
+                result.failed[task[0]] = error
+                continue
+            result.aligned += 1
+            result.units += counts[0]
+            result.warnings += counts[1]
+        return result
+
+    def run_dirs(
+        self,
+        source_dir: str | Path,
+        target_dir: str | Path,
+        output_dir: str | Path,
+        pattern: str = "*.md",
+        *,
+        source_lang: str = "en",
+        target_lang: str = "es",
+    ) -> AlignResult:
+        """Align every document under ``source_dir`` with the same relative path under ``target_dir``.
+
+        Args:
+            source_dir: Directory of source documents (searched recursively)
+            target_dir: Directory of translated documents mirroring ``source_dir``
+            output_dir: Directory receiving ``<name>.xlf`` per pair, mirroring ``source_dir``
+            pattern: Glob pattern for source documents
+            source_lang: Source language code
+            target_lang: Target language code
+
+        Returns:
+            AlignResult; sources without a translation are reported as failed
+
+        Raises:
+            FileOperationError: If either input directory does not exist
+        """
+        source_root, target_root, output_root = Path(source_dir), Path(target_dir), Path(output_dir)
+        for root in (source_root, target_root):
+            if not root.is_dir():
+                msg = f"Input directory not found: {root}"
+                raise FileOperationError(msg)
+
+        triples, missing = [], []
+        for source in sorted(source_root.rglob(pattern)):
+            if not source.is_file():
+                continue
+            target = target_root / source.relative_to(source_root)
+            if target.is_file():
+                triples.append((source, target, output_path_for(source, source_root, output_root)))
+            else:
+                missing.append(str(source))
+        result = self.run(triples, source_lang, target_lang)
+        for source in missing:
+            result.failed[source] = "No translated document"
+        return result
+
+    def _results(self, tasks: list[_PairTask]) -> Iterator[tuple[tuple[int, int] | None, str | None]]:
+        """Align pairs in order, by pair or, when pairs are fewer than workers, by span."""
+        if self.parallel == 1 or len(tasks) >= self.parallel:
+            with self._pool() as pool:
+                yield from pool.map(_align_file, tasks, chunksize=max(1, len(tasks) // (self.parallel * 8)))
+            return
+        for source_file, target_file, output_file, source_lang, target_lang, _, _ in tasks:
+            try:
+                pair = self.align(read_pair(source_file, target_file, source_lang, target_lang))
+                yield _write(pair, output_file, self.id_strategy), None
+            except Exception as e:
+                yield None, str(e) or type(e).__name__
+
+    def _pool(self) -> AbstractContextManager:
+        """Return a process pool, or an in-process stand-in when ``parallel`` is 1."""
+        if self.parallel == 1:
+            return nullcontext(InProcessPool())
+        return ProcessPoolExecutor(max_workers=self.parallel)
@@ -0,0 +1,326 @@
+"""Corpus-level word count and repetition analysis.
+
+Runs the extraction pipeline over a directory and reports CAT-style
+statistics: word and character counts, internal repetitions, cross-file
+repetitions and translation memory match bands. Each file is reduced to a
+compact table of unique segments keyed by a stable content hash, so counting
+and TM lookups happen once per distinct segment. Files are processed in
+parallel and their partial tables are merged in file order; TM lookups then
+run once per segment that is unique across the corpus.
+"""
+# this_file: src/vexy_markliff/core/analysis.py
+
+import hashlib
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass, field
+from itertools import chain
+from pathlib import Path
+from typing import Any
+
+from vexy_markliff.core import parser as parser_module
+from vexy_markliff.core.converter import DOCUMENT_KINDS
+from vexy_markliff.exceptions import FileOperationError
+from vexy_markliff.tm.memory import TranslationMemory, normalize_source
+from vexy_markliff.utils import InProcessPool, get_logger
+
+logger = get_logger(__name__)
+
+# Document kind → parser class in vexy_markliff.core.parser
+_PARSERS = {"markdown": "MarkdownParser", "html": "HTMLParser"}
+
+# Fuzzy match bands as (label, lowest similarity), best first
+DEFAULT_BANDS: tuple[tuple[str, float], ...] = (
+    ("95-99%", 95.0),
+    ("85-94%", 85.0),
+    ("75-84%", 75.0),
+    ("50-74%", 50.0),
+)
+
+REPETITIONS = "repetitions"
+CROSS_FILE_REPETITIONS = "cross_file_repetitions"
+EXACT = "100%"
+EXACT_SIMILARITY = 100.0
+NEW = "new"
+
+_WORD_RE = re.compile(r"\w+(?:['\u2019-]\w+)*")
+
+# Per-process state for pool workers
+_worker_tm = None
+_worker_parsers: dict[str, Any] = {}
+
+# Unique segment digest → [occurrences, words, characters, normalized text]
+SegmentTable = dict[bytes, list]
+
+
+def count_words(text: str) -> int:
+    """Count words the way CAT tools do.
+
+    A word is a run of word characters; apostrophes and hyphens inside a word
+    do not split it.
+
+    Args:
+        text: Segment text
+
+    Returns:
+        Word count
+    """
+    return len(_WORD_RE.findall(text))
+
+
+def segment_digest(key: str) -> bytes:
+    """Return a stable 8-byte digest of a normalized segment.
+
+    Python's ``hash`` is salted per process, so worker results could not be
+    merged with it.
+
+    Args:
+        key: Normalized segment text
+
+    Returns:
+        Digest bytes
+    """
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+
+
+@dataclass
+class AnalysisReport:
+    """Aggregated analysis counters.
+
+    ``segments``, ``words`` and ``characters`` map a category (``100%``, a
+    fuzzy band label, ``repetitions``, ``cross_file_repetitions`` or ``new``)
+    to its total. Characters exclude whitespace.
+    """
+
+    files: int = 0
+    segments: Counter = field(default_factory=Counter)
+    words: Counter = field(default_factory=Counter)
+    characters: Counter = field(default_factory=Counter)
+    failed: dict[str, str] = field(default_factory=dict)
+    bands: tuple[tuple[str, float], ...] = DEFAULT_BANDS
+
+    def add(self, category: str, segments: int, words: int, characters: int) -> None:
+        """Add counts to a category."""
+        self.segments[category] += segments
+        self.words[category] += words
+        self.characters[category] += characters
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the report as a plain dict with categories in CAT-tool order."""
+        order = [REPETITIONS, CROSS_FILE_REPETITIONS, EXACT, *(label for label, _ in self.bands), NEW]
+        return {
+            "files": self.files,
+            "categories": {
+                name: {"segments": self.segments[name], "words": self.words[name], "characters": self.characters[name]}
+                for name in order
+            },
+            "total": {
+                "segments": sum(self.segments.values()),
+                "words": sum(self.words.values()),
+                "characters": sum(self.characters.values()),
+            },
+            "failed": dict(self.failed),
+        }
+
+
+def _init_worker(tm_path: str | None, fuzzy_threshold: float | None) -> None:
+    """Load the translation memory once per process."""
+    global _worker_tm
+    if tm_path is None:
+        _worker_tm = None
+        return
+    _worker_tm = TranslationMemory.load(tm_path, fuzzy_threshold=fuzzy_threshold)
+
+
+def _extract(path: Path) -> list[str]:
+    """Run the extraction pipeline on one file and return its segment texts."""
+    parser_name = _PARSERS[DOCUMENT_KINDS[path.suffix.lower()]]
+    parser = _worker_parsers.get(parser_name)
+    if parser is None:
+        parser = _worker_parsers[parser_name] = getattr(parser_module, parser_name)()
+    content = path.read_text(encoding="utf-8")
+    if not content.strip():
+        return []
+    parsed = parser.parse(content)
+    return [s["content"] for s in parsed.get("segments", []) if s.get("translatable", True)]
+
+
+def _analyze_file(path: str) -> tuple[SegmentTable | None, str | None]:
+    """Reduce one file to its unique-segment table.
+
+    Args:
+        path: Input file path
+
+    Returns:
+        (table, None) on success or (None, error message) on failure
+    """
+    try:
+        texts = _extract(Path(path))
+    except Exception as e:
+        return None, str(e) or type(e).__name__
+
+    table: SegmentTable = {}
+    for text in texts:
+        key = normalize_source(text)
+        if not key:
+            continue
+        digest = segment_digest(key)
+        row = table.get(digest)
+        if row is None:
+            table[digest] = [1, count_words(key), len(key) - key.count(" "), key]
+        else:
+            row[0] += 1
+    return table, None
+
+
+def _match_chunk(task: tuple[list[str], str, str]) -> list[float]:
+    """Return the best TM similarity (0 when unmatched) for each segment in a chunk.
+
+    Args:
+        task: Tuple of (normalized segments, source language, target language)
+
+    Returns:
+        One similarity per segment, in input order
+    """
+    keys, source_lang, target_lang = task
+    tm = _worker_tm
+    scores = [0.0] * len(keys)
+    unmatched = []
+    for i, key in enumerate(keys):
+        if tm.lookup(key, source_lang, target_lang) is not None:
+            scores[i] = EXACT_SIMILARITY
+        else:
+            unmatched.append(i)
+    if tm.fuzzy_threshold is not None and unmatched:
+        index = tm.fuzzy_index(source_lang, target_lang)
+        results = index.lookup_batch((keys[i] for i in unmatched), tm.fuzzy_threshold, limit=1)
+        for i, matches in zip(unmatched, results, strict=True):
+            if matches:
+                scores[i] = matches[0].similarity
+    return scores
+
+
+class CorpusAnalyzer:
+    """Compute CAT-style word counts and match statistics for a directory.
+
+    Every segment falls into exactly one category. Walking files in sorted
+    order, a segment already seen in the same file is a repetition, one first
+    seen in an earlier file is a cross-file repetition, and any other segment
+    is classified by its best TM match (100%, a fuzzy band, or new).
+
+    The run has two parallel phases: files are extracted and reduced to
+    unique-segment tables, then the TM is queried once per segment that is
+    unique across the whole corpus, so repetitions never cost a lookup.
+    """
+
+    def __init__(
+        self,
+        tm: str | Path | None = None,
+        parallel: int = 1,
+        bands: tuple[tuple[str, float], ...] = DEFAULT_BANDS,
+        chunk_size: int = 500,
+    ) -> None:
+        """Initialize the analyzer.
+
+        Args:
+            tm: Optional translation memory database for match bands
+            parallel: Number of worker processes (1 analyzes in-process)
+            bands: Fuzzy bands as (label, lowest similarity), best first
+            chunk_size: Segments per TM lookup task
+        """
+        self.tm = str(tm) if tm is not None else None
+        self.parallel = max(1, parallel)
+        self.bands = bands
+        self.chunk_size = chunk_size
+
+    def run(
+        self,
+        input_dir: str | Path,
+        pattern: str = "*.md",
+        source_lang: str = "en",
+        target_lang: str = "es",
+    ) -> AnalysisReport:
+        """Analyze all files under ``input_dir`` matching ``pattern``.
+
+        Args:
+            input_dir: Directory searched recursively for input files
+            pattern: Glob pattern for input files
+            source_lang: Source language code (for TM lookups)
+            target_lang: Target language code (for TM lookups)
+
+        Returns:
+            AnalysisReport with per-category counts
+
+        Raises:
+            FileOperationError: If the input directory or TM does not exist
+        """
+        root = Path(input_dir)
+        if not root.is_dir():
+            msg = f"Input directory not found: {input_dir}"
+            raise FileOperationError(msg)
+        if self.tm is not None and not Path(self.tm).is_file():
+            msg = f"Translation memory not found: {self.tm}"
+            raise FileOperationError(msg)
+
+        paths = [p for p in sorted(root.rglob(pattern)) if p.is_file() and p.suffix.lower() in DOCUMENT_KINDS]
+        report = AnalysisReport(bands=self.bands)
+        # Corpus-wide first occurrences: digest → (words, characters, normalized text)
+        first: dict[bytes, tuple[int, int, str]] = {}
+
+        fuzzy_threshold = self.bands[-1][1] if self.bands else None
+        with self._pool(fuzzy_threshold) as pool:
+            results = pool.map(_analyze_file, [str(p) for p in paths], chunksize=8)
+            for path, (table, error) in zip(paths, results, strict=True):
+                rel = path.relative_to(root).as_posix()
+                if error is not None:
+                    logger.error(f"Failed to analyze {rel}: {error}")
+                    report.failed[rel] = error
+                    continue
+                report.files += 1
+                self._merge(report, table, first)
+
+            if self.tm is None:
+                for words, chars, _ in first.values():
+                    report.add(NEW, 1, words, chars)
+                return report
+
+            rows = list(first.values())
+            chunks = [
+                ([key for _, _, key in rows[i : i + self.chunk_size]], source_lang, target_lang)
+                for i in range(0, len(rows), self.chunk_size)
+            ]
+            scores = chain.from_iterable(pool.map(_match_chunk, chunks))
+            for (words, chars, _), similarity in zip(rows, scores, strict=True):
+                report.add(self._band(similarity), 1, words, chars)
+        return report
+
+    def _pool(self, fuzzy_threshold: float | None) -> AbstractContextManager:
+        """Return a process pool, or an in-process stand-in when ``parallel`` is 1."""
+        if self.parallel == 1:
+            _init_worker(self.tm, fuzzy_threshold)
+            return nullcontext(InProcessPool())
+        return ProcessPoolExecutor(
+            max_workers=self.parallel, initializer=_init_worker, initargs=(self.tm, fuzzy_threshold)
+        )
+
+    @staticmethod
+    def _merge(report: AnalysisReport, table: SegmentTable, first: dict[bytes, tuple[int, int, str]]) -> None:
+        """Fold one file's unique-segment table into the report."""
+        for digest, (count, words, chars, key) in table.items():
+            if digest in first:
+                report.add(CROSS_FILE_REPETITIONS, 1, words, chars)
+            else:
+                first[digest] = (words, chars, key)
+            if count > 1:
+                report.add(REPETITIONS, count - 1, words * (count - 1), chars * (count - 1))
+
+    def _band(self, similarity: float) -> str:
+        """Map a best TM similarity to its category."""
+        if similarity >= EXACT_SIMILARITY:
+            return EXACT
+        for label, lowest in self.bands:
+            if similarity >= lowest:
+                return label
+        return NEW
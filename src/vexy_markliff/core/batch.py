@@ -0,0 +1,243 @@
+"""Batch conversion engine with checkpointed, resumable runs."""
+# this_file: src/vexy_markliff/core/batch.py
+
+import json
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TextIO
+
+from vexy_markliff.core.converter import DOCUMENT_KINDS, VexyMarkliff
+from vexy_markliff.exceptions import ConfigurationError, FileOperationError
+from vexy_markliff.utils import TEMP_SUFFIX, atomic_write_text, get_logger
+
+logger = get_logger(__name__)
+
+CHECKPOINT_NAME = ".vexy-markliff-checkpoint.jsonl"
+CHECKPOINT_VERSION = 1
+
+# Per-process converter, created lazily inside pool workers
+_worker_converter = None
+
+
+@dataclass
+class BatchResult:
+    """Summary of a batch run."""
+
+    converted: int = 0
+    skipped: int = 0
+    failed: dict[str, str] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the summary as a plain dict."""
+        return {"converted": self.converted, "skipped": self.skipped, "failed": dict(self.failed)}
+
+
+def output_path_for(input_path: Path, input_dir: Path, output_dir: Path) -> Path:
+    """Map an input file to its XLIFF output path (``doc.md`` → ``doc.md.xlf``).
+
+    Args:
+        input_path: Input file path
+        input_dir: Root input directory
+        output_dir: Root output directory
+
+    Returns:
+        Output file path mirroring the input tree
+    """
+    rel = input_path.relative_to(input_dir)
+    return output_dir / rel.parent / f"{rel.name}.xlf"
+
+
+def _convert_one(task: tuple[str, str, str, str]) -> str | None:
+    """Convert a single file and write the result atomically.
+
+    Args:
+        task: Tuple of (input path, output path, source language, target language)
+
+    Returns:
+        None on success, or the error message on failure
+    """
+    global _worker_converter
+    input_file, output_file, source_lang, target_lang = task
+    try:
+        if _worker_converter is None:
+            _worker_converter = VexyMarkliff()
+        method = getattr(_worker_converter, f"{DOCUMENT_KINDS[Path(input_file).suffix.lower()]}_to_xliff")
+        content = Path(input_file).read_text(encoding="utf-8")
+        atomic_write_text(output_file, method(content, source_lang, target_lang))
+    except Exception as e:
+        return str(e) or type(e).__name__
+    return None
+
+
+class BatchConverter:
+    """Convert a directory tree to XLIFF with periodic checkpoints.
+
+    Completed files are appended to a checkpoint journal inside the output
+    directory every ``checkpoint_interval`` files. A resumed run skips every
+    file in the checkpoint plus any file whose output already exists and is not
+    older than its input: outputs are written atomically, so an existing output
+    is always complete.
+    """
+
+    def __init__(self, checkpoint_interval: int = 100, parallel: int = 1) -> None:
+        """Initialize the batch converter.
+
+        Args:
+            checkpoint_interval: Number of completed files between checkpoint writes
+            parallel: Number of worker processes (1 converts in-process)
+        """
+        if checkpoint_interval < 1:
+            msg = f"checkpoint_interval must be positive, got {checkpoint_interval}"
+            raise ConfigurationError(msg)
+        self.checkpoint_interval = checkpoint_interval
+        self.parallel = max(1, parallel)
+
+    def run(
+        self,
+        input_dir: str | Path,
+        output_dir: str | Path,
+        pattern: str = "*.md",
+        source_lang: str = "en",
+        target_lang: str = "es",
+        *,
+        resume: bool = False,
+    ) -> BatchResult:
+        """Convert all files under ``input_dir`` matching ``pattern``.
+
+        Args:
+            input_dir: Directory searched recursively for input files
+            output_dir: Directory receiving ``<name>.xlf`` outputs
+            pattern: Glob pattern for input files
+            source_lang: Source language code
+            target_lang: Target language code
+            resume: Continue from the last checkpoint instead of starting over
+
+        Returns:
+            BatchResult summary
+
+        Raises:
+            FileOperationError: If the input directory does not exist
+            ConfigurationError: If the checkpoint belongs to a different run
+        """
+        in_root = Path(input_dir)
+        out_root = Path(output_dir)
+        if not in_root.is_dir():
+            msg = f"Input directory not found: {input_dir}"
+            raise FileOperationError(msg)
+        out_root.mkdir(parents=True, exist_ok=True)
+        self._remove_stale_temp_files(out_root)
+
+        run_key = {"input_dir": str(in_root.resolve()), "pattern": pattern, "langs": [source_lang, target_lang]}
+        checkpoint_path = out_root / CHECKPOINT_NAME
+        completed = self._load_checkpoint(checkpoint_path, run_key) if resume else set()
+
+        result = BatchResult()
+        tasks = []
+        for input_path in sorted(in_root.rglob(pattern)):
+            if not input_path.is_file() or input_path.suffix.lower() not in DOCUMENT_KINDS:
+                continue
+            rel = input_path.relative_to(in_root).as_posix()
+            output_path = output_path_for(input_path, in_root, out_root)
+            if resume and (rel in completed or self._is_up_to_date(input_path, output_path)):
+                result.skipped += 1
+                continue
+            tasks.append((rel, (str(input_path), str(output_path), source_lang, target_lang)))
+
+        if not resume or not checkpoint_path.exists():
+            atomic_write_text(checkpoint_path, json.dumps({"version": CHECKPOINT_VERSION, "run": run_key}) + "\n")
+
+        pending: list[str] = []
+        with open(checkpoint_path, "a+", encoding="utf-8") as journal:
+            # Terminate a torn last line so new entries start on a fresh line
+            if journal.tell() and not self._ends_with_newline(checkpoint_path):
+                journal.write("\n")
+            for rel, error in self._execute(tasks):
+                if error is None:
+                    pending.append(rel)
+                    result.converted += 1
+                else:
+                    logger.error(f"Failed to convert {rel}: {error}")
+                    result.failed[rel] = error
+                if len(pending) >= self.checkpoint_interval:
+                    self._append_checkpoint(journal, pending)
+            self._append_checkpoint(journal, pending)
+
+        if not result.failed:
+            checkpoint_path.unlink(missing_ok=True)
+        return result
+
+    def _execute(self, tasks: list[tuple[str, tuple[str, str, str, str]]]) -> Iterator[tuple[str, str | None]]:
+        """Run conversion tasks, yielding ``(relative path, error)`` as they complete."""
+        if self.parallel == 1:
+            for rel, task in tasks:
+                yield rel, _convert_one(task)
+            return
+
+        # Keep a bounded window of in-flight futures so huge batches stay flat in memory
+        window = self.parallel * 4
+        pending: dict[Future[str | None], str] = {}
+        queue = iter(tasks)
+        with ProcessPoolExecutor(max_workers=self.parallel) as executor:
+            while True:
+                for rel, task in queue:
+                    pending[executor.submit(_convert_one, task)] = rel
+                    if len(pending) >= window:
+                        break
+                if not pending:
+                    return
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield pending.pop(future), future.result()
+
+    @staticmethod
+    def _is_up_to_date(input_path: Path, output_path: Path) -> bool:
+        """Check whether an output exists and is at least as new as its input."""
+        try:
+            return output_path.stat().st_mtime >= input_path.stat().st_mtime
+        except FileNotFoundError:
+            return False
+
+    @staticmethod
+    def _remove_stale_temp_files(out_root: Path) -> None:
+        """Delete temporary files left behind by an interrupted run."""
+        for tmp in out_root.rglob(f".*{TEMP_SUFFIX}"):
+            tmp.unlink(missing_ok=True)
+
+    @staticmethod
+    def _load_checkpoint(path: Path, run_key: dict[str, Any]) -> set[str]:
+        """Load the completed set from a checkpoint journal.
+
+        The first line holds the run header; every following line is one
+        completed input path. A torn last line from a killed run is ignored.
+
+        Raises:
+            ConfigurationError: If the checkpoint was written for a different run
+        """
+        if not path.exists():
+            return set()
+        with open(path, encoding="utf-8") as f:
+            try:
+                header = json.loads(f.readline())
+            except ValueError:
+                header = {}
+            if header.get("version") != CHECKPOINT_VERSION or header.get("run") != run_key:
+                msg = f"Checkpoint {path} belongs to a different batch run; rerun without resume to start over"
+                raise ConfigurationError(msg)
+            return {line[:-1] for line in f if line.endswith("\n")}
+
+    @staticmethod
+    def _ends_with_newline(path: Path) -> bool:
+        """Check whether a file's last byte is a newline."""
+        with open(path, "rb") as f:
+            f.seek(-1, 2)
+            return f.read(1) == b"\n"
+
+    @staticmethod
+    def _append_checkpoint(journal: TextIO, completed: list[str]) -> None:
+        """Append completed paths to the checkpoint journal and flush it to disk."""
+        if completed:
+            journal.write("".join(f"{rel}\n" for rel in completed))
+            journal.flush()
+            completed.clear()
@@ -1,16 +1,32 @@
 """Main conversion orchestrator - simplified for core functionality only."""
 # this_file: src/vexy_markliff/core/converter.py
 
-from typing import TYPE_CHECKING
-
+import importlib
+from collections.abc import Iterable
+from io import BytesIO
+from types import ModuleType
+from typing import IO, TYPE_CHECKING, Any
+
+from vexy_markliff.config import STORAGE_MODES
+from vexy_markliff.core.ids import ID_STRATEGIES
 from vexy_markliff.exceptions import ConversionError, ValidationError
 from vexy_markliff.utils import get_logger, validate_language_code
 
 if TYPE_CHECKING:
     from vexy_markliff.config import ConversionConfig
+    from vexy_markliff.core.update import UpdateReport
+    from vexy_markliff.models.document_pair import TwoDocumentPair
+    from vexy_markliff.models.xliff import TranslationUnit, XLIFFDocument
+    from vexy_markliff.tm.memory import TranslationMemory
 
 logger = get_logger(__name__)
 
+# Bilingual exchange formats handled by export_units/merge_units (modules in vexy_markliff.formats)
+EXCHANGE_FORMATS = ("po", "ts", "resx")
+
+# Input file suffix → document kind accepted by the extraction pipeline
+DOCUMENT_KINDS = {".md": "markdown", ".markdown": "markdown", ".html": "html", ".htm": "html"}
+
 
 class VexyMarkliff:
     """Core converter for bidirectional Markdown/HTML ↔ XLIFF conversion.
@@ -19,13 +35,39 @@ class VexyMarkliff:
     with round-trip fidelity and XLIFF compliance.
     """
 
-    def __init__(self, config=None):
+    def __init__(
+        self,
+        config=None,
+        translation_memory: "TranslationMemory | None" = None,
+        id_strategy: str | None = None,
+        storage: str | None = None,
+        skip_classes: Iterable[str] | None = None,
+    ):
         """Initialize converter with optional configuration.
 
         Args:
             config: ConversionConfig instance or None for defaults
+            translation_memory: Optional TranslationMemory used to pre-fill
+                targets of exact (100%) matches during extraction
+            id_strategy: Unit ID strategy, ``position`` or ``content``;
+                defaults to the configured one
+            storage: One-document storage mode, ``source``, ``target`` or
+                ``both``; defaults to the configured one
+            skip_classes: CSS classes marking elements whose content is not
+                extracted; defaults to the configured ones
         """
         self.config = config
+        self.translation_memory = translation_memory
+        self.id_strategy = id_strategy or getattr(config, "id_strategy", "position")
+        self.id_collision = getattr(config, "id_collision", "suffix")
+        if self.id_strategy not in ID_STRATEGIES:
+            msg = f"Unknown ID strategy: {self.id_strategy}. Use one of {', '.join(ID_STRATEGIES)}"
+            raise ValidationError(msg)
+        self.storage = storage or getattr(config, "storage", "source")
+        if self.storage not in STORAGE_MODES:
+            msg = f"Unknown storage mode: {self.storage}. Use one of {', '.join(STORAGE_MODES)}"
+            raise ValidationError(msg)
+        self.skip_classes = tuple(skip_classes if skip_classes is not None else getattr(config, "skip_classes", ()))
 
     def markdown_to_xliff(self, content: str, source_lang: str = "en", target_lang: str = "es") -> str:
         """Convert Markdown content to XLIFF 2.1 format.
@@ -42,36 +84,7 @@ class VexyMarkliff:
             ValidationError: If content or language codes are invalid
             ConversionError: If conversion fails
         """
-        if not content or not content.strip():
-            msg = "Content cannot be empty"
-            raise ValidationError(msg)
-
-        if not validate_language_code(source_lang):
-            msg = f"Invalid source language code: {source_lang}"
-            raise ValidationError(msg)
-
-        if not validate_language_code(target_lang):
-            msg = f"Invalid target language code: {target_lang}"
-            raise ValidationError(msg)
-
-        try:
-            # Import dependencies only when needed
-            from vexy_markliff.core.parser import MarkdownParser
-            from vexy_markliff.models.xliff import XLIFFDocument
-
-            # Parse Markdown to structured content
-            parser = MarkdownParser()
-            parsed_content = parser.parse(content)
-
-            # Create XLIFF document
-            xliff_doc = XLIFFDocument(source_lang=source_lang, target_lang=target_lang, content=parsed_content)
-
-            return xliff_doc.to_xml()
-
-        except Exception as e:
-            logger.error(f"Markdown to XLIFF conversion failed: {e}")
-            msg = f"Failed to convert Markdown to XLIFF: {e}"
-            raise ConversionError(msg)
+        return self._extract_document(content, "markdown", source_lang, target_lang).to_xml()
 
     def html_to_xliff(self, content: str, source_lang: str = "en", target_lang: str = "es") -> str:
         """Convert HTML content to XLIFF 2.1 format.
@@ -88,36 +101,7 @@ class VexyMarkliff:
             ValidationError: If content or language codes are invalid
             ConversionError: If conversion fails
         """
-        if not content or not content.strip():
-            msg = "Content cannot be empty"
-            raise ValidationError(msg)
-
-        if not validate_language_code(source_lang):
-            msg = f"Invalid source language code: {source_lang}"
-            raise ValidationError(msg)
-
-        if not validate_language_code(target_lang):
-            msg = f"Invalid target language code: {target_lang}"
-            raise ValidationError(msg)
-
-        try:
-            # Import dependencies only when needed
-            from vexy_markliff.core.parser import HTMLParser
-            from vexy_markliff.models.xliff import XLIFFDocument
-
-            # Parse HTML to structured content
-            parser = HTMLParser()
-            parsed_content = parser.parse(content)
-
-            # Create XLIFF document
-            xliff_doc = XLIFFDocument(source_lang=source_lang, target_lang=target_lang, content=parsed_content)
-
-            return xliff_doc.to_xml()
-
-        except Exception as e:
-            logger.error(f"HTML to XLIFF conversion failed: {e}")
-            msg = f"Failed to convert HTML to XLIFF: {e}"
-            raise ConversionError(msg)
+        return self._extract_document(content, "html", source_lang, target_lang).to_xml()
 
     def xliff_to_markdown(self, xliff_content: str) -> str:
         """Convert XLIFF content back to Markdown format.
@@ -186,3 +170,310 @@ class VexyMarkliff:
             logger.error(f"XLIFF to HTML conversion failed: {e}")
             msg = f"Failed to convert XLIFF to HTML: {e}"
             raise ConversionError(msg)
+
+    def markdown_to_po(self, content: str, source_lang: str = "en", target_lang: str = "es") -> str:
+        """Convert Markdown content to a gettext PO catalog.
+
+        Args:
+            content: Markdown content as string
+            source_lang: Source language code (ISO 639-1)
+            target_lang: Target language code (ISO 639-1)
+
+        Returns:
+            PO catalog text
+
+        Raises:
+            ValidationError: If content or language codes are invalid
+            ConversionError: If conversion fails
+        """
+        out = BytesIO()
+        self.export_units(content, out, "markdown", "po", source_lang=source_lang, target_lang=target_lang)
+        return out.getvalue().decode("utf-8")
+
+    def html_to_po(self, content: str, source_lang: str = "en", target_lang: str = "es") -> str:
+        """Convert HTML content to a gettext PO catalog.
+
+        Args:
+            content: HTML content as string
+            source_lang: Source language code (ISO 639-1)
+            target_lang: Target language code (ISO 639-1)
+
+        Returns:
+            PO catalog text
+
+        Raises:
+            ValidationError: If content or language codes are invalid
+            ConversionError: If conversion fails
+        """
+        out = BytesIO()
+        self.export_units(content, out, "html", "po", source_lang=source_lang, target_lang=target_lang)
+        return out.getvalue().decode("utf-8")
+
+    def po_to_markdown(self, po_content: str | IO[bytes]) -> str:
+        """Merge a translated PO catalog back into Markdown.
+
+        Args:
+            po_content: PO text, or a binary file object streamed entry by entry
+
+        Returns:
+            Reconstructed Markdown content
+
+        Raises:
+            ParsingError: If the catalog is malformed
+            ConversionError: If conversion fails
+        """
+        return self.merge_units(po_content, "po", "markdown")
+
+    def po_to_html(self, po_content: str | IO[bytes]) -> str:
+        """Merge a translated PO catalog back into HTML.
+
+        Args:
+            po_content: PO text, or a binary file object streamed entry by entry
+
+        Returns:
+            Reconstructed HTML content
+
+        Raises:
+            ParsingError: If the catalog is malformed
+            ConversionError: If conversion fails
+        """
+        return self.merge_units(po_content, "po", "html")
+
+    def export_units(
+        self,
+        content: str,
+        out: IO[bytes],
+        kind: str,
+        fmt: str,
+        *,
+        source_lang: str = "en",
+        target_lang: str = "es",
+    ) -> int:
+        """Extract Markdown or HTML content and stream it to a bilingual format.
+
+        Args:
+            content: Source document text
+            out: Binary stream receiving the output
+            kind: ``markdown`` or ``html``
+            fmt: Exchange format: ``po``, ``ts`` or ``resx``
+            source_lang: Source language code (ISO 639-1)
+            target_lang: Target language code (ISO 639-1)
+
+        Returns:
+            Number of entries written
+
+        Raises:
+            ValidationError: If content, language codes or format are invalid
+            ConversionError: If conversion fails
+        """
+        module = _format_module(fmt)
+        document = self._extract_document(content, kind, source_lang, target_lang)
+        try:
+            units = (unit for xliff_file in document.files for unit in xliff_file.units)
+            return module.export_units(units, out, source_lang, target_lang)
+        except Exception as e:
+            logger.error(f"{fmt} export failed: {e}")
+            msg = f"Failed to write {fmt} output: {e}"
+            raise ConversionError(msg)
+
+    def merge_units(self, source: str | IO[bytes], fmt: str, kind: str) -> str:
+        """Merge a translated bilingual file back into Markdown or HTML.
+
+        Entries are streamed from the input; each contributes its reviewed
+        translation, or its source text while untranslated. Entries of
+        attribute sub-units set the attribute on their owner's element.
+
+        Args:
+            source: File content, or a binary file object
+            fmt: Exchange format: ``po``, ``ts`` or ``resx``
+            kind: ``markdown`` or ``html``
+
+        Returns:
+            Reconstructed document
+
+        Raises:
+            ValidationError: If the format is unknown
+            ParsingError: If the input is malformed
+        """
+        module = _format_module(fmt)
+        stream = BytesIO(source.encode("utf-8")) if isinstance(source, str) else source
+        return self.reconstruct(module.merge_entries(stream), kind)
+
+    def parallel_to_xliff(self, pair: "TwoDocumentPair") -> str:
+        """Align a source document with its existing translation into XLIFF.
+
+        Headings and list items are matched structurally, then sentences by
+        length; each aligned pair becomes a ``translated`` unit. Alignment
+        warnings are attached to the units as notes.
+
+        Args:
+            pair: Source and target documents with their languages and formats
+
+        Returns:
+            XLIFF with one unit per aligned sentence group
+
+        Raises:
+            ValidationError: If language codes or formats are invalid, or the source is empty
+        """
+        from vexy_markliff.core.align import align_pair, pair_to_xliff  # noqa: PLC0415 - loaded on first use
+
+        for code in (pair.source_lang, pair.target_lang):
+            if not validate_language_code(code):
+                msg = f"Invalid language code: {code}"
+                raise ValidationError(msg)
+
+        align_pair(pair)
+        return pair_to_xliff(pair, self.id_strategy, self.id_collision)
+
+    def update_xliff(self, old_xliff: str | IO[bytes], content: str, kind: str) -> tuple[str, "UpdateReport"]:
+        """Re-extract changed content and carry an earlier XLIFF's translations forward.
+
+        Unchanged and moved units keep their targets and states; units whose
+        source changed keep their old target for review. Languages are taken
+        from the earlier XLIFF.
+
+        Args:
+            old_xliff: Previous XLIFF content, or a binary file object
+            content: New Markdown or HTML text
+            kind: ``markdown`` or ``html``
+
+        Returns:
+            (updated XLIFF, report of the per-unit changes)
+
+        Raises:
+            ValidationError: If the earlier XLIFF has no units, or content is invalid
+            ParsingError: If the earlier XLIFF is malformed
+            ConversionError: If extraction fails
+        """
+        from vexy_markliff.core.streaming import iter_units  # noqa: PLC0415 - loaded on first use
+        from vexy_markliff.core.update import merge_forward  # noqa: PLC0415 - core.update imports this module
+
+        stream = BytesIO(old_xliff.encode("utf-8")) if isinstance(old_xliff, str) else old_xliff
+        old = list(iter_units(stream))
+        if not old:
+            msg = "The earlier XLIFF has no translation units"
+            raise ValidationError(msg)
+        document = self._extract_document(content, kind, old[0].source_lang, old[0].target_lang)
+        report = merge_forward(old, document)
+        return document.to_xml(), report
+
+    def reconstruct(self, entries: Iterable[tuple[str, str, str | None]], kind: str) -> str:
+        """Rebuild a Markdown or HTML document from its units in order.
+
+        Args:
+            entries: (text, source, attribute, owned) of each unit: its
+                translation, or source while untranslated; its source text;
+                the attribute name of attribute sub-units, else None; and
+                whether a sub-unit has an owner unit (see ``merge_segments``)
+            kind: ``markdown`` or ``html``
+
+        Returns:
+            Reconstructed document
+        """
+        from vexy_markliff.core.parser import HTMLParser, MarkdownParser, merge_segments  # noqa: PLC0415
+
+        segments = merge_segments(entries)
+        parser = MarkdownParser() if kind == "markdown" else HTMLParser()
+        return parser.reconstruct(
+            {"segments": segments, "structure": {"tag": "document", "attributes": {}, "children_count": len(segments)}}
+        )
+
+    def extract_units(
+        self, content: str, kind: str, source_lang: str = "en", target_lang: str = "es"
+    ) -> list[tuple["TranslationUnit", dict[str, Any]]]:
+        """Run the segment pipeline and pair each unit with its parser segment.
+
+        The segment carries extraction details the unit model does not keep,
+        such as the originating ``element``.
+
+        Args:
+            content: Source document text
+            kind: ``markdown`` or ``html``
+            source_lang: Source language code (ISO 639-1)
+            target_lang: Target language code (ISO 639-1)
+
+        Returns:
+            (unit, segment) pairs in document order
+
+        Raises:
+            ValidationError: If content or language codes are invalid
+            ConversionError: If extraction fails
+        """
+        document, segments = self._extract(content, kind, source_lang, target_lang)
+        units = (unit for xliff_file in document.files for unit in xliff_file.units)
+        translatable = (segment for segment in segments if segment.get("translatable", True))
+        return list(zip(units, translatable, strict=True))
+
+    def _extract_document(self, content: str, kind: str, source_lang: str, target_lang: str) -> "XLIFFDocument":
+        """Run the segment pipeline and return the (TM pre-filled) document model.
+
+        Args:
+            content: Source document text
+            kind: ``markdown`` or ``html``
+            source_lang: Source language code (ISO 639-1)
+            target_lang: Target language code (ISO 639-1)
+
+        Returns:
+            XLIFFDocument with one unit per translatable segment
+
+        Raises:
+            ValidationError: If content or language codes are invalid
+            ConversionError: If extraction fails
+        """
+        return self._extract(content, kind, source_lang, target_lang)[0]
+
+    def _new_document(self, parsed: dict[str, Any], source_lang: str, target_lang: str) -> "XLIFFDocument":
+        """Build the document model for parsed content with the configured unit IDs and storage."""
+        from vexy_markliff.models.xliff import XLIFFDocument  # noqa: PLC0415 - loaded on first use
+
+        return XLIFFDocument(
+            source_lang=source_lang,
+            target_lang=target_lang,
+            content=parsed,
+            id_strategy=self.id_strategy,
+            id_collision=self.id_collision,
+            storage=self.storage,
+        )
+
+    def _extract(
+        self, content: str, kind: str, source_lang: str, target_lang: str
+    ) -> tuple["XLIFFDocument", list[dict[str, Any]]]:
+        """Validate and parse content; return the document model and the parser segments."""
+        if not content or not content.strip():
+            msg = "Content cannot be empty"
+            raise ValidationError(msg)
+
+        if not validate_language_code(source_lang):
+            msg = f"Invalid source language code: {source_lang}"
+            raise ValidationError(msg)
+
+        if not validate_language_code(target_lang):
+            msg = f"Invalid target language code: {target_lang}"
+            raise ValidationError(msg)
+
+        try:
+            from vexy_markliff.core.parser import HTMLParser, MarkdownParser  # noqa: PLC0415 - loaded on first use
+
+            parser = MarkdownParser(self.skip_classes) if kind == "markdown" else HTMLParser(self.skip_classes)
+            parsed = parser.parse(content)
+            xliff_doc = self._new_document(parsed, source_lang, target_lang)
+            if self.translation_memory is not None:
+                self.translation_memory.prefill(xliff_doc)
+            return xliff_doc, parsed.get("segments", [])
+
+        except Exception as e:
+            logger.error(f"{kind} extraction failed: {e}")
+            msg = f"Failed to extract {kind} content: {e}"
+            raise ConversionError(msg)
+
+
+def _format_module(fmt: str) -> ModuleType:
+    """Return the formats module implementing an exchange format.
+
+    Raises:
+        ValidationError: If the format is unknown
+    """
+    if fmt not in EXCHANGE_FORMATS:
+        msg = f"Unknown exchange format: {fmt}. Use one of {list(EXCHANGE_FORMATS)}"
+        raise ValidationError(msg)
+    return importlib.import_module(f"vexy_markliff.formats.{fmt}")
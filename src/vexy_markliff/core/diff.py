@@ -0,0 +1,218 @@
+"""Structural diff of two XLIFF files.
+
+Units are aligned by key rather than by XML position, so the report lists
+translation-level differences instead of markup noise. Both files are
+streamed with ``iter_units``: the first is indexed as fixed-size digests
+of each unit's source and target (text and inline codes with their
+original markup) and its state, the second is compared against that
+index, and a final pass over the first file fetches the old texts of the
+differing units only. Memory grows with 8-byte digests per unit plus the
+differences, never with the documents themselves, and every step is a
+dict lookup, so the diff runs in linear time.
+"""
+# this_file: src/vexy_markliff/core/diff.py
+
+from collections import Counter
+from collections.abc import Iterator, Sequence
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from vexy_markliff.core.analysis import segment_digest
+from vexy_markliff.core.streaming import UnitRecord, iter_units
+from vexy_markliff.exceptions import ValidationError
+from vexy_markliff.formats.columnar import write_jsonl
+from vexy_markliff.models.inline import InlineCode
+from vexy_markliff.tm.memory import normalize_source
+from vexy_markliff.utils import atomic_open, get_logger
+
+logger = get_logger(__name__)
+
+ADDED = "added"
+REMOVED = "removed"
+CHANGED_SOURCE = "changed-source"
+CHANGED_TARGET = "changed-target"
+CHANGED_STATE = "changed-state"
+STATUSES = (ADDED, REMOVED, CHANGED_SOURCE, CHANGED_TARGET, CHANGED_STATE)
+
+# Unit alignment: by (file id, unit id), or by normalized source and occurrence
+DIFF_KEYS = ("id", "content")
+
+_UnitKey = tuple[str, ...]
+
+
+@dataclass
+class UnitDiff:
+    """One differing unit.
+
+    ``changed-source`` takes precedence over ``changed-target``, which takes
+    precedence over ``changed-state``; the old and new values of all three
+    are kept, so every difference of the unit can be read off.
+    """
+
+    status: str
+    file_id: str
+    unit_id: str
+    old_source: str | None = None
+    source: str | None = None
+    old_target: str | None = None
+    target: str | None = None
+    old_state: str | None = None
+    state: str | None = None
+
+
+@dataclass
+class DiffReport:
+    """Differences between two XLIFF files."""
+
+    units_a: int = 0
+    units_b: int = 0
+    differences: list[UnitDiff] = field(default_factory=list)
+
+    @property
+    def counts(self) -> Counter:
+        """Number of differing units per status."""
+        return Counter(diff.status for diff in self.differences)
+
+    def to_dict(self, *, details: bool = False) -> dict[str, Any]:
+        """Return the report as a plain dict.
+
+        Args:
+            details: Include every differing unit
+
+        Returns:
+            Unit totals and counts per status, and the differences when requested
+        """
+        counts = self.counts
+        report: dict[str, Any] = {"units_a": self.units_a, "units_b": self.units_b}
+        report.update({status: counts[status] for status in STATUSES})
+        if details:
+            report["units"] = [asdict(diff) for diff in self.differences]
+        return report
+
+
+def _digest(text: str | None, codes: Sequence[InlineCode] = ()) -> bytes | None:
+    """Return the 8-byte digest of a text and its inline codes, keeping None distinct from empty.
+
+    Each code contributes its kind, ID, span and original markup, so added,
+    dropped, moved or edited markup (such as a changed link target) is a
+    difference even when the plain text is the same.
+    """
+    if text is None:
+        return None
+    # NUL cannot occur in XML text, so it separates the codes and their fields unambiguously
+    fields = (
+        field for c in codes for field in (f"{c.kind}:{c.id}:{c.start}:{c.end}", c.data_start or "", c.data_end or "")
+    )
+    return segment_digest("\0".join([text, *fields]))
+
+
+def _keyed(records: Iterator[UnitRecord], key: str) -> Iterator[tuple[_UnitKey, UnitRecord]]:
+    """Pair each unit with its alignment key."""
+    if key == "id":
+        for record in records:
+            yield (record.file_id, record.unit_id), record
+        return
+
+    occurrences: Counter[bytes] = Counter()
+    for record in records:
+        digest = _digest(normalize_source(record.source))
+        yield (digest.hex(), str(occurrences[digest])), record
+        occurrences[digest] += 1
+
+
+def diff_xliff(file_a: str | Path, file_b: str | Path, key: str = "id") -> DiffReport:
+    """Compare two XLIFF files unit by unit.
+
+    Args:
+        file_a: Reference file, e.g. the file sent for translation (read twice)
+        file_b: File compared against it, e.g. the vendor's return
+        key: ``id`` aligns units by file and unit ID; ``content`` by
+            normalized source text and occurrence, for files whose IDs
+            were regenerated (source changes then show as removed + added)
+
+    Returns:
+        DiffReport with the differing units in ``file_b`` order, followed by
+        the removed units in ``file_a`` order
+
+    Raises:
+        ValidationError: If the key is unknown or ``file_a`` repeats a unit key
+        ParsingError: If either file is malformed
+    """
+    if key not in DIFF_KEYS:
+        msg = f"Unknown diff key: {key}. Use one of {', '.join(DIFF_KEYS)}"
+        raise ValidationError(msg)
+
+    report = DiffReport()
+    index: dict[_UnitKey, tuple[bytes | None, bytes | None, str]] = {}
+    for unit_key, record in _keyed(iter_units(file_a), key):
+        if unit_key in index:
+            msg = f"Duplicate unit {record.unit_id!r} in file {record.file_id!r} of {file_a}"
+            raise ValidationError(msg)
+        index[unit_key] = (
+            _digest(record.source, record.source_codes),
+            _digest(record.target, record.target_codes),
+            record.state,
+        )
+        report.units_a += 1
+
+    # Differences still waiting for the old texts of file_a
+    pending: dict[_UnitKey, UnitDiff] = {}
+    for unit_key, record in _keyed(iter_units(file_b), key):
+        report.units_b += 1
+        old = index.pop(unit_key, None)
+        if old is None:
+            report.differences.append(
+                UnitDiff(ADDED, record.file_id, record.unit_id, source=record.source, target=record.target)
+            )
+            continue
+        source_digest, target_digest, state = old
+        if source_digest != _digest(record.source, record.source_codes):
+            status = CHANGED_SOURCE
+        elif target_digest != _digest(record.target, record.target_codes):
+            status = CHANGED_TARGET
+        elif state != record.state:
+            status = CHANGED_STATE
+        else:
+            continue
+        diff = UnitDiff(
+            status, record.file_id, record.unit_id, source=record.source, target=record.target, state=record.state
+        )
+        report.differences.append(diff)
+        pending[unit_key] = diff
+
+    if pending or index:
+        for unit_key, record in _keyed(iter_units(file_a), key):
+            diff = pending.get(unit_key)
+            if diff is None and unit_key in index:
+                diff = UnitDiff(REMOVED, record.file_id, record.unit_id)
+                report.differences.append(diff)
+            if diff is not None:
+                diff.old_source, diff.old_target, diff.old_state = record.source, record.target, record.state
+    return report
+
+
+def diff_files(
+    file_a: str | Path, file_b: str | Path, output_file: str | Path | None = None, key: str = "id"
+) -> DiffReport:
+    """Diff two XLIFF files, optionally writing the differences as JSON Lines.
+
+    Args:
+        file_a: Reference XLIFF file
+        file_b: XLIFF file compared against it
+        output_file: Optional JSON Lines file receiving one line per difference
+        key: Unit alignment, ``id`` or ``content``
+
+    Returns:
+        DiffReport of the comparison
+    """
+    report = diff_xliff(file_a, file_b, key)
+    if output_file is not None:
+        with atomic_open(output_file, "wb") as out:
+            write_jsonl((asdict(diff) for diff in report.differences), out)
+    counts = report.counts
+    logger.info(
+        f"Diffed {file_a} ({report.units_a} units) and {file_b} ({report.units_b} units): "
+        + ", ".join(f"{counts[status]} {status}" for status in STATUSES)
+    )
+    return report
@@ -0,0 +1,227 @@
+"""XLIFF Format Style (``fs:fs``/``fs:subFs``) values for HTML elements.
+
+``fs:fs`` names the HTML element a unit or inline code came from and
+``fs:subFs`` carries the element's attributes, so a merger can rebuild the
+markup. Both are computed while the parser walks the document, from tables
+built once at import: the ``fs:fs`` value of every tag, and attributes a
+tag implies when the author left them out. Attribute lists are escaped
+with a single ``str.translate`` per name or value (see
+``docs/512-prefs-html2.md`` §1.1):
+
+- ``,`` separates a name from its value and ``\\`` separates pairs
+- literal commas become ``\\,`` and literal backslashes ``\\\\``
+- an empty value is written as ``name,``
+"""
+# this_file: src/vexy_markliff/core/format_style.py
+
+from collections.abc import Iterable
+
+# HTML5 elements; the Format Style module takes these as fs:fs values
+HTML5_ELEMENTS = frozenset(
+    [
+        "a",
+        "abbr",
+        "address",
+        "area",
+        "article",
+        "aside",
+        "audio",
+        "b",
+        "base",
+        "bdi",
+        "bdo",
+        "blockquote",
+        "body",
+        "br",
+        "button",
+        "canvas",
+        "caption",
+        "cite",
+        "code",
+        "col",
+        "colgroup",
+        "data",
+        "datalist",
+        "dd",
+        "del",
+        "details",
+        "dfn",
+        "dialog",
+        "div",
+        "dl",
+        "dt",
+        "em",
+        "embed",
+        "fieldset",
+        "figcaption",
+        "figure",
+        "footer",
+        "form",
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "h5",
+        "h6",
+        "head",
+        "header",
+        "hgroup",
+        "hr",
+        "html",
+        "i",
+        "iframe",
+        "img",
+        "input",
+        "ins",
+        "kbd",
+        "label",
+        "legend",
+        "li",
+        "link",
+        "main",
+        "map",
+        "mark",
+        "menu",
+        "meta",
+        "meter",
+        "nav",
+        "noscript",
+        "object",
+        "ol",
+        "optgroup",
+        "option",
+        "output",
+        "p",
+        "param",
+        "picture",
+        "pre",
+        "progress",
+        "q",
+        "rp",
+        "rt",
+        "ruby",
+        "s",
+        "samp",
+        "script",
+        "search",
+        "section",
+        "select",
+        "slot",
+        "small",
+        "source",
+        "span",
+        "strong",
+        "style",
+        "sub",
+        "summary",
+        "sup",
+        "table",
+        "tbody",
+        "td",
+        "template",
+        "textarea",
+        "tfoot",
+        "th",
+        "thead",
+        "time",
+        "title",
+        "tr",
+        "track",
+        "u",
+        "ul",
+        "var",
+        "video",
+        "wbr",
+    ]
+)
+
+# Obsolete elements take the fs:fs value of their modern counterpart (docs/512 §3)
+LEGACY_ELEMENTS = {
+    "acronym": "abbr",
+    "applet": "object",
+    "basefont": "span",
+    "big": "span",
+    "blink": "span",
+    "center": "div",
+    "dir": "ul",
+    "font": "span",
+    "frame": "iframe",
+    "frameset": "div",
+    "isindex": "input",
+    "marquee": "div",
+    "menuitem": "li",
+    "noframes": "div",
+    "strike": "s",
+    "tt": "code",
+}
+
+# Tag → fs:fs value; custom elements and other unknown tags keep their own name
+FS_NAMES = {**{tag: tag for tag in HTML5_ELEMENTS}, **LEGACY_ELEMENTS}
+
+# Attributes recorded in fs:subFs when the author omitted them (docs/510 §6)
+IMPLIED_ATTRIBUTES = {"bdi": (("dir", "auto"),), "bdo": (("dir", "auto"),)}
+
+_ESCAPE = str.maketrans({",": "\\,", "\\": "\\\\"})
+
+
+def fs_name(tag: str) -> str:
+    """Return the ``fs:fs`` value of a tag."""
+    return FS_NAMES.get(tag, tag)
+
+
+def sub_fs(tag: str, attributes: Iterable[tuple[str, str]]) -> str | None:
+    """Encode an element's attributes as an ``fs:subFs`` value.
+
+    Args:
+        tag: Element tag, for its implied attributes
+        attributes: (name, value) pairs in document order
+
+    Returns:
+        Escaped attribute list, or None if the element has no attributes
+    """
+    pairs = list(attributes)
+    implied = IMPLIED_ATTRIBUTES.get(tag)
+    if implied:
+        names = {name for name, _ in pairs}
+        pairs.extend(pair for pair in implied if pair[0] not in names)
+    if not pairs:
+        return None
+    return "\\".join(f"{name.translate(_ESCAPE)},{value.translate(_ESCAPE)}" for name, value in pairs)
+
+
+def parse_sub_fs(value: str) -> list[tuple[str, str]]:
+    """Decode an ``fs:subFs`` value into (name, value) pairs.
+
+    Args:
+        value: Escaped attribute list
+
+    Returns:
+        Attribute pairs in order
+    """
+    pairs: list[tuple[str, str]] = []
+    fields: list[str] = []
+    current: list[str] = []
+    chars = iter(value)
+    for char in chars:
+        if char == "\\":
+            following = next(chars, "")
+            if following in (",", "\\"):
+                current.append(following)
+                continue
+            # A lone backslash separates pairs; the character after it starts the next name
+            fields.append("".join(current))
+            pairs.append(_pair(fields))
+            fields, current = [], [following] if following else []
+        elif char == "," and not fields:
+            fields.append("".join(current))
+            current = []
+        else:
+            current.append(char)
+    fields.append("".join(current))
+    if fields != [""]:
+        pairs.append(_pair(fields))
+    return pairs
+
+
+def _pair(fields: list[str]) -> tuple[str, str]:
+    return (fields[0], fields[1]) if len(fields) > 1 else (fields[0], "")
@@ -0,0 +1,105 @@
+"""Translation unit ID strategies.
+
+``position`` numbers units in document order (``unit_1``, ``unit_2``, ...),
+so inserting a paragraph renumbers everything after it. ``content`` derives
+each ID from a hash of the unit's normalized source, its structural path in
+the document and its occurrence index among identical (source, path) pairs:
+edits only change the IDs of the units they touch, and downstream diffing,
+caching and TM leverage can key on IDs directly.
+"""
+# this_file: src/vexy_markliff/core/ids.py
+
+from collections import Counter
+
+from vexy_markliff.exceptions import ValidationError
+from vexy_markliff.tm.memory import normalize_source
+
+ID_STRATEGIES = ("position", "content")
+
+# What to do when two different units hash to the same ID
+COLLISION_POLICIES = ("suffix", "error")
+
+# Hex digits kept from the 64-bit digest
+DEFAULT_ID_LENGTH = 16
+
+
+def content_unit_id(source: str, path: str = "", occurrence: int = 0, length: int = DEFAULT_ID_LENGTH) -> str:
+    """Return the content-derived ID of a unit.
+
+    Args:
+        source: Source text (normalized before hashing)
+        path: Structural path of the unit, e.g. ``div/ul/li``
+        occurrence: Index of this (source, path) pair among its repeats
+        length: Number of hex digits to keep
+
+    Returns:
+        ID such as ``u3f2a9c0d1b7e4a55``
+    """
+    from vexy_markliff.core.analysis import segment_digest  # noqa: PLC0415 - core.analysis imports this module
+
+    key = f"{normalize_source(source)}\x1f{path}\x1f{occurrence}"
+    return "u" + segment_digest(key).hex()[:length]
+
+
+class UnitIdAllocator:
+    """Hands out unique unit IDs for one document."""
+
+    def __init__(self, strategy: str = "position", on_collision: str = "suffix", length: int = DEFAULT_ID_LENGTH):
+        """Initialize the allocator.
+
+        Args:
+            strategy: ``position`` or ``content``
+            on_collision: For content IDs, ``suffix`` appends ``-2``, ``-3``...
+                to a colliding ID, ``error`` raises
+            length: Hex digits of content IDs
+
+        Raises:
+            ValidationError: If the strategy or collision policy is unknown
+        """
+        if strategy not in ID_STRATEGIES:
+            msg = f"Unknown ID strategy: {strategy}. Use one of {', '.join(ID_STRATEGIES)}"
+            raise ValidationError(msg)
+        if on_collision not in COLLISION_POLICIES:
+            msg = f"Unknown collision policy: {on_collision}. Use one of {', '.join(COLLISION_POLICIES)}"
+            raise ValidationError(msg)
+        self.strategy = strategy
+        self.on_collision = on_collision
+        self.length = length
+        self.collisions = 0
+        self._occurrences: Counter[tuple[str, str]] = Counter()
+        self._issued: dict[str, tuple[str, str, int]] = {}
+
+    def allocate(self, source: str, path: str = "") -> str:
+        """Return the ID of the next unit in document order.
+
+        Args:
+            source: Source text of the unit
+            path: Structural path of the unit
+
+        Returns:
+            Unit ID, unique within this allocator
+
+        Raises:
+            ValidationError: On a hash collision under the ``error`` policy
+        """
+        if self.strategy == "position":
+            unit_id = f"unit_{len(self._issued) + 1}"
+            self._issued[unit_id] = (source, path, 0)
+            return unit_id
+
+        key = (normalize_source(source), path)
+        occurrence = self._occurrences[key]
+        self._occurrences[key] += 1
+        base = content_unit_id(source, path, occurrence, self.length)
+        unit_id = base
+        suffix = 1
+        while unit_id in self._issued:
+            if self.on_collision == "error":
+                msg = f"Unit ID collision: {unit_id} for {source!r} and {self._issued[unit_id][0]!r}"
+                raise ValidationError(msg)
+            suffix += 1
+            unit_id = f"{base}-{suffix}"
+        if suffix > 1:
+            self.collisions += 1
+        self._issued[unit_id] = (source, path, occurrence)
+        return unit_id
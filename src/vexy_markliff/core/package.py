@@ -0,0 +1,209 @@
+"""Multi-document XLIFF packages.
+
+Packing extracts any number of Markdown/HTML documents into a single XLIFF
+with one ``<file>`` per document, recording each document's relative path
+in ``original``. Each ``<file>`` is written out as soon as its document is
+extracted, so a package holds only that document in memory.
+Unpacking streams the package back and rebuilds each document under an
+output directory.
+"""
+# this_file: src/vexy_markliff/core/package.py
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from itertools import groupby
+from pathlib import Path
+from typing import IO
+
+from lxml import etree
+
+from vexy_markliff.core.converter import DOCUMENT_KINDS, VexyMarkliff
+from vexy_markliff.core.streaming import iter_units
+from vexy_markliff.exceptions import FileOperationError, ValidationError
+from vexy_markliff.models.inline import FS_NS, DataTable, render_inline
+from vexy_markliff.models.xliff import XLIFFFile, xliff_start_tag
+from vexy_markliff.utils import atomic_open, atomic_write_text, get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class PackageStats:
+    """Counters for a pack or unpack run."""
+
+    files: int = 0
+    units: int = 0
+    failed: dict[str, str] = field(default_factory=dict)
+
+
+def iter_documents(inputs: Iterable[str | Path], pattern: str = "*.md") -> Iterator[tuple[Path, str]]:
+    """Expand input files and directories into (path, original) pairs.
+
+    Files contribute their name; directories are searched recursively for
+    ``pattern`` and contribute paths relative to the directory.
+
+    Args:
+        inputs: Files and directories
+        pattern: Glob pattern used inside directories
+
+    Yields:
+        (path, original) for each document, directories in sorted order
+
+    Raises:
+        FileOperationError: If an input does not exist
+    """
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            for child in sorted(path.rglob(pattern)):
+                if child.is_file():
+                    yield child, child.relative_to(path).as_posix()
+        elif path.is_file():
+            yield path, path.name
+        else:
+            msg = f"Input not found: {item}"
+            raise FileOperationError(msg)
+
+
+def pack_documents(
+    documents: Iterable[tuple[Path, str]],
+    out: IO[bytes],
+    source_lang: str = "en",
+    target_lang: str = "es",
+    converter: VexyMarkliff | None = None,
+) -> PackageStats:
+    """Extract documents into one XLIFF package with one ``<file>`` each.
+
+    Documents that cannot be extracted (unsupported suffix, empty, invalid)
+    are logged, recorded in ``failed`` and left out of the package.
+
+    Args:
+        documents: (path, original) pairs, for example from ``iter_documents``
+        out: Binary stream receiving the package
+        source_lang: Source language code
+        target_lang: Target language code
+        converter: Converter running the extraction (and TM pre-fill)
+
+    Returns:
+        PackageStats with document and unit counts
+
+    Raises:
+        ValidationError: If two documents share the same ``original``
+    """
+    converter = converter if converter is not None else VexyMarkliff()
+    stats = PackageStats()
+    seen: set[str] = set()
+    # The root declares the fs namespace, so it is written by hand (see xliff_start_tag)
+    out.write(f"<?xml version='1.0' encoding='utf-8'?>\n{xliff_start_tag()}>\n".encode())
+    for path, original in documents:
+        if original in seen:
+            msg = f"Duplicate document in package: {original}"
+            raise ValidationError(msg)
+        seen.add(original)
+        kind = DOCUMENT_KINDS.get(path.suffix.lower())
+        try:
+            if kind is None:
+                msg = f"Unsupported document type: {path.suffix}"
+                raise ValidationError(msg)
+            content = path.read_text(encoding="utf-8")
+            units = [unit for unit, _ in converter.extract_units(content, kind, source_lang, target_lang)]
+        except Exception as e:
+            logger.error(f"Failed to extract {original}: {e}")
+            stats.failed[original] = str(e) or type(e).__name__
+            continue
+
+        stats.files += 1
+        xliff_file = XLIFFFile(
+            id=f"f{stats.files}", original=original, source_language=source_lang, target_language=target_lang
+        )
+        # Inline markup is stored once per document, ahead of its units
+        data = DataTable()
+        unit_elems = [unit.to_element(converter.storage, data) for unit in units]
+        if len(data):
+            unit_elems.insert(0, data.to_element())
+        # Built as one tree so Format Style attributes share one fs declaration;
+        # one unit per line keeps diffs of packages readable
+        file_elem = etree.Element("file", xliff_file.attributes(), nsmap={"fs": FS_NS})
+        file_elem.text = "\n"
+        for unit_elem in unit_elems:
+            unit_elem.tail = "\n"
+            file_elem.append(unit_elem)
+        file_elem.tail = "\n"
+        # The root already declares fs; drop the copy lxml writes on the file
+        chunk = etree.tostring(file_elem, encoding="utf-8")
+        out.write(chunk.replace(f'<file xmlns:fs="{FS_NS}"'.encode(), b"<file", 1))
+        stats.units += len(units)
+    out.write(b"</xliff>")
+    return stats
+
+
+def pack_files(
+    inputs: Iterable[str | Path],
+    output_file: str | Path,
+    pattern: str = "*.md",
+    source_lang: str = "en",
+    target_lang: str = "es",
+    *,
+    converter: VexyMarkliff | None = None,
+) -> PackageStats:
+    """Pack input files and directories into an XLIFF package file.
+
+    Args:
+        inputs: Files and directories (searched recursively for ``pattern``)
+        output_file: Package path; written atomically
+        pattern: Glob pattern used inside directories
+        source_lang: Source language code
+        target_lang: Target language code
+        converter: Converter running the extraction (and TM pre-fill)
+
+    Returns:
+        PackageStats with document and unit counts
+    """
+    with atomic_open(output_file, "wb") as out:
+        stats = pack_documents(iter_documents(inputs, pattern), out, source_lang, target_lang, converter)
+    logger.info(f"Packed {stats.units} units from {stats.files} documents into {output_file}")
+    return stats
+
+
+def unpack_package(
+    source: str | Path | IO[bytes], output_dir: str | Path, converter: VexyMarkliff | None = None
+) -> PackageStats:
+    """Rebuild every document of an XLIFF package under ``output_dir``.
+
+    Each ``<file>`` is written to its ``original`` path (``<id>.md`` when it
+    has none), as Markdown or HTML by suffix. Units contribute their target,
+    or their source while untranslated, with the original markup of their
+    inline codes restored; attribute sub-units set the
+    attribute on their owner's element.
+
+    Args:
+        source: Package path or binary file object
+        output_dir: Directory receiving the documents
+        converter: Converter used to rebuild documents
+
+    Returns:
+        PackageStats with document and unit counts
+
+    Raises:
+        ValidationError: If an ``original`` points outside ``output_dir``
+        ParsingError: If the package is malformed
+    """
+    converter = converter if converter is not None else VexyMarkliff()
+    root = Path(output_dir).resolve()
+    stats = PackageStats()
+    for (file_id, original), units in groupby(iter_units(source), key=lambda u: (u.file_id, u.original)):
+        name = original or f"{file_id}.md"
+        dest = (root / name).resolve()
+        if not dest.is_relative_to(root):
+            msg = f"Package file {file_id} points outside the output directory: {name}"
+            raise ValidationError(msg)
+        entries = []
+        for unit in units:
+            text, codes = (unit.target, unit.target_codes) if unit.target else (unit.source, unit.source_codes)
+            entries.append((render_inline(text, codes), unit.source, unit.attribute, unit.owner is not None))
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(dest, converter.reconstruct(entries, DOCUMENT_KINDS.get(dest.suffix.lower(), "markdown")))
+        stats.files += 1
+        stats.units += len(entries)
+    logger.info(f"Unpacked {stats.files} documents into {output_dir}")
+    return stats
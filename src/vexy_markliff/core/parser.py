@@ -1,22 +1,292 @@
 """HTML and Markdown parsing utilities - simplified for core functionality."""
 # this_file: src/vexy_markliff/core/parser.py
 
-from typing import Any, Dict, List
+import re
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any, Dict, List
 
 import markdown_it
 from lxml import etree, html
 
+from vexy_markliff.core.format_style import fs_name, sub_fs
 from vexy_markliff.exceptions import ParsingError, ValidationError
-from vexy_markliff.utils import get_logger, normalize_whitespace
+from vexy_markliff.utils import get_logger
+
+if TYPE_CHECKING:
+    from vexy_markliff.models.inline import InlineCode
 
 logger = get_logger(__name__)
 
+# Inline elements kept inside their block's segment as <pc> spans around their text
+INLINE_TAGS = frozenset(
+    {
+        "a", "abbr", "b", "bdi", "bdo", "cite", "code", "del", "dfn", "em", "i", "ins", "kbd", "mark",
+        "q", "s", "samp", "small", "span", "strong", "sub", "sup", "time", "u", "var",
+        # obsolete inline elements, mapped to modern fs:fs values
+        "acronym", "big", "font", "strike", "tt",
+    }
+)  # fmt: skip
+# Empty inline elements kept as <ph> placeholders
+PLACEHOLDER_TAGS = frozenset({"br", "img", "input", "wbr"})
+# Elements whose content is never translated: whole subtrees are skipped, inline ones are locked
+SKIPPED_TAGS = frozenset({"code", "pre", "script", "style"})
+
+# Attributes holding human-readable text, extracted as sub-units of their element (docs/502-htmlattr.md)
+GLOBAL_TRANSLATABLE_ATTRIBUTES = ("title", "aria-label", "aria-description")
+TRANSLATABLE_ATTRIBUTES = {
+    tag: (*names, *GLOBAL_TRANSLATABLE_ATTRIBUTES)
+    for tag, names in {
+        "area": ("alt",),
+        "img": ("alt",),
+        "input": ("alt", "placeholder"),
+        "optgroup": ("label",),
+        "option": ("label",),
+        "textarea": ("placeholder",),
+        "track": ("label",),
+    }.items()
+}
+
+_WHITESPACE = re.compile(r"\s+")
+_ATTR_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
+
+
+def _is_inline(element: etree._Element) -> bool:
+    return isinstance(element.tag, str) and (element.tag in INLINE_TAGS or element.tag in PLACEHOLDER_TAGS)
+
+
+def _attribute_markup(attributes: dict[str, str]) -> str:
+    return "".join(f' {name}="{value.translate(_ATTR_ESCAPE)}"' for name, value in attributes.items())
+
+
+def _unowned(sub_units: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Mark sub-units whose element has no segment holding its text."""
+    for sub_unit in sub_units:
+        sub_unit["owner"] = None
+    return sub_units
+
+
+def merge_segments(entries: Iterable[tuple[str, str, str | None, bool]]) -> list[dict[str, Any]]:
+    """Return the segments rebuilding a document from its units in order.
+
+    Attribute sub-units are not rebuilt as text of their own. Each owned
+    sub-unit follows the unit holding its element (see
+    ``HTMLParser._extract_segments``): its text replaces the original value
+    in that unit's markup, or becomes an attribute of the rebuilt block when
+    the markup has no such value (the attribute belongs to the block
+    itself). Sub-units without an owner belong to elements without text,
+    which the rebuilt document does not contain, and are skipped.
+
+    Args:
+        entries: (text, source, attribute, owned) of each unit: the text to
+            rebuild, the source text, the attribute name of sub-units (None
+            for units with text of their own) and whether a sub-unit has an
+            owner unit
+
+    Returns:
+        Segments for ``HTMLParser.reconstruct``
+    """
+    segments: list[dict[str, Any]] = []
+    for text, source, attribute, owned in entries:
+        if attribute is None:
+            segments.append({"content": text, "translatable": True, "element": "text"})
+        elif owned and segments:
+            owner = segments[-1]
+            original = _attribute_markup({attribute: source})
+            if original in owner["content"]:
+                owner["content"] = owner["content"].replace(original, _attribute_markup({attribute: text}), 1)
+            else:
+                owner.setdefault("attributes", {})[attribute] = text
+    return segments
+
+
+class _Markup:
+    """Per-parse memo of each distinct (tag, attributes) combination.
+
+    Pages repeat the same link, icon and class markup many times; each
+    combination is serialized and escaped once, and repeats share the
+    resulting strings.
+    """
+
+    def __init__(self) -> None:
+        self._elements: dict[tuple[str, tuple[tuple[str, str], ...]], tuple[str, str, str | None]] = {}
+        self._end_tags: dict[str, str] = {}
+
+    def describe(self, element: etree._Element) -> tuple[str, str, str | None]:
+        """Return (start tag markup, ``fs:fs``, ``fs:subFs``) of an element."""
+        tag = element.tag
+        attributes = tuple(element.attrib.items())
+        found = self._elements.get((tag, attributes))
+        if found is None:
+            attrs = "".join(f' {name}="{value.translate(_ATTR_ESCAPE)}"' for name, value in attributes)
+            found = self._elements[(tag, attributes)] = (f"<{tag}{attrs}>", fs_name(tag), sub_fs(tag, attributes))
+        return found
+
+    def translatable(self, element: etree._Element) -> list[tuple[str, str]]:
+        """Return the (name, value) pairs of an element's non-empty translatable attributes."""
+        names = TRANSLATABLE_ATTRIBUTES.get(element.tag, GLOBAL_TRANSLATABLE_ATTRIBUTES)
+        pairs = []
+        for name in names:
+            value = element.get(name)
+            if value and not value.isspace():
+                pairs.append((name, _WHITESPACE.sub(" ", value).strip()))
+        return pairs
+
+    def attribute_segments(self, element: etree._Element, path: str, owner: int) -> list[dict[str, Any]]:
+        """Return the sub-unit segments of an element's translatable attributes.
+
+        Args:
+            element: Element carrying the attributes
+            path: Structural path of the element
+            owner: Node number of the block whose segment holds the element's text
+        """
+        if not element.attrib:
+            return []
+        _, fs, attrs = self.describe(element)
+        return [
+            {
+                "content": value,
+                "translatable": True,
+                "element": element.tag,
+                "attribute": name,
+                "path": f"{path}@{name}",
+                "codes": [],
+                "fs": fs,
+                "sub_fs": attrs,
+                "owner": owner,
+            }
+            for name, value in self.translatable(element)
+        ]
+
+    def end_tag(self, tag: str) -> str:
+        """Return the end tag markup of a tag."""
+        found = self._end_tags.get(tag)
+        if found is None:
+            found = self._end_tags[tag] = f"</{tag}>"
+        return found
+
+
+class _InlineRun:
+    """Text and inline codes of one segment, collected while walking its block.
+
+    Whitespace is collapsed as text arrives, so code offsets always refer
+    to the final segment text. Markup payloads and Format Style values come
+    from the parse's ``_Markup`` memo; ``skipped`` tells which inline
+    elements hold text that must not be translated.
+    """
+
+    def __init__(self, markup: _Markup, path: str, node: int, skipped: Callable[[etree._Element], bool]) -> None:
+        self.parts: list[str] = []
+        self.length = 0
+        self.codes: list[InlineCode] = []
+        # Sub-units of translatable attributes on inline elements, emitted after the segment if it has text
+        self.attributes: list[dict[str, Any]] = []
+        self._markup = markup
+        self._path = path
+        self._node = node
+        self._skipped = skipped
+        self._space = True
+
+    def text(self, value: str | None) -> None:
+        """Append text, collapsing whitespace runs (also across codes)."""
+        if not value:
+            return
+        value = _WHITESPACE.sub(" ", value)
+        if self._space and value.startswith(" "):
+            value = value[1:]
+        if value:
+            self.parts.append(value)
+            self.length += len(value)
+            self._space = value.endswith(" ")
+
+    def element(self, element: etree._Element, parent: str | None = None, *, locked: bool = False) -> None:
+        """Append an inline element as a ``<ph>``, or as a ``<pc>`` around its content.
+
+        Args:
+            element: Inline element
+            parent: ID of the enclosing code
+            locked: Whether an enclosing element already locks the text
+        """
+        # Loaded on first use, so importing the parser does not load pydantic
+        from vexy_markliff.models.inline import InlineCode  # noqa: PLC0415
+
+        data_start, fs, attrs = self._markup.describe(element)
+        code_id = str(len(self.codes) + 1)
+        at = self.length
+        lock = not locked and self._skipped(element)
+        locked = locked or lock
+        if element.attrib and not locked:
+            self.attributes.extend(self._markup.attribute_segments(element, f"{self._path}/{element.tag}", self._node))
+        if element.tag in PLACEHOLDER_TAGS:
+            self.codes.append(
+                InlineCode(
+                    id=code_id, kind="ph", start=at, end=at, parent=parent, data_start=data_start, fs=fs, sub_fs=attrs
+                )
+            )
+            return
+        data_end = self._markup.end_tag(element.tag)
+        spans = [
+            InlineCode(
+                id=code_id,
+                start=at,
+                end=at,
+                parent=parent,
+                data_start=data_start,
+                data_end=data_end,
+                fs=fs,
+                sub_fs=attrs,
+            )
+        ]
+        # Untranslatable inline markup (ITS translate="no", code) locks its text with a marker inside the paired code
+        if lock:
+            marker_id = str(len(self.codes) + 2)
+            spans.append(InlineCode(id=marker_id, kind="mrk", start=at, end=at, parent=code_id, translate=False))
+        self.codes.extend(spans)
+        self.text(element.text)
+        for child in element:
+            if isinstance(child.tag, str):
+                self.element(child, spans[-1].id, locked=locked)
+            self.text(child.tail)
+        for span in spans:
+            span.end = self.length
+
+    def segment(self, element: str, owner: etree._Element) -> dict[str, Any] | None:
+        """Return the collected segment, or None if it has no text.
+
+        Args:
+            element: ``element`` label of the segment
+            owner: Block element whose text the segment holds
+        """
+        if self._space and self.parts:
+            self.parts[-1] = self.parts[-1][:-1]
+            self.length -= 1
+            for code in self.codes:
+                code.start, code.end = min(code.start, self.length), min(code.end, self.length)
+        content = "".join(self.parts)
+        if not content:
+            return None
+        segment = {
+            "content": content,
+            "translatable": True,
+            "element": element,
+            "path": self._path,
+            "codes": self.codes,
+            "node": self._node,
+        }
+        if isinstance(owner.tag, str):
+            _, segment["fs"], segment["sub_fs"] = self._markup.describe(owner)
+        return segment
+
 
 class MarkdownParser:
     """Simple parser for Markdown content using markdown-it-py."""
 
-    def __init__(self) -> None:
-        """Initialize the Markdown parser."""
+    def __init__(self, skip_classes: Iterable[str] = ()) -> None:
+        """Initialize the Markdown parser.
+
+        Args:
+            skip_classes: CSS classes of (inline HTML) elements whose content is not translated
+        """
+        self.skip_classes = tuple(skip_classes)
         # Initialize with CommonMark preset
         self.md = markdown_it.MarkdownIt("commonmark", {"breaks": True, "html": True})
         # Enable tables and strikethrough
@@ -43,7 +313,7 @@ class MarkdownParser:
             html_content = self.md.render(content)
 
             # Then parse HTML for structure
-            html_parser = HTMLParser()
+            html_parser = HTMLParser(self.skip_classes)
             return html_parser.parse(html_content)
 
         except Exception as e:
@@ -80,9 +350,15 @@ class MarkdownParser:
 class HTMLParser:
     """Simple parser for HTML content using lxml."""
 
-    def __init__(self) -> None:
-        """Initialize the HTML parser."""
-        pass
+    def __init__(self, skip_classes: Iterable[str] = ()) -> None:
+        """Initialize the HTML parser.
+
+        Args:
+            skip_classes: CSS classes marking elements whose content is not translated
+        """
+        self._markup = _Markup()
+        self._nodes = 0
+        self._skip_classes = frozenset(skip_classes)
 
     def parse(self, content: str) -> dict[str, Any]:
         """Parse HTML content into structured format.
@@ -105,6 +381,7 @@ class HTMLParser:
             doc = html.fromstring(content)
 
             # Extract translatable segments
+            self._markup, self._nodes = _Markup(), 0
             segments = self._extract_segments(doc)
 
             return {"segments": segments, "structure": self._extract_structure(doc)}
@@ -135,7 +412,8 @@ class HTMLParser:
             html_parts = []
             for segment in segments:
                 if segment.get("translatable", True):
-                    html_parts.append(f"<p>{segment['content']}</p>")
+                    attrs = _attribute_markup(segment.get("attributes", {}))
+                    html_parts.append(f"<p{attrs}>{segment['content']}</p>")
                 else:
                     html_parts.append(segment["content"])
 
@@ -146,40 +424,92 @@ class HTMLParser:
             msg = f"Failed to reconstruct HTML: {e}"
             raise ParsingError(msg)
 
-    def _extract_segments(self, element) -> list[dict[str, Any]]:
+    def _extract_segments(self, element, parent_path: str = "") -> list[dict[str, Any]]:
         """Extract translatable segments from HTML element.
 
         Args:
             element: HTML element to process
+            parent_path: Structural path of the element's parent
 
         Returns:
-            List of translatable segments
+            List of translatable segments; each records the ``path`` of tags
+            leading to the element holding its text, e.g. ``div/ul/li``.
+            Inline elements stay within the segment of their text as
+            ``codes``; block children end the current segment. Segments and
+            codes carry the ``fs``/``sub_fs`` Format Style values of their
+            element. Every block is numbered as a ``node``; translatable
+            attributes become sub-unit segments with the ``attribute`` name
+            and the ``owner`` node whose segments hold the element's text
+            (the block itself, or the block around an inline element). A
+            sub-unit directly follows the segment holding its element: the
+            block's first segment, or the segment of the inline element's
+            run. Elements without such a segment (an image alone in its
+            paragraph, a block whose text is all in child blocks) still give
+            their sub-units, with ``owner`` None, where the element starts.
+            Untranslatable subtrees (see ``_skipped``) yield nothing and are
+            not walked.
         """
+        if self._skipped(element):
+            return []
         segments = []
-
-        # Process text content
-        if element.text and element.text.strip():
-            text = normalize_whitespace(element.text)
-            if text:
-                segments.append(
-                    {
-                        "content": text,
-                        "translatable": True,
-                        "element": element.tag if hasattr(element, "tag") else "text",
-                    }
-                )
-
-        # Process child elements
+        path = f"{parent_path}/{element.tag}" if parent_path else element.tag
+        self._nodes += 1
+        node = self._nodes
+        # The block's own sub-units wait for its first segment
+        pending = self._markup.attribute_segments(element, path, node)
+
+        # Text up to the first block child belongs to the element itself, later runs are tail text
+        run, label = _InlineRun(self._markup, path, node, self._skipped), element.tag
+        run.text(element.text)
         for child in element:
-            segments.extend(self._extract_segments(child))
+            if not isinstance(child.tag, str):
+                pass  # comments and processing instructions keep the text around them together
+            elif _is_inline(child):
+                run.element(child)
+            else:
+                self._close_run(run, label, element, segments, pending)
+                run, label = _InlineRun(self._markup, path, node, self._skipped), "text"
+                segments.extend(self._extract_segments(child, path))
+            run.text(child.tail)
+
+        self._close_run(run, label, element, segments, pending)
+        if pending:
+            # The block has no text of its own to hold its sub-units
+            segments[:0] = _unowned(pending)
+        return segments
 
-            # Process tail text
-            if child.tail and child.tail.strip():
-                text = normalize_whitespace(child.tail)
-                if text:
-                    segments.append({"content": text, "translatable": True, "element": "text"})
+    def _skipped(self, element) -> bool:
+        """Return whether an element's content is left out of translation.
 
-        return segments
+        Comments, processing instructions, ``SKIPPED_TAGS``, ITS
+        ``translate="no"`` and elements with a configured skip class qualify;
+        the check reads only the element itself, so a skipped block subtree
+        is never walked.
+        """
+        if not isinstance(element.tag, str):
+            return True
+        if element.tag in SKIPPED_TAGS or element.get("translate") == "no":
+            return True
+        return bool(self._skip_classes) and not self._skip_classes.isdisjoint(element.get("class", "").split())
+
+    @staticmethod
+    def _close_run(
+        run: _InlineRun, label: str, owner, segments: list[dict[str, Any]], pending: list[dict[str, Any]]
+    ) -> None:
+        """Append a run's segment, if it has text, followed by the sub-units it owns.
+
+        ``pending`` holds the block's sub-units until its first segment and is
+        emptied once they are placed. A run without text has no unit to own
+        the sub-units of its inline elements, so they are appended unowned.
+        """
+        segment = run.segment(label, owner)
+        if segment is None:
+            segments.extend(_unowned(run.attributes))
+            return
+        segments.append(segment)
+        segments.extend(pending)
+        pending.clear()
+        segments.extend(run.attributes)
 
     def _extract_structure(self, element) -> dict[str, Any]:
         """Extract document structure for skeleton preservation.
@@ -0,0 +1,436 @@
+"""Quality checks for translated XLIFF.
+
+Units are streamed with ``iterparse`` and reduced to compact rows: their
+plain source and target text and the inline codes of each side. Rows are
+checked in fixed-size chunks, by worker processes when ``parallel`` is
+above one; at most two chunks per worker are in flight, so memory stays
+bounded for files of any size, and chunk results are collected in
+submission order, so reports are identical to a serial run. All patterns
+are compiled at import.
+
+Checks (``CHECKS``):
+
+- ``tags``: the target has the same inline codes (kind and ID) as the source
+- ``placeholders``: the same ``{name}``, ``{{name}}``, ``${name}``,
+  ``%s``/``%(name)s`` placeholders and literal HTML tags in the text
+- ``numbers``: the same numbers, ignoring group and decimal separators
+- ``urls``: the same URLs
+- ``whitespace``: the same leading and trailing whitespace
+- ``untranslated``: a target exists and differs from a source with letters
+- ``length``: the target/source length ratio is within bounds
+"""
+# this_file: src/vexy_markliff/core/qa.py
+
+import re
+from collections import Counter, deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import IO, Any
+
+from lxml import etree
+
+from vexy_markliff.core.streaming import file_context, iterparse_xliff, local_name, release
+from vexy_markliff.exceptions import ParsingError, ValidationError
+from vexy_markliff.formats.columnar import write_jsonl
+from vexy_markliff.utils import atomic_open, get_logger
+
+logger = get_logger(__name__)
+
+CHECKS = ("tags", "placeholders", "numbers", "urls", "whitespace", "untranslated", "length")
+
+DEFAULT_CHUNK_SIZE = 2000
+DEFAULT_MIN_RATIO = 0.5
+DEFAULT_MAX_RATIO = 2.0
+# Sources shorter than this are not length-checked; ratios of short strings are noise
+DEFAULT_MIN_LENGTH = 20
+
+_UNIT_TAGS = ("{*}unit", "{*}trans-unit")
+_CODE_TAGS = frozenset({"pc", "ph", "sc", "ec", "mrk", "sm", "em", "g", "x", "bx", "ex", "bpt", "ept", "it"})
+
+_URL_RE = re.compile(r"(?:https?://|www\.)[^\s<>\"']+")
+_URL_TRAILER = ".,;:!?)]}'\""
+_NUMBER_RE = re.compile(r"\d+(?:[.,]\d+)*")
+_SEPARATORS = str.maketrans("", "", ".,")
+_PLACEHOLDER_RE = re.compile(
+    r"\{\{\s*[\w.]+\s*\}\}"  # {{name}}
+    r"|\$\{[\w.]+\}"  # ${name}
+    r"|\{[\w.]*\}"  # {name}, {0}, {}
+    r"|%(?:\(\w+\)|\d+\$)?[sdif]"  # %s, %(name)s, %1$s
+    r"|</?[A-Za-z][\w-]*(?:\s[^<>]*)?/?>"  # literal HTML tags
+)
+_LETTER_RE = re.compile(r"[^\W\d_]")
+
+# (file id, unit id, source, target, source codes, target codes); codes are (kind, id) pairs
+_Row = tuple[str, str, str, str | None, tuple[tuple[str, str], ...], tuple[tuple[str, str], ...]]
+# (check, file id, unit id, message)
+_Finding = tuple[str, str, str, str]
+
+
+@dataclass
+class QAIssue:
+    """One finding of a check."""
+
+    check: str
+    file_id: str
+    unit_id: str
+    message: str
+
+
+@dataclass
+class QAReport:
+    """Findings of a QA run, in unit order."""
+
+    units: int = 0
+    issues: list[QAIssue] = field(default_factory=list)
+
+    @property
+    def counts(self) -> Counter:
+        """Number of findings per check."""
+        return Counter(issue.check for issue in self.issues)
+
+    def to_dict(self, *, details: bool = False) -> dict[str, Any]:
+        """Return the report as a plain dict.
+
+        Args:
+            details: Include every finding
+
+        Returns:
+            Unit total, number of units with findings and findings per check
+        """
+        counts = self.counts
+        report: dict[str, Any] = {
+            "units": self.units,
+            "flagged_units": len({(issue.file_id, issue.unit_id) for issue in self.issues}),
+        }
+        report.update({check: counts[check] for check in CHECKS})
+        if details:
+            report["issues"] = [asdict(issue) for issue in self.issues]
+        return report
+
+
+@dataclass(frozen=True)
+class _Settings:
+    """Check selection and thresholds, sent to workers with every chunk."""
+
+    checks: tuple[str, ...] = CHECKS
+    min_ratio: float = DEFAULT_MIN_RATIO
+    max_ratio: float = DEFAULT_MAX_RATIO
+    min_length: int = DEFAULT_MIN_LENGTH
+
+
+def _multiset_message(what: str, source: list[str], target: list[str]) -> str | None:
+    """Describe how two lists differ as multisets, or return None if they hold the same items."""
+    if source == target:
+        return None
+    missing, extra = Counter(source), Counter(target)
+    missing.subtract(target)
+    extra.subtract(source)
+    parts = []
+    if +missing:
+        parts.append("missing " + ", ".join(sorted((+missing).elements())))
+    if +extra:
+        parts.append("extra " + ", ".join(sorted((+extra).elements())))
+    return f"{what} differ: {'; '.join(parts)}" if parts else None
+
+
+def _check_tags(row: _Row) -> str | None:
+    source_codes, target_codes = row[4], row[5]
+    if source_codes == target_codes:
+        return None
+    return _multiset_message(
+        "Inline codes",
+        [f"<{kind} id={code_id}>" for kind, code_id in source_codes],
+        [f"<{kind} id={code_id}>" for kind, code_id in target_codes],
+    )
+
+
+def _check_placeholders(row: _Row) -> str | None:
+    return _multiset_message("Placeholders", _PLACEHOLDER_RE.findall(row[2]), _PLACEHOLDER_RE.findall(row[3]))
+
+
+def _numbers(text: str) -> list[str]:
+    if "://" in text or "www." in text:
+        text = _URL_RE.sub(" ", text)
+    return _NUMBER_RE.findall(text)
+
+
+def _check_numbers(row: _Row) -> str | None:
+    source, target = _numbers(row[2]), _numbers(row[3])
+    if source == target:
+        return None
+    # 1,000.5 and 1.000,5 are the same number
+    return _multiset_message(
+        "Numbers", [n.translate(_SEPARATORS) for n in source], [n.translate(_SEPARATORS) for n in target]
+    )
+
+
+def _urls(text: str) -> list[str]:
+    if "://" not in text and "www." not in text:
+        return []
+    return [url.rstrip(_URL_TRAILER) for url in _URL_RE.findall(text)]
+
+
+def _check_urls(row: _Row) -> str | None:
+    return _multiset_message("URLs", _urls(row[2]), _urls(row[3]))
+
+
+def _check_whitespace(row: _Row) -> str | None:
+    source, target = row[2], row[3]
+    sides = []
+    if source[:1].isspace() != target[:1].isspace():
+        sides.append("Leading")
+    if source[-1:].isspace() != target[-1:].isspace():
+        sides.append("trailing" if sides else "Trailing")
+    return f"{' and '.join(sides)} whitespace differs" if sides else None
+
+
+def _check_untranslated(row: _Row) -> str | None:
+    source, target = row[2], row[3]
+    if target is None or not target.strip():
+        return "No translation"
+    if target.strip() == source.strip() and _LETTER_RE.search(source):
+        return "Target is identical to source"
+    return None
+
+
+def _check_length(row: _Row, settings: _Settings) -> str | None:
+    source_length = len(row[2])
+    if source_length < settings.min_length:
+        return None
+    ratio = len(row[3]) / source_length
+    if settings.min_ratio <= ratio <= settings.max_ratio:
+        return None
+    return f"Length ratio {ratio:.2f} outside {settings.min_ratio:g}-{settings.max_ratio:g}"
+
+
+# Checks of the row alone; ``length`` also needs the settings' thresholds
+_CHECK_FUNCTIONS: dict[str, Callable[[_Row], str | None]] = {
+    "tags": _check_tags,
+    "placeholders": _check_placeholders,
+    "numbers": _check_numbers,
+    "urls": _check_urls,
+    "whitespace": _check_whitespace,
+    "untranslated": _check_untranslated,
+}
+
+
+def _check_chunk(task: tuple[list[_Row], _Settings]) -> list[_Finding]:
+    """Run the selected checks over a chunk of rows.
+
+    Args:
+        task: (rows, settings)
+
+    Returns:
+        (check, file id, unit id, message) findings in row order
+    """
+    rows, settings = task
+    untranslated = "untranslated" in settings.checks
+    # Only the untranslated check applies to units without a target
+    text_checks = [
+        (name, partial(_check_length, settings=settings) if name == "length" else _CHECK_FUNCTIONS[name])
+        for name in settings.checks
+        if name != "untranslated"
+    ]
+    findings: list[_Finding] = []
+    for row in rows:
+        if untranslated:
+            message = _check_untranslated(row)
+            if message:
+                findings.append(("untranslated", row[0], row[1], message))
+        if not row[3]:
+            continue
+        for name, check in text_checks:
+            message = check(row)
+            if message:
+                findings.append((name, row[0], row[1], message))
+    return findings
+
+
+def _side(elem: etree._Element | None) -> tuple[str | None, tuple[tuple[str, str], ...]]:
+    """Return the text and inline codes of a source or target, or (None, ()) if absent."""
+    if elem is None:
+        return None, ()
+    if not len(elem):
+        return elem.text or "", ()
+    codes = tuple(
+        (name, code.get("id", "")) for code in elem.iterdescendants() if (name := local_name(code.tag)) in _CODE_TAGS
+    )
+    return "".join(elem.itertext()), codes
+
+
+def _container_sides(container: etree._Element) -> tuple[etree._Element | None, etree._Element | None]:
+    """Return the ``<source>`` and ``<target>`` children of a trans-unit or segment."""
+    source = target = None
+    for child in container:
+        name = local_name(child.tag)
+        if name == "source":
+            source = child
+        elif name == "target":
+            target = child
+    return source, target
+
+
+def _unit_row(unit: etree._Element, file_id: str) -> _Row | None:
+    """Reduce a unit to a row, or None if it has no source text."""
+    if local_name(unit.tag) == "trans-unit":
+        source_elem, target_elem = _container_sides(unit)
+        source, source_codes = _side(source_elem)
+        if not source:
+            return None
+        target, target_codes = _side(target_elem)
+        return file_id, unit.get("id", ""), source, target, source_codes, target_codes
+
+    # XLIFF 2 units: segments are checked together, as the unit's text
+    sources, targets, source_codes, target_codes = [], [], [], []
+    translated = False
+    for segment in unit:
+        if local_name(segment.tag) != "segment":
+            continue
+        source_elem, target_elem = _container_sides(segment)
+        if source_elem is None:
+            continue
+        source, codes = _side(source_elem)
+        target, t_codes = _side(target_elem)
+        sources.append(source)
+        targets.append(target or "")
+        source_codes.extend(codes)
+        target_codes.extend(t_codes)
+        translated = translated or target is not None
+    if not any(sources):
+        return None
+    return (
+        file_id,
+        unit.get("id", ""),
+        " ".join(sources),
+        " ".join(targets) if translated else None,
+        tuple(source_codes),
+        tuple(target_codes),
+    )
+
+
+def _iter_rows(source: str | Path | IO[bytes]) -> Iterator[_Row]:
+    """Stream the rows of an XLIFF file's units with source text."""
+    container, file_id = None, ""
+    try:
+        for _, elem in iterparse_xliff(source, events=("end",), tag=_UNIT_TAGS):
+            parent = elem.getparent()
+            if parent is not container:
+                container = parent
+                file_id = file_context(parent)[0]
+            row = _unit_row(elem, file_id)
+            release(elem)
+            if row is not None:
+                yield row
+    except etree.XMLSyntaxError as e:
+        msg = f"Invalid XLIFF XML in {source}: {e}"
+        raise ParsingError(msg) from e
+
+
+def _chunks(rows: Iterable[_Row], size: int) -> Iterator[list[_Row]]:
+    chunk: list[_Row] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class QAChecker:
+    """Run translation quality checks over XLIFF files."""
+
+    def __init__(
+        self,
+        checks: Iterable[str] | None = None,
+        *,
+        parallel: int = 1,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        min_ratio: float = DEFAULT_MIN_RATIO,
+        max_ratio: float = DEFAULT_MAX_RATIO,
+        min_length: int = DEFAULT_MIN_LENGTH,
+    ) -> None:
+        """Initialize the checker.
+
+        Args:
+            checks: Checks to run (default: all of ``CHECKS``)
+            parallel: Number of worker processes (1 checks in-process)
+            chunk_size: Units per worker task
+            min_ratio: Lowest accepted target/source length ratio
+            max_ratio: Highest accepted target/source length ratio
+            min_length: Shortest source (in characters) that is length-checked
+
+        Raises:
+            ValidationError: If a check is unknown or the ratio bounds are inverted
+        """
+        selected = tuple(checks) if checks is not None else CHECKS
+        unknown = [name for name in selected if name not in CHECKS]
+        if unknown:
+            msg = f"Unknown QA check: {', '.join(unknown)}. Use any of {', '.join(CHECKS)}"
+            raise ValidationError(msg)
+        if min_ratio > max_ratio:
+            msg = f"min_ratio {min_ratio} is above max_ratio {max_ratio}"
+            raise ValidationError(msg)
+        self.settings = _Settings(selected, min_ratio, max_ratio, min_length)
+        self.parallel = max(1, parallel)
+        self.chunk_size = max(1, chunk_size)
+
+    def check(self, source: str | Path | IO[bytes]) -> QAReport:
+        """Check every unit of an XLIFF file.
+
+        Args:
+            source: XLIFF file path or binary file object
+
+        Returns:
+            QAReport with the findings in unit order
+
+        Raises:
+            ParsingError: If the XLIFF is malformed
+        """
+        report = QAReport()
+
+        def counted(rows: Iterator[_Row]) -> Iterator[_Row]:
+            for row in rows:
+                report.units += 1
+                yield row
+
+        tasks = ((chunk, self.settings) for chunk in _chunks(counted(_iter_rows(source)), self.chunk_size))
+        for findings in self._results(tasks):
+            report.issues.extend(QAIssue(*finding) for finding in findings)
+        return report
+
+    def _results(self, tasks: Iterator[tuple[list[_Row], _Settings]]) -> Iterator[list[_Finding]]:
+        """Check chunks in order, keeping at most two chunks per worker in flight."""
+        if self.parallel == 1:
+            yield from map(_check_chunk, tasks)
+            return
+        with ProcessPoolExecutor(max_workers=self.parallel) as pool:
+            pending: deque = deque()
+            for task in tasks:
+                pending.append(pool.submit(_check_chunk, task))
+                if len(pending) >= self.parallel * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+
+def qa_file(source: str | Path, output_file: str | Path | None = None, checker: QAChecker | None = None) -> QAReport:
+    """Check an XLIFF file, optionally writing the findings as JSON Lines.
+
+    Args:
+        source: XLIFF file to check
+        output_file: Optional JSON Lines file receiving one line per finding
+        checker: Configured checker (default: all checks, in-process)
+
+    Returns:
+        QAReport of the file
+    """
+    report = (checker or QAChecker()).check(source)
+    if output_file is not None:
+        with atomic_open(output_file, "wb") as out:
+            write_jsonl((asdict(issue) for issue in report.issues), out)
+    logger.info(f"Checked {report.units} units of {source}: {len(report.issues)} findings")
+    return report
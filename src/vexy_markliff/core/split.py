@@ -0,0 +1,419 @@
+"""Word-count-balanced splitting and joining of XLIFF files.
+
+Splitting streams a document twice: the first pass counts source words per
+unit, the second writes every unit verbatim into its part. Parts are cut at
+unit boundaries only and keep the enclosing ``<file>``/``<group>`` elements
+of their units, so each part is a complete XLIFF document. The part number,
+part count and source file name are recorded in a processing instruction
+before each part's root, which lets ``join`` restore the original order,
+IDs and structure without touching the XLIFF markup. A file-level
+``<originalData>`` table of inline markup is repeated in every part that
+holds units of its file and written once on join. Both directions hold
+one unit in memory at a time.
+"""
+# this_file: src/vexy_markliff/core/split.py
+
+import re
+from collections.abc import Iterable, Iterator
+from contextlib import ExitStack
+from copy import deepcopy
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import IO, NamedTuple
+from xml.sax.saxutils import quoteattr, unescape
+
+from lxml import etree
+
+from vexy_markliff.core.analysis import count_words
+from vexy_markliff.core.streaming import UNIT_TAGS, iterparse_xliff, local_name, release, xml_writer
+from vexy_markliff.exceptions import ParsingError, ValidationError
+from vexy_markliff.utils import atomic_open, get_logger
+
+logger = get_logger(__name__)
+
+# Processing instruction carrying part metadata, e.g. <?vexy-markliff-split part="1" parts="4" source="a.xlf"?>
+SPLIT_PI = "vexy-markliff-split"
+
+# File-level elements carried over with the units that follow them
+_PASSTHROUGH = frozenset({"notes", "header", "skeleton", "originalData"})
+# File-level inline code table: repeated in every part that holds units of its file, written once on join
+_DATA_TABLE = "originalData"
+_EVENT_TAGS = tuple(f"{{*}}{name}" for name in (*UNIT_TAGS, *_PASSTHROUGH))
+# lxml writes namespace declarations right after the tag name, before the attributes
+_DECLARATIONS_RE = re.compile(rb'<[^\s/>]+((?: xmlns(?::[^=\s]+)?="[^"]*")+)')
+_XMLNS_RE = re.compile(rb' xmlns(?::([^=\s]+))?="([^"]*)"')
+
+
+@dataclass
+class SplitStats:
+    """Counters for a split or join run."""
+
+    parts: int = 0
+    units: int = 0
+    words: int = 0
+
+
+def unit_words(unit: etree._Element) -> int:
+    """Count the source words of a unit (segments only, not ignorables or candidates).
+
+    Args:
+        unit: ``<unit>`` or ``<trans-unit>`` element
+
+    Returns:
+        Word count of the unit's source text
+    """
+    words = 0
+    for child in unit:
+        name = local_name(child.tag)
+        if name == "source":
+            words += count_words("".join(child.itertext()))
+        elif name == "segment":
+            for part in child:
+                if local_name(part.tag) == "source":
+                    words += count_words("".join(part.itertext()))
+    return words
+
+
+class _Root(NamedTuple):
+    """Root element of a document and the split metadata preceding it."""
+
+    tag: str
+    attrib: dict[str, str]
+    nsmap: dict[str | None, str]
+    part: dict[str, str]
+
+
+def _read_root(source: str | Path) -> _Root:
+    """Read a document's root element and any split processing instruction before it."""
+    part: dict[str, str] = {}
+    try:
+        for event, elem in iterparse_xliff(source, events=("pi", "start")):
+            if event == "start":
+                return _Root(elem.tag, dict(elem.attrib), dict(elem.nsmap), part)
+            if elem.target == SPLIT_PI:
+                part = {key: elem.get(key) for key in ("part", "parts", "source") if elem.get(key) is not None}
+    except etree.XMLSyntaxError as e:
+        msg = f"Invalid XLIFF XML in {source}: {e}"
+        raise ParsingError(msg) from e
+    msg = f"Empty XLIFF document: {source}"
+    raise ParsingError(msg)
+
+
+def _iter_items(source: str | Path) -> Iterator[tuple[list[etree._Element], etree._Element, bool]]:
+    """Stream units and file-level passthrough elements with their container chain.
+
+    Yields:
+        (containers from ``<file>`` down, element, is_unit); the element is
+        released once the consumer resumes the generator
+    """
+    try:
+        for _, elem in iterparse_xliff(source, events=("end",), tag=_EVENT_TAGS):
+            is_unit = local_name(elem.tag) in UNIT_TAGS
+            chain = []
+            parent = elem.getparent()
+            inside_unit = False
+            while parent is not None and parent.getparent() is not None:
+                if local_name(parent.tag) in UNIT_TAGS:
+                    inside_unit = True
+                    break
+                chain.append(parent)
+                parent = parent.getparent()
+            # Notes of a unit are written with the unit itself
+            if inside_unit:
+                continue
+            chain.reverse()
+            yield chain, elem, is_unit
+            release(elem)
+    except etree.XMLSyntaxError as e:
+        msg = f"Invalid XLIFF XML in {source}: {e}"
+        raise ParsingError(msg) from e
+
+
+def _container_key(elem: etree._Element) -> tuple[str, tuple[tuple[str, str], ...]]:
+    """Identify a container element by its tag and attributes."""
+    return elem.tag, tuple(elem.attrib.items())
+
+
+def _declared(elem: etree._Element) -> dict[str | None, str]:
+    """Return the namespace declarations an element adds to its parent's scope."""
+    parent = elem.getparent()
+    inherited = parent.nsmap if parent is not None else {}
+    return {prefix: uri for prefix, uri in elem.nsmap.items() if inherited.get(prefix) != uri}
+
+
+# Namespace scope of the output as hashable (prefix, URI) pairs
+_Scope = tuple[tuple[str | None, str], ...]
+
+
+@lru_cache(maxsize=64)
+def _undeclared(declarations: bytes, scope: _Scope) -> bytes:
+    """Drop the declarations of a start tag that ``scope`` already makes."""
+    in_scope = dict(scope)
+
+    def inherited(match: re.Match[bytes]) -> bytes:
+        prefix = match.group(1).decode() if match.group(1) else None
+        return b"" if in_scope.get(prefix) == unescape(match.group(2).decode(), {"&quot;": '"'}) else match.group(0)
+
+    return _XMLNS_RE.sub(inherited, declarations)
+
+
+def _serialize(elem: etree._Element, scope: _Scope) -> bytes:
+    """Serialize an element with its tail, minus the namespace declarations in ``scope``.
+
+    lxml declares every namespace a subtree uses on the subtree's first tag,
+    so each unit would repeat the document root's declarations; those that
+    match the declarations in effect in the output are dropped. Units share
+    a handful of declaration blocks, so the rewrite is cached per block.
+    """
+    raw = etree.tostring(elem, encoding="utf-8", with_tail=True)
+    match = _DECLARATIONS_RE.match(raw)
+    if match is None:
+        return raw
+    return b"".join((raw[: match.start(1)], _undeclared(match.group(1), scope), raw[match.end(1) :]))
+
+
+class _StructureWriter:
+    """Writes units into an output document, reopening their containers as needed."""
+
+    def __init__(self, out: IO[bytes], root: "_Root", part: dict[str, str] | None = None):
+        self._stack = ExitStack()
+        self._out = out
+        self._xf = self._stack.enter_context(xml_writer(out))
+        if part:
+            pseudo = " ".join(f"{key}={quoteattr(value)}" for key, value in part.items())
+            pi = etree.ProcessingInstruction(SPLIT_PI, pseudo)
+            pi.tail = "\n"
+            self._xf.write(pi)
+        self._stack.enter_context(self._xf.element(root.tag, root.attrib, nsmap=root.nsmap))
+        self._xf.write("\n")
+        self._root_scope: _Scope = tuple(root.nsmap.items())
+        # (container key, open element, namespaces in scope inside it) per open container
+        self._open: list[tuple[tuple[str, tuple[tuple[str, str], ...]], ExitStack, _Scope]] = []
+
+    def write(self, chain: list[etree._Element], elem: etree._Element) -> None:
+        """Write ``elem`` inside containers matching ``chain``."""
+        keys = [_container_key(c) for c in chain]
+        common = 0
+        while common < min(len(keys), len(self._open)) and self._open[common][0] == keys[common]:
+            common += 1
+        self._close_to(common)
+        for container, key in zip(chain[common:], keys[common:], strict=True):
+            declared = _declared(container)
+            scope = ExitStack()
+            scope.enter_context(self._xf.element(container.tag, dict(container.attrib), nsmap=declared))
+            self._xf.write("\n")
+            self._open.append((key, scope, tuple({**dict(self._scope()), **declared}.items())))
+        # Units are copied as serialized bytes; the writer's buffer goes out first to keep the order
+        self._xf.flush()
+        self._out.write(_serialize(elem, self._scope()))
+
+    def _scope(self) -> _Scope:
+        """Return the namespaces declared at the current output position."""
+        return self._open[-1][2] if self._open else self._root_scope
+
+    def _close_to(self, depth: int) -> None:
+        while len(self._open) > depth:
+            _, scope, _ = self._open.pop()
+            scope.close()
+            self._xf.write("\n")
+
+    def close(self) -> None:
+        """Close open containers and the document."""
+        self._close_to(0)
+        self._stack.close()
+
+
+class _PartAssigner:
+    """Assigns consecutive units to parts, either balanced or by a word budget."""
+
+    def __init__(self, parts: int | None, max_words: int | None, total_words: int = 0, total_units: int = 0):
+        self.parts = min(parts, total_units) if parts else None
+        self.max_words = max_words
+        self.total_words = total_words
+        self.total_units = total_units
+        self.current = 0
+        self.part_words = 0
+        self.part_units = 0
+        self.seen_words = 0
+        self.seen_units = 0
+
+    def assign(self, words: int) -> int:
+        """Return the 0-based part of the next unit."""
+        if self.part_units:
+            if self.parts:
+                # Place the unit by the position of its midpoint in the word stream
+                if self.total_words:
+                    desired = int((self.seen_words + words / 2) * self.parts / self.total_words)
+                else:
+                    desired = self.seen_units * self.parts // self.total_units
+                must_advance = self.total_units - self.seen_units <= self.parts - 1 - self.current
+                if (desired > self.current or must_advance) and self.current < self.parts - 1:
+                    self._advance()
+            elif self.part_words + words > self.max_words:
+                self._advance()
+        self.part_words += words
+        self.part_units += 1
+        self.seen_words += words
+        self.seen_units += 1
+        return self.current
+
+    def _advance(self) -> None:
+        self.current += 1
+        self.part_words = self.part_units = 0
+
+
+def part_path(source: Path, output_dir: Path, index: int, count: int) -> Path:
+    """Return the path of part ``index`` (1-based) of ``count``."""
+    width = max(3, len(str(count)))
+    return output_dir / f"{source.stem}.part{index:0{width}d}{source.suffix or '.xlf'}"
+
+
+def split_xliff(
+    source: str | Path, output_dir: str | Path, parts: int | None = None, max_words: int | None = None
+) -> list[Path]:
+    """Split an XLIFF file into parts of balanced source word counts.
+
+    Args:
+        source: XLIFF file to split (read twice)
+        output_dir: Directory receiving the parts
+        parts: Number of roughly equal parts
+        max_words: Alternatively, the word budget per part; a unit larger
+            than the budget gets a part of its own
+
+    Returns:
+        Paths of the written parts in order
+
+    Raises:
+        ValidationError: If not exactly one of ``parts``/``max_words`` is a positive number
+        ParsingError: If the XML is malformed
+    """
+    if (parts is None) == (max_words is None) or (parts or max_words or 0) < 1:
+        msg = "Give either parts or max_words as a positive number"
+        raise ValidationError(msg)
+    source = Path(source)
+    output_dir = Path(output_dir)
+    root = _read_root(source)
+
+    # Pass 1: totals for balancing, and the part count for the word budget
+    total_words = total_units = 0
+    budget = _PartAssigner(None, max_words) if max_words else None
+    for _, elem, is_unit in _iter_items(source):
+        if is_unit:
+            words = unit_words(elem)
+            total_words += words
+            total_units += 1
+            if budget is not None:
+                budget.assign(words)
+    if total_units == 0:
+        msg = f"No translation units to split in {source}"
+        raise ValidationError(msg)
+    count = budget.current + 1 if budget is not None else min(parts, total_units)
+
+    # Pass 2: write every unit into its part
+    output_dir.mkdir(parents=True, exist_ok=True)
+    paths = [part_path(source, output_dir, i, count) for i in range(1, count + 1)]
+    assigner = _PartAssigner(parts, max_words, total_words, total_units)
+    current = -1
+    writer: _StructureWriter | None = None
+    part_scope: ExitStack | None = None
+    tables: dict[tuple, etree._Element] = {}
+    with ExitStack() as files:
+        for chain, elem, is_unit in _iter_items(source):
+            index = assigner.assign(unit_words(elem)) if is_unit else max(current, 0)
+            if index != current:
+                # Close the previous part before opening the next
+                if writer is not None and part_scope is not None:
+                    writer.close()
+                    part_scope.close()
+                part_scope = files.enter_context(ExitStack())
+                out = part_scope.enter_context(atomic_open(paths[index], "wb"))
+                part = {"part": str(index + 1), "parts": str(count), "source": source.name}
+                writer = _StructureWriter(out, root, part)
+                current = index
+                if is_unit and chain and _container_key(chain[0]) in tables:
+                    writer.write(chain[:1], tables[_container_key(chain[0])])
+            if local_name(elem.tag) == _DATA_TABLE and chain:
+                tables[_container_key(chain[0])] = deepcopy(elem)
+            writer.write(chain, elem)
+        if writer is not None:
+            writer.close()
+    logger.info(f"Split {total_units} units ({total_words} words) of {source} into {count} parts")
+    return paths
+
+
+def join_xliff(parts: Iterable[str | Path], out: IO[bytes]) -> SplitStats:
+    """Reassemble the parts written by ``split_xliff`` into one document.
+
+    Parts may be given in any order; they are validated to form one
+    complete set and joined in part order, merging the containers a split
+    cut in two.
+
+    Args:
+        parts: Part files
+        out: Binary stream receiving the joined document
+
+    Returns:
+        SplitStats with part, unit and word counts
+
+    Raises:
+        ValidationError: If parts are missing, duplicated or from different sources
+        ParsingError: If a part is malformed
+    """
+    headers: dict[int, tuple[Path, _Root]] = {}
+    sources, counts = set(), set()
+    for part in parts:
+        path = Path(part)
+        root = _read_root(path)
+        try:
+            index = int(root.part["part"])
+            counts.add(int(root.part["parts"]))
+        except (KeyError, ValueError) as e:
+            msg = f"{path} is not a part written by split"
+            raise ValidationError(msg) from e
+        sources.add(root.part.get("source"))
+        if index in headers:
+            msg = f"Part {index} given twice: {headers[index][0]} and {path}"
+            raise ValidationError(msg)
+        headers[index] = (path, root)
+    if len(sources) > 1 or len(counts) > 1:
+        msg = f"Parts come from different splits: {sorted(map(str, sources))}"
+        raise ValidationError(msg)
+    count = counts.pop() if counts else 0
+    missing = sorted(set(range(1, count + 1)) - set(headers))
+    if not headers or missing:
+        msg = f"Missing parts: {missing or 'all'}"
+        raise ValidationError(msg)
+
+    stats = SplitStats(parts=count)
+    writer = _StructureWriter(out, headers[1][1])
+    tables: set[tuple] = set()
+    for index in range(1, count + 1):
+        for chain, elem, is_unit in _iter_items(headers[index][0]):
+            if is_unit:
+                stats.units += 1
+                stats.words += unit_words(elem)
+            elif local_name(elem.tag) == _DATA_TABLE and chain:
+                # Parts after the first repeat their file's table
+                if _container_key(chain[0]) in tables:
+                    continue
+                tables.add(_container_key(chain[0]))
+            writer.write(chain, elem)
+    writer.close()
+    return stats
+
+
+def join_files(parts: Iterable[str | Path], output_file: str | Path) -> SplitStats:
+    """Join split parts into an XLIFF file, writing it atomically.
+
+    Args:
+        parts: Part files
+        output_file: Path of the joined document
+
+    Returns:
+        SplitStats with part, unit and word counts
+    """
+    with atomic_open(output_file, "wb") as out:
+        stats = join_xliff(parts, out)
+    logger.info(f"Joined {stats.parts} parts ({stats.units} units) into {output_file}")
+    return stats
@@ -0,0 +1,331 @@
+"""Streaming XML reading and writing built on lxml.
+
+Reads XLIFF units one at a time in constant memory, so multi-GB files can be
+processed without materializing an ``XLIFFDocument``. Both XLIFF 2.x
+(``<unit>``/``<segment>``, ``srcLang``/``trgLang``) and 1.2-style
+(``<trans-unit>``, ``source-language``/``target-language``) layouts are
+understood. The same hardened iterparse and an incremental ``xmlfile``
+writer are shared by the other XML exchange formats.
+"""
+# this_file: src/vexy_markliff/core/streaming.py
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, NamedTuple
+
+from lxml import etree
+
+from vexy_markliff.exceptions import ParsingError, ValidationError
+from vexy_markliff.models.inline import InlineCode, read_data, read_inline
+from vexy_markliff.models.xliff import ATTRIBUTE_ATTR, OWNER_ATTR
+from vexy_markliff.utils import get_logger
+
+logger = get_logger(__name__)
+
+UNIT_TAGS = frozenset({"unit", "trans-unit"})
+
+# Only unit elements produce iterparse events in iter_units; everything else
+# is handled in C without a round trip through Python
+_UNIT_TAGS = ("{*}unit", "{*}trans-unit")
+
+# Tags seen in real documents are few; the cap keeps hostile input from growing the cache
+_LOCAL_NAMES_MAX = 4096
+_local_names: dict[object, str] = {}
+
+
+def local_name(tag: object) -> str:
+    """Return an element tag without its namespace.
+
+    Args:
+        tag: lxml element tag (comments and PIs have non-string tags)
+
+    Returns:
+        Local tag name, or an empty string for non-elements
+    """
+    name = _local_names.get(tag)
+    if name is None:
+        name = tag.rpartition("}")[2] if isinstance(tag, str) else ""
+        if len(_local_names) < _LOCAL_NAMES_MAX:
+            _local_names[tag] = name
+    return name
+
+
+def element_text(elem: etree._Element | None) -> str | None:
+    """Return the full text of an element including inline descendants.
+
+    Args:
+        elem: Element or None
+
+    Returns:
+        Concatenated text, or None if ``elem`` is None
+    """
+    if elem is None:
+        return None
+    if not len(elem):
+        return elem.text or ""
+    return "".join(elem.itertext())
+
+
+class UnitRecord(NamedTuple):
+    """Lightweight view of one translation unit read from a stream."""
+
+    file_id: str
+    unit_id: str
+    source_lang: str
+    target_lang: str
+    state: str
+    segments: tuple[tuple[str, str | None], ...]
+    original: str = ""
+    # Name of the HTML attribute an attribute sub-unit holds
+    attribute: str | None = None
+    # ID of the unit holding the text of a sub-unit's element
+    owner: str | None = None
+    # Inline codes of each segment's (source, target), parallel to ``segments``
+    codes: tuple[tuple[tuple[InlineCode, ...], tuple[InlineCode, ...]], ...] = ()
+
+    @property
+    def source(self) -> str:
+        """Source text of all segments."""
+        return " ".join(source for source, _ in self.segments)
+
+    @property
+    def target(self) -> str | None:
+        """Target text of all segments, or None if no segment has a target."""
+        if all(target is None for _, target in self.segments):
+            return None
+        return " ".join(target or "" for _, target in self.segments)
+
+    @property
+    def source_codes(self) -> list[InlineCode]:
+        """Inline codes of ``source``, with offsets into the joined text."""
+        return _join_codes([source for source, _ in self.segments], [source for source, _ in self.codes])
+
+    @property
+    def target_codes(self) -> list[InlineCode]:
+        """Inline codes of ``target``, with offsets into the joined text."""
+        return _join_codes([target or "" for _, target in self.segments], [target for _, target in self.codes])
+
+
+def _join_codes(texts: list[str], codes: list[tuple[InlineCode, ...]]) -> list[InlineCode]:
+    """Shift the codes of segment texts joined with single spaces onto the joined text."""
+    if len(codes) <= 1:
+        return list(codes[0]) if codes else []
+    joined: list[InlineCode] = []
+    offset = 0
+    for text, segment_codes in zip(texts, codes, strict=True):
+        joined.extend(
+            code.model_copy(update={"start": code.start + offset, "end": code.end + offset}) for code in segment_codes
+        )
+        offset += len(text) + 1
+    return joined
+
+
+def iterparse_xliff(
+    source: str | Path | IO[bytes],
+    events: tuple[str, ...] = ("start", "end"),
+    tag: tuple[str, ...] | None = None,
+) -> Iterator:
+    """Create a hardened iterparse iterator over an XLIFF file.
+
+    Args:
+        source: File path or binary file object
+        events: Events to report
+        tag: Optional tag filter (``{*}name`` matches any namespace)
+
+    Returns:
+        lxml iterparse iterator
+    """
+    return etree.iterparse(
+        str(source) if isinstance(source, Path) else source,
+        events=events,
+        tag=tag,
+        resolve_entities=False,
+        no_network=True,
+        huge_tree=True,
+        remove_comments=True,
+    )
+
+
+@contextmanager
+def xml_writer(out: IO[bytes], doctype: str | None = None) -> Iterator[etree.xmlfile]:
+    """Open an incremental UTF-8 XML writer.
+
+    Elements are serialized as soon as they are written, so documents of any
+    size are produced without building a tree.
+
+    Args:
+        out: Binary stream to write to
+        doctype: Optional DOCTYPE declaration
+
+    Yields:
+        lxml ``xmlfile`` writer with the XML declaration already written
+    """
+    with etree.xmlfile(out, encoding="utf-8") as xf:
+        xf.write_declaration()
+        if doctype:
+            xf.write_doctype(doctype)
+        yield xf
+
+
+def release(elem: etree._Element) -> None:
+    """Free an element and its already-processed preceding siblings.
+
+    Args:
+        elem: Element whose end event has been handled
+    """
+    elem.clear(keep_tail=False)
+    parent = elem.getparent()
+    if parent is not None:
+        while elem.getprevious() is not None:
+            del parent[0]
+
+
+def _unit_segments(
+    unit: etree._Element, data: dict[str, str]
+) -> tuple[tuple[tuple[str, str | None], ...], tuple[tuple[tuple[InlineCode, ...], tuple[InlineCode, ...]], ...]]:
+    """Extract (source, target) pairs and their inline codes from a unit element.
+
+    Args:
+        unit: ``<unit>`` or ``<trans-unit>`` element
+        data: Payloads of the file's ``<originalData>``; the unit's own
+            table is added to them
+
+    Returns:
+        (segments, codes) as stored in ``UnitRecord``
+    """
+    if local_name(unit.tag) == "trans-unit":
+        containers = [unit]
+    else:
+        containers = [child for child in unit if local_name(child.tag) == "segment"]
+    for child in unit:
+        if local_name(child.tag) == "originalData":
+            data = {**data, **read_data(child)}
+    segments = []
+    codes = []
+    for container in containers:
+        source_elem = target_elem = None
+        for child in container:
+            name = local_name(child.tag)
+            if name == "source":
+                source_elem = child
+            elif name == "target":
+                target_elem = child
+        if source_elem is None and target_elem is None:
+            continue
+        # ``target`` storage: monolingual target text without a source
+        source, source_codes = _inline(source_elem, data) if source_elem is not None else ("", ())
+        target, target_codes = _inline(target_elem, data) if target_elem is not None else (None, ())
+        segments.append((source, target))
+        codes.append((source_codes, target_codes))
+    return tuple(segments), tuple(codes)
+
+
+def _inline(elem: etree._Element, data: dict[str, str]) -> tuple[str, tuple[InlineCode, ...]]:
+    """Return the plain text and inline codes of a ``<source>`` or ``<target>``.
+
+    Text without child elements skips the code reader. Codes whose markup
+    cannot be resolved are left out rather than failing the stream.
+    """
+    if not len(elem):
+        return elem.text or "", ()
+    try:
+        text, codes = read_inline(elem, data)
+    except ValidationError as e:
+        logger.debug(f"Reading unit text without its inline codes: {e}")
+        return element_text(elem) or "", ()
+    return text, tuple(codes)
+
+
+def iter_units(source: str | Path | IO[bytes]) -> Iterator[UnitRecord]:
+    """Stream translation units from an XLIFF file.
+
+    Args:
+        source: File path or binary file object
+
+    Yields:
+        UnitRecord for each ``<unit>`` / ``<trans-unit>``
+
+    Raises:
+        ParsingError: If the XML is malformed
+    """
+    container = file_elem = None
+    file_id, source_lang, target_lang, original = "", "", "", ""
+    data: dict[str, str] = {}
+    try:
+        for _, elem in iterparse_xliff(source, events=("end",), tag=_UNIT_TAGS):
+            parent = elem.getparent()
+            if parent is not container:
+                container = parent
+                file_id, source_lang, target_lang, original = file_context(parent)
+                # The file's originalData precedes its units and is released with the first of them
+                enclosing = _enclosing_file(parent)
+                if enclosing is not file_elem:
+                    file_elem = enclosing
+                    data = _file_data(enclosing)
+            segments, codes = _unit_segments(elem, data)
+            yield UnitRecord(
+                file_id=file_id,
+                unit_id=elem.get("id", ""),
+                source_lang=source_lang,
+                target_lang=target_lang,
+                state=_unit_state(elem),
+                segments=segments,
+                original=original,
+                attribute=elem.get(ATTRIBUTE_ATTR),
+                owner=elem.get(OWNER_ATTR),
+                codes=codes,
+            )
+            release(elem)
+    except etree.XMLSyntaxError as e:
+        msg = f"Invalid XLIFF XML in {source}: {e}"
+        raise ParsingError(msg) from e
+
+
+def file_context(elem: etree._Element | None) -> tuple[str, str, str, str]:
+    """Resolve (file id, source language, target language, original) for a unit's container.
+
+    Walks up through ``<group>`` elements to the enclosing ``<file>`` and falls
+    back to the root's 2.x ``srcLang``/``trgLang`` attributes.
+    """
+    file_id, source_lang, target_lang, original = "", "", "", ""
+    while elem is not None:
+        name = local_name(elem.tag)
+        if name == "file":
+            file_id = elem.get("id", "")
+            original = elem.get("original", "")
+            source_lang = elem.get("srcLang") or elem.get("source-language") or ""
+            target_lang = elem.get("trgLang") or elem.get("target-language") or ""
+        elif name == "xliff":
+            source_lang = source_lang or elem.get("srcLang", "")
+            target_lang = target_lang or elem.get("trgLang", "")
+        elem = elem.getparent()
+    return file_id, source_lang, target_lang, original
+
+
+def _enclosing_file(elem: etree._Element | None) -> etree._Element | None:
+    """Return the ``<file>`` element holding ``elem``, if any."""
+    while elem is not None and local_name(elem.tag) != "file":
+        elem = elem.getparent()
+    return elem
+
+
+def _file_data(file_elem: etree._Element | None) -> dict[str, str]:
+    """Return the payloads of a file's ``<originalData>`` table."""
+    if file_elem is None:
+        return {}
+    for child in file_elem:
+        if local_name(child.tag) == "originalData":
+            return read_data(child)
+    return {}
+
+
+def _unit_state(unit: etree._Element) -> str:
+    """Return a unit's state from the unit, its first segment (2.x) or its target (1.2)."""
+    state = unit.get("state")
+    if state is None:
+        for child in unit:
+            if local_name(child.tag) in ("segment", "target"):
+                state = child.get("state")
+                break
+    return state or "initial"
@@ -0,0 +1,729 @@
+"""Streaming XLIFF 1.2 ↔ 2.1 transcoder.
+
+Structural elements (``<xliff>``, ``<file>``, ``<group>``) are mirrored as
+iterparse start/end events arrive, and every unit is rewritten on its end
+event and serialized immediately, so memory use is bounded by the largest
+unit. Elements are matched by local name. Each unit is converted according
+to its own layout: 1.2 ``trans-unit`` elements, XLIFF 2 ``unit`` elements,
+and the hybrid layout this package writes (``trans-unit`` elements with
+XLIFF 2 inline codes under a 2.1 namespace, their markup in a file-level
+``<originalData>``). Units already in the requested layout are copied with
+their namespaces normalized.
+
+Mapping summary:
+
+- ``trans-unit`` ↔ ``unit``/``segment``; ``seg-source`` ``<mrk mtype="seg">``
+  ↔ multiple segments and ignorables
+- ``source-language``/``target-language`` on ``<file>`` ↔ ``srcLang``/``trgLang``
+- ``<g>``↔``<pc>``, ``<x>``↔``<ph>``, ``<bx>``/``<ex>``↔``<sc>``/``<ec>``;
+  native-code ``<ph>``/``<bpt>``/``<ept>``/``<it>`` ↔ codes with
+  ``originalData``; a ``<pc>`` with original data becomes a
+  ``<bpt>``/``<ept>`` pair around its content
+- attributes of other namespaces (Format Style, this package's sub-unit
+  attributes) are kept on units and inline codes
+- ``<mrk>``, notes, ``alt-trans`` ↔ ``mtc:matches`` and unit states
+"""
+# this_file: src/vexy_markliff/core/transcode.py
+
+from collections.abc import Callable
+from contextlib import suppress
+from copy import deepcopy
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any
+
+from lxml import etree
+
+from vexy_markliff.core.streaming import iterparse_xliff, local_name, release, xml_writer
+from vexy_markliff.exceptions import ConversionError, ParsingError, ValidationError
+from vexy_markliff.models.inline import read_data
+from vexy_markliff.utils import atomic_open, get_logger
+
+logger = get_logger(__name__)
+
+XLIFF12_NS = "urn:oasis:names:tc:xliff:document:1.2"
+XLIFF2_NS = "urn:oasis:names:tc:xliff:document:2.0"
+MTC_NS = "urn:oasis:names:tc:xliff:matches:2.0"
+VERSIONS = ("1.2", "2.0", "2.1")
+
+# Prefix shared by the 1.2 and 2.x namespaces and the 2.1 namespace of the hybrid layout
+_CORE_NS_PREFIX = "urn:oasis:names:tc:xliff:document:"
+
+# Elements that produce iterparse events; unit content is handled on the unit's end event
+_EVENT_TAGS = tuple(
+    f"{{*}}{name}"
+    for name in ("xliff", "file", "body", "group", "unit", "trans-unit", "bin-unit", "header", "notes", "originalData")
+)
+_UNIT_NAMES = frozenset({"unit", "trans-unit", "bin-unit"})
+
+STATES_12_TO_2 = {
+    "initial": "initial",  # hybrid files mark machine translations with the 2.x state
+    "new": "initial",
+    "needs-translation": "initial",
+    "needs-adaptation": "translated",
+    "needs-l10n": "translated",
+    "needs-review-adaptation": "translated",
+    "needs-review-l10n": "translated",
+    "needs-review-translation": "translated",
+    "translated": "translated",
+    "signed-off": "reviewed",
+    "final": "final",
+}
+STATES_2_TO_12 = {"initial": "new", "translated": "translated", "reviewed": "signed-off", "final": "final"}
+
+# 1.2 mtype values that XLIFF 2 expresses with its own mrk type
+_MRK_TYPES_12 = frozenset({"term", "comment"})
+
+
+@dataclass
+class TranscodeStats:
+    """Counters for a transcoding run."""
+
+    files: int = 0
+    units: int = 0
+    skipped: int = 0
+
+
+def _text(elem: etree._Element | None) -> str:
+    return "".join(elem.itertext()) if elem is not None else ""
+
+
+def _is_core(namespace: str | None) -> bool:
+    """Return whether a namespace is an XLIFF core namespace (or none)."""
+    return namespace is None or namespace.startswith(_CORE_NS_PREFIX)
+
+
+def _foreign_nsmap(elem: etree._Element) -> dict[str, str]:
+    """Return the prefixed non-XLIFF namespaces in scope of ``elem``."""
+    return {prefix: uri for prefix, uri in elem.nsmap.items() if prefix and not _is_core(uri)}
+
+
+def _copy_foreign(src: etree._Element, dst: etree._Element) -> None:
+    """Copy the attributes of ``src`` that belong to other namespaces, e.g. ``fs:fs``."""
+    for key, value in src.attrib.items():
+        if not _is_core(etree.QName(key).namespace):
+            dst.set(key, value)
+
+
+def _normalized(elem: etree._Element) -> etree._Element:
+    """Return a copy of ``elem`` with XLIFF elements unqualified, for output in the same layout."""
+    copy = deepcopy(elem)
+    for node in copy.iter(etree.Element):
+        if _is_core(etree.QName(node).namespace):
+            node.tag = etree.QName(node).localname
+    etree.cleanup_namespaces(copy)
+    return copy
+
+
+def _append_text(parent: etree._Element, text: str | None) -> None:
+    """Append text after the last child of ``parent`` (or to its text)."""
+    if not text:
+        return
+    if len(parent):
+        last = parent[-1]
+        last.tail = (last.tail or "") + text
+    else:
+        parent.text = (parent.text or "") + text
+
+
+class _UnitContext:
+    """Per-unit state shared by the inline converters."""
+
+    def __init__(self) -> None:
+        self.data: list[tuple[str, str]] = []
+        self.data_by_id: dict[str, str] = {}
+        self.rids: dict[str, str] = {}
+        # Input data ID -> unit data ID, so shared file-level data is copied once per unit
+        self.refs: dict[str, str] = {}
+        self.counter = 0
+
+    def add_data(self, native: str) -> str:
+        data_id = f"d{len(self.data) + 1}"
+        self.data.append((data_id, native))
+        return data_id
+
+    def next_id(self, prefix: str) -> str:
+        self.counter += 1
+        return f"{prefix}{self.counter}"
+
+
+# --------------------------------------------------------------------------- 1.2 → 2
+
+
+def _pair_key(end: etree._Element) -> str:
+    """Return the key pairing an ``<ept>``/``<ex>`` with its start: ``rid``, or ``id`` when absent."""
+    return end.get("rid") or end.get("id", "")
+
+
+def _inline_to_2(src: etree._Element, dst: etree._Element, ctx: _UnitContext) -> None:
+    """Copy 1.2 inline content of ``src`` into ``dst`` as XLIFF 2 markup."""
+    _append_text(dst, src.text)
+    for child in src:
+        name = local_name(child.tag)
+        code_id = child.get("id") or ctx.next_id("c")
+        first = len(dst)
+        if name == "g":
+            pc = etree.SubElement(dst, "pc", id=code_id)
+            _inline_to_2(child, pc, ctx)
+        elif name == "x":
+            etree.SubElement(dst, "ph", id=code_id)
+        elif name == "bx":
+            ctx.rids[child.get("rid") or code_id] = code_id
+            etree.SubElement(dst, "sc", id=code_id)
+        elif name == "ex":
+            start = ctx.rids.get(_pair_key(child))
+            if start is not None:
+                etree.SubElement(dst, "ec", startRef=start)
+            else:
+                etree.SubElement(dst, "ec", id=code_id, isolated="yes")
+        elif name == "ph":
+            etree.SubElement(dst, "ph", id=code_id, dataRef=ctx.add_data(_text(child)))
+        elif name == "bpt":
+            ctx.rids[child.get("rid") or code_id] = code_id
+            etree.SubElement(dst, "sc", id=code_id, dataRef=ctx.add_data(_text(child)))
+        elif name == "ept":
+            data_ref = ctx.add_data(_text(child))
+            start = ctx.rids.get(_pair_key(child))
+            if start is not None:
+                etree.SubElement(dst, "ec", startRef=start, dataRef=data_ref)
+            else:
+                etree.SubElement(dst, "ec", id=code_id, isolated="yes", dataRef=data_ref)
+        elif name == "it":
+            tag = "sc" if child.get("pos") == "open" else "ec"
+            etree.SubElement(dst, tag, id=code_id, isolated="yes", dataRef=ctx.add_data(_text(child)))
+        elif name == "mrk":
+            mtype = child.get("mtype", "")
+            mrk = etree.SubElement(dst, "mrk", id=child.get("mid") or ctx.next_id("m"))
+            if mtype == "protected":
+                mrk.set("translate", "no")
+            else:
+                mrk.set("type", mtype if mtype in _MRK_TYPES_12 else "generic")
+                if mtype == "comment" and child.get("comment"):
+                    mrk.set("value", child.get("comment"))
+            _inline_to_2(child, mrk, ctx)
+        else:
+            # Unknown wrappers are dropped but their text is kept
+            _inline_to_2(child, dst, ctx)
+            _append_text(dst, child.tail)
+            continue
+        if len(dst) > first:
+            _copy_foreign(child, dst[first])
+        _append_text(dst, child.tail)
+
+
+def _inline_2_to_2(src: etree._Element, dst: etree._Element, ctx: _UnitContext) -> None:
+    """Copy XLIFF 2 inline content of a hybrid unit, moving its data into the unit's ``originalData``."""
+    _append_text(dst, src.text)
+    for child in src:
+        if not isinstance(child.tag, str):
+            continue
+        code = etree.SubElement(dst, local_name(child.tag))
+        for key, value in child.attrib.items():
+            if key in ("dataRef", "dataRefStart", "dataRefEnd"):
+                if value not in ctx.refs and value in ctx.data_by_id:
+                    ctx.refs[value] = ctx.add_data(ctx.data_by_id[value])
+                if value in ctx.refs:
+                    code.set(key, ctx.refs[value])
+            else:
+                code.set(key, value)
+        _inline_2_to_2(child, code, ctx)
+        _append_text(dst, child.tail)
+
+
+# Converts the inline content of one source or target
+_Inline = Callable[[etree._Element, etree._Element, _UnitContext], None]
+
+
+def _unit_to_2(
+    tu: etree._Element, inline: _Inline = _inline_to_2, data: dict[str, str] | None = None
+) -> etree._Element:
+    """Rewrite a ``<trans-unit>`` as an XLIFF 2 ``<unit>``.
+
+    Args:
+        tu: 1.2 or hybrid unit
+        inline: Converter of its inline content: ``_inline_to_2`` for 1.2
+            markup, ``_inline_2_to_2`` for the hybrid layout
+        data: File-level original data referenced by hybrid inline codes
+
+    Returns:
+        Unqualified ``<unit>`` element
+    """
+    ctx = _UnitContext()
+    ctx.data_by_id = dict(data or {})
+    unit = etree.Element("unit", id=tu.get("id", ""), nsmap=_foreign_nsmap(tu))
+    if tu.get("resname"):
+        unit.set("name", tu.get("resname"))
+    if tu.get("translate"):
+        unit.set("translate", tu.get("translate"))
+    _copy_foreign(tu, unit)
+
+    source = seg_source = target = None
+    notes: list[etree._Element] = []
+    alt_trans: list[etree._Element] = []
+    matches: list[etree._Element] = []
+    for child in tu:
+        name = local_name(child.tag)
+        if name == "originalData":
+            ctx.data_by_id.update(read_data(child))
+        elif name == "matches":
+            matches.append(_normalized(child))
+        elif name == "source":
+            source = child
+        elif name == "seg-source":
+            seg_source = child
+        elif name == "target":
+            target = child
+        elif name == "note":
+            notes.append(child)
+        elif name == "alt-trans":
+            alt_trans.append(child)
+
+    state_12 = (target.get("state") if target is not None else None) or tu.get("state")
+    state = "final" if tu.get("approved") == "yes" else STATES_12_TO_2.get(state_12 or "")
+
+    unit.extend(matches)
+    if alt_trans:
+        alt_matches = etree.SubElement(unit, f"{{{MTC_NS}}}matches", nsmap={"mtc": MTC_NS})
+        for i, alt in enumerate(alt_trans, 1):
+            match = etree.SubElement(alt_matches, f"{{{MTC_NS}}}match", id=f"m{i}")
+            quality = (alt.get("match-quality") or "").rstrip("%")
+            with suppress(ValueError):
+                match.set("similarity", f"{float(quality):g}")
+            if alt.get("origin"):
+                match.set("origin", alt.get("origin"))
+            # Each match has its own originalData, so its data IDs never point into the unit's
+            match_ctx = _UnitContext()
+            for part in ("source", "target"):
+                elem = next((c for c in alt if local_name(c.tag) == part), None)
+                if elem is not None:
+                    _inline_to_2(elem, etree.SubElement(match, part), match_ctx)
+            if match_ctx.data:
+                match_data = etree.Element("originalData")
+                for data_id, native in match_ctx.data:
+                    etree.SubElement(match_data, "data", id=data_id).text = native
+                match.insert(0, match_data)
+    if notes:
+        notes_elem = etree.SubElement(unit, "notes")
+        for note in notes:
+            note_elem = etree.SubElement(notes_elem, "note")
+            note_elem.text = _text(note)
+            if note.get("from"):
+                note_elem.set("category", note.get("from"))
+    original_data = etree.SubElement(unit, "originalData")
+
+    seg_marks = [m for m in seg_source.iter("{*}mrk") if m.get("mtype") == "seg"] if seg_source is not None else []
+    if seg_marks:
+        target_marks = {
+            m.get("mid"): m for m in (target.iter("{*}mrk") if target is not None else ()) if m.get("mtype") == "seg"
+        }
+        _append_ignorable(unit, seg_source.text)
+        for mark in seg_marks:
+            segment = etree.SubElement(unit, "segment", id=mark.get("mid", ""))
+            if state:
+                segment.set("state", state)
+            inline(mark, etree.SubElement(segment, "source"), ctx)
+            target_mark = target_marks.get(mark.get("mid"))
+            if target_mark is not None:
+                inline(target_mark, etree.SubElement(segment, "target"), ctx)
+            _append_ignorable(unit, mark.tail)
+    else:
+        segment = etree.SubElement(unit, "segment")
+        if state:
+            segment.set("state", state)
+        if source is not None:
+            inline(source, etree.SubElement(segment, "source"), ctx)
+        else:
+            etree.SubElement(segment, "source")
+        if target is not None:
+            inline(target, etree.SubElement(segment, "target"), ctx)
+
+    if ctx.data:
+        for data_id, native in ctx.data:
+            etree.SubElement(original_data, "data", id=data_id).text = native
+    else:
+        unit.remove(original_data)
+    return unit
+
+
+def _append_ignorable(unit: etree._Element, text: str | None) -> None:
+    """Keep inter-segment text of a segmented 1.2 source as an ``<ignorable>``."""
+    if text:
+        ignorable = etree.SubElement(unit, "ignorable")
+        etree.SubElement(ignorable, "source").text = text
+
+
+def _notes_to_2(header: etree._Element) -> etree._Element | None:
+    """Turn the notes of a 1.2 ``<header>`` into an XLIFF 2 ``<notes>``."""
+    notes = [c for c in header if local_name(c.tag) == "note"]
+    if not notes:
+        return None
+    notes_elem = etree.Element("notes")
+    for note in notes:
+        etree.SubElement(notes_elem, "note").text = _text(note)
+    return notes_elem
+
+
+# --------------------------------------------------------------------------- 2 → 1.2
+
+
+def _inline_to_12(src: etree._Element, dst: etree._Element, ctx: _UnitContext) -> None:
+    """Copy XLIFF 2 inline content of ``src`` into ``dst`` as 1.2 markup."""
+    _append_text(dst, src.text)
+    for child in src:
+        name = local_name(child.tag)
+        code_id = child.get("id") or ctx.next_id("c")
+        native = ctx.data_by_id.get(child.get("dataRef", ""))
+        first = len(dst)
+        if name == "pc":
+            native_start = ctx.data_by_id.get(child.get("dataRefStart", ""))
+            native_end = ctx.data_by_id.get(child.get("dataRefEnd", ""))
+            if native_start is None and native_end is None:
+                g = etree.SubElement(dst, "g", id=code_id)
+                _inline_to_12(child, g, ctx)
+            else:
+                # g cannot hold native data, so the span becomes a bpt/ept pair
+                etree.SubElement(dst, "bpt", id=code_id, rid=code_id).text = native_start or ""
+                _inline_to_12(child, dst, ctx)
+                etree.SubElement(dst, "ept", id=f"{code_id}e", rid=code_id).text = native_end or ""
+        elif name == "ph":
+            if native is not None:
+                etree.SubElement(dst, "ph", id=code_id).text = native
+            else:
+                etree.SubElement(dst, "x", id=code_id)
+        elif name == "sc":
+            if child.get("isolated") == "yes":
+                if native is not None:
+                    etree.SubElement(dst, "it", id=code_id, pos="open").text = native
+                else:
+                    etree.SubElement(dst, "bx", id=code_id)
+            elif native is not None:
+                etree.SubElement(dst, "bpt", id=code_id, rid=code_id).text = native
+            else:
+                etree.SubElement(dst, "bx", id=code_id, rid=code_id)
+        elif name == "ec":
+            start = child.get("startRef")
+            end_id = child.get("id") or (f"{start}e" if start else ctx.next_id("c"))
+            if start is None:
+                if native is not None:
+                    etree.SubElement(dst, "it", id=end_id, pos="close").text = native
+                else:
+                    etree.SubElement(dst, "ex", id=end_id)
+            elif native is not None:
+                etree.SubElement(dst, "ept", id=end_id, rid=start).text = native
+            else:
+                etree.SubElement(dst, "ex", id=end_id, rid=start)
+        elif name == "mrk":
+            if child.get("translate") == "no":
+                mtype = "protected"
+            else:
+                mrk_type = child.get("type", "generic")
+                mtype = mrk_type if mrk_type in _MRK_TYPES_12 else f"x-{mrk_type.replace(':', '-')}"
+            mrk = etree.SubElement(dst, "mrk", mtype=mtype, mid=child.get("id") or ctx.next_id("m"))
+            if child.get("value") and mtype == "comment":
+                mrk.set("comment", child.get("value"))
+            _inline_to_12(child, mrk, ctx)
+        elif name == "cp":
+            with suppress(ValueError):
+                _append_text(dst, chr(int(child.get("hex", ""), 16)))
+        else:
+            # sm/em markers and unknown elements are dropped, their text kept
+            _inline_to_12(child, dst, ctx)
+            _append_text(dst, child.tail)
+            continue
+        if len(dst) > first:
+            _copy_foreign(child, dst[first])
+        _append_text(dst, child.tail)
+
+
+def _unit_to_12(unit: etree._Element) -> etree._Element:
+    """Rewrite an XLIFF 2 ``<unit>`` as a 1.2 ``<trans-unit>``."""
+    ctx = _UnitContext()
+    tu = etree.Element("trans-unit", id=unit.get("id", ""), nsmap=_foreign_nsmap(unit))
+    if unit.get("name"):
+        tu.set("resname", unit.get("name"))
+    if unit.get("translate"):
+        tu.set("translate", unit.get("translate"))
+    _copy_foreign(unit, tu)
+
+    parts: list[etree._Element] = []
+    notes: list[etree._Element] = []
+    matches: list[etree._Element] = []
+    for child in unit:
+        name = local_name(child.tag)
+        if name in ("segment", "ignorable"):
+            parts.append(child)
+        elif name == "notes":
+            notes.extend(c for c in child if local_name(c.tag) == "note")
+        elif name == "originalData":
+            ctx.data_by_id = {d.get("id", ""): _text(d) for d in child if local_name(d.tag) == "data"}
+        elif name == "matches":
+            matches.extend(c for c in child if local_name(c.tag) == "match")
+
+    segments = [p for p in parts if local_name(p.tag) == "segment"]
+    # The least advanced segment state applies to the whole trans-unit
+    states = [STATES_2_TO_12.get(s.get("state", "initial"), "new") for s in segments if s.get("state")]
+    state = min(states, key=list(STATES_2_TO_12.values()).index) if states else None
+
+    def part_of(container: etree._Element, name: str) -> etree._Element | None:
+        return next((c for c in container if local_name(c.tag) == name), None)
+
+    source = etree.SubElement(tu, "source")
+    target: etree._Element | None = None
+    if len(parts) == 1 and segments:
+        segment_source = part_of(segments[0], "source")
+        if segment_source is not None:
+            _inline_to_12(segment_source, source, ctx)
+        target_src = part_of(segments[0], "target")
+        if target_src is not None:
+            target = etree.SubElement(tu, "target")
+            _inline_to_12(target_src, target, ctx)
+    else:
+        seg_source = etree.SubElement(tu, "seg-source")
+        if any(part_of(s, "target") is not None for s in segments):
+            target = etree.SubElement(tu, "target")
+        for i, part in enumerate(parts, 1):
+            part_source = part_of(part, "source")
+            part_target = part_of(part, "target")
+            if part_source is None:
+                continue
+            if local_name(part.tag) == "ignorable":
+                _inline_to_12(part_source, source, ctx)
+                _inline_to_12(part_source, seg_source, ctx)
+                if target is not None:
+                    _inline_to_12(part_target if part_target is not None else part_source, target, ctx)
+                continue
+            mid = part.get("id") or str(i)
+            _inline_to_12(part_source, source, ctx)
+            _inline_to_12(part_source, etree.SubElement(seg_source, "mrk", mtype="seg", mid=mid), ctx)
+            if target is not None and part_target is not None:
+                _inline_to_12(part_target, etree.SubElement(target, "mrk", mtype="seg", mid=mid), ctx)
+    if state and target is not None:
+        target.set("state", state)
+        if state == "final":
+            tu.set("approved", "yes")
+
+    for note in notes:
+        note_elem = etree.SubElement(tu, "note")
+        note_elem.text = _text(note)
+        if note.get("category"):
+            note_elem.set("from", note.get("category"))
+    for match in matches:
+        alt = etree.SubElement(tu, "alt-trans")
+        if match.get("similarity"):
+            alt.set("match-quality", match.get("similarity"))
+        if match.get("origin"):
+            alt.set("origin", match.get("origin"))
+        # Match content references the match's own originalData
+        match_ctx = _UnitContext()
+        match_data = part_of(match, "originalData")
+        if match_data is not None:
+            match_ctx.data_by_id = {d.get("id", ""): _text(d) for d in match_data if local_name(d.tag) == "data"}
+        for part in ("source", "target"):
+            elem = part_of(match, part)
+            if elem is not None:
+                _inline_to_12(elem, etree.SubElement(alt, part), match_ctx)
+    return tu
+
+
+def _notes_to_12(notes: etree._Element) -> etree._Element:
+    """Turn a file-level XLIFF 2 ``<notes>`` into a 1.2 ``<header>``."""
+    header = etree.Element("header")
+    for note in notes:
+        if local_name(note.tag) == "note":
+            etree.SubElement(header, "note").text = _text(note)
+    return header
+
+
+# --------------------------------------------------------------------------- driver
+
+
+class _Transcoder:
+    """Event-driven writer state for one transcoding run."""
+
+    def __init__(self, xf: Any, to_version: str) -> None:
+        self.xf = xf
+        self.to_v2 = to_version != "1.2"
+        self.version = to_version
+        self.stack: list[Any] = []
+        self.root_attrib: dict[str, str] = {}
+        self.root_open = False
+        self.body_open = False
+        self.languages: tuple[str, str] = ("", "")
+        self.stats = TranscodeStats()
+        # Input trans-units hold 1.2 inline markup, or XLIFF 2 markup in the hybrid layout
+        self.inline_12 = True
+        self.file_data: dict[str, str] = {}
+
+    def open(self, tag: str, attrib: dict[str, str]) -> None:
+        ctx = self.xf.element(tag, attrib)
+        ctx.__enter__()
+        self.stack.append(ctx)
+
+    def close(self) -> None:
+        self.stack.pop().__exit__(None, None, None)
+
+    def start(self, elem: etree._Element) -> None:
+        name = local_name(elem.tag)
+        if name == "xliff":
+            self.root_attrib = dict(elem.attrib)
+            self.inline_12 = (
+                etree.QName(elem).namespace == XLIFF12_NS or elem.get("version", "1.2").split(".")[0] == "1"
+            )
+        elif name == "file":
+            self.start_file(elem)
+        elif name == "group":
+            self.ensure_body()
+            attrib = {k: v for k, v in elem.attrib.items() if k in ("id", "translate")}
+            group_name = elem.get("resname") or elem.get("name")
+            if group_name:
+                attrib["name" if self.to_v2 else "resname"] = group_name
+            self.open("group", attrib)
+
+    def start_file(self, elem: etree._Element) -> None:
+        self.stats.files += 1
+        self.file_data = {}
+        src = elem.get("source-language") or elem.get("srcLang") or self.root_attrib.get("srcLang", "")
+        trg = elem.get("target-language") or elem.get("trgLang") or self.root_attrib.get("trgLang", "")
+        if not src:
+            msg = "XLIFF file has no source language"
+            raise ValidationError(msg)
+        if self.to_v2:
+            if not self.root_open:
+                attrib = {"xmlns": XLIFF2_NS, "version": self.version, "srcLang": src}
+                if trg:
+                    attrib["trgLang"] = trg
+                self.open("xliff", attrib)
+                self.root_open = True
+                self.languages = (src, trg)
+            elif (src, trg) != self.languages:
+                first = "-".join(self.languages)
+                msg = f"XLIFF 2 allows one language pair per document, found {src}-{trg} after {first}"
+                raise ConversionError(msg)
+            attrib = {"id": elem.get("id") or f"f{self.stats.files}"}
+            if elem.get("original"):
+                attrib["original"] = elem.get("original")
+            self.open("file", attrib)
+        else:
+            if not self.root_open:
+                self.open("xliff", {"xmlns": XLIFF12_NS, "version": "1.2"})
+                self.root_open = True
+            attrib = {
+                "original": elem.get("original") or elem.get("id") or f"f{self.stats.files}",
+                "source-language": src,
+                "datatype": elem.get("datatype", "plaintext"),
+            }
+            if trg:
+                attrib["target-language"] = trg
+            self.open("file", attrib)
+            self.body_open = False
+
+    def ensure_body(self) -> None:
+        if not self.to_v2 and not self.body_open:
+            self.open("body", {})
+            self.body_open = True
+
+    def convert_unit(self, elem: etree._Element) -> etree._Element:
+        """Rewrite a unit of any input layout in the output layout."""
+        if local_name(elem.tag) == "unit":
+            return _normalized(elem) if self.to_v2 else _unit_to_12(elem)
+        if self.inline_12:
+            return _unit_to_2(elem) if self.to_v2 else _normalized(elem)
+        unit = _unit_to_2(elem, _inline_2_to_2, self.file_data)
+        return unit if self.to_v2 else _unit_to_12(unit)
+
+    def end(self, elem: etree._Element) -> None:
+        name = local_name(elem.tag)
+        if name in _UNIT_NAMES:
+            if name == "bin-unit":
+                self.stats.skipped += 1
+            else:
+                self.ensure_body()
+                self.xf.write(self.convert_unit(elem))
+                self.stats.units += 1
+            release(elem)
+        elif name == "originalData":
+            # File-level data of the hybrid layout; units reference it by ID
+            self.file_data = read_data(elem)
+        elif name == "header":
+            notes = _notes_to_2(elem)
+            if notes is not None:
+                self.xf.write(notes if self.to_v2 else _notes_to_12(notes))
+        elif name == "notes":
+            if self.to_v2:
+                self.xf.write(_normalized(elem))
+            elif not self.body_open:
+                self.xf.write(_notes_to_12(elem))
+        elif name == "group":
+            self.close()
+            release(elem)
+        elif name == "file":
+            if self.body_open:
+                self.close()
+                self.body_open = False
+            self.close()
+            release(elem)
+        elif name == "xliff":
+            while self.stack:
+                self.close()
+
+
+def transcode(source: str | Path | IO[bytes], out: IO[bytes], to_version: str = "2.1") -> TranscodeStats:
+    """Stream an XLIFF document into the requested version.
+
+    Input in either version (or the same version, which normalizes it) is
+    accepted; the input layout is recognized per element.
+
+    Args:
+        source: Input file path or binary file object
+        out: Binary stream receiving the transcoded document
+        to_version: ``1.2``, ``2.0`` or ``2.1``
+
+    Returns:
+        TranscodeStats with file, unit and skipped counts
+
+    Raises:
+        ValidationError: If the version is unsupported or a file has no source language
+        ConversionError: If 2.x output would need several source languages
+        ParsingError: If the XML is malformed
+    """
+    if to_version not in VERSIONS:
+        msg = f"Unsupported XLIFF version: {to_version}. Use one of {list(VERSIONS)}"
+        raise ValidationError(msg)
+    in_unit = 0
+    try:
+        with xml_writer(out) as xf:
+            state = _Transcoder(xf, to_version)
+            for event, elem in iterparse_xliff(source, events=("start", "end"), tag=_EVENT_TAGS):
+                name = local_name(elem.tag)
+                # Notes inside units are part of the unit, not file-level structure
+                if name in _UNIT_NAMES:
+                    in_unit += 1 if event == "start" else -1
+                    if event == "start":
+                        continue
+                elif in_unit:
+                    continue
+                if event == "start":
+                    state.start(elem)
+                else:
+                    state.end(elem)
+    except etree.XMLSyntaxError as e:
+        msg = f"Invalid XLIFF XML in {source}: {e}"
+        raise ParsingError(msg) from e
+    return state.stats
+
+
+def transcode_file(input_file: str | Path, output_file: str | Path, to_version: str = "2.1") -> TranscodeStats:
+    """Transcode an XLIFF file, writing the result atomically.
+
+    Args:
+        input_file: Input XLIFF path
+        output_file: Output XLIFF path
+        to_version: ``1.2``, ``2.0`` or ``2.1``
+
+    Returns:
+        TranscodeStats with file, unit and skipped counts
+    """
+    with atomic_open(output_file, "wb") as out:
+        stats = transcode(Path(input_file), out, to_version)
+    logger.info(f"Transcoded {stats.units} units in {stats.files} files to XLIFF {to_version}")
+    return stats
@@ -0,0 +1,191 @@
+"""Merge-forward of translations into re-extracted documents.
+
+When a source document changes, its new extraction starts without
+targets. ``merge_forward`` carries the targets and states of an earlier
+XLIFF into it, matching units in three linear passes over hash indexes:
+
+1. same unit ID and same normalized source: ``unchanged``
+2. same normalized source under another ID (reordered, or renumbered
+   positional IDs): ``moved``, still translated as before
+3. remaining units between two matched neighbours, paired in document
+   order with the old units left in the same gap: ``changed``; the old
+   target is kept for reference with state ``needs-review-translation``
+
+Carried targets keep their inline codes, so links and placeholders in a
+translation survive the update. New units left over are ``added`` and old
+ones ``removed``. Every decision is recorded in an ``UpdateReport``.
+"""
+# this_file: src/vexy_markliff/core/update.py
+
+from collections import Counter, defaultdict, deque
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from vexy_markliff.core.converter import DOCUMENT_KINDS, VexyMarkliff
+from vexy_markliff.core.streaming import UnitRecord
+from vexy_markliff.exceptions import ValidationError
+from vexy_markliff.tm.memory import normalize_source
+from vexy_markliff.utils import atomic_write_text, get_logger
+
+if TYPE_CHECKING:
+    from vexy_markliff.models.xliff import XLIFFDocument
+
+logger = get_logger(__name__)
+
+UNCHANGED = "unchanged"
+MOVED = "moved"
+CHANGED = "changed"
+ADDED = "added"
+REMOVED = "removed"
+STATUSES = (UNCHANGED, MOVED, CHANGED, ADDED, REMOVED)
+
+# State of units whose source changed under an existing translation
+REVIEW_STATE = "needs-review-translation"
+
+
+@dataclass
+class UnitChange:
+    """What happened to one unit during an update."""
+
+    status: str
+    unit_id: str | None
+    old_id: str | None = None
+    source: str | None = None
+    old_source: str | None = None
+
+
+@dataclass
+class UpdateReport:
+    """Per-unit outcome of a merge-forward."""
+
+    changes: list[UnitChange] = field(default_factory=list)
+
+    @property
+    def counts(self) -> Counter:
+        """Number of units per status."""
+        return Counter(change.status for change in self.changes)
+
+    def to_dict(self, *, details: bool = False) -> dict[str, Any]:
+        """Return the report as a plain dict.
+
+        Args:
+            details: Include the per-unit changes (unchanged units omitted)
+
+        Returns:
+            Status counts, and the changes when requested
+        """
+        counts = self.counts
+        report: dict[str, Any] = {status: counts[status] for status in STATUSES}
+        if details:
+            report["units"] = [asdict(change) for change in self.changes if change.status != UNCHANGED]
+        return report
+
+
+def merge_forward(old_units: Iterable[UnitRecord], document: "XLIFFDocument") -> UpdateReport:
+    """Carry translations from old units into a freshly extracted document.
+
+    Args:
+        old_units: Units of the previous XLIFF, in document order
+        document: New extraction; its units are updated in place
+
+    Returns:
+        UpdateReport with one entry per new unit and per removed old unit
+    """
+    old = list(old_units)
+    new = [unit for xliff_file in document.files for unit in xliff_file.units]
+    old_keys = [normalize_source(unit.source) for unit in old]
+    new_keys = [normalize_source(unit.source) for unit in new]
+    matched: list[int | None] = [None] * len(new)
+    status: list[str] = [ADDED] * len(new)
+    used = [False] * len(old)
+
+    # Pass 1: identical ID and text
+    by_id = {(unit.unit_id, key): i for i, (unit, key) in enumerate(zip(old, old_keys, strict=True))}
+    for j, (unit, key) in enumerate(zip(new, new_keys, strict=True)):
+        i = by_id.get((unit.id, key))
+        if i is not None and not used[i]:
+            matched[j], status[j], used[i] = i, UNCHANGED, True
+
+    # Pass 2: identical text elsewhere, first unused occurrence first
+    by_text: dict[str, deque[int]] = defaultdict(deque)
+    for i, key in enumerate(old_keys):
+        if not used[i]:
+            by_text[key].append(i)
+    for j, key in enumerate(new_keys):
+        if matched[j] is None and by_text.get(key):
+            i = by_text[key].popleft()
+            matched[j], status[j], used[i] = i, MOVED, True
+
+    # Pass 3: pair leftovers in the gaps between matched units
+    cursor = 0
+    for j in range(len(new)):
+        i = matched[j]
+        if i is not None:
+            cursor = i + 1
+        elif cursor < len(old) and not used[cursor]:
+            matched[j], status[j], used[cursor] = cursor, CHANGED, True
+            cursor += 1
+
+    report = UpdateReport()
+    for j, unit in enumerate(new):
+        i = matched[j]
+        previous = old[i] if i is not None else None
+        if previous is not None and previous.target is not None:
+            unit.target, unit.target_codes = previous.target, previous.target_codes
+            unit.state = REVIEW_STATE if status[j] == CHANGED else previous.state
+        report.changes.append(
+            UnitChange(
+                status=status[j],
+                unit_id=unit.id,
+                old_id=previous.unit_id if previous else None,
+                source=unit.source,
+                old_source=previous.source if previous and status[j] == CHANGED else None,
+            )
+        )
+    for i, unit in enumerate(old):
+        if not used[i]:
+            report.changes.append(UnitChange(status=REMOVED, unit_id=None, old_id=unit.unit_id, old_source=unit.source))
+    return report
+
+
+def update_file(
+    xliff_file: str | Path,
+    source_file: str | Path,
+    output_file: str | Path,
+    converter: VexyMarkliff | None = None,
+) -> UpdateReport:
+    """Re-extract a changed source document and merge an XLIFF's translations forward.
+
+    Languages are taken from the old XLIFF; the document kind from the
+    source file's suffix.
+
+    Args:
+        xliff_file: XLIFF with the existing translations
+        source_file: Changed Markdown or HTML document
+        output_file: Path of the updated XLIFF
+        converter: Converter used for extraction (ID strategy, TM)
+
+    Returns:
+        UpdateReport of the merge
+
+    Raises:
+        ValidationError: If the source kind is unknown or the XLIFF has no units
+        ParsingError: If the XLIFF is malformed
+    """
+    source_path = Path(source_file)
+    kind = DOCUMENT_KINDS.get(source_path.suffix.lower())
+    if kind is None:
+        msg = f"Unsupported source document: {source_path}. Use one of {', '.join(sorted(DOCUMENT_KINDS))}"
+        raise ValidationError(msg)
+    converter = converter or VexyMarkliff()
+    with open(xliff_file, "rb") as f:
+        xliff, report = converter.update_xliff(f, source_path.read_text(encoding="utf-8"), kind)
+    atomic_write_text(output_file, xliff)
+    counts = report.counts
+    logger.info(
+        f"Updated {output_file}: {counts[UNCHANGED] + counts[MOVED]} kept, {counts[CHANGED]} to review, "
+        f"{counts[ADDED]} added, {counts[REMOVED]} removed"
+    )
+    return report
@@ -0,0 +1,277 @@
+"""Streaming validation of XLIFF files.
+
+Units are checked one at a time as ``iterparse`` delivers them and are
+released afterwards, so memory stays bounded by the largest unit (plus the
+unit IDs of the current ``<file>``, kept to detect duplicates). Built-in
+rules cover the structure this package relies on and the pipeline
+guarantees of the specification (``docs/530-vexy-markliff-spec.md`` §4):
+
+- ``structure``: the root is ``<xliff version>``, files and units have
+  IDs, unit IDs are unique per file, and every unit has text
+- ``data-ref``: every ``<ph>`` references ``originalData``, and every
+  ``dataRef``/``dataRefStart``/``dataRefEnd`` resolves to a ``<data>`` of
+  the unit or its file
+- ``format-style``: every unit carries ``fs:fs``
+
+An XML Schema, such as the OASIS XLIFF 2.1 core schema (which declares
+``<unit>`` as a global element), can be given as well; each unit is then
+validated against it. Parsed schemas and compiled rule sets are cached per
+process, so checking many files loads a schema once.
+"""
+# this_file: src/vexy_markliff/core/validate.py
+
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import IO, Any
+
+from lxml import etree
+
+from vexy_markliff.core.streaming import UNIT_TAGS, iterparse_xliff, local_name, release
+from vexy_markliff.exceptions import FileOperationError, ParsingError, ValidationError
+from vexy_markliff.models.inline import FS_ATTR
+from vexy_markliff.utils import get_logger
+
+logger = get_logger(__name__)
+
+# Elements producing iterparse events; everything else stays in C
+_EVENT_TAGS = ("{*}xliff", "{*}file", "{*}originalData", "{*}unit", "{*}trans-unit")
+
+# Stored issues per file; later ones are counted only
+DEFAULT_MAX_ISSUES = 1000
+
+
+@dataclass
+class _FileScope:
+    """What the rules know about the ``<file>`` around the current unit."""
+
+    file_id: str = ""
+    data: set[str] = field(default_factory=set)
+    unit_ids: set[str] = field(default_factory=set)
+
+
+# A rule yields a message per problem it finds in a unit
+Rule = Callable[[etree._Element, _FileScope], Iterator[str]]
+
+
+@dataclass
+class Issue:
+    """One validation problem."""
+
+    rule: str
+    message: str
+    file_id: str = ""
+    unit_id: str = ""
+    line: int | None = None
+
+
+@dataclass
+class ValidationReport:
+    """Result of validating one XLIFF file."""
+
+    path: str = ""
+    files: int = 0
+    units: int = 0
+    issue_count: int = 0
+    issues: list[Issue] = field(default_factory=list)
+
+    @property
+    def valid(self) -> bool:
+        """Whether no rule found a problem."""
+        return self.issue_count == 0
+
+    def to_dict(self, *, details: bool = False) -> dict[str, Any]:
+        """Return the report as a plain dict.
+
+        Args:
+            details: Include the stored issues
+
+        Returns:
+            Validity, file and unit totals and the number of issues
+        """
+        report: dict[str, Any] = {
+            "path": self.path,
+            "valid": self.valid,
+            "files": self.files,
+            "units": self.units,
+            "issues": self.issue_count,
+        }
+        if details:
+            report["details"] = [asdict(issue) for issue in self.issues]
+        return report
+
+
+def _check_structure(unit: etree._Element, scope: _FileScope) -> Iterator[str]:
+    """Units need a unique ID and text: a source per segment, or a 1.2-style source or target."""
+    unit_id = unit.get("id")
+    if not unit_id:
+        yield "Unit has no id"
+    elif unit_id in scope.unit_ids:
+        yield f"Duplicate unit id {unit_id}"
+    else:
+        scope.unit_ids.add(unit_id)
+
+    names = [local_name(child.tag) for child in unit]
+    if local_name(unit.tag) == "trans-unit":
+        if "source" not in names and "target" not in names:
+            yield "Unit has no source or target"
+        return
+    segments = [child for child, name in zip(unit, names, strict=True) if name == "segment"]
+    if not segments:
+        yield "Unit has no segment"
+    for segment in segments:
+        if not any(local_name(child.tag) == "source" for child in segment):
+            yield f"Segment {segment.get('id')} has no source" if segment.get("id") else "Segment has no source"
+
+
+def _check_data_refs(unit: etree._Element, scope: _FileScope) -> Iterator[str]:
+    """Every ``<ph>`` references originalData and every data reference resolves."""
+    data = scope.data
+    local = [child for child in unit if local_name(child.tag) == "originalData"]
+    if local:
+        data = data | {ref for original in local for ref in _data_ids(original)}
+    for code in unit.iter("{*}ph", "{*}pc", "{*}sc", "{*}ec"):
+        name = local_name(code.tag)
+        attrs = ("dataRefStart", "dataRefEnd") if name == "pc" else ("dataRef",)
+        refs = [ref for ref in map(code.get, attrs) if ref is not None]
+        if name == "ph" and not refs:
+            yield f"<ph id={code.get('id')}> does not reference originalData"
+        for ref in refs:
+            if ref not in data:
+                yield f"<{name} id={code.get('id')}> references undefined data {ref}"
+
+
+def _check_format_style(unit: etree._Element, _scope: _FileScope) -> Iterator[str]:
+    """Every unit records the element its text came from."""
+    if not unit.get(FS_ATTR):
+        yield "Unit has no fs:fs"
+
+
+RULES: dict[str, Rule] = {
+    "structure": _check_structure,
+    "data-ref": _check_data_refs,
+    "format-style": _check_format_style,
+}
+
+
+@lru_cache(maxsize=32)
+def compile_rules(names: tuple[str, ...] | None = None) -> tuple[tuple[str, Rule], ...]:
+    """Resolve rule names to their checks, once per process and selection.
+
+    Args:
+        names: Rule names, or None for all of ``RULES``
+
+    Returns:
+        (name, check) pairs in the given order
+
+    Raises:
+        ValidationError: If a rule name is unknown
+    """
+    if names is None:
+        return tuple(RULES.items())
+    unknown = [name for name in names if name not in RULES]
+    if unknown:
+        msg = f"Unknown validation rule: {', '.join(unknown)}. Use any of {', '.join(RULES)}"
+        raise ValidationError(msg)
+    return tuple((name, RULES[name]) for name in names)
+
+
+@lru_cache(maxsize=8)
+def load_schema(path: str) -> etree.XMLSchema:
+    """Parse an XML Schema, once per process and path.
+
+    Args:
+        path: Absolute path of the ``.xsd`` file; schemas it imports are
+            resolved relative to it, never over the network
+
+    Returns:
+        Compiled schema
+
+    Raises:
+        FileOperationError: If the file does not exist
+        ParsingError: If it is not a valid XML Schema
+    """
+    if not Path(path).is_file():
+        msg = f"Schema file not found: {path}"
+        raise FileOperationError(msg)
+    try:
+        parser = etree.XMLParser(resolve_entities=False, no_network=True)
+        return etree.XMLSchema(etree.parse(path, parser))
+    except (etree.XMLSyntaxError, etree.XMLSchemaParseError) as e:
+        msg = f"Invalid XML Schema {path}: {e}"
+        raise ParsingError(msg) from e
+
+
+def validate(
+    source: str | Path | IO[bytes],
+    schema: str | Path | None = None,
+    rules: Iterable[str] | None = None,
+    max_issues: int = DEFAULT_MAX_ISSUES,
+) -> ValidationReport:
+    """Validate an XLIFF file unit by unit.
+
+    Args:
+        source: XLIFF file path or binary file object
+        schema: Optional XML Schema each unit is validated against
+        rules: Built-in rules to apply (default: all of ``RULES``)
+        max_issues: Issues stored in the report; later ones are only counted
+
+    Returns:
+        ValidationReport with file, unit and issue counts
+
+    Raises:
+        ValidationError: If a rule name is unknown
+        FileOperationError: If the schema file does not exist
+        ParsingError: If the schema or the XLIFF is not well-formed XML
+    """
+    checks = compile_rules(tuple(rules) if rules is not None else None)
+    xsd = load_schema(str(Path(schema).resolve())) if schema is not None else None
+    apply_structure = any(name == "structure" for name, _ in checks)
+    report = ValidationReport(path=str(source) if isinstance(source, (str, Path)) else getattr(source, "name", ""))
+    scope = _FileScope()
+
+    def add(rule: str, message: str, unit_id: str = "", line: int | None = None) -> None:
+        report.issue_count += 1
+        if len(report.issues) < max_issues:
+            report.issues.append(Issue(rule, message, scope.file_id, unit_id, line))
+
+    try:
+        for event, elem in iterparse_xliff(source, events=("start", "end"), tag=_EVENT_TAGS):
+            name = local_name(elem.tag)
+            if event == "start":
+                if name == "xliff" and apply_structure and not elem.get("version"):
+                    add("structure", "Root <xliff> has no version", line=elem.sourceline)
+                elif name == "file":
+                    scope = _FileScope(file_id=elem.get("id", ""))
+                    report.files += 1
+                    if apply_structure and not scope.file_id:
+                        add("structure", "File has no id", line=elem.sourceline)
+                continue
+            if name == "originalData":
+                # Unit-level tables are read by the data-ref rule with their unit
+                if local_name(elem.getparent().tag) not in UNIT_TAGS:
+                    scope.data.update(_data_ids(elem))
+                continue
+            if name not in UNIT_TAGS:
+                continue
+            report.units += 1
+            unit_id = elem.get("id", "")
+            for rule, check in checks:
+                for message in check(elem, scope):
+                    add(rule, message, unit_id, elem.sourceline)
+            if xsd is not None and not xsd.validate(elem):
+                for error in xsd.error_log:
+                    add("schema", error.message, unit_id, error.line)
+            release(elem)
+    except etree.XMLSyntaxError as e:
+        msg = f"Invalid XLIFF XML in {report.path}: {e}"
+        raise ParsingError(msg) from e
+    return report
+
+
+def _data_ids(original: etree._Element) -> Iterator[str]:
+    """Yield the IDs of the ``<data>`` elements of an ``<originalData>`` element."""
+    for data in original:
+        if local_name(data.tag) == "data":
+            yield data.get("id", "")
@@ -0,0 +1,91 @@
+"""Bilingual exchange formats for vexy-markliff.
+
+This package contains streaming writers and readers for formats other than
+XLIFF:
+- po: gettext PO catalogs
+- ts: Qt Linguist TS files
+- resx: .NET resx resources
+
+Each of these provides ``export_units`` and ``merge_entries`` hooks used by
+the converter's ``export_units``/``merge_units``. Entries are keyed by
+``entry_key``, which marks attribute sub-units so merging can put their text
+back onto the owner's element, or skip it for sub-units without an owner. The columnar module exports extracted units
+as JSON Lines or Parquet/Arrow for analytics.
+"""
+# this_file: src/vexy_markliff/formats/__init__.py
+
+from typing import TYPE_CHECKING
+
+# Use lazy imports so format modules are only loaded when used
+if TYPE_CHECKING:
+    from vexy_markliff.formats.columnar import export_corpus, iter_corpus_records, write_arrow, write_jsonl
+    from vexy_markliff.formats.po import PoEntry, iter_po, write_po
+    from vexy_markliff.formats.resx import ResxEntry, iter_resx, write_resx
+    from vexy_markliff.formats.ts import TsMessage, iter_ts, write_ts
+    from vexy_markliff.models.xliff import TranslationUnit
+
+_LAZY_IMPORTS = {
+    "export_corpus": "vexy_markliff.formats.columnar",
+    "iter_corpus_records": "vexy_markliff.formats.columnar",
+    "write_arrow": "vexy_markliff.formats.columnar",
+    "write_jsonl": "vexy_markliff.formats.columnar",
+    "PoEntry": "vexy_markliff.formats.po",
+    "iter_po": "vexy_markliff.formats.po",
+    "write_po": "vexy_markliff.formats.po",
+    "ResxEntry": "vexy_markliff.formats.resx",
+    "iter_resx": "vexy_markliff.formats.resx",
+    "write_resx": "vexy_markliff.formats.resx",
+    "TsMessage": "vexy_markliff.formats.ts",
+    "iter_ts": "vexy_markliff.formats.ts",
+    "write_ts": "vexy_markliff.formats.ts",
+}
+
+
+def entry_key(unit: "TranslationUnit") -> str:
+    """Return the key of a unit's entry.
+
+    That is its ID, plus ``@attribute`` for attribute sub-units, or
+    ``#attribute`` for sub-units without an owner unit.
+    """
+    if not unit.attribute:
+        return unit.id
+    return f"{unit.id}{'@' if unit.owner else '#'}{unit.attribute}"
+
+
+def key_attribute(key: str) -> str | None:
+    """Return the attribute name recorded in an entry key, or None for units with text of their own."""
+    return key.partition("@")[2] or key.partition("#")[2] or None
+
+
+def key_owned(key: str) -> bool:
+    """Return whether an entry key belongs to a unit with an owner, or to one with text of its own."""
+    return "#" not in key
+
+
+def __getattr__(name: str):
+    """Lazy import attributes to avoid performance bottlenecks."""
+    if name in _LAZY_IMPORTS:
+        module = __import__(_LAZY_IMPORTS[name], fromlist=[name])
+        return getattr(module, name)
+    msg = f"module '{__name__}' has no attribute '{name}'"
+    raise AttributeError(msg)
+
+
+__all__ = [
+    "PoEntry",
+    "ResxEntry",
+    "TsMessage",
+    "entry_key",
+    "export_corpus",
+    "iter_corpus_records",
+    "iter_po",
+    "iter_resx",
+    "iter_ts",
+    "key_attribute",
+    "key_owned",
+    "write_arrow",
+    "write_jsonl",
+    "write_po",
+    "write_resx",
+    "write_ts",
+]
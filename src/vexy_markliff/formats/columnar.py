@@ -0,0 +1,299 @@
+"""Columnar export of extracted units for analytics pipelines.
+
+Units come out of the regular extraction pipeline as flat records, one row
+per unit, and are written in record batches: JSON Lines always, Parquet or
+Arrow IPC when the optional ``pyarrow`` dependency is installed. Only one
+batch is held in memory, so a corpus of any size streams through.
+"""
+# this_file: src/vexy_markliff/formats/columnar.py
+
+import json
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+from typing import IO, Any
+
+from vexy_markliff.core.analysis import segment_digest
+from vexy_markliff.core.converter import DOCUMENT_KINDS, VexyMarkliff
+from vexy_markliff.exceptions import ConfigurationError, FileOperationError, ValidationError
+from vexy_markliff.tm.memory import normalize_source
+from vexy_markliff.utils import atomic_open, get_logger
+
+logger = get_logger(__name__)
+
+# Column name → Arrow type name; also the key order of JSON Lines records
+COLUMNS = {
+    "file_id": "string",
+    "unit_id": "string",
+    "source": "string",
+    "target": "string",
+    "state": "string",
+    "element": "string",
+    "index": "int32",
+    "offset": "int64",
+    "length": "int32",
+    "source_hash": "string",
+    "target_hash": "string",
+}
+
+COLUMNAR_FORMATS = ("jsonl", "parquet", "arrow")
+DEFAULT_BATCH_SIZE = 10_000
+
+_SUFFIX_FORMATS = {".jsonl": "jsonl", ".ndjson": "jsonl", ".parquet": "parquet", ".arrow": "arrow", ".feather": "arrow"}
+
+
+@dataclass
+class ColumnarStats:
+    """Counters for a columnar export run."""
+
+    files: int = 0
+    units: int = 0
+    failed: dict[str, str] = field(default_factory=dict)
+
+
+def text_hash(text: str | None) -> str | None:
+    """Return the hex digest of a segment's normalized text.
+
+    The digest matches the keys used by corpus analysis, so rows can be
+    joined with analysis output and deduplicated across files.
+
+    Args:
+        text: Segment text
+
+    Returns:
+        16-character hex digest, or None for missing text
+    """
+    if text is None:
+        return None
+    return segment_digest(normalize_source(text)).hex()
+
+
+def unit_records(
+    file_id: str,
+    content: str,
+    kind: str,
+    converter: VexyMarkliff,
+    *,
+    source_lang: str = "en",
+    target_lang: str = "es",
+) -> Iterator[dict[str, Any]]:
+    """Extract one document and yield a flat record per unit.
+
+    ``offset`` is the character position of the unit's source text in the
+    input, or -1 where the text does not occur verbatim (for example when
+    Markdown markup splits it).
+
+    Args:
+        file_id: Identifier stored in the ``file_id`` column
+        content: Source document text
+        kind: ``markdown`` or ``html``
+        converter: Converter running the extraction (and TM pre-fill)
+        source_lang: Source language code
+        target_lang: Target language code
+
+    Yields:
+        Records with the keys of ``COLUMNS``
+    """
+    cursor = 0
+    for index, (unit, segment) in enumerate(converter.extract_units(content, kind, source_lang, target_lang)):
+        offset = content.find(unit.source, cursor)
+        if offset >= 0:
+            cursor = offset + len(unit.source)
+        yield {
+            "file_id": file_id,
+            "unit_id": unit.id,
+            "source": unit.source,
+            "target": unit.target,
+            "state": unit.state,
+            "element": segment.get("element"),
+            "index": index,
+            "offset": offset,
+            "length": len(unit.source),
+            "source_hash": text_hash(unit.source),
+            "target_hash": text_hash(unit.target),
+        }
+
+
+def iter_corpus_records(
+    input_dir: str | Path,
+    pattern: str = "*.md",
+    source_lang: str = "en",
+    target_lang: str = "es",
+    *,
+    converter: VexyMarkliff | None = None,
+    stats: ColumnarStats | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Stream unit records for every Markdown/HTML file under a directory.
+
+    Files are processed one at a time in sorted order; the ``file_id`` of a
+    row is the file's path relative to ``input_dir``. Files that fail to
+    extract are logged, recorded in ``stats.failed`` and skipped.
+
+    Args:
+        input_dir: Directory searched recursively for input files
+        pattern: Glob pattern for input files
+        source_lang: Source language code
+        target_lang: Target language code
+        converter: Converter to use (a default one if None)
+        stats: Optional counters updated while streaming
+
+    Yields:
+        Records with the keys of ``COLUMNS``
+
+    Raises:
+        FileOperationError: If the input directory does not exist
+    """
+    root = Path(input_dir)
+    if not root.is_dir():
+        msg = f"Input directory not found: {input_dir}"
+        raise FileOperationError(msg)
+    converter = converter if converter is not None else VexyMarkliff()
+    stats = stats if stats is not None else ColumnarStats()
+
+    for path in sorted(root.rglob(pattern)):
+        kind = DOCUMENT_KINDS.get(path.suffix.lower())
+        if kind is None or not path.is_file():
+            continue
+        rel = path.relative_to(root).as_posix()
+        try:
+            content = path.read_text(encoding="utf-8")
+            if not content.strip():
+                continue
+            records = list(
+                unit_records(rel, content, kind, converter, source_lang=source_lang, target_lang=target_lang)
+            )
+        except Exception as e:
+            logger.error(f"Failed to extract {rel}: {e}")
+            stats.failed[rel] = str(e) or type(e).__name__
+            continue
+        stats.files += 1
+        stats.units += len(records)
+        yield from records
+
+
+def batched(records: Iterable[dict[str, Any]], batch_size: int) -> Iterator[list[dict[str, Any]]]:
+    """Group records into lists of at most ``batch_size``."""
+    iterator = iter(records)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
+
+
+def write_jsonl(records: Iterable[dict[str, Any]], out: IO[bytes], batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+    """Write records as UTF-8 JSON Lines, one write per batch.
+
+    Args:
+        records: Unit records
+        out: Binary stream to write to
+        batch_size: Records per write
+
+    Returns:
+        Number of records written
+    """
+    count = 0
+    for batch in batched(records, batch_size):
+        out.write("".join(json.dumps(record, ensure_ascii=False) + "\n" for record in batch).encode("utf-8"))
+        count += len(batch)
+    return count
+
+
+def _require_pyarrow() -> Any:
+    """Import pyarrow or explain how to install it."""
+    try:
+        import pyarrow as pa  # noqa: PLC0415 - optional dependency
+    except ImportError as e:
+        msg = "Parquet and Arrow export require pyarrow: pip install 'vexy-markliff[columnar]'"
+        raise ConfigurationError(msg) from e
+    return pa
+
+
+def arrow_schema() -> Any:
+    """Return the pyarrow schema of unit records."""
+    pa = _require_pyarrow()
+    return pa.schema([(name, getattr(pa, type_name)()) for name, type_name in COLUMNS.items()])
+
+
+def write_arrow(
+    records: Iterable[dict[str, Any]], out: IO[bytes], fmt: str = "parquet", batch_size: int = DEFAULT_BATCH_SIZE
+) -> int:
+    """Write records as Parquet or Arrow IPC in record batches.
+
+    Args:
+        records: Unit records
+        out: Binary stream to write to
+        fmt: ``parquet`` or ``arrow``
+        batch_size: Rows per record batch (and Parquet row group)
+
+    Returns:
+        Number of records written
+
+    Raises:
+        ConfigurationError: If pyarrow is not installed
+    """
+    pa = _require_pyarrow()
+    schema = arrow_schema()
+    if fmt == "parquet":
+        import pyarrow.parquet as pq  # noqa: PLC0415 - optional dependency
+
+        writer = pq.ParquetWriter(out, schema)
+    else:
+        writer = pa.ipc.new_file(out, schema)
+    count = 0
+    with writer:
+        for batch in batched(records, batch_size):
+            writer.write_batch(pa.RecordBatch.from_pylist(batch, schema=schema))
+            count += len(batch)
+    return count
+
+
+def export_corpus(
+    input_dir: str | Path,
+    output_file: str | Path,
+    pattern: str = "*.md",
+    source_lang: str = "en",
+    target_lang: str = "es",
+    *,
+    fmt: str | None = None,
+    converter: VexyMarkliff | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> ColumnarStats:
+    """Export the units of a directory to a columnar file.
+
+    Args:
+        input_dir: Directory searched recursively for input files
+        output_file: Output path; written atomically
+        pattern: Glob pattern for input files
+        source_lang: Source language code
+        target_lang: Target language code
+        fmt: ``jsonl``, ``parquet`` or ``arrow``; inferred from the output
+            suffix if None (JSON Lines for unknown suffixes)
+        converter: Converter to use (a default one if None)
+        batch_size: Records per batch
+
+    Returns:
+        ColumnarStats with file and unit counts and failed files
+
+    Raises:
+        ValidationError: If the format is unknown
+        ConfigurationError: If Parquet/Arrow is requested without pyarrow
+        FileOperationError: If the input directory does not exist
+    """
+    fmt = fmt or _SUFFIX_FORMATS.get(Path(output_file).suffix.lower(), "jsonl")
+    if fmt not in COLUMNAR_FORMATS:
+        msg = f"Unknown columnar format: {fmt}. Use one of {list(COLUMNAR_FORMATS)}"
+        raise ValidationError(msg)
+    if fmt != "jsonl":
+        _require_pyarrow()
+    if not Path(input_dir).is_dir():
+        msg = f"Input directory not found: {input_dir}"
+        raise FileOperationError(msg)
+
+    stats = ColumnarStats()
+    records = iter_corpus_records(input_dir, pattern, source_lang, target_lang, converter=converter, stats=stats)
+    with atomic_open(output_file, "wb") as out:
+        if fmt == "jsonl":
+            write_jsonl(records, out, batch_size)
+        else:
+            write_arrow(records, out, fmt, batch_size)
+    logger.info(f"Exported {stats.units} units from {stats.files} files to {output_file}")
+    return stats
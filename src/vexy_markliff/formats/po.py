@@ -0,0 +1,217 @@
+"""Streaming gettext PO writer and reader.
+
+Units are written one entry at a time as they come out of the segment
+pipeline, and PO files are read line by line, so neither direction needs the
+whole catalog in memory. Each entry carries its key (the unit id, see
+``entry_key``) as ``msgctxt`` so repeated source strings stay distinct and
+map back to their position.
+"""
+# this_file: src/vexy_markliff/formats/po.py
+
+import io
+import re
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, NamedTuple, TextIO
+
+from vexy_markliff.exceptions import ParsingError
+from vexy_markliff.formats import entry_key, key_attribute, key_owned
+from vexy_markliff.models.inline import render_inline
+
+if TYPE_CHECKING:
+    from vexy_markliff.models.xliff import TranslationUnit
+
+_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n", "\t": "\\t", "\r": "\\r"})
+_UNESCAPES = {"n": "\n", "t": "\t", "r": "\r", '"': '"', "\\": "\\", "a": "\a", "b": "\b", "f": "\f", "v": "\v"}
+_UNESCAPE_RE = re.compile(r"\\(.)")
+_KEYWORD_RE = re.compile(r"(msgctxt|msgid_plural|msgid|msgstr(?:\[\d+\])?)\s+\"(.*)\"\s*$")
+
+
+class PoEntry(NamedTuple):
+    """One catalog entry read from a PO file."""
+
+    msgctxt: str | None
+    msgid: str
+    msgstr: str
+    fuzzy: bool = False
+
+
+def escape_po(text: str) -> str:
+    """Escape text for use inside a PO string literal."""
+    return text.translate(_ESCAPES)
+
+
+def unescape_po(text: str) -> str:
+    """Resolve the escape sequences of a PO string literal."""
+    if "\\" not in text:
+        return text
+    return _UNESCAPE_RE.sub(lambda m: _UNESCAPES.get(m.group(1), m.group(1)), text)
+
+
+def _po_string(keyword: str, text: str) -> str:
+    """Format a keyword and its string, splitting multi-line text after each ``\\n``."""
+    lines = text.splitlines(keepends=True)
+    if len(lines) <= 1:
+        return f'{keyword} "{escape_po(text)}"\n'
+    return f'{keyword} ""\n' + "".join(f'"{escape_po(line)}"\n' for line in lines)
+
+
+def po_header(source_lang: str, target_lang: str, project: str = "vexy-markliff") -> str:
+    """Return the header entry of a generated catalog.
+
+    Args:
+        source_lang: Source language code
+        target_lang: Target language code
+        project: Value of ``Project-Id-Version``
+
+    Returns:
+        Header entry text including the trailing blank line
+    """
+    fields = (
+        f"Project-Id-Version: {project}\n"
+        f"Language: {target_lang}\n"
+        "MIME-Version: 1.0\n"
+        "Content-Type: text/plain; charset=UTF-8\n"
+        "Content-Transfer-Encoding: 8bit\n"
+        f"X-Source-Language: {source_lang}\n"
+        "X-Generator: vexy-markliff\n"
+    )
+    return _po_string("msgid", "") + _po_string("msgstr", fields) + "\n"
+
+
+def write_po(
+    units: Iterable["TranslationUnit"],
+    out: TextIO,
+    source_lang: str,
+    target_lang: str,
+    project: str = "vexy-markliff",
+) -> int:
+    """Stream translation units to a PO catalog.
+
+    Units with a target are written as translated entries. Units without one
+    but with a TM candidate get the best candidate as ``msgstr`` flagged
+    ``#, fuzzy``, the gettext convention for translations needing review.
+    Inline codes are written as their original markup.
+
+    Args:
+        units: Translation units in document order
+        out: Text stream to write to
+        source_lang: Source language code
+        target_lang: Target language code
+        project: Value of ``Project-Id-Version``
+
+    Returns:
+        Number of entries written (excluding the header)
+    """
+    out.write(po_header(source_lang, target_lang, project))
+    count = 0
+    for unit in units:
+        msgstr = render_inline(unit.target, unit.target_codes) if unit.target else ""
+        if not msgstr and unit.matches:
+            msgstr = unit.matches[0].target
+            out.write(f"#. TM match {unit.matches[0].similarity:g}%\n#, fuzzy\n")
+        out.write(_po_string("msgctxt", entry_key(unit)))
+        out.write(_po_string("msgid", render_inline(unit.source, unit.codes)))
+        out.write(_po_string("msgstr", msgstr))
+        out.write("\n")
+        count += 1
+    return count
+
+
+def iter_po(lines: Iterable[str]) -> Iterator[PoEntry]:
+    """Stream entries from PO text.
+
+    The header entry (empty ``msgid``) and obsolete ``#~`` entries are
+    skipped. For plural entries the singular ``msgid`` and ``msgstr[0]`` are
+    returned.
+
+    Args:
+        lines: Lines of a PO file (an open text file works)
+
+    Yields:
+        PoEntry for each catalog entry
+
+    Raises:
+        ParsingError: If a line cannot be parsed
+    """
+    fields: dict[str, str] = {}
+    fuzzy = False
+    current: str | None = None
+
+    def entry() -> PoEntry | None:
+        if "msgid" not in fields or not fields["msgid"]:
+            return None
+        return PoEntry(fields.get("msgctxt"), fields["msgid"], fields.get("msgstr", ""), fuzzy)
+
+    for lineno, raw in enumerate(lines, 1):
+        line = raw.strip()
+        if not line or line.startswith("#~"):
+            continue
+        if line.startswith("#"):
+            # A comment after strings starts the next entry
+            if current is not None:
+                result = entry()
+                if result is not None:
+                    yield result
+                fields, fuzzy, current = {}, False, None
+            if line.startswith("#,") and any(flag.strip() == "fuzzy" for flag in line[2:].split(",")):
+                fuzzy = True
+            continue
+        if line.startswith('"'):
+            if current is None or line == '"' or not line.endswith('"'):
+                msg = f"Unexpected string continuation on line {lineno}"
+                raise ParsingError(msg)
+            fields[current] += unescape_po(line[1:-1])
+            continue
+        match = _KEYWORD_RE.match(line)
+        if match is None:
+            msg = f"Cannot parse PO line {lineno}: {line[:60]}"
+            raise ParsingError(msg)
+        keyword, value = match.groups()
+        if keyword == "msgstr[0]":
+            keyword = "msgstr"
+        if keyword in ("msgctxt", "msgid") and current is not None and current.startswith("msgstr"):
+            result = entry()
+            if result is not None:
+                yield result
+            fields, fuzzy = {}, False
+        fields[keyword] = unescape_po(value)
+        current = keyword
+
+    result = entry()
+    if result is not None:
+        yield result
+
+
+def export_units(units: Iterable["TranslationUnit"], out: IO[bytes], source_lang: str, target_lang: str) -> int:
+    """Write units as a UTF-8 PO catalog to a binary stream (converter export hook)."""
+    text = io.TextIOWrapper(out, encoding="utf-8", newline="\n", write_through=True)
+    try:
+        return write_po(units, text, source_lang, target_lang)
+    finally:
+        text.detach()
+
+
+def merge_entries(source: Path | IO[bytes]) -> Iterator[tuple[str, str, str | None, bool]]:
+    """Yield (text, source, attribute, owned) to merge for each entry.
+
+    The text is the reviewed translation, else the source; the attribute
+    and owner are read from the entry key.
+    """
+    if isinstance(source, Path):
+        with open(source, encoding="utf-8") as f:
+            yield from _merge_lines(f)
+    else:
+        text = io.TextIOWrapper(source, encoding="utf-8")
+        try:
+            yield from _merge_lines(text)
+        finally:
+            text.detach()
+
+
+def _merge_lines(lines: Iterable[str]) -> Iterator[tuple[str, str, str | None, bool]]:
+    """Yield merge entries of PO lines."""
+    for entry in iter_po(lines):
+        text = entry.msgstr if entry.msgstr and not entry.fuzzy else entry.msgid
+        key = entry.msgctxt or ""
+        yield text, entry.msgid, key_attribute(key), key_owned(key)
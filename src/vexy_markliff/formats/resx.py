@@ -0,0 +1,131 @@
+"""Streaming .NET resx writer and reader.
+
+Each unit becomes a ``<data>`` entry named after its key (the unit id, see
+``entry_key``), with the translation (or the source while untranslated) as
+``<value>`` and the source text as ``<comment>``, inline codes written as
+their original markup. Entries are serialized through the shared incremental
+XML writer and read back with the hardened iterparse reader.
+"""
+# this_file: src/vexy_markliff/formats/resx.py
+
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, NamedTuple
+
+from lxml import etree
+
+from vexy_markliff.core.streaming import element_text, iterparse_xliff, local_name, release, xml_writer
+from vexy_markliff.exceptions import ParsingError
+from vexy_markliff.formats import entry_key, key_attribute, key_owned
+from vexy_markliff.models.inline import render_inline
+
+if TYPE_CHECKING:
+    from vexy_markliff.models.xliff import TranslationUnit
+
+XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
+
+# Standard headers identifying a resx 2.0 file to the .NET resource tools
+RESX_HEADERS = (
+    ("resmimetype", "text/microsoft-resx"),
+    ("version", "2.0"),
+    (
+        "reader",
+        (
+            "System.Resources.ResXResourceReader, System.Windows.Forms, Version=4.0.0.0, "
+            "Culture=neutral, PublicKeyToken=b77a5c561934e089"
+        ),
+    ),
+    (
+        "writer",
+        (
+            "System.Resources.ResXResourceWriter, System.Windows.Forms, Version=4.0.0.0, "
+            "Culture=neutral, PublicKeyToken=b77a5c561934e089"
+        ),
+    ),
+)
+
+
+class ResxEntry(NamedTuple):
+    """One string ``<data>`` entry read from a resx file."""
+
+    name: str
+    value: str
+    comment: str | None
+
+
+def write_resx(units: Iterable["TranslationUnit"], out: IO[bytes]) -> int:
+    """Stream translation units to a resx file.
+
+    Args:
+        units: Translation units in document order
+        out: Binary stream to write to
+
+    Returns:
+        Number of entries written
+    """
+    count = 0
+    with xml_writer(out) as xf, xf.element("root"):
+        # One entry per line keeps diffs of exported files readable
+        xf.write("\n")
+        for name, value in RESX_HEADERS:
+            header = etree.Element("resheader", name=name)
+            etree.SubElement(header, "value").text = value
+            header.tail = "\n"
+            xf.write(header)
+        for unit in units:
+            data = etree.Element("data", {"name": entry_key(unit), XML_SPACE: "preserve"})
+            source = render_inline(unit.source, unit.codes)
+            etree.SubElement(data, "value").text = (
+                render_inline(unit.target, unit.target_codes) if unit.target else source
+            )
+            etree.SubElement(data, "comment").text = source
+            data.tail = "\n"
+            xf.write(data)
+            count += 1
+    return count
+
+
+def iter_resx(source: str | Path | IO[bytes]) -> Iterator[ResxEntry]:
+    """Stream string entries from a resx file.
+
+    Entries with a ``type`` or ``mimetype`` attribute hold serialized objects
+    rather than strings and are skipped.
+
+    Args:
+        source: File path or binary file object
+
+    Yields:
+        ResxEntry for each string ``<data>`` element
+
+    Raises:
+        ParsingError: If the XML is malformed
+    """
+    try:
+        for _, elem in iterparse_xliff(source, events=("end",), tag=("{*}data",)):
+            if elem.get("type") is None and elem.get("mimetype") is None:
+                value = comment = None
+                for child in elem:
+                    name = local_name(child.tag)
+                    if name == "value":
+                        value = child
+                    elif name == "comment":
+                        comment = child
+                yield ResxEntry(elem.get("name", ""), element_text(value) or "", element_text(comment))
+            release(elem)
+    except etree.XMLSyntaxError as e:
+        msg = f"Invalid resx XML in {source}: {e}"
+        raise ParsingError(msg) from e
+
+
+def export_units(units: Iterable["TranslationUnit"], out: IO[bytes], *_languages: str) -> int:
+    """Write units as resx (converter export hook); languages are implied by the file name."""
+    return write_resx(units, out)
+
+
+def merge_entries(source: str | Path | IO[bytes]) -> Iterator[tuple[str, str, str | None, bool]]:
+    """Yield (value, source, attribute, owned) of each string entry for merging.
+
+    The source is read from the ``<comment>``, falling back to the value.
+    """
+    for entry in iter_resx(source):
+        yield entry.value, entry.comment or entry.value, key_attribute(entry.name), key_owned(entry.name)
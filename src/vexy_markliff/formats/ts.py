@@ -0,0 +1,144 @@
+"""Streaming Qt Linguist TS writer and reader.
+
+Messages are serialized one at a time through the shared incremental XML
+writer and read back with the hardened iterparse reader, releasing each
+``<message>`` once handled.
+"""
+# this_file: src/vexy_markliff/formats/ts.py
+
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, NamedTuple
+
+from lxml import etree
+
+from vexy_markliff.core.streaming import element_text, iterparse_xliff, local_name, release, xml_writer
+from vexy_markliff.exceptions import ParsingError
+from vexy_markliff.formats import entry_key, key_attribute, key_owned
+from vexy_markliff.models.inline import render_inline
+
+if TYPE_CHECKING:
+    from vexy_markliff.models.xliff import TranslationUnit
+
+TS_VERSION = "2.1"
+DEFAULT_CONTEXT = "vexy-markliff"
+
+
+class TsMessage(NamedTuple):
+    """One ``<message>`` read from a TS file."""
+
+    id: str
+    source: str
+    translation: str | None
+    unfinished: bool
+    context: str
+
+
+def write_ts(
+    units: Iterable["TranslationUnit"],
+    out: IO[bytes],
+    source_lang: str,
+    target_lang: str,
+    context: str = DEFAULT_CONTEXT,
+) -> int:
+    """Stream translation units to a Qt TS file.
+
+    All units go into one ``<context>``. Untranslated units get an empty
+    ``<translation type="unfinished"/>``; a TM candidate is written as an
+    unfinished translation for review. Inline codes are written as their
+    original markup.
+
+    Args:
+        units: Translation units in document order
+        out: Binary stream to write to
+        source_lang: Source language code
+        target_lang: Target language code
+        context: Name of the TS context
+
+    Returns:
+        Number of messages written
+    """
+    count = 0
+    with (
+        xml_writer(out, doctype="<!DOCTYPE TS>") as xf,
+        xf.element("TS", version=TS_VERSION, language=target_lang, sourcelanguage=source_lang),
+    ):
+        xf.write("\n")
+        with xf.element("context"):
+            # One message per line keeps diffs of exported files readable
+            name = etree.Element("name")
+            name.text = context
+            name.tail = "\n"
+            xf.write("\n", name)
+            for unit in units:
+                message = etree.Element("message", id=entry_key(unit))
+                etree.SubElement(message, "source").text = render_inline(unit.source, unit.codes)
+                translation = etree.SubElement(message, "translation")
+                if unit.target:
+                    translation.text = render_inline(unit.target, unit.target_codes)
+                else:
+                    translation.set("type", "unfinished")
+                    if unit.matches:
+                        translation.text = unit.matches[0].target
+                message.tail = "\n"
+                xf.write(message)
+                count += 1
+        xf.write("\n")
+    return count
+
+
+def iter_ts(source: str | Path | IO[bytes]) -> Iterator[TsMessage]:
+    """Stream messages from a Qt TS file.
+
+    Args:
+        source: File path or binary file object
+
+    Yields:
+        TsMessage for each ``<message>``
+
+    Raises:
+        ParsingError: If the XML is malformed
+    """
+    context = ""
+    try:
+        for _, elem in iterparse_xliff(source, events=("end",), tag=("{*}name", "{*}message")):
+            if local_name(elem.tag) == "name":
+                parent = elem.getparent()
+                if parent is not None and local_name(parent.tag) == "context":
+                    context = elem.text or ""
+                continue
+            source_elem = translation = None
+            for child in elem:
+                name = local_name(child.tag)
+                if name == "source":
+                    source_elem = child
+                elif name == "translation":
+                    translation = child
+            unfinished = translation is None or translation.get("type") in ("unfinished", "obsolete", "vanished")
+            yield TsMessage(
+                id=elem.get("id", ""),
+                source=element_text(source_elem) or "",
+                translation=element_text(translation),
+                unfinished=unfinished,
+                context=context,
+            )
+            release(elem)
+    except etree.XMLSyntaxError as e:
+        msg = f"Invalid TS XML in {source}: {e}"
+        raise ParsingError(msg) from e
+
+
+def export_units(units: Iterable["TranslationUnit"], out: IO[bytes], source_lang: str, target_lang: str) -> int:
+    """Write units as TS (converter export hook)."""
+    return write_ts(units, out, source_lang, target_lang)
+
+
+def merge_entries(source: str | Path | IO[bytes]) -> Iterator[tuple[str, str, str | None, bool]]:
+    """Yield (text, source, attribute, owned) to merge for each message.
+
+    The text is the finished translation, else the source; the attribute
+    and owner are read from the message id.
+    """
+    for message in iter_ts(source):
+        text = message.translation if message.translation and not message.unfinished else message.source
+        yield text, message.source, key_attribute(message.id), key_owned(message.id)
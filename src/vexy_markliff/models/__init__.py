@@ -8,29 +8,36 @@ from typing import TYPE_CHECKING
 
 # Use lazy imports to avoid importing heavy Pydantic models during package init
 if TYPE_CHECKING:
+    from vexy_markliff.models.document_pair import AlignedSegmentPair, DocumentSegment, TwoDocumentPair
+    from vexy_markliff.models.inline import InlineCode
     from vexy_markliff.models.xliff import TranslationUnit, XLIFFDocument, XLIFFFile
 
+_LAZY_IMPORTS = {
+    "AlignedSegmentPair": "vexy_markliff.models.document_pair",
+    "DocumentSegment": "vexy_markliff.models.document_pair",
+    "InlineCode": "vexy_markliff.models.inline",
+    "TranslationUnit": "vexy_markliff.models.xliff",
+    "TwoDocumentPair": "vexy_markliff.models.document_pair",
+    "XLIFFDocument": "vexy_markliff.models.xliff",
+    "XLIFFFile": "vexy_markliff.models.xliff",
+}
+
 
 def __getattr__(name: str):
     """Lazy import attributes to avoid performance bottlenecks."""
-    if name == "TranslationUnit":
-        from vexy_markliff.models.xliff import TranslationUnit
-
-        return TranslationUnit
-    if name == "XLIFFDocument":
-        from vexy_markliff.models.xliff import XLIFFDocument
-
-        return XLIFFDocument
-    if name == "XLIFFFile":
-        from vexy_markliff.models.xliff import XLIFFFile
-
-        return XLIFFFile
+    if name in _LAZY_IMPORTS:
+        module = __import__(_LAZY_IMPORTS[name], fromlist=[name])
+        return getattr(module, name)
     msg = f"module '{__name__}' has no attribute '{name}'"
     raise AttributeError(msg)
 
 
 __all__ = [
+    "AlignedSegmentPair",
+    "DocumentSegment",
+    "InlineCode",
     "TranslationUnit",
+    "TwoDocumentPair",
     "XLIFFDocument",
     "XLIFFFile",
 ]
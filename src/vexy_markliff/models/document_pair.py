@@ -0,0 +1,58 @@
+"""Pydantic models for two-document (parallel) alignment."""
+# this_file: src/vexy_markliff/models/document_pair.py
+
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+
+class DocumentSegment(BaseModel):
+    """A block of one document: heading, list item, table cell or paragraph."""
+
+    id: str = Field(..., description="Segment identifier, unique within its document")
+    content: str = Field(..., description="Text of the block")
+    type: str = Field("paragraph", description="heading, list_item, cell or paragraph")
+    level: int = Field(0, description="Heading level, or nesting depth of a list item")
+    metadata: dict[str, Any] = Field(default_factory=dict, description="Extraction details such as the tag path")
+
+
+class AlignedSegmentPair(BaseModel):
+    """Source and target text aligned to each other.
+
+    ``alignment_type`` names the number of sentences on each side, e.g.
+    ``1-1``, ``2-1`` or ``1-0`` for source text without a translation.
+    """
+
+    source: str = Field("", description="Source text (empty for target-only text)")
+    target: str | None = Field(None, description="Aligned target text")
+    alignment_type: str = Field("1-1", description="Sentences on each side, source first")
+    cost: float = Field(0.0, description="Alignment cost; lower is more certain")
+    path: str = Field("", description="Structural path of the source block")
+
+
+class TwoDocumentPair(BaseModel):
+    """A source document and its existing translation, with their alignment."""
+
+    source_lang: str = Field("en", description="Source language code")
+    target_lang: str = Field("es", description="Target language code")
+    source_content: str = Field(..., description="Source document text")
+    target_content: str = Field(..., description="Translated document text")
+    source_format: str = Field("markdown", description="markdown or html")
+    target_format: str = Field("markdown", description="markdown or html")
+    aligned_pairs: list[AlignedSegmentPair] = Field(default_factory=list, description="Alignment in source order")
+    warnings: list[str] = Field(default_factory=list, description="Structural alignment warnings")
+
+    def add_aligned_pair(
+        self, source: str, target: str | None, alignment_type: str = "1-1", cost: float = 0.0, path: str = ""
+    ) -> None:
+        """Append an aligned pair."""
+        self.aligned_pairs.append(
+            AlignedSegmentPair(source=source, target=target, alignment_type=alignment_type, cost=cost, path=path)
+        )
+
+    def get_alignment_summary(self) -> dict[str, Any]:
+        """Return the number of pairs per alignment type and the warnings."""
+        types: dict[str, int] = {}
+        for pair in self.aligned_pairs:
+            types[pair.alignment_type] = types.get(pair.alignment_type, 0) + 1
+        return {"pairs": len(self.aligned_pairs), "types": types, "warnings": list(self.warnings)}
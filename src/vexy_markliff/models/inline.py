@@ -0,0 +1,258 @@
+"""Inline codes of translation units (``<pc>``, ``<ph>``, ``<mrk>``).
+
+A unit keeps its text plain, so matching, counting and diffing never see
+markup; its inline codes are stored beside the text as spans over
+character offsets, in document (pre-)order, each naming the code that
+encloses it. The original markup of each code is written once per
+``<file>`` into an ``<originalData>`` table keyed by payload, so markup
+repeated across units (the same link, the same icon) costs one ``<data>``
+element per file.
+"""
+# this_file: src/vexy_markliff/models/inline.py
+
+from collections.abc import Iterator, Sequence
+
+from lxml import etree
+from pydantic import BaseModel, Field
+
+from vexy_markliff.exceptions import ValidationError
+
+CODE_KINDS = ("pc", "ph", "mrk")
+
+# XLIFF 2 Format Style module namespace
+FS_NS = "urn:oasis:names:tc:xliff:fs:2.0"
+FS_ATTR = f"{{{FS_NS}}}fs"
+SUB_FS_ATTR = f"{{{FS_NS}}}subFs"
+
+# Events produced by inline_events
+TEXT, OPEN, CLOSE, PLACEHOLDER = "text", "open", "close", "placeholder"
+
+
+class InlineCode(BaseModel):
+    """An inline code over ``start:end`` of a unit's plain text.
+
+    ``pc`` codes enclose text, ``ph`` codes stand alone (``start == end``)
+    and ``mrk`` codes annotate the text they enclose, e.g. as not translatable.
+    """
+
+    id: str = Field(..., description="Code identifier, unique within the unit")
+    kind: str = Field("pc", description="pc, ph or mrk")
+    start: int = Field(..., description="Offset of the code's first character in the unit text")
+    end: int = Field(..., description="Offset after the code's last character (start for ph)")
+    parent: str | None = Field(None, description="ID of the enclosing pc or mrk, None at top level")
+    data_start: str | None = Field(None, description="Original markup opening the span, or of the placeholder")
+    data_end: str | None = Field(None, description="Original markup closing the span")
+    translate: bool = Field(True, description="False for mrk spans that must not be translated")
+    fs: str | None = Field(None, description="Format Style: the HTML element of the code")
+    sub_fs: str | None = Field(None, description="Format Style: the element's escaped attribute list")
+
+
+class DataTable:
+    """Per-file ``<originalData>`` table that stores each distinct payload once."""
+
+    def __init__(self) -> None:
+        """Initialize an empty table."""
+        self._ids: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def ref(self, payload: str) -> str:
+        """Return the ``<data>`` ID of a payload, adding it on first use.
+
+        Args:
+            payload: Original markup
+
+        Returns:
+            Data ID such as ``d1``
+        """
+        data_id = self._ids.get(payload)
+        if data_id is None:
+            data_id = self._ids[payload] = f"d{len(self._ids) + 1}"
+        return data_id
+
+    def to_element(self) -> etree._Element:
+        """Build the ``<originalData>`` element of the table."""
+        original = etree.Element("originalData")
+        for payload, data_id in self._ids.items():
+            etree.SubElement(original, "data", id=data_id).text = payload
+        return original
+
+
+def read_data(original: etree._Element | None) -> dict[str, str]:
+    """Map the data IDs of an ``<originalData>`` element to their payloads."""
+    if original is None:
+        return {}
+    return {data.get("id", ""): "".join(data.itertext()) for data in original if _local(data.tag) == "data"}
+
+
+def inline_events(text: str, codes: Sequence[InlineCode]) -> Iterator[tuple[str, str | InlineCode]]:
+    """Interleave a unit's text with its codes in document order.
+
+    Args:
+        text: Plain unit text
+        codes: Codes in document order
+
+    Yields:
+        ``(TEXT, str)``, ``(OPEN, code)``, ``(CLOSE, code)`` and ``(PLACEHOLDER, code)`` events
+    """
+    stack: list[InlineCode] = []
+    pos = 0
+    for code in codes:
+        while stack and stack[-1].id != code.parent:
+            top = stack.pop()
+            if top.end > pos:
+                yield TEXT, text[pos : top.end]
+                pos = top.end
+            yield CLOSE, top
+        if code.start > pos:
+            yield TEXT, text[pos : code.start]
+            pos = code.start
+        if code.kind == "ph":
+            yield PLACEHOLDER, code
+        else:
+            yield OPEN, code
+            stack.append(code)
+    while stack:
+        top = stack.pop()
+        if top.end > pos:
+            yield TEXT, text[pos : top.end]
+            pos = top.end
+        yield CLOSE, top
+    if pos < len(text):
+        yield TEXT, text[pos:]
+
+
+def write_inline(container: etree._Element, text: str, codes: Sequence[InlineCode], data: DataTable) -> None:
+    """Fill a ``<source>`` or ``<target>`` element with text and inline codes.
+
+    Args:
+        container: Empty element to fill
+        text: Plain unit text
+        codes: Codes in document order
+        data: Table receiving the original markup of the codes
+    """
+    if not codes:
+        container.text = text
+        return
+    stack = [container]
+    for event, value in inline_events(text, codes):
+        if event == TEXT:
+            _append_text(stack[-1], value)
+        elif event == CLOSE:
+            stack.pop()
+        else:
+            elem = etree.SubElement(stack[-1], value.kind, id=value.id)
+            if value.kind == "mrk":
+                if not value.translate:
+                    elem.set("translate", "no")
+            elif value.kind == "ph":
+                if value.data_start is not None:
+                    elem.set("dataRef", data.ref(value.data_start))
+            else:
+                if value.data_start is not None:
+                    elem.set("dataRefStart", data.ref(value.data_start))
+                if value.data_end is not None:
+                    elem.set("dataRefEnd", data.ref(value.data_end))
+            if value.fs:
+                elem.set(FS_ATTR, value.fs)
+            if value.sub_fs:
+                elem.set(SUB_FS_ATTR, value.sub_fs)
+            if event == OPEN:
+                stack.append(elem)
+
+
+def read_inline(container: etree._Element, data: dict[str, str]) -> tuple[str, list[InlineCode]]:
+    """Split a ``<source>`` or ``<target>`` element into plain text and inline codes.
+
+    Args:
+        container: Element to read
+        data: Payloads of the data IDs in scope (see ``read_data``)
+
+    Returns:
+        (plain text, codes in document order)
+
+    Raises:
+        ValidationError: If a code references a data ID that is not defined
+    """
+    parts: list[str] = []
+    codes: list[InlineCode] = []
+    length = 0
+
+    def payload(elem: etree._Element, attr: str) -> str | None:
+        ref = elem.get(attr)
+        if ref is None:
+            return None
+        if ref not in data:
+            msg = f"Inline code {elem.get('id')} references undefined data {ref}"
+            raise ValidationError(msg)
+        return data[ref]
+
+    def walk(elem: etree._Element, parent: str | None) -> None:
+        nonlocal length
+        if elem.text:
+            parts.append(elem.text)
+            length += len(elem.text)
+        for child in elem:
+            kind = _local(child.tag) if isinstance(child.tag, str) else ""
+            if kind in CODE_KINDS:
+                code = InlineCode(
+                    id=child.get("id") or str(len(codes) + 1),
+                    kind=kind,
+                    start=length,
+                    end=length,
+                    parent=parent,
+                    data_start=payload(child, "dataRef" if kind == "ph" else "dataRefStart"),
+                    data_end=payload(child, "dataRefEnd"),
+                    translate=child.get("translate") != "no",
+                    fs=child.get(FS_ATTR),
+                    sub_fs=child.get(SUB_FS_ATTR),
+                )
+                codes.append(code)
+                if kind != "ph":
+                    walk(child, code.id)
+                    code.end = length
+            elif isinstance(child.tag, str):
+                walk(child, parent)
+            if child.tail:
+                parts.append(child.tail)
+                length += len(child.tail)
+
+    walk(container, None)
+    return "".join(parts), codes
+
+
+def render_inline(text: str, codes: Sequence[InlineCode]) -> str:
+    """Return the text with the original markup of its codes restored.
+
+    Args:
+        text: Plain unit text
+        codes: Codes in document order
+
+    Returns:
+        Text with each code's original markup around or at its span
+    """
+    if not codes:
+        return text
+    out = []
+    for event, value in inline_events(text, codes):
+        if event == TEXT:
+            out.append(value)
+        elif event == CLOSE:
+            out.append(value.data_end or "")
+        else:
+            out.append(value.data_start or "")
+    return "".join(out)
+
+
+def _append_text(parent: etree._Element, text: str) -> None:
+    """Append text after the last child of ``parent`` (or to its text)."""
+    if len(parent):
+        last = parent[-1]
+        last.tail = (last.tail or "") + text
+    else:
+        parent.text = (parent.text or "") + text
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
@@ -6,12 +6,58 @@ from typing import Any, Dict, List, Optional
 from lxml import etree
 from pydantic import BaseModel, Field
 
+from vexy_markliff.config import STORAGE_MODES
 from vexy_markliff.exceptions import ValidationError
+from vexy_markliff.models.inline import (
+    FS_ATTR,
+    FS_NS,
+    SUB_FS_ATTR,
+    DataTable,
+    InlineCode,
+    read_data,
+    read_inline,
+    render_inline,
+    write_inline,
+)
 from vexy_markliff.utils import get_logger
 
 logger = get_logger(__name__)
 
 
+XLIFF_NS = "urn:oasis:names:tc:xliff:document:2.1"
+# XLIFF 2 Translation Candidates module namespace
+MTC_NS = "urn:oasis:names:tc:xliff:matches:2.0"
+# Project namespace of the attributes linking attribute sub-units to their owner unit
+MARKLIFF_NS = "urn:vexy-markliff:xliff:1.0"
+ATTRIBUTE_ATTR = f"{{{MARKLIFF_NS}}}attribute"
+OWNER_ATTR = f"{{{MARKLIFF_NS}}}owner"
+
+
+def xliff_start_tag(version: str = "2.1") -> str:
+    """Return the opening ``<xliff`` tag, without its closing ``>``.
+
+    The Format Style namespace is declared here once for the whole document.
+    lxml writes namespace declarations ahead of attributes, so the tag is
+    built by hand to keep ``version`` first.
+
+    Args:
+        version: XLIFF version attribute
+
+    Returns:
+        Start tag up to and including its last attribute
+    """
+    return f'<xliff version="{version}" xmlns="{XLIFF_NS}" xmlns:fs="{FS_NS}"'
+
+
+class TranslationMatch(BaseModel):
+    """Represents a translation candidate (``<mtc:match>``) for a unit."""
+
+    source: str = Field(..., description="Source text of the candidate")
+    target: str = Field(..., description="Target text of the candidate")
+    similarity: float = Field(..., description="Similarity to the unit source (0-100)")
+    origin: str = Field("tm", description="Where the candidate came from")
+
+
 class TranslationUnit(BaseModel):
     """Represents a translation unit in XLIFF."""
 
@@ -19,6 +65,76 @@ class TranslationUnit(BaseModel):
     source: str = Field(..., description="Source text content")
     target: str | None = Field(None, description="Target text content")
     state: str = Field("new", description="Translation state")
+    matches: list[TranslationMatch] = Field(default_factory=list, description="Translation candidates")
+    notes: list[str] = Field(default_factory=list, description="Notes for translators and reviewers")
+    codes: list[InlineCode] = Field(default_factory=list, description="Inline codes of the source text")
+    target_codes: list[InlineCode] = Field(default_factory=list, description="Inline codes of the target text")
+    fs: str | None = Field(None, description="Format Style: the HTML element the text came from")
+    sub_fs: str | None = Field(None, description="Format Style: the element's escaped attribute list")
+    attribute: str | None = Field(None, description="HTML attribute whose value this sub-unit holds")
+    owner: str | None = Field(None, description="ID of the unit holding the text of the attribute's element")
+
+    def to_element(self, storage: str = "source", data: DataTable | None = None) -> etree._Element:
+        """Build the ``<trans-unit>`` element for this unit.
+
+        The unit keeps its extracted text once, in ``source``; in ``target``
+        and ``both`` storage that same string (and its inline codes) is
+        written as the target unless the unit has a translation of its own.
+
+        Args:
+            storage: ``source``, ``target`` or ``both``
+            data: File-level table receiving the original markup of inline
+                codes; without one, the unit gets its own ``<originalData>``
+
+        Returns:
+            Unqualified element, placed in the document namespace by its parent
+        """
+        unit_elem = etree.Element("trans-unit", nsmap={"vm": MARKLIFF_NS} if self.attribute else None)
+        unit_elem.set("id", self.id)
+        unit_elem.set("state", self.state)
+        if self.fs:
+            unit_elem.set(FS_ATTR, self.fs)
+        if self.sub_fs:
+            unit_elem.set(SUB_FS_ATTR, self.sub_fs)
+        if self.attribute:
+            unit_elem.set(ATTRIBUTE_ATTR, self.attribute)
+        if self.owner:
+            unit_elem.set(OWNER_ATTR, self.owner)
+        table = data if data is not None else DataTable()
+
+        # Add source
+        if storage != "target":
+            source_elem = etree.SubElement(unit_elem, "source")
+            write_inline(source_elem, self.source, self.codes, table)
+
+        # Add target if present
+        if self.target:
+            target, target_codes = self.target, self.target_codes
+        elif storage != "source":
+            target, target_codes = self.source, self.codes
+        else:
+            target, target_codes = None, []
+        if target:
+            target_elem = etree.SubElement(unit_elem, "target")
+            write_inline(target_elem, target, target_codes, table)
+
+        if data is None and len(table):
+            unit_elem.insert(0, table.to_element())
+
+        for note in self.notes:
+            etree.SubElement(unit_elem, "note").text = note
+
+        # Add translation candidates
+        if self.matches:
+            matches_elem = etree.SubElement(unit_elem, f"{{{MTC_NS}}}matches", nsmap={"mtc": MTC_NS})
+            for i, match in enumerate(self.matches, 1):
+                match_elem = etree.SubElement(matches_elem, f"{{{MTC_NS}}}match")
+                match_elem.set("id", f"{self.id}-m{i}")
+                match_elem.set("similarity", f"{match.similarity:g}")
+                match_elem.set("origin", match.origin)
+                etree.SubElement(match_elem, "source").text = match.source
+                etree.SubElement(match_elem, "target").text = match.target
+        return unit_elem
 
 
 class XLIFFFile(BaseModel):
@@ -27,8 +143,19 @@ class XLIFFFile(BaseModel):
     id: str = Field(..., description="File identifier")
     source_language: str = Field(..., description="Source language code")
     target_language: str = Field(..., description="Target language code")
+    original: str | None = Field(None, description="Path of the source document")
+    storage: str = Field("source", description="Where unit text is written: source, target or both")
     units: list[TranslationUnit] = Field(default_factory=list, description="Translation units")
 
+    def attributes(self) -> dict[str, str]:
+        """Return the attributes of this file's ``<file>`` element."""
+        attrib = {"id": self.id}
+        if self.original:
+            attrib["original"] = self.original
+        attrib["source-language"] = self.source_language
+        attrib["target-language"] = self.target_language
+        return attrib
+
 
 class XLIFFDocument(BaseModel):
     """Represents complete XLIFF 2.1 document."""
@@ -36,29 +163,69 @@ class XLIFFDocument(BaseModel):
     version: str = Field("2.1", description="XLIFF version")
     files: list[XLIFFFile] = Field(default_factory=list, description="XLIFF files")
 
-    def __init__(self, source_lang: str = "en", target_lang: str = "es", content: dict[str, Any] | None = None, **data):
+    def __init__(
+        self,
+        source_lang: str = "en",
+        target_lang: str = "es",
+        content: dict[str, Any] | None = None,
+        id_strategy: str = "position",
+        id_collision: str = "suffix",
+        *,
+        storage: str = "source",
+        **data,
+    ):
         """Initialize XLIFF document with content.
 
         Args:
             source_lang: Source language code
             target_lang: Target language code
             content: Parsed content from parser
+            id_strategy: How unit IDs are assigned: ``position`` (``unit_1``...)
+                or ``content`` (hash of source, structural path and occurrence)
+            id_collision: Content ID collision policy: ``suffix`` or ``error``
+            storage: One-document storage mode: ``source`` (default), ``target``
+                or ``both``; the text is stored once per unit in every mode
             **data: Additional data for Pydantic
+
+        Raises:
+            ValidationError: If the storage mode is unknown
         """
         super().__init__(**data)
+        if storage not in STORAGE_MODES:
+            msg = f"Unknown storage mode: {storage}. Use one of {', '.join(STORAGE_MODES)}"
+            raise ValidationError(msg)
 
         if content:
+            from vexy_markliff.core.ids import UnitIdAllocator  # noqa: PLC0415 - cycle via tm.memory
+
             # Create translation units from parsed content
             units = []
             segments = content.get("segments", [])
+            ids = UnitIdAllocator(id_strategy, id_collision)
 
-            for i, segment in enumerate(segments):
+            # Attribute sub-units follow the unit holding their element's text
+            owner = None
+            for segment in segments:
                 if segment.get("translatable", True):
-                    unit = TranslationUnit(id=f"unit_{i + 1}", source=segment["content"], state="new")
+                    unit_id = ids.allocate(segment["content"], segment.get("path", ""))
+                    unit = TranslationUnit(
+                        id=unit_id,
+                        source=segment["content"],
+                        state="new",
+                        codes=segment.get("codes", []),
+                        fs=segment.get("fs"),
+                        sub_fs=segment.get("sub_fs"),
+                        attribute=segment.get("attribute"),
+                        owner=owner if segment.get("owner") is not None and "attribute" in segment else None,
+                    )
                     units.append(unit)
+                    if unit.attribute is None:
+                        owner = unit_id
 
             # Create file
-            xliff_file = XLIFFFile(id="file_1", source_language=source_lang, target_language=target_lang, units=units)
+            xliff_file = XLIFFFile(
+                id="file_1", source_language=source_lang, target_language=target_lang, units=units, storage=storage
+            )
             self.files = [xliff_file]
 
     @classmethod
@@ -87,25 +254,68 @@ class XLIFFDocument(BaseModel):
                 target_lang = file_elem.get("target-language", "es")
 
                 units = []
+                target_only = paired = 0
+                seeds: set[str] = set()
+                file_data = read_data(file_elem.find("xliff:originalData", namespaces=ns))
                 for unit_elem in file_elem.xpath(".//xliff:trans-unit", namespaces=ns):
                     unit_id = unit_elem.get("id", f"unit_{len(units) + 1}")
+                    state = unit_elem.get("state", "new")
 
                     source_elem = unit_elem.find("xliff:source", namespaces=ns)
                     target_elem = unit_elem.find("xliff:target", namespaces=ns)
-
-                    source_text = source_elem.text if source_elem is not None else ""
-                    target_text = target_elem.text if target_elem is not None else None
+                    unit_data = read_data(unit_elem.find("xliff:originalData", namespaces=ns))
+                    data = {**file_data, **unit_data} if unit_data else file_data
+
+                    target_text, target_codes = None, []
+                    if target_elem is not None:
+                        target_text, target_codes = read_inline(target_elem, data)
+                        target_text = target_text or None
+                    if source_elem is None and target_text is not None:
+                        # Target-only storage: keep the text once, as the unit's text
+                        source_text, codes = target_text, target_codes
+                        target_text, target_codes = None, []
+                        target_only += 1
+                    else:
+                        source_text, codes = read_inline(source_elem, data) if source_elem is not None else ("", [])
+                        paired += source_elem is not None and target_elem is not None
+                        if target_text is not None and state == "new" and target_text == source_text:
+                            # An untranslated unit whose target repeats its source is a ``both`` storage seed
+                            target_text, target_codes = None, []
+                            seeds.add(unit_id)
 
                     unit = TranslationUnit(
-                        id=unit_id, source=source_text, target=target_text, state=unit_elem.get("state", "new")
+                        id=unit_id,
+                        source=source_text,
+                        target=target_text,
+                        state=state,
+                        notes=[note.text or "" for note in unit_elem.findall("xliff:note", namespaces=ns)],
+                        codes=codes,
+                        target_codes=target_codes,
+                        fs=unit_elem.get(FS_ATTR),
+                        sub_fs=unit_elem.get(SUB_FS_ATTR),
+                        attribute=unit_elem.get(ATTRIBUTE_ATTR),
+                        owner=unit_elem.get(OWNER_ATTR),
                     )
                     units.append(unit)
 
+                if units and target_only == len(units):
+                    storage = "target"
+                elif seeds and paired == len(units):
+                    storage = "both"
+                else:
+                    # Outside ``both`` storage an identical target is the unit's own
+                    storage = "source"
+                    for unit in units:
+                        if unit.id in seeds:
+                            unit.target, unit.target_codes = unit.source, unit.codes
+
                 xliff_file = XLIFFFile(
                     id=file_elem.get("id", "file_1"),
+                    original=file_elem.get("original"),
                     source_language=source_lang,
                     target_language=target_lang,
                     units=units,
+                    storage=storage,
                 )
                 files.append(xliff_file)
 
@@ -124,34 +334,25 @@ class XLIFFDocument(BaseModel):
         """
         try:
             # Create XLIFF root element
-            xliff = etree.Element("xliff")
+            xliff = etree.Element("xliff", nsmap={"fs": FS_NS})
             xliff.set("version", self.version)
-            xliff.set("xmlns", "urn:oasis:names:tc:xliff:document:2.1")
+            xliff.set("xmlns", XLIFF_NS)
 
             # Add files
             for xliff_file in self.files:
-                file_elem = etree.SubElement(xliff, "file")
-                file_elem.set("id", xliff_file.id)
-                file_elem.set("source-language", xliff_file.source_language)
-                file_elem.set("target-language", xliff_file.target_language)
+                file_elem = etree.SubElement(xliff, "file", xliff_file.attributes())
 
-                # Add units
+                # Add units; their inline markup is collected once per file
+                data = DataTable()
                 for unit in xliff_file.units:
-                    unit_elem = etree.SubElement(file_elem, "trans-unit")
-                    unit_elem.set("id", unit.id)
-                    unit_elem.set("state", unit.state)
-
-                    # Add source
-                    source_elem = etree.SubElement(unit_elem, "source")
-                    source_elem.text = unit.source
-
-                    # Add target if present
-                    if unit.target:
-                        target_elem = etree.SubElement(unit_elem, "target")
-                        target_elem.text = unit.target
+                    file_elem.append(unit.to_element(xliff_file.storage, data))
+                if len(data):
+                    file_elem.insert(0, data.to_element())
 
-            # Convert to string
-            return etree.tostring(xliff, encoding="unicode", pretty_print=True)
+            # Convert to string, moving the fs declaration behind the attributes
+            xml = etree.tostring(xliff, encoding="unicode", pretty_print=True)
+            written = f'<xliff xmlns:fs="{FS_NS}" version="{self.version}" xmlns="{XLIFF_NS}"'
+            return xml.replace(written, xliff_start_tag(self.version), 1)
 
         except Exception as e:
             logger.error(f"Failed to generate XLIFF XML: {e}")
@@ -165,10 +366,14 @@ class XLIFFDocument(BaseModel):
         Returns:
             Structured content dict
         """
-        segments = []
-        for xliff_file in self.files:
-            for unit in xliff_file.units:
-                segments.append({"content": unit.source, "translatable": True, "element": "text"})
+        from vexy_markliff.core.parser import merge_segments  # noqa: PLC0415 - loaded on first use
+
+        # Attribute values go back onto their owner's element rather than into text of their own
+        segments = merge_segments(
+            (render_inline(unit.source, unit.codes), unit.source, unit.attribute, unit.owner is not None)
+            for xliff_file in self.files
+            for unit in xliff_file.units
+        )
 
         return {
             "segments": segments,
@@ -0,0 +1,37 @@
+"""Machine translation for vexy-markliff.
+
+This package contains the machine-translation (MT) subsystem:
+- MTProvider: Interface of batch translation backends
+- HTTPProvider: JSON-over-HTTP backend with pooled keep-alive connections and retries
+- MTPretranslator: Batched, concurrent pre-translation of untranslated units
+"""
+# this_file: src/vexy_markliff/mt/__init__.py
+
+from typing import TYPE_CHECKING
+
+# Use lazy imports so http.client and thread pools are only loaded when MT is used
+if TYPE_CHECKING:
+    from vexy_markliff.mt.pretranslate import MTPretranslator
+    from vexy_markliff.mt.provider import HTTPProvider, MTProvider
+
+_LAZY_IMPORTS = {
+    "HTTPProvider": "vexy_markliff.mt.provider",
+    "MTPretranslator": "vexy_markliff.mt.pretranslate",
+    "MTProvider": "vexy_markliff.mt.provider",
+}
+
+
+def __getattr__(name: str):
+    """Lazy import attributes to avoid performance bottlenecks."""
+    if name in _LAZY_IMPORTS:
+        module = __import__(_LAZY_IMPORTS[name], fromlist=[name])
+        return getattr(module, name)
+    msg = f"module '{__name__}' has no attribute '{name}'"
+    raise AttributeError(msg)
+
+
+__all__ = [
+    "HTTPProvider",
+    "MTPretranslator",
+    "MTProvider",
+]
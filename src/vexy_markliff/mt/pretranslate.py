@@ -0,0 +1,250 @@
+"""Pre-translation of XLIFF documents with a machine-translation provider.
+
+Units without a target are grouped per language pair and deduplicated, so
+text repeated across units and files is sent once. The distinct segments
+are sent in batches of up to ``batch_size`` per request, with at most
+``concurrency`` requests in flight on worker threads. Translations are
+written back as targets with ``state="initial"``, XLIFF 2's state for text
+nobody has reviewed yet.
+
+Inline codes travel as XML elements (see ``vexy_markliff.mt.provider``) and
+are mapped back to the source codes by ID, so the original markup of links
+and placeholders is restored from the unit itself rather than trusted to
+the backend. A translation that is not well-formed or invents codes leaves
+its units untranslated and is counted as rejected.
+"""
+# this_file: src/vexy_markliff/mt/pretranslate.py
+
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from xml.sax.saxutils import escape, quoteattr
+
+from lxml import etree
+
+from vexy_markliff.exceptions import ConversionError
+from vexy_markliff.models.inline import CLOSE, OPEN, TEXT, InlineCode, inline_events, read_inline
+from vexy_markliff.models.xliff import XLIFFDocument
+from vexy_markliff.utils import atomic_write_text, get_logger
+
+if TYPE_CHECKING:
+    from vexy_markliff.models.xliff import TranslationUnit
+    from vexy_markliff.mt.provider import MTProvider
+
+logger = get_logger(__name__)
+
+DEFAULT_CONCURRENCY = 4
+MT_STATE = "initial"
+
+_PARSER = etree.XMLParser(resolve_entities=False, no_network=True)
+
+
+@dataclass
+class MTReport:
+    """Summary of a pre-translation run."""
+
+    units: int = 0
+    translated: int = 0
+    segments: int = 0
+    requests: int = 0
+    failed: int = 0
+    rejected: int = 0
+    errors: list[str] = field(default_factory=list)
+
+    def to_dict(self, *, details: bool = False) -> dict[str, Any]:
+        """Return the summary as a plain dict.
+
+        Args:
+            details: Include the error message of every failed request
+
+        Returns:
+            Units without a target, units translated, distinct segments sent,
+            requests made and units left untranslated by failed requests or
+            rejected translations
+        """
+        report: dict[str, Any] = {
+            "units": self.units,
+            "translated": self.translated,
+            "segments": self.segments,
+            "requests": self.requests,
+            "failed": self.failed,
+            "rejected": self.rejected,
+        }
+        if details:
+            report["errors"] = list(self.errors)
+        return report
+
+
+def encode_segment(text: str, codes: Sequence[InlineCode]) -> str:
+    """Return a unit's text as an XML fragment with its inline codes as elements.
+
+    Args:
+        text: Plain unit text
+        codes: Codes in document order
+
+    Returns:
+        Escaped text with ``<pc>``, ``<ph/>`` and ``<mrk>`` elements
+    """
+    if not codes:
+        return escape(text)
+    out = []
+    for event, value in inline_events(text, codes):
+        if event == TEXT:
+            out.append(escape(value))
+        elif event == CLOSE:
+            out.append(f"</{value.kind}>")
+        elif event == OPEN:
+            locked = ' translate="no"' if not value.translate else ""
+            out.append(f"<{value.kind} id={quoteattr(value.id)}{locked}>")
+        else:
+            out.append(f"<ph id={quoteattr(value.id)}/>")
+    return "".join(out)
+
+
+def decode_segment(translation: str, codes: Sequence[InlineCode]) -> tuple[str, list[InlineCode]] | None:
+    """Read a translated fragment back into plain text and codes.
+
+    Codes take their original markup and Format Style from the source code
+    with the same ID; codes the translation drops are left to QA.
+
+    Args:
+        translation: Fragment returned by the provider
+        codes: Inline codes of the unit's source
+
+    Returns:
+        (plain text, codes), or None if the fragment is not well-formed, is
+        empty or has a code the source does not
+    """
+    try:
+        container = etree.fromstring(f"<target>{translation}</target>", _PARSER)
+    except etree.XMLSyntaxError:
+        return None
+    text, target_codes = read_inline(container, {})
+    if not text.strip():
+        return None
+    if not target_codes:
+        return text, []
+    sources = {code.id: code for code in codes}
+    mapped = []
+    for code in target_codes:
+        source = sources.get(code.id)
+        if source is None or source.kind != code.kind:
+            return None
+        mapped.append(
+            code.model_copy(
+                update={
+                    "data_start": source.data_start,
+                    "data_end": source.data_end,
+                    "translate": source.translate,
+                    "fs": source.fs,
+                    "sub_fs": source.sub_fs,
+                }
+            )
+        )
+    return text, mapped
+
+
+class MTPretranslator:
+    """Fill empty targets of XLIFF documents from a machine-translation provider."""
+
+    def __init__(
+        self, provider: "MTProvider", batch_size: int | None = None, concurrency: int = DEFAULT_CONCURRENCY
+    ) -> None:
+        """Initialize the pretranslator.
+
+        Args:
+            provider: Backend translating the segments
+            batch_size: Segments per request (default and upper bound: the
+                provider's ``max_batch``)
+            concurrency: Most requests in flight at a time
+        """
+        self.provider = provider
+        self.batch_size = max(1, min(batch_size or provider.max_batch, provider.max_batch))
+        self.concurrency = max(1, concurrency)
+
+    def prefill(self, document: "XLIFFDocument") -> MTReport:
+        """Machine-translate the units of a document that have no target.
+
+        Files in target-only storage hold their text as the target and are
+        left alone. A ``new`` unit whose target equals its source is a
+        ``both`` storage seed and counts as untranslated.
+
+        Args:
+            document: XLIFF document to update in place
+
+        Returns:
+            MTReport of the run
+        """
+        report = MTReport()
+        # (source language, target language) -> encoded segment -> units with that segment
+        pending: dict[tuple[str, str], dict[str, list[TranslationUnit]]] = {}
+        for xliff_file in document.files:
+            if xliff_file.storage == "target":
+                continue
+            segments = pending.setdefault((xliff_file.source_language, xliff_file.target_language), {})
+            for unit in xliff_file.units:
+                # A ``new`` unit whose target is its source holds a ``both`` storage seed
+                untranslated = unit.target is None or (unit.state == "new" and unit.target == unit.source)
+                if untranslated and unit.source.strip():
+                    segments.setdefault(encode_segment(unit.source, unit.codes), []).append(unit)
+                    report.units += 1
+
+        batches = []
+        for (source_lang, target_lang), segments in pending.items():
+            keys = list(segments)
+            report.segments += len(keys)
+            for i in range(0, len(keys), self.batch_size):
+                batches.append((keys[i : i + self.batch_size], segments, source_lang, target_lang))
+        if not batches:
+            return report
+
+        with ThreadPoolExecutor(max_workers=min(self.concurrency, len(batches))) as pool:
+            futures = {
+                pool.submit(self.provider.translate, keys, source_lang, target_lang): (keys, segments)
+                for keys, segments, source_lang, target_lang in batches
+            }
+            for future in as_completed(futures):
+                keys, segments = futures[future]
+                report.requests += 1
+                try:
+                    translations = future.result()
+                except ConversionError as e:
+                    report.failed += sum(len(segments[key]) for key in keys)
+                    report.errors.append(str(e))
+                    continue
+                for key, translation in zip(keys, translations, strict=True):
+                    for unit in segments[key]:
+                        decoded = decode_segment(translation, unit.codes)
+                        if decoded is None:
+                            report.rejected += 1
+                            continue
+                        unit.target, unit.target_codes = decoded
+                        unit.state = MT_STATE
+                        report.translated += 1
+        return report
+
+
+def pretranslate_file(input_file: str | Path, output_file: str | Path, pretranslator: MTPretranslator) -> MTReport:
+    """Machine-translate the untranslated units of an XLIFF file.
+
+    Args:
+        input_file: XLIFF file to pre-translate
+        output_file: Path of the pre-translated XLIFF
+        pretranslator: Configured pretranslator
+
+    Returns:
+        MTReport of the run
+
+    Raises:
+        ValidationError: If the XLIFF is malformed
+    """
+    document = XLIFFDocument.from_xml(Path(input_file).read_text(encoding="utf-8"))
+    report = pretranslator.prefill(document)
+    atomic_write_text(output_file, document.to_xml())
+    logger.info(
+        f"Pre-translated {report.translated} of {report.units} units of {input_file} "
+        f"in {report.requests} requests ({report.failed} failed, {report.rejected} rejected)"
+    )
+    return report
@@ -0,0 +1,246 @@
+"""Machine-translation providers.
+
+A provider translates a batch of segments in one call. ``HTTPProvider``
+speaks a small JSON protocol over pooled keep-alive connections:
+
+- request: ``POST`` to the endpoint with
+  ``{"source_lang": ..., "target_lang": ..., "format": "xml", "texts": [...]}``
+- response: ``{"translations": [...]}``, one string per text, in order
+
+Segments are XML text fragments: ``&``, ``<`` and ``>`` are escaped and
+inline codes appear as ``<pc id="1">...</pc>``, ``<ph id="2"/>`` and
+``<mrk id="3" translate="no">...</mrk>`` elements that the backend must
+keep. Services with other protocols subclass ``HTTPProvider`` and override
+``build_request`` and ``parse_response``.
+
+Failed requests are retried with exponential backoff and jitter on
+connection errors and on HTTP 408, 429 and 5xx responses, honouring a
+numeric ``Retry-After`` header.
+"""
+# this_file: src/vexy_markliff/mt/provider.py
+
+import http.client
+import json
+import queue
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from http import HTTPStatus
+from typing import Any
+from urllib.parse import urlsplit
+
+from vexy_markliff.exceptions import ConfigurationError, ConversionError
+from vexy_markliff.utils import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_BATCH = 50
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 0.5
+MAX_BACKOFF = 30.0
+
+RETRY_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+class MTProvider(ABC):
+    """Interface of machine-translation backends."""
+
+    # Most segments the backend accepts per call
+    max_batch: int = DEFAULT_MAX_BATCH
+
+    @abstractmethod
+    def translate(self, texts: Sequence[str], source_lang: str, target_lang: str) -> list[str]:
+        """Translate a batch of segments.
+
+        Args:
+            texts: Segments (XML text fragments, see the module docstring)
+            source_lang: Source language code
+            target_lang: Target language code
+
+        Returns:
+            One translation per segment, in order
+
+        Raises:
+            ConversionError: If the batch cannot be translated
+        """
+
+    def close(self) -> None:
+        """Release resources such as open connections."""
+        # Providers without resources keep this no-op default
+        return
+
+
+class ConnectionPool:
+    """Thread-safe pool of keep-alive HTTP connections to one host.
+
+    At most ``size`` connections exist at a time; idle ones are reused most
+    recently used first, so a burst followed by a lull keeps few sockets warm.
+    """
+
+    def __init__(self, url: str, size: int = 4, timeout: float = DEFAULT_TIMEOUT) -> None:
+        """Initialize the pool without connecting.
+
+        Args:
+            url: ``http`` or ``https`` URL of the host
+            size: Most connections open at a time
+            timeout: Socket timeout in seconds
+
+        Raises:
+            ConfigurationError: If the URL is not an http(s) URL
+        """
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            msg = f"Unsupported MT endpoint: {url}. Use an http or https URL"
+            raise ConfigurationError(msg)
+        self._factory = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        self.host = parts.hostname
+        self.port = parts.port
+        self.timeout = timeout
+        self.created = 0
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max(1, size))
+
+    @contextmanager
+    def connection(self) -> Iterator[http.client.HTTPConnection]:
+        """Borrow a connection, waiting while all are in use.
+
+        Connections are returned to the pool after use, or closed if the
+        block raised, since their state is then unknown.
+        """
+        with self._slots:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = self._factory(self.host, self.port, timeout=self.timeout)
+                self.created += 1
+            try:
+                yield conn
+            except BaseException:
+                conn.close()
+                raise
+            self._idle.put(conn)
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+class HTTPProvider(MTProvider):
+    """JSON-over-HTTP provider with connection pooling and retries."""
+
+    def __init__(
+        self,
+        endpoint: str,
+        api_key: str | None = None,
+        *,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        pool_size: int = 4,
+        timeout: float = DEFAULT_TIMEOUT,
+        retries: int = DEFAULT_RETRIES,
+        backoff: float = DEFAULT_BACKOFF,
+    ) -> None:
+        """Initialize the provider.
+
+        Args:
+            endpoint: URL receiving the translation requests
+            api_key: Optional key sent as ``Authorization: Bearer <key>``
+            max_batch: Most segments per request
+            pool_size: Most connections open at a time; match the
+                pretranslator's concurrency
+            timeout: Socket timeout in seconds
+            retries: Retries of a failed request
+            backoff: Delay before the first retry in seconds; it doubles
+                with each further retry, up to ``MAX_BACKOFF``
+
+        Raises:
+            ConfigurationError: If the endpoint is not an http(s) URL
+        """
+        self.pool = ConnectionPool(endpoint, pool_size, timeout)
+        parts = urlsplit(endpoint)
+        self.path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        self.headers = {"Content-Type": "application/json", "Accept": "application/json"}
+        if api_key:
+            self.headers["Authorization"] = f"Bearer {api_key}"
+        self.max_batch = max(1, max_batch)
+        self.retries = max(0, retries)
+        self.backoff = max(0.0, backoff)
+
+    def build_request(self, texts: Sequence[str], source_lang: str, target_lang: str) -> dict[str, Any]:
+        """Return the JSON body of a request."""
+        return {"source_lang": source_lang, "target_lang": target_lang, "format": "xml", "texts": list(texts)}
+
+    def parse_response(self, payload: Any) -> list[str]:
+        """Return the translations of a decoded JSON response."""
+        return payload["translations"]
+
+    def translate(self, texts: Sequence[str], source_lang: str, target_lang: str) -> list[str]:
+        """Translate a batch in one request, retrying transient failures.
+
+        Raises:
+            ConversionError: If the request keeps failing, is rejected or the
+                response does not hold one translation per segment
+        """
+        body = json.dumps(self.build_request(texts, source_lang, target_lang)).encode("utf-8")
+        error = ""
+        for attempt in range(self.retries + 1):
+            delay: float | None = None
+            try:
+                status, retry_after, payload = self._post(body)
+            except (OSError, http.client.HTTPException) as e:
+                error = str(e) or type(e).__name__
+            else:
+                if status == HTTPStatus.OK:
+                    return self._translations(payload, len(texts))
+                error = f"HTTP {status}: {payload[:200].decode('utf-8', 'replace')}"
+                if status not in RETRY_STATUSES:
+                    msg = f"MT request rejected with {error}"
+                    raise ConversionError(msg)
+                delay = retry_after
+            if attempt < self.retries:
+                if delay is None:
+                    # Full jitter keeps concurrent retries from arriving together; it needs no crypto-grade randomness
+                    jitter = random.uniform(0.5, 1.0)  # noqa: S311
+                    delay = min(MAX_BACKOFF, self.backoff * 2**attempt) * jitter
+                logger.debug(f"MT request failed ({error}); retrying in {delay:.2f}s")
+                time.sleep(delay)
+        msg = f"MT request failed after {self.retries + 1} attempts: {error}"
+        raise ConversionError(msg)
+
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self.pool.close()
+
+    def _post(self, body: bytes) -> tuple[int, float | None, bytes]:
+        """Send one request on a pooled connection; return status, Retry-After and body."""
+        with self.pool.connection() as conn:
+            conn.request("POST", self.path, body=body, headers=self.headers)
+            response = conn.getresponse()
+            # The body must be read in full before the connection can be reused
+            payload = response.read()
+        retry_after = response.getheader("Retry-After")
+        try:
+            delay = min(MAX_BACKOFF, float(retry_after)) if retry_after is not None else None
+        except ValueError:
+            delay = None
+        return response.status, delay, payload
+
+    def _translations(self, payload: bytes, expected: int) -> list[str]:
+        """Decode a successful response and check it answers every segment."""
+        try:
+            translations = self.parse_response(json.loads(payload))
+        except (ValueError, KeyError, TypeError) as e:
+            msg = f"Malformed MT response: {e}"
+            raise ConversionError(msg) from e
+        if not isinstance(translations, list) or len(translations) != expected:
+            got = len(translations) if isinstance(translations, list) else type(translations).__name__
+            msg = f"MT response has {got} translations for {expected} segments"
+            raise ConversionError(msg)
+        return [str(text) for text in translations]
@@ -0,0 +1,39 @@
+"""Translation memory for vexy-markliff.
+
+This package contains the translation memory (TM) subsystem:
+- TranslationMemory: In-memory exact-match index used to pre-fill targets
+- FuzzyIndex: N-gram inverted index for fuzzy candidate lookup
+- TMStore: SQLite persistence with bulk insert
+- harvest: Bulk import of translated XLIFF into a TM database
+"""
+# this_file: src/vexy_markliff/tm/__init__.py
+
+from typing import TYPE_CHECKING
+
+# Use lazy imports so the sqlite3 module is only loaded when a TM is used
+if TYPE_CHECKING:
+    from vexy_markliff.tm.fuzzy import FuzzyIndex
+    from vexy_markliff.tm.memory import TranslationMemory
+    from vexy_markliff.tm.store import TMStore
+
+_LAZY_IMPORTS = {
+    "FuzzyIndex": "vexy_markliff.tm.fuzzy",
+    "TranslationMemory": "vexy_markliff.tm.memory",
+    "TMStore": "vexy_markliff.tm.store",
+}
+
+
+def __getattr__(name: str):
+    """Lazy import attributes to avoid performance bottlenecks."""
+    if name in _LAZY_IMPORTS:
+        module = __import__(_LAZY_IMPORTS[name], fromlist=[name])
+        return getattr(module, name)
+    msg = f"module '{__name__}' has no attribute '{name}'"
+    raise AttributeError(msg)
+
+
+__all__ = [
+    "FuzzyIndex",
+    "TMStore",
+    "TranslationMemory",
+]
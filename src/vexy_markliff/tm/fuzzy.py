@@ -0,0 +1,246 @@
+"""Fuzzy translation memory lookup with a character n-gram inverted index."""
+# this_file: src/vexy_markliff/tm/fuzzy.py
+
+import math
+from array import array
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass
+from itertools import chain
+
+from vexy_markliff.tm.memory import normalize_source
+from vexy_markliff.utils import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class FuzzyMatch:
+    """A fuzzy TM match for a query segment."""
+
+    source: str
+    target: str
+    similarity: float  # 0-100, Levenshtein-based
+
+
+def ngrams(text: str, n: int) -> set[str]:
+    """Return the set of character n-grams of a string.
+
+    Strings shorter than ``n`` yield themselves as a single gram.
+
+    Args:
+        text: Input text
+        n: Gram length
+
+    Returns:
+        Set of n-grams
+    """
+    if len(text) <= n:
+        return {text}
+    return {text[i : i + n] for i in range(len(text) - n + 1)}
+
+
+def bounded_levenshtein(a: str, b: str, max_distance: int) -> int:
+    """Levenshtein distance with an upper bound, using Myers' bit-parallel algorithm.
+
+    The shorter string is encoded as per-character bitmasks and each character
+    of the longer string updates a whole DP column with a handful of integer
+    operations, so the cost is O(len(b)) big-int steps instead of
+    O(len(a) * len(b)) cell updates. The scan stops as soon as the distance
+    can no longer come back under the bound.
+
+    Args:
+        a: First string
+        b: Second string
+        max_distance: Largest distance of interest
+
+    Returns:
+        The edit distance, or ``max_distance + 1`` if it exceeds the bound
+    """
+    if len(a) > len(b):
+        a, b = b, a
+    over = max_distance + 1
+    if len(b) - len(a) > max_distance:
+        return over
+    if not a:
+        return len(b)
+
+    peq: dict[str, int] = {}
+    for i, char in enumerate(a):
+        peq[char] = peq.get(char, 0) | (1 << i)
+    mask = (1 << len(a)) - 1
+    last = 1 << (len(a) - 1)
+    pv, mv, score = mask, 0, len(a)
+    remaining = len(b)
+    for char in b:
+        remaining -= 1
+        eq = peq.get(char, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | ~(xh | pv)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        # Each remaining character can lower the distance by at most one
+        if score - remaining > max_distance:
+            return over
+        ph = (ph << 1) | 1
+        mh <<= 1
+        pv = (mh | ~(xv | ph)) & mask
+        mv = ph & xv
+    return score if score <= max_distance else over
+
+
+class FuzzyIndex:
+    """Character n-gram inverted index over TM sources for one language pair.
+
+    Candidate retrieval uses prefix filtering: a source within edit distance
+    ``d`` of a query shares at least ``|Q| - n*d`` of the query's n-grams, so it
+    must contain one of the ``n*d + 1`` rarest query grams. Only those short
+    posting lists are probed, within a fixed budget of posting entries, which
+    keeps retrieval sublinear in TM size. Shortlisted candidates are then
+    scored with a bounded bit-parallel edit distance, best-bound first,
+    stopping once no remaining candidate can beat the current results.
+    """
+
+    def __init__(self, n: int = 3, max_candidates: int = 100, probe_budget: int = 20000) -> None:
+        """Initialize an empty index.
+
+        Args:
+            n: Character n-gram length
+            max_candidates: Maximum candidates shortlisted per query
+            probe_budget: Maximum posting entries read per query; once the rarest
+                grams exhaust it, more common grams are not probed
+        """
+        self.n = n
+        self.max_candidates = max_candidates
+        self.probe_budget = probe_budget
+        self._sources: list[str] = []
+        self._targets: list[str] = []
+        self._keys: list[str] = []
+        self._postings: dict[str, array] = {}
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[tuple[str, str]], n: int = 3) -> "FuzzyIndex":
+        """Build an index from (source, target) pairs.
+
+        Args:
+            entries: Iterable of (source, target)
+            n: Character n-gram length
+
+        Returns:
+            Populated FuzzyIndex
+        """
+        index = cls(n=n)
+        for source, target in entries:
+            index.add(source, target)
+        return index
+
+    def add(self, source: str, target: str) -> None:
+        """Add an entry to the index.
+
+        Args:
+            source: Source text
+            target: Translated text
+        """
+        entry_id = len(self._keys)
+        key = normalize_source(source)
+        self._sources.append(source)
+        self._targets.append(target)
+        self._keys.append(key)
+        postings = self._postings
+        for gram in ngrams(key, self.n):
+            posting = postings.get(gram)
+            if posting is None:
+                posting = postings[gram] = array("I")
+            posting.append(entry_id)
+
+    def __len__(self) -> int:
+        """Return the number of indexed entries."""
+        return len(self._keys)
+
+    def lookup(self, text: str, threshold: float = 75.0, limit: int = 3) -> list[FuzzyMatch]:
+        """Return the best matches for a segment.
+
+        Args:
+            text: Query segment
+            threshold: Minimum similarity (0-100)
+            limit: Maximum number of matches
+
+        Returns:
+            Matches sorted by decreasing similarity
+        """
+        query = normalize_source(text)
+        if not query:
+            return []
+        ratio = threshold / 100.0
+        max_distance = math.floor((1 - ratio) * len(query) / ratio) if ratio > 0 else len(query)
+        grams = sorted(ngrams(query, self.n), key=lambda g: len(self._postings.get(g, ())))
+
+        # Prefix filter: any qualifying candidate contains one of these grams
+        probe = []
+        volume = 0
+        for gram in grams[: self.n * max_distance + 1]:
+            posting = self._postings.get(gram)
+            if posting is None:
+                continue
+            if probe and volume + len(posting) > self.probe_budget:
+                break
+            probe.append(posting)
+            volume += len(posting)
+        hits = Counter(chain.from_iterable(probe))
+        shortlist = [entry_id for entry_id, _ in hits.most_common(self.max_candidates)]
+
+        # Count filter: each edit destroys at most n grams, which gives a cheap
+        # lower bound on the distance and an upper bound on the similarity
+        query_grams = set(grams)
+        bounded = []
+        for entry_id in shortlist:
+            key = self._keys[entry_id]
+            longest = max(len(query), len(key))
+            bound = min(max_distance, math.floor((1 - ratio) * longest))
+            missing = len(query_grams) - len(query_grams & ngrams(key, self.n))
+            lower = max(abs(len(query) - len(key)), math.ceil(missing / self.n))
+            if lower <= bound:
+                bounded.append((1 - lower / longest, entry_id, bound, longest))
+        bounded.sort(reverse=True)
+
+        matches: list[FuzzyMatch] = []
+        for best_case, entry_id, bound, longest in bounded:
+            cutoff = bound
+            if len(matches) >= limit:
+                if 100.0 * best_case <= matches[-1].similarity:
+                    break
+                # Only distances that beat the current worst match are of interest
+                cutoff = min(bound, math.ceil((1 - matches[-1].similarity / 100.0) * longest))
+            distance = bounded_levenshtein(query, self._keys[entry_id], cutoff)
+            if distance <= cutoff:
+                similarity = round(100.0 * (1 - distance / longest), 2)
+                matches.append(FuzzyMatch(self._sources[entry_id], self._targets[entry_id], similarity))
+                matches.sort(key=lambda m: m.similarity, reverse=True)
+                del matches[limit:]
+        return matches
+
+    def lookup_batch(self, texts: Iterable[str], threshold: float = 75.0, limit: int = 3) -> list[list[FuzzyMatch]]:
+        """Score many segments in one call.
+
+        Repeated segments are looked up once and share their result.
+
+        Args:
+            texts: Query segments
+            threshold: Minimum similarity (0-100)
+            limit: Maximum number of matches per segment
+
+        Returns:
+            One match list per input segment, in input order
+        """
+        cache: dict[str, list[FuzzyMatch]] = {}
+        results = []
+        for text in texts:
+            matches = cache.get(text)
+            if matches is None:
+                matches = cache[text] = self.lookup(text, threshold, limit)
+            results.append(matches)
+        return results
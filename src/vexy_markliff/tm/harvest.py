@@ -0,0 +1,90 @@
+"""Harvest translation memory entries from translated XLIFF files."""
+# this_file: src/vexy_markliff/tm/harvest.py
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+from vexy_markliff.core.streaming import iter_units
+from vexy_markliff.tm.memory import normalize_source
+from vexy_markliff.tm.store import TMRow, TMStore
+from vexy_markliff.utils import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class ImportStats:
+    """Counters for a TM import run."""
+
+    files: int = 0
+    pairs: int = 0
+    skipped: int = 0
+    written: int = 0
+
+
+def iter_xliff_pairs(
+    paths: Iterable[str | Path],
+    stats: ImportStats | None = None,
+    exclude_states: Iterable[str] = (),
+) -> Iterator[TMRow]:
+    """Stream TM rows from the segments of XLIFF files.
+
+    Files are read with the streaming reader, one unit at a time; no
+    document model is built. Identical pairs from ``new`` units are the
+    seeds of ``both`` storage and are skipped.
+
+    Args:
+        paths: XLIFF files to read
+        stats: Optional counters updated while streaming
+        exclude_states: Unit states whose targets are skipped (for example
+            ``initial`` to leave out machine-translated drafts)
+
+    Yields:
+        (source_lang, target_lang, source_key, source, target) rows
+    """
+    stats = stats if stats is not None else ImportStats()
+    excluded = frozenset(exclude_states)
+    for path in paths:
+        stats.files += 1
+        for unit in iter_units(Path(path)):
+            if unit.state in excluded:
+                stats.skipped += len(unit.segments)
+                continue
+            # A ``new`` unit whose target repeats its source is a ``both`` storage seed, not a translation
+            seeded = unit.state == "new"
+            for source, target in unit.segments:
+                key = normalize_source(source)
+                if not key or not target or not target.strip() or (seeded and target == source):
+                    stats.skipped += 1
+                    continue
+                stats.pairs += 1
+                yield unit.source_lang, unit.target_lang, key, source, target
+
+
+def import_xliff(
+    paths: Iterable[str | Path],
+    db: str | Path,
+    on_conflict: str = "replace",
+    batch_size: int = 50000,
+    exclude_states: Iterable[str] = (),
+) -> ImportStats:
+    """Bulk-load source/target pairs from XLIFF files into a TM database.
+
+    Args:
+        paths: XLIFF files to read
+        db: Path to the TM SQLite database (created if missing)
+        on_conflict: ``replace`` (newest wins) or ``keep`` (existing wins)
+        batch_size: Rows per transaction
+        exclude_states: Unit states whose targets are skipped
+
+    Returns:
+        ImportStats with file, pair, skipped and written counts
+    """
+    stats = ImportStats()
+    with TMStore(db) as store:
+        stats.written = store.bulk_load(
+            iter_xliff_pairs(paths, stats, exclude_states), on_conflict=on_conflict, batch_size=batch_size
+        )
+    logger.info(f"Imported {stats.written} TM entries from {stats.files} files ({stats.skipped} skipped)")
+    return stats
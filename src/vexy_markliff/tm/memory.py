@@ -0,0 +1,214 @@
+"""Exact-match translation memory with an in-memory hash index."""
+# this_file: src/vexy_markliff/tm/memory.py
+
+import unicodedata
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from vexy_markliff.exceptions import FileOperationError
+from vexy_markliff.models.xliff import TranslationMatch
+from vexy_markliff.utils import get_logger, normalize_whitespace
+
+if TYPE_CHECKING:
+    from vexy_markliff.models.xliff import XLIFFDocument
+    from vexy_markliff.tm.fuzzy import FuzzyIndex
+
+logger = get_logger(__name__)
+
+
+def normalize_source(text: str) -> str:
+    """Normalize source text into a TM lookup key.
+
+    Applies Unicode NFC normalization and collapses whitespace so that
+    segments differing only in formatting share one entry.
+
+    Args:
+        text: Source text
+
+    Returns:
+        Normalized lookup key
+    """
+    return normalize_whitespace(unicodedata.normalize("NFC", text))
+
+
+class TranslationMemory:
+    """In-memory exact-match translation memory.
+
+    Entries are held in one dict per language pair keyed by the normalized
+    source text, so each lookup is a single O(1) hash probe regardless of TM
+    size. The original source text is kept alongside the target so the memory
+    can be persisted and exported losslessly.
+
+    When ``fuzzy_threshold`` is set, units without an exact match also receive
+    fuzzy candidates from a per-language-pair FuzzyIndex built on first use.
+    """
+
+    def __init__(self, fuzzy_threshold: float | None = None, fuzzy_limit: int = 3) -> None:
+        """Initialize an empty translation memory.
+
+        Args:
+            fuzzy_threshold: Minimum similarity (0-100) for fuzzy candidates,
+                or None to only use exact matches
+            fuzzy_limit: Maximum fuzzy candidates attached per unit
+        """
+        self.fuzzy_threshold = fuzzy_threshold
+        self.fuzzy_limit = fuzzy_limit
+        self._index: dict[tuple[str, str], dict[str, tuple[str, str]]] = {}
+        self._fuzzy: dict[tuple[str, str], FuzzyIndex] = {}
+
+    def add(self, source: str, target: str, source_lang: str, target_lang: str) -> None:
+        """Add or replace a single entry.
+
+        Args:
+            source: Source text
+            target: Translated text
+            source_lang: Source language code
+            target_lang: Target language code
+        """
+        self._pair(source_lang, target_lang)[normalize_source(source)] = (source, target)
+        self._fuzzy.pop((source_lang, target_lang), None)
+
+    def add_many(self, entries: Iterable[tuple[str, str, str, str]]) -> None:
+        """Add entries in bulk.
+
+        Args:
+            entries: Iterable of (source, target, source_lang, target_lang)
+        """
+        for source, target, source_lang, target_lang in entries:
+            self.add(source, target, source_lang, target_lang)
+
+    def lookup(self, source: str, source_lang: str, target_lang: str) -> str | None:
+        """Return the stored translation for an exact (normalized) source match.
+
+        Args:
+            source: Source text to look up
+            source_lang: Source language code
+            target_lang: Target language code
+
+        Returns:
+            Target text, or None when there is no 100% match
+        """
+        pair = self._index.get((source_lang, target_lang))
+        if pair is None:
+            return None
+        entry = pair.get(normalize_source(source))
+        return entry[1] if entry is not None else None
+
+    def prefill(self, document: "XLIFFDocument") -> int:
+        """Fill empty targets of a document from exact matches.
+
+        Matched units get the stored target and ``state="translated"``. Units
+        with inline codes are never exact-filled, since the stored plain target
+        carries no codes to pair with them. If fuzzy matching is enabled, the
+        remaining units get ``<mtc:match>`` candidates scored in one batch per
+        file.
+
+        Args:
+            document: XLIFF document to update in place
+
+        Returns:
+            Number of units pre-filled
+        """
+        filled = 0
+        for xliff_file in document.files:
+            lang_pair = (xliff_file.source_language, xliff_file.target_language)
+            pair = self._index.get(lang_pair)
+            if not pair:
+                continue
+            unmatched = []
+            for unit in xliff_file.units:
+                if unit.target is not None:
+                    continue
+                entry = None if unit.codes else pair.get(normalize_source(unit.source))
+                if entry is not None:
+                    unit.target = entry[1]
+                    unit.state = "translated"
+                    filled += 1
+                else:
+                    unmatched.append(unit)
+
+            if self.fuzzy_threshold is not None and unmatched:
+                fuzzy = self.fuzzy_index(*lang_pair)
+                results = fuzzy.lookup_batch((u.source for u in unmatched), self.fuzzy_threshold, self.fuzzy_limit)
+                for unit, matches in zip(unmatched, results, strict=True):
+                    unit.matches = [
+                        TranslationMatch(source=m.source, target=m.target, similarity=m.similarity) for m in matches
+                    ]
+        return filled
+
+    def fuzzy_index(self, source_lang: str, target_lang: str) -> "FuzzyIndex":
+        """Return the fuzzy index for a language pair, building it on first use.
+
+        Args:
+            source_lang: Source language code
+            target_lang: Target language code
+
+        Returns:
+            FuzzyIndex over the pair's entries
+        """
+        from vexy_markliff.tm.fuzzy import FuzzyIndex  # noqa: PLC0415 - fuzzy imports this module
+
+        index = self._fuzzy.get((source_lang, target_lang))
+        if index is None:
+            pair = self._index.get((source_lang, target_lang), {})
+            index = self._fuzzy[(source_lang, target_lang)] = FuzzyIndex.from_entries(pair.values())
+        return index
+
+    def entries(self) -> Iterator[tuple[str, str, str, str]]:
+        """Iterate over all entries as (source, target, source_lang, target_lang)."""
+        for (source_lang, target_lang), pair in self._index.items():
+            for source, target in pair.values():
+                yield source, target, source_lang, target_lang
+
+    def save(self, path: str | Path) -> None:
+        """Persist the memory to a SQLite database with one bulk insert.
+
+        Args:
+            path: Path to the SQLite database file
+        """
+        from vexy_markliff.tm.store import TMStore  # noqa: PLC0415 - sqlite3 loads only on save/load
+
+        with TMStore(path) as store:
+            store.insert_many(
+                (source_lang, target_lang, key, source, target)
+                for (source_lang, target_lang), pair in self._index.items()
+                for key, (source, target) in pair.items()
+            )
+
+    @classmethod
+    def load(cls, path: str | Path, fuzzy_threshold: float | None = None) -> "TranslationMemory":
+        """Load a memory from a SQLite database.
+
+        Args:
+            path: Path to the SQLite database file
+            fuzzy_threshold: Minimum similarity (0-100) for fuzzy candidates, or None
+
+        Returns:
+            TranslationMemory instance
+
+        Raises:
+            FileOperationError: If the database does not exist
+        """
+        from vexy_markliff.tm.store import TMStore  # noqa: PLC0415 - sqlite3 loads only on save/load
+
+        if not Path(path).is_file():
+            msg = f"Translation memory not found: {path}"
+            raise FileOperationError(msg)
+        memory = cls(fuzzy_threshold=fuzzy_threshold)
+        with TMStore(path) as store:
+            for source_lang, target_lang, key, source, target in store.iter_rows():
+                memory._pair(source_lang, target_lang)[key] = (source, target)
+        logger.debug(f"Loaded {len(memory)} TM entries from {path}")
+        return memory
+
+    def __len__(self) -> int:
+        """Return the total number of entries across language pairs."""
+        return sum(len(pair) for pair in self._index.values())
+
+    def _pair(self, source_lang: str, target_lang: str) -> dict[str, tuple[str, str]]:
+        """Return (creating if needed) the index for a language pair."""
+        pair = self._index.get((source_lang, target_lang))
+        if pair is None:
+            pair = self._index[(source_lang, target_lang)] = {}
+        return pair
@@ -0,0 +1,159 @@
+"""SQLite persistence for translation memory entries."""
+# this_file: src/vexy_markliff/tm/store.py
+
+import sqlite3
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from types import TracebackType
+from typing import TYPE_CHECKING
+
+from vexy_markliff.exceptions import ConfigurationError, FileOperationError
+from vexy_markliff.utils import get_logger
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+logger = get_logger(__name__)
+
+# One row per (language pair, normalized source); the original source is kept for export
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tm (
+    source_lang TEXT NOT NULL,
+    target_lang TEXT NOT NULL,
+    source_key TEXT NOT NULL,
+    source TEXT NOT NULL,
+    target TEXT NOT NULL,
+    PRIMARY KEY (source_lang, target_lang, source_key)
+) WITHOUT ROWID
+"""
+
+# (source_lang, target_lang, source_key, source, target)
+TMRow = tuple[str, str, str, str, str]
+
+# Conflict policy → INSERT verb used when a (language pair, source) already exists
+CONFLICT_POLICIES = {
+    "replace": "INSERT OR REPLACE",
+    "keep": "INSERT OR IGNORE",
+}
+
+
+class TMStore:
+    """SQLite-backed translation memory store.
+
+    Rows are written with ``executemany`` inside a single transaction per
+    call, which keeps bulk loads of millions of entries fast.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Open (and create if needed) a TM database.
+
+        Args:
+            path: Path to the SQLite database file
+
+        Raises:
+            FileOperationError: If the database cannot be opened
+        """
+        self.path = Path(path)
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(_SCHEMA)
+        except (OSError, sqlite3.Error) as e:
+            msg = f"Cannot open translation memory {path}: {e}"
+            raise FileOperationError(msg) from e
+
+    def insert_many(self, rows: Iterable[TMRow]) -> None:
+        """Insert or replace rows in one transaction.
+
+        Args:
+            rows: Iterable of (source_lang, target_lang, source_key, source, target)
+        """
+        with self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO tm VALUES (?, ?, ?, ?, ?)", rows)
+
+    def bulk_load(self, rows: Iterable[TMRow], on_conflict: str = "replace", batch_size: int = 50000) -> int:
+        """Stream rows into the store in batched transactions.
+
+        Duplicates inside a batch are collapsed before insertion (last wins for
+        ``replace``, first wins for ``keep``); duplicates against existing rows
+        are resolved by the conflict policy.
+
+        Args:
+            rows: Iterable of (source_lang, target_lang, source_key, source, target)
+            on_conflict: ``replace`` to overwrite existing entries, ``keep`` to keep them
+            batch_size: Rows per transaction
+
+        Returns:
+            Number of rows inserted or replaced
+
+        Raises:
+            ConfigurationError: If the conflict policy is unknown
+        """
+        verb = CONFLICT_POLICIES.get(on_conflict)
+        if verb is None:
+            msg = f"Unknown conflict policy: {on_conflict}. Use one of {sorted(CONFLICT_POLICIES)}"
+            raise ConfigurationError(msg)
+        sql = f"{verb} INTO tm VALUES (?, ?, ?, ?, ?)"
+        keep_first = on_conflict == "keep"
+        written = 0
+        batch: dict[tuple[str, str, str], TMRow] = {}
+
+        def flush() -> int:
+            before = self._conn.total_changes
+            with self._conn:
+                self._conn.executemany(sql, batch.values())
+            batch.clear()
+            return self._conn.total_changes - before
+
+        for row in rows:
+            key = row[:3]
+            if keep_first and key in batch:
+                continue
+            batch[key] = row
+            if len(batch) >= batch_size:
+                written += flush()
+        if batch:
+            written += flush()
+        return written
+
+    def iter_rows(self, source_lang: str | None = None, target_lang: str | None = None) -> Iterator[TMRow]:
+        """Iterate over stored rows, optionally restricted to one language pair.
+
+        Args:
+            source_lang: Only return rows with this source language
+            target_lang: Only return rows with this target language
+        """
+        sql = "SELECT source_lang, target_lang, source_key, source, target FROM tm"
+        clauses, params = [], []
+        if source_lang is not None:
+            clauses.append("source_lang = ?")
+            params.append(source_lang)
+        if target_lang is not None:
+            clauses.append("target_lang = ?")
+            params.append(target_lang)
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        yield from self._conn.execute(sql, params)
+
+    def __len__(self) -> int:
+        """Return the number of stored entries."""
+        return int(self._conn.execute("SELECT COUNT(*) FROM tm").fetchone()[0])
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> "Self":
+        """Enter context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Close the store on context exit."""
+        self.close()
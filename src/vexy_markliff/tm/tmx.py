@@ -0,0 +1,393 @@
+"""Streaming TMX import and export for the translation memory.
+
+TMX files are read with lxml iterparse one ``<tu>`` at a time, so memory use
+stays flat regardless of file size. Large UTF-8 files can additionally be
+split into byte ranges at ``<tu>`` boundaries and parsed by several worker
+processes; rows are still yielded in file order so conflict resolution is
+deterministic. Export streams rows from the TM store through
+``etree.xmlfile`` without building a tree.
+"""
+# this_file: src/vexy_markliff/tm/tmx.py
+
+import mmap
+import re
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import IO
+
+from lxml import etree
+
+from vexy_markliff import __version__
+from vexy_markliff.core.streaming import iterparse_xliff, local_name, release, xml_writer
+from vexy_markliff.exceptions import FileOperationError, ParsingError
+from vexy_markliff.tm.harvest import ImportStats
+from vexy_markliff.tm.memory import normalize_source
+from vexy_markliff.tm.store import TMRow, TMStore
+from vexy_markliff.utils import atomic_open, get_logger
+
+logger = get_logger(__name__)
+
+TMX_VERSION = "1.4"
+XML_LANG = "{http://www.w3.org/XML/1998/namespace}lang"
+ALL_LANGUAGES = "*all*"
+
+# Opening <tu> tag; requiring whitespace or '>' next excludes <tuv>
+_TU_START = re.compile(rb"<tu[\s>]")
+_BODY_END = b"</body>"
+
+# Inline elements whose content is native markup rather than translatable text
+_NATIVE_CODES = frozenset({"bpt", "ept", "ph", "it", "ut"})
+
+DEFAULT_CHUNK_SIZE = 64 * 1024 * 1024
+
+
+def seg_text(seg: etree._Element) -> str:
+    """Return the translatable text of a ``<seg>``.
+
+    Native codes carried by ``<bpt>``/``<ept>``/``<ph>``/``<it>``/``<ut>`` are
+    dropped; text of ``<hi>``/``<sub>`` and all tails are kept.
+
+    Args:
+        seg: TMX ``<seg>`` element
+
+    Returns:
+        Plain segment text
+    """
+    if not len(seg):
+        return seg.text or ""
+    parts = [seg.text or ""]
+    for child in seg:
+        if local_name(child.tag) not in _NATIVE_CODES:
+            parts.append(seg_text(child))
+        parts.append(child.tail or "")
+    return "".join(parts)
+
+
+def _tu_rows(tu: etree._Element, header_srclang: str, source_lang: str | None) -> tuple[list[TMRow], int]:
+    """Convert one ``<tu>`` into TM rows, returning (rows, skipped variants)."""
+    variants = []
+    for tuv in tu:
+        if local_name(tuv.tag) != "tuv":
+            continue
+        lang = tuv.get(XML_LANG) or tuv.get("lang") or ""
+        for seg in tuv:
+            if local_name(seg.tag) == "seg":
+                variants.append((lang, seg_text(seg)))
+                break
+    if not variants:
+        return [], 0
+
+    src_lang = tu.get("srclang") or header_srclang
+    if not src_lang or src_lang == ALL_LANGUAGES:
+        src_lang = source_lang or variants[0][0]
+    wanted = src_lang.lower()
+    source = next((text for lang, text in variants if lang.lower() == wanted), None)
+    if source is None or not source.strip():
+        return [], len(variants)
+
+    key = normalize_source(source)
+    rows = []
+    skipped = 0
+    for lang, text in variants:
+        if lang.lower() == wanted:
+            continue
+        if not text.strip():
+            skipped += 1
+            continue
+        rows.append((src_lang, lang, key, source, text))
+    return rows, skipped
+
+
+def read_header(path: str | Path) -> dict[str, str]:
+    """Read the attributes of a TMX ``<header>`` without parsing the body.
+
+    Args:
+        path: TMX file path
+
+    Returns:
+        Header attributes (empty if there is no header)
+
+    Raises:
+        ParsingError: If the XML is malformed before the header ends
+    """
+    try:
+        for _, elem in iterparse_xliff(Path(path), events=("end",), tag=("{*}header", "{*}body")):
+            return dict(elem.attrib) if local_name(elem.tag) == "header" else {}
+    except etree.XMLSyntaxError as e:
+        msg = f"Invalid TMX XML in {path}: {e}"
+        raise ParsingError(msg) from e
+    return {}
+
+
+def _iter_tu_rows(
+    source: Path | IO[bytes], header_srclang: str, source_lang: str | None, stats: ImportStats
+) -> Iterator[TMRow]:
+    """Stream rows from every ``<tu>`` of a TMX document or fragment."""
+    for _, tu in iterparse_xliff(source, events=("end",), tag=("{*}tu",)):
+        rows, skipped = _tu_rows(tu, header_srclang, source_lang)
+        stats.pairs += len(rows)
+        stats.skipped += skipped
+        yield from rows
+        release(tu)
+
+
+def iter_tmx(path: str | Path, source_lang: str | None = None, stats: ImportStats | None = None) -> Iterator[TMRow]:
+    """Stream TM rows from a TMX file in constant memory.
+
+    A ``<tu>`` with N language variants yields one row per non-source variant.
+
+    Args:
+        path: TMX file path
+        source_lang: Source language used when neither the ``<tu>`` nor the
+            header names one (``srclang="*all*"``); defaults to the first variant
+        stats: Optional counters updated while streaming
+
+    Yields:
+        (source_lang, target_lang, source_key, source, target) rows
+
+    Raises:
+        ParsingError: If the XML is malformed
+    """
+    path = Path(path)
+    stats = stats if stats is not None else ImportStats()
+    header_srclang = read_header(path).get("srclang", "")
+    stats.files += 1
+    try:
+        yield from _iter_tu_rows(path, header_srclang, source_lang, stats)
+    except etree.XMLSyntaxError as e:
+        msg = f"Invalid TMX XML in {path}: {e}"
+        raise ParsingError(msg) from e
+
+
+class _RangeReader:
+    """File-like view of a byte range wrapped in a synthetic ``<body>`` element."""
+
+    def __init__(self, f: IO[bytes], start: int, end: int) -> None:
+        f.seek(start)
+        self._f = f
+        self._remaining = end - start
+        self._prefix = b"<body>"
+        self._suffix = b"</body>"
+
+    def read(self, size: int = -1) -> bytes:
+        if self._prefix:
+            data, self._prefix = self._prefix, b""
+            return data
+        if self._remaining > 0:
+            n = self._remaining if size is None or size < 0 else min(size, self._remaining)
+            data = self._f.read(n)
+            self._remaining = 0 if not data else self._remaining - len(data)
+            if data:
+                return data
+        data, self._suffix = self._suffix, b""
+        return data
+
+
+def split_ranges(path: str | Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> list[tuple[int, int]]:
+    """Split the body of a TMX file into byte ranges starting at ``<tu>`` tags.
+
+    The boundaries are found by scanning the memory-mapped file forward from
+    each nominal split point to the next ``<tu`` tag. This relies on markup
+    inside segments being escaped, which TMX requires outside CDATA sections.
+
+    Args:
+        path: UTF-8 encoded TMX file path
+        chunk_size: Nominal range size in bytes
+
+    Returns:
+        List of (start, end) byte offsets covering all ``<tu>`` elements
+    """
+    with open(path, "rb") as f:
+        if not f.seek(0, 2):
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            first = _TU_START.search(mm)
+            if first is None:
+                return []
+            end = mm.rfind(_BODY_END)
+            end = len(mm) if end < 0 else end
+            ranges = []
+            start = first.start()
+            while start < end:
+                boundary = _TU_START.search(mm, min(start + chunk_size, end), end)
+                stop = boundary.start() if boundary is not None else end
+                ranges.append((start, stop))
+                start = stop
+            return ranges
+
+
+def _parse_range(
+    path: str, start: int, end: int, header_srclang: str, source_lang: str | None
+) -> tuple[list[TMRow], int]:
+    """Worker: parse one byte range of a TMX file into rows."""
+    stats = ImportStats()
+    try:
+        with open(path, "rb") as f:
+            rows = list(_iter_tu_rows(_RangeReader(f, start, end), header_srclang, source_lang, stats))
+    except etree.XMLSyntaxError as e:
+        msg = f"Invalid TMX XML in {path} (bytes {start}-{end}): {e}"
+        raise ParsingError(msg) from None
+    return rows, stats.skipped
+
+
+def _is_utf8(path: Path) -> bool:
+    """Check whether a file can be split on raw bytes (UTF-8 or ASCII encoded)."""
+    with open(path, "rb") as f:
+        head = f.read(256)
+    if head.startswith((b"\xff\xfe", b"\xfe\xff")):
+        return False
+    match = re.search(rb"""encoding=["']([A-Za-z0-9._-]+)["']""", head.split(b"?>", 1)[0])
+    return match is None or match.group(1).lower() in (b"utf-8", b"utf8", b"us-ascii", b"ascii")
+
+
+def read_tmx(
+    path: str | Path,
+    source_lang: str | None = None,
+    parallel: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    stats: ImportStats | None = None,
+) -> Iterator[TMRow]:
+    """Stream TM rows from a TMX file, optionally parsing byte ranges in parallel.
+
+    With ``parallel > 1`` the file is split at ``<tu>`` boundaries and each
+    range is parsed in a worker process. A bounded window of ranges is in
+    flight at once and results are yielded in file order. Files that are not
+    UTF-8 encoded are always read serially.
+
+    Args:
+        path: TMX file path
+        source_lang: Fallback source language (see iter_tmx)
+        parallel: Number of worker processes
+        chunk_size: Nominal byte range size per worker task
+        stats: Optional counters updated while streaming
+
+    Yields:
+        (source_lang, target_lang, source_key, source, target) rows
+
+    Raises:
+        ParsingError: If the XML is malformed
+    """
+    path = Path(path)
+    stats = stats if stats is not None else ImportStats()
+    if parallel <= 1 or not _is_utf8(path):
+        yield from iter_tmx(path, source_lang, stats)
+        return
+
+    header_srclang = read_header(path).get("srclang", "")
+    stats.files += 1
+    ranges = iter(split_ranges(path, chunk_size))
+    pending: deque[Future[tuple[list[TMRow], int]]] = deque()
+    with ProcessPoolExecutor(max_workers=parallel) as executor:
+        while True:
+            for start, end in ranges:
+                pending.append(executor.submit(_parse_range, str(path), start, end, header_srclang, source_lang))
+                if len(pending) >= parallel * 2:
+                    break
+            if not pending:
+                return
+            rows, skipped = pending.popleft().result()
+            stats.pairs += len(rows)
+            stats.skipped += skipped
+            yield from rows
+
+
+def import_tmx(
+    paths: Iterable[str | Path],
+    db: str | Path,
+    source_lang: str | None = None,
+    *,
+    on_conflict: str = "replace",
+    batch_size: int = 50000,
+    parallel: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> ImportStats:
+    """Bulk-load TMX files into a TM database.
+
+    Args:
+        paths: TMX files to read
+        db: Path to the TM SQLite database (created if missing)
+        source_lang: Fallback source language for ``srclang="*all*"`` files
+        on_conflict: ``replace`` (newest wins) or ``keep`` (existing wins)
+        batch_size: Rows per transaction
+        parallel: Worker processes per file
+        chunk_size: Nominal byte range size per worker task
+
+    Returns:
+        ImportStats with file, pair, skipped and written counts
+    """
+    stats = ImportStats()
+    rows = (
+        row
+        for path in paths
+        for row in read_tmx(path, source_lang, parallel=parallel, chunk_size=chunk_size, stats=stats)
+    )
+    with TMStore(db) as store:
+        stats.written = store.bulk_load(rows, on_conflict=on_conflict, batch_size=batch_size)
+    logger.info(f"Imported {stats.written} TM entries from {stats.files} TMX files ({stats.skipped} skipped)")
+    return stats
+
+
+def write_tmx(rows: Iterable[TMRow], path: str | Path, srclang: str = ALL_LANGUAGES) -> int:
+    """Stream TM rows to a TMX 1.4 file.
+
+    The file is written atomically. When ``srclang`` is ``*all*`` every
+    ``<tu>`` carries its own ``srclang`` attribute.
+
+    Args:
+        rows: (source_lang, target_lang, source_key, source, target) rows
+        path: Output TMX file path
+        srclang: Header source language
+
+    Returns:
+        Number of translation units written
+    """
+    count = 0
+    with atomic_open(path, "wb") as f, xml_writer(f) as xf, xf.element("tmx", version=TMX_VERSION):
+        header = etree.Element(
+            "header",
+            creationtool="vexy-markliff",
+            creationtoolversion=__version__,
+            segtype="sentence",
+            adminlang="en",
+            srclang=srclang,
+            datatype="plaintext",
+        )
+        header.set("o-tmf", "vexy-markliff")
+        xf.write(header)
+        with xf.element("body"):
+            for source_lang, target_lang, _, source, target in rows:
+                tu = etree.Element("tu")
+                if srclang == ALL_LANGUAGES:
+                    tu.set("srclang", source_lang)
+                for lang, text in ((source_lang, source), (target_lang, target)):
+                    tuv = etree.SubElement(tu, "tuv", {XML_LANG: lang})
+                    etree.SubElement(tuv, "seg").text = text
+                xf.write(tu)
+                count += 1
+    return count
+
+
+def export_tmx(db: str | Path, path: str | Path, source_lang: str | None = None, target_lang: str | None = None) -> int:
+    """Export a TM database to TMX.
+
+    Args:
+        db: Path to the TM SQLite database
+        path: Output TMX file path
+        source_lang: Only export this source language
+        target_lang: Only export this target language
+
+    Returns:
+        Number of translation units written
+
+    Raises:
+        FileOperationError: If the database does not exist
+    """
+    if not Path(db).is_file():
+        msg = f"Translation memory not found: {db}"
+        raise FileOperationError(msg)
+    with TMStore(db) as store:
+        count = write_tmx(store.iter_rows(source_lang, target_lang), path, srclang=source_lang or ALL_LANGUAGES)
+    logger.info(f"Exported {count} TM entries to {path}")
+    return count
@@ -7,9 +7,16 @@ directly support the core conversion functionality.
 # this_file: src/vexy_markliff/utils.py
 
 import logging
+import os
 import re
+import tempfile
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List
+from typing import IO, List
+
+# Suffix of in-flight temporary files written by atomic_open
+TEMP_SUFFIX = ".vexy-tmp"
 
 
 def normalize_whitespace(text: str) -> str:
@@ -48,6 +55,61 @@ def validate_file_path(path: str) -> bool:
     return Path(path).exists() and Path(path).is_file()
 
 
+@contextmanager
+def atomic_open(path: str | Path, mode: str = "w") -> Iterator[IO]:
+    """Open a file for atomic writing.
+
+    The content goes to a temporary file in the destination directory which is
+    renamed over the target when the block exits cleanly, so readers never
+    observe a partial file even if the process is killed mid-write.
+
+    Args:
+        path: Destination file path
+        mode: ``"w"`` for UTF-8 text or ``"wb"`` for bytes
+
+    Yields:
+        Writable file object
+    """
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=TEMP_SUFFIX)
+    try:
+        with os.fdopen(fd, mode, encoding=None if "b" in mode else "utf-8") as f:
+            yield f
+        Path(tmp_name).replace(target)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def atomic_write_text(path: str | Path, text: str) -> None:
+    """Write text to a file atomically.
+
+    Args:
+        path: Destination file path
+        text: Text content to write (UTF-8)
+    """
+    with atomic_open(path) as f:
+        f.write(text)
+
+
+class InProcessPool:
+    """Minimal executor interface that runs tasks in the calling process.
+
+    Stands in for a process pool when ``parallel`` is 1, so callers keep one
+    ``pool.map`` code path.
+    """
+
+    @staticmethod
+    def map(fn: Callable, iterable: Iterable, chunksize: int = 1) -> Iterator:  # noqa: ARG004
+        """Apply ``fn`` lazily to each item, like ``Executor.map``.
+
+        ``chunksize`` is accepted for signature compatibility with
+        ``Executor.map`` and ignored: in-process calls are not batched.
+        """
+        return map(fn, iterable)
+
+
 def split_sentences_simple(text: str) -> list[str]:
     """Simple sentence splitting for translation units.
 
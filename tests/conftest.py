@@ -7,6 +7,7 @@ from typing import Any
 import pytest
 
 from vexy_markliff.core.parser import HTMLParser, MarkdownParser
+from vexy_markliff.models.document_pair import DocumentSegment, TwoDocumentPair
 from vexy_markliff.models.xliff import XLIFFDocument
 
 
@@ -0,0 +1,137 @@
+"""Tests for two-document alignment."""
+# this_file: tests/test_align.py
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from vexy_markliff.cli import VexyMarkliffCLI
+from vexy_markliff.core.align import align_lengths, align_pair, document_segments, split_sentences
+from vexy_markliff.core.converter import VexyMarkliff
+from vexy_markliff.core.parser import MarkdownParser
+from vexy_markliff.exceptions import ValidationError
+from vexy_markliff.models.xliff import XLIFFDocument
+
+SOURCE = """# Installation
+
+Download the package. Run the installer. It takes a minute.
+
+- First item here.
+- Second item is longer than the first.
+
+## Usage
+
+Open the app. Click start.
+"""
+TARGET = """# Instalación
+
+Descargue el paquete. Ejecute el instalador, que tarda un minuto.
+
+- Primer elemento aquí.
+- El segundo elemento es más largo que el primero.
+
+## Uso
+
+Abra la aplicación. Haga clic en iniciar.
+"""
+
+
+class TestSegmentation:
+    """Tests for blocks and sentences."""
+
+    def test_blocks(self) -> None:
+        """Blocks carry their type, level and path."""
+        segments = document_segments(SOURCE, "markdown")
+
+        assert [(s.type, s.level) for s in segments] == [
+            ("heading", 1),
+            ("paragraph", 0),
+            ("list_item", 1),
+            ("list_item", 1),
+            ("heading", 2),
+            ("paragraph", 0),
+        ]
+        assert segments[2].metadata["path"] == "div/ul/li"
+
+    def test_sentences_keep_punctuation(self) -> None:
+        """Sentences are split after final punctuation without losing it."""
+        assert split_sentences("One. Two? Three") == ["One.", "Two?", "Three"]
+
+
+class TestAlignment:
+    """Tests for the alignment engine."""
+
+    def test_structure_and_sentences(self, two_document_pair_factory: Any) -> None:
+        """Headings and list items pair up; sentences merge 2-1 where lengths say so."""
+        pair = align_pair(two_document_pair_factory(source_content=SOURCE, target_content=TARGET))
+        pairs = [(p.source, p.target, p.alignment_type) for p in pair.aligned_pairs]
+
+        assert pairs[0] == ("Installation", "Instalación", "1-1")
+        assert ("Run the installer. It takes a minute.", "Ejecute el instalador, que tarda un minuto.", "2-1") in pairs
+        assert ("Usage", "Uso", "1-1") in pairs
+        assert pair.warnings == []
+        assert pair.get_alignment_summary()["types"] == {"1-1": 7, "2-1": 1}
+
+    def test_diverging_structure_warns(self, two_document_pair_factory: Any) -> None:
+        """A missing heading adds a warning and falls back to length alignment."""
+        target = TARGET.replace("## Uso\n\n", "")
+        pair = align_pair(two_document_pair_factory(source_content=SOURCE, target_content=target))
+
+        assert pair.warnings == ["Heading structure differs (2 in source, 1 in target); aligned by sentence length"]
+        assert ("Usage Open the app.", "Abra la aplicación.", "2-1") in [
+            (p.source, p.target, p.alignment_type) for p in pair.aligned_pairs
+        ]
+
+    def test_banded_dp_is_linear_in_practice(self) -> None:
+        """Long spans align exactly when lengths correspond."""
+        source = [20 + (i * 37) % 150 for i in range(3000)]
+        target = [int(length * 1.2) for length in source]
+
+        beads = align_lengths(source, target, ratio=1.2)
+
+        assert len(beads) == 3000
+        assert all(b[1] - b[0] == 1 and b[3] - b[2] == 1 for b in beads)
+
+    def test_merges_and_empty_sides(self) -> None:
+        """A split translation becomes a 1-2 bead; unmatched sides become 1-0 and 0-1 beads."""
+
+        def shape(beads: list) -> list[tuple[int, int]]:
+            return [(b[1] - b[0], b[3] - b[2]) for b in beads]
+
+        assert shape(align_lengths([30, 80, 50], [30, 25, 80, 50])) == [(1, 1), (1, 2), (1, 1)]
+        assert shape(align_lengths([10, 20], [])) == [(1, 0), (1, 0)]
+        assert shape(align_lengths([], [10])) == [(0, 1)]
+
+    def test_errors(self, two_document_pair_factory: Any) -> None:
+        """Unknown formats and empty sources are rejected."""
+        with pytest.raises(ValidationError):
+            align_pair(two_document_pair_factory(source_format="docx"))
+        with pytest.raises(ValidationError):
+            align_pair(two_document_pair_factory(source_content=" "))
+
+
+class TestParallelToXliff:
+    """Tests for the converter method and the CLI."""
+
+    def test_units_and_notes(self, two_document_pair_factory: Any) -> None:
+        """Aligned pairs become translated units; merges and warnings become notes."""
+        pair = two_document_pair_factory(source_content=SOURCE, target_content=TARGET.replace("## Uso\n\n", ""))
+        document = XLIFFDocument.from_xml(VexyMarkliff().parallel_to_xliff(pair))
+        units = document.files[0].units
+
+        assert units[0].notes[0].startswith("Heading structure differs")
+        assert all(u.state == "translated" for u in units if u.target)
+        assert document.files[0].target_language == "es"
+
+    def test_cli(self, tmp_path: Path) -> None:
+        """The align command reads both documents and writes XLIFF."""
+        source, target = tmp_path / "en.md", tmp_path / "es.html"
+        source.write_text(SOURCE, encoding="utf-8")
+        target.write_text(MarkdownParser().md.render(TARGET), encoding="utf-8")
+        output = tmp_path / "pair.xlf"
+
+        summary = VexyMarkliffCLI().align(str(source), str(target), str(output), target_lang="es")
+
+        assert summary["pairs"] == 8
+        assert "<target>Uso</target>" in output.read_text(encoding="utf-8")
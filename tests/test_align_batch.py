@@ -0,0 +1,124 @@
+"""Tests for parallel alignment of document pairs."""
+# this_file: tests/test_align_batch.py
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from vexy_markliff.cli import VexyMarkliffCLI
+from vexy_markliff.core.align import align_pair
+from vexy_markliff.core.align_batch import AlignmentRunner
+from vexy_markliff.exceptions import FileOperationError, ValidationError
+
+SECTION = """## Step {n}
+
+Download package {n}. Run the installer. It takes a minute.
+
+- First item {n}.
+- Second item {n} is longer than the first.
+"""
+TRANSLATION = """## Paso {n}
+
+Descargue el paquete {n}. Ejecute el instalador, que tarda un minuto.
+
+- Primer elemento {n}.
+- El segundo elemento {n} es más largo que el primero.
+"""
+
+
+def document(template: str, sections: int) -> str:
+    """Build a document of numbered sections."""
+    return "\n".join(template.format(n=n) for n in range(sections))
+
+
+@pytest.fixture
+def trees(tmp_path: Path) -> tuple[Path, Path]:
+    """Mirrored source and target trees with five document pairs."""
+    source, target = tmp_path / "en", tmp_path / "es"
+    for name in ("a.md", "b.md", "c.md", "sub/d.md", "sub/e.md"):
+        sections = len(name) + 2
+        (source / name).parent.mkdir(parents=True, exist_ok=True)
+        (target / name).parent.mkdir(parents=True, exist_ok=True)
+        (source / name).write_text(document(SECTION, sections), encoding="utf-8")
+        (target / name).write_text(document(TRANSLATION, sections), encoding="utf-8")
+    return source, target
+
+
+def outputs(root: Path) -> dict[str, str]:
+    """Read every XLIFF output under a directory."""
+    return {str(p.relative_to(root)): p.read_text(encoding="utf-8") for p in sorted(root.rglob("*.xlf"))}
+
+
+class TestAlignmentRunner:
+    """Tests for the runner."""
+
+    def test_parallel_pairs_match_serial(self, trees: tuple[Path, Path], tmp_path: Path) -> None:
+        """Pairs aligned by workers produce the same files as a serial run."""
+        serial = AlignmentRunner().run_dirs(*trees, tmp_path / "serial", target_lang="es")
+        parallel = AlignmentRunner(parallel=2).run_dirs(*trees, tmp_path / "parallel", target_lang="es")
+
+        assert serial.to_dict() == parallel.to_dict()
+        assert serial.aligned == 5
+        assert serial.warnings == 0
+        assert outputs(tmp_path / "serial") == outputs(tmp_path / "parallel")
+        assert "sub/d.md.xlf" in outputs(tmp_path / "parallel")
+
+    def test_parallel_sections_match_serial(self, two_document_pair_factory: Any) -> None:
+        """A single pair split into sections over workers aligns exactly as in-process."""
+        serial = align_pair(
+            two_document_pair_factory(source_content=document(SECTION, 12), target_content=document(TRANSLATION, 12))
+        )
+        parallel = AlignmentRunner(parallel=3).align(
+            two_document_pair_factory(source_content=document(SECTION, 12), target_content=document(TRANSLATION, 12))
+        )
+
+        assert parallel.aligned_pairs == serial.aligned_pairs
+        assert parallel.aligned_pairs[0].source == "Step 0"
+        assert parallel.aligned_pairs[-1].target == "El segundo elemento 11 es más largo que el primero."
+
+    def test_failures(self, trees: tuple[Path, Path], tmp_path: Path) -> None:
+        """Missing translations and unreadable pairs are reported without stopping the run."""
+        source, target = trees
+        (target / "b.md").unlink()
+        (source / "c.md").write_text(" ", encoding="utf-8")
+
+        result = AlignmentRunner(parallel=2).run_dirs(source, target, tmp_path / "out", target_lang="es")
+
+        assert result.aligned == 3
+        assert result.failed == {
+            str(source / "b.md"): "No translated document",
+            str(source / "c.md"): "Source document has no text to align",
+        }
+
+    def test_errors(self, trees: tuple[Path, Path], tmp_path: Path) -> None:
+        """Unknown ID strategies, bad languages and missing directories are rejected."""
+        with pytest.raises(ValidationError):
+            AlignmentRunner(id_strategy="random")
+        with pytest.raises(FileOperationError):
+            AlignmentRunner().run_dirs(tmp_path / "missing", trees[1], tmp_path / "out")
+        result = AlignmentRunner().run_dirs(*trees, tmp_path / "out", target_lang="???")
+        assert result.aligned == 0
+        assert len(result.failed) == 5
+
+
+class TestCli:
+    """Tests for the CLI commands."""
+
+    def test_align_batch(self, trees: tuple[Path, Path], tmp_path: Path) -> None:
+        """The align_batch command summarizes the run."""
+        summary = VexyMarkliffCLI().align_batch(str(trees[0]), str(trees[1]), str(tmp_path / "out"), parallel=2)
+
+        assert summary["aligned"] == 5
+        assert summary["failed"] == {}
+
+    def test_align_parallel(self, trees: tuple[Path, Path], tmp_path: Path) -> None:
+        """The align command accepts a worker count without changing its output."""
+        cli = VexyMarkliffCLI()
+        source, target = str(trees[0] / "a.md"), str(trees[1] / "a.md")
+
+        serial = cli.align(source, target, str(tmp_path / "1.xlf"), ids="content")
+        parallel = cli.align(source, target, str(tmp_path / "2.xlf"), ids="content", parallel=2)
+
+        assert serial == parallel
+        assert (tmp_path / "1.xlf").read_text(encoding="utf-8") == (tmp_path / "2.xlf").read_text(encoding="utf-8")
@@ -0,0 +1,71 @@
+"""Tests for corpus word count and repetition analysis."""
+# this_file: tests/test_analysis.py
+
+from pathlib import Path
+
+import pytest
+
+from vexy_markliff.cli import VexyMarkliffCLI
+from vexy_markliff.core.analysis import CorpusAnalyzer, count_words
+from vexy_markliff.exceptions import FileOperationError
+from vexy_markliff.tm.memory import TranslationMemory
+
+
+@pytest.fixture
+def corpus(tmp_path: Path) -> Path:
+    """Two Markdown files with internal and cross-file repetitions."""
+    docs = tmp_path / "docs"
+    (docs / "sub").mkdir(parents=True)
+    (docs / "a.md").write_text("Save the file.\n\nSave the file.\n\nOpen the settings menu now.\n", encoding="utf-8")
+    (docs / "sub" / "b.md").write_text("Save the file.\n\nClose the window.\n", encoding="utf-8")
+    (docs / "notes.txt").write_text("Ignored text.", encoding="utf-8")
+    return docs
+
+
+class TestCountWords:
+    """Tests for count_words."""
+
+    def test_counts_contractions_and_hyphens_as_one_word(self) -> None:
+        """Apostrophes and hyphens inside words do not split them."""
+        assert count_words("Don't re-open the file, 2 times.") == 6
+
+
+class TestCorpusAnalyzer:
+    """Tests for CorpusAnalyzer."""
+
+    def test_repetition_categories(self, corpus: Path) -> None:
+        """Internal and cross-file repetitions are separated from new text."""
+        report = CorpusAnalyzer().run(corpus).to_dict()
+
+        assert report["files"] == 2
+        assert report["categories"]["repetitions"] == {"segments": 1, "words": 3, "characters": 12}
+        assert report["categories"]["cross_file_repetitions"]["segments"] == 1
+        assert report["categories"]["new"] == {"segments": 3, "words": 11, "characters": 50}
+        assert report["total"] == {"segments": 5, "words": 17, "characters": 74}
+
+    def test_tm_match_bands(self, corpus: Path, tmp_path: Path) -> None:
+        """First occurrences are classified by their best TM match."""
+        tm = TranslationMemory()
+        tm.add("Save the file.", "Guarda el archivo.", "en", "es")
+        tm.add("Open the settings menu.", "Abre el menú de ajustes.", "en", "es")
+        tm.save(tmp_path / "tm.sqlite")
+
+        report = CorpusAnalyzer(tm=tmp_path / "tm.sqlite").run(corpus).to_dict()
+        categories = report["categories"]
+
+        assert categories["100%"]["segments"] == 1
+        assert categories["85-94%"]["segments"] == 1
+        assert categories["new"]["segments"] == 1
+
+    def test_parallel_matches_serial(self, corpus: Path) -> None:
+        """Worker processes produce the same report as an in-process run."""
+        assert CorpusAnalyzer(parallel=2).run(corpus).to_dict() == CorpusAnalyzer().run(corpus).to_dict()
+
+    def test_missing_directory(self, tmp_path: Path) -> None:
+        """A missing input directory raises FileOperationError."""
+        with pytest.raises(FileOperationError):
+            CorpusAnalyzer().run(tmp_path / "missing")
+
+    def test_cli_analyze(self, corpus: Path) -> None:
+        """The analyze command returns the report dict."""
+        assert VexyMarkliffCLI().analyze(str(corpus))["total"]["segments"] == 5
@@ -0,0 +1,167 @@
+"""Tests for translatable attribute extraction."""
+# this_file: tests/test_attributes.py
+
+from pathlib import Path
+
+from lxml import etree
+
+from vexy_markliff.core.converter import VexyMarkliff
+from vexy_markliff.core.package import pack_files, unpack_package
+from vexy_markliff.core.parser import HTMLParser, MarkdownParser
+from vexy_markliff.models.xliff import ATTRIBUTE_ATTR, OWNER_ATTR, XLIFFDocument
+
+
+def attribute_segments(content: str) -> list[tuple[str, str, str]]:
+    """Return (element, attribute, text) of the attribute sub-units of an HTML fragment."""
+    segments = HTMLParser().parse(content)["segments"]
+    return [(s["element"], s["attribute"], s["content"]) for s in segments if "attribute" in s]
+
+
+class TestExtraction:
+    """Tests for attribute sub-units in the parser walk."""
+
+    def test_accessibility_attributes(self) -> None:
+        """alt, title, placeholder and aria-label become sub-units."""
+        html = (
+            '<div><p>A <img src="c.png" alt="A cat"> and <abbr title="Internationalization">i18n</abbr></p>'
+            '<textarea placeholder="Your message">Hi</textarea><button aria-label="Close">x</button></div>'
+        )
+
+        assert attribute_segments(html) == [
+            ("img", "alt", "A cat"),
+            ("abbr", "title", "Internationalization"),
+            ("textarea", "placeholder", "Your message"),
+            ("button", "aria-label", "Close"),
+        ]
+
+    def test_tag_specific_attributes(self) -> None:
+        """alt and placeholder only count on the elements that define them."""
+        assert attribute_segments('<p alt="no" placeholder="no">Text</p>') == []
+        assert attribute_segments('<p>Find <input alt="Go" placeholder="Search"></p>') == [
+            ("input", "alt", "Go"),
+            ("input", "placeholder", "Search"),
+        ]
+
+    def test_empty_and_blank_values(self) -> None:
+        """Empty or whitespace-only values are skipped and whitespace is collapsed."""
+        html = '<p>Pics <img alt=""><img alt="  "><img alt=" a\n b "></p>'
+
+        assert attribute_segments(html) == [("img", "alt", "a b")]
+
+    def test_sub_unit_fields(self) -> None:
+        """Sub-units carry their owner node, a distinct path and the element's Format Style."""
+        segments = HTMLParser().parse('<p title="Tip">Text</p>')["segments"]
+        text, title = segments
+
+        assert title["owner"] == text["node"]
+        assert title["path"] == f"{text['path']}@title"
+        assert (title["fs"], title["sub_fs"]) == ("p", "title,Tip")
+
+    def test_markdown_image(self) -> None:
+        """The alt text of a Markdown image is extracted."""
+        segments = MarkdownParser().parse("Our ![A logo](logo.png)\n")["segments"]
+
+        assert [(s["content"], s.get("attribute")) for s in segments] == [("Our", None), ("A logo", "alt")]
+
+    def test_sub_units_follow_their_owner(self) -> None:
+        """Block and inline sub-units come right after the segment holding their element."""
+        html = '<li title="Item">Intro <ul><li>Nested</li></ul> then <abbr title="Term">t</abbr></li>'
+        segments = HTMLParser().parse(html)["segments"]
+
+        assert [(s["content"], s.get("attribute")) for s in segments] == [
+            ("Intro", None),
+            ("Item", "title"),
+            ("Nested", None),
+            ("then t", None),
+            ("Term", "title"),
+        ]
+
+    def test_sub_units_without_owner(self) -> None:
+        """Elements without text to hold them still give sub-units, unowned, where they start."""
+        html = '<div title="Box"><p>Text</p></div><form><input placeholder="Search"></form>'
+        segments = HTMLParser().parse(html)["segments"]
+
+        assert [(s["content"], s.get("attribute"), s.get("owner", 0)) for s in segments] == [
+            ("Box", "title", None),
+            ("Text", None, 0),
+            ("Search", "placeholder", None),
+        ]
+
+    def test_image_only_paragraph(self) -> None:
+        """The alt text of an image alone in its paragraph is extracted."""
+        segments = MarkdownParser().parse("![Company logo](logo.png)\n")["segments"]
+
+        assert [(s["content"], s.get("attribute"), s["owner"]) for s in segments] == [("Company logo", "alt", None)]
+
+
+class TestDocument:
+    """Tests for attribute sub-units in XLIFF documents."""
+
+    def test_owner_links(self) -> None:
+        """Sub-units point at the unit holding their element's text."""
+        xml = VexyMarkliff().html_to_xliff('<p title="Tip">See <img src="a.png" alt="Map">here</p>', "en", "es")
+        units = XLIFFDocument.from_xml(xml).files[0].units
+
+        assert [(u.source, u.attribute, u.owner) for u in units] == [
+            ("See here", None, None),
+            ("Tip", "title", "unit_1"),
+            ("Map", "alt", "unit_1"),
+        ]
+
+    def test_unowned_sub_units(self) -> None:
+        """Sub-units without an owner have no owner link and are not applied to another unit."""
+        converter = VexyMarkliff()
+        xml = converter.markdown_to_xliff("Intro\n\n![Company logo](logo.png)\n", "en", "de")
+        units = XLIFFDocument.from_xml(xml).files[0].units
+
+        assert [(u.source, u.attribute, u.owner) for u in units] == [
+            ("Intro", None, None),
+            ("Company logo", "alt", None),
+        ]
+        assert converter.xliff_to_markdown(xml) == "<p>Intro</p>"
+
+    def test_xml_attributes(self) -> None:
+        """Sub-units are marked with their attribute and owner in the project namespace."""
+        xml = VexyMarkliff().html_to_xliff('<p title="Tip">Text</p>', "en", "es")
+        unit = etree.fromstring(xml.encode()).xpath("//*[@id='unit_2']")[0]
+
+        assert (unit.get(ATTRIBUTE_ATTR), unit.get(OWNER_ATTR)) == ("title", "unit_1")
+        assert ' attribute="' not in xml
+
+    def test_reconstruct_applies_sub_units(self) -> None:
+        """Attribute values go back onto their element instead of into paragraphs."""
+        converter = VexyMarkliff()
+        xml = converter.html_to_xliff('<p title="Tip">See <img src="a.png" alt="Map">here</p>', "en", "es")
+
+        assert converter.xliff_to_html(xml) == '<p title="Tip">See <img src="a.png" alt="Map">here</p>'
+
+
+class TestMerge:
+    """Tests for merging translated attribute sub-units."""
+
+    def test_po(self) -> None:
+        """PO entries of sub-units are applied to the owner element."""
+        converter = VexyMarkliff()
+        po = converter.markdown_to_po('# Docs\n\n<p title="Docs title">Hello</p>\n', "en", "de")
+
+        assert 'msgctxt "unit_3@title"' in po
+        po = po.replace('msgid "Docs title"\nmsgstr ""', 'msgid "Docs title"\nmsgstr "Doku-Titel"')
+        assert converter.po_to_markdown(po) == '<p>Docs</p>\n<p title="Doku-Titel">Hello</p>'
+
+    def test_po_unowned(self) -> None:
+        """Keys of unowned sub-units are marked and their entries skipped when merging."""
+        converter = VexyMarkliff()
+        po = converter.markdown_to_po("Intro\n\n![Company logo](logo.png)\n", "en", "de")
+
+        assert 'msgctxt "unit_2#alt"' in po
+        assert converter.po_to_markdown(po) == "<p>Intro</p>"
+
+    def test_unpack(self, tmp_path: Path) -> None:
+        """Unpacking applies sub-units instead of rebuilding them as paragraphs."""
+        (tmp_path / "in").mkdir()
+        (tmp_path / "in" / "a.html").write_text('<p title="Cat">A cat</p>', encoding="utf-8")
+        pack_files([tmp_path / "in"], tmp_path / "p.xlf", pattern="*.html")
+
+        unpack_package(tmp_path / "p.xlf", tmp_path / "out")
+
+        assert (tmp_path / "out" / "a.html").read_text(encoding="utf-8") == '<p title="Cat">A cat</p>'
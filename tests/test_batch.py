@@ -0,0 +1,84 @@
+"""Tests for checkpointed batch conversion."""
+# this_file: tests/test_batch.py
+
+import json
+from pathlib import Path
+
+import pytest
+
+from vexy_markliff.core import batch as batch_module
+from vexy_markliff.core.batch import CHECKPOINT_NAME, BatchConverter
+from vexy_markliff.exceptions import ConfigurationError
+
+
+def _make_tree(root: Path, count: int) -> None:
+    for i in range(count):
+        sub = root / f"dir{i % 2}"
+        sub.mkdir(parents=True, exist_ok=True)
+        (sub / f"doc{i}.md").write_text(f"# Title {i}\n\nParagraph {i}.", encoding="utf-8")
+
+
+class TestBatchConverter:
+    """Tests for BatchConverter."""
+
+    def test_converts_tree(self, tmp_path: Path) -> None:
+        """All inputs are converted and the checkpoint is removed on success."""
+        _make_tree(tmp_path / "in", 4)
+        result = BatchConverter().run(tmp_path / "in", tmp_path / "out")
+
+        assert result.converted == 4
+        assert not result.failed
+        assert (tmp_path / "out" / "dir0" / "doc0.md.xlf").exists()
+        assert not (tmp_path / "out" / CHECKPOINT_NAME).exists()
+
+    def test_resume_skips_completed(self, tmp_path: Path, monkeypatch) -> None:
+        """A resumed run only converts files the interrupted run did not finish."""
+        _make_tree(tmp_path / "in", 6)
+        real_convert = batch_module._convert_one
+        calls: list[str] = []
+
+        def crashing_convert(task):
+            if len(calls) == 4:
+                msg = "killed"
+                raise KeyboardInterrupt(msg)
+            calls.append(task[0])
+            return real_convert(task)
+
+        monkeypatch.setattr(batch_module, "_convert_one", crashing_convert)
+        with pytest.raises(KeyboardInterrupt):
+            BatchConverter(checkpoint_interval=2).run(tmp_path / "in", tmp_path / "out")
+
+        checkpoint = tmp_path / "out" / CHECKPOINT_NAME
+        lines = checkpoint.read_text(encoding="utf-8").splitlines()
+        assert json.loads(lines[0])["version"] == 1
+        assert len(lines) == 5
+
+        calls.clear()
+        monkeypatch.setattr(batch_module, "_convert_one", lambda task: calls.append(task[0]) or real_convert(task))
+        result = BatchConverter().run(tmp_path / "in", tmp_path / "out", resume=True)
+
+        assert result.skipped == 4
+        assert result.converted == 2
+        assert len(calls) == 2
+
+    def test_resume_rejects_foreign_checkpoint(self, tmp_path: Path) -> None:
+        """Resuming with a checkpoint from a different run is an error."""
+        _make_tree(tmp_path / "in", 1)
+        out = tmp_path / "out"
+        out.mkdir()
+        (out / CHECKPOINT_NAME).write_text(json.dumps({"version": 1, "run": {}}) + "\n", encoding="utf-8")
+
+        with pytest.raises(ConfigurationError):
+            BatchConverter().run(tmp_path / "in", out, resume=True)
+
+    def test_failures_are_reported(self, tmp_path: Path) -> None:
+        """Files that fail to convert are reported and keep the checkpoint."""
+        (tmp_path / "in").mkdir()
+        (tmp_path / "in" / "empty.md").write_text("", encoding="utf-8")
+        (tmp_path / "in" / "ok.md").write_text("# Ok", encoding="utf-8")
+
+        result = BatchConverter().run(tmp_path / "in", tmp_path / "out")
+
+        assert result.converted == 1
+        assert list(result.failed) == ["empty.md"]
+        assert (tmp_path / "out" / CHECKPOINT_NAME).exists()
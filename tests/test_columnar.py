@@ -0,0 +1,130 @@
+"""Tests for columnar (JSON Lines / Parquet / Arrow) unit export."""
+# this_file: tests/test_columnar.py
+
+import json
+import sys
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+
+from vexy_markliff.cli import VexyMarkliffCLI
+from vexy_markliff.core.analysis import segment_digest
+from vexy_markliff.core.converter import VexyMarkliff
+from vexy_markliff.exceptions import ConfigurationError, FileOperationError, ValidationError
+from vexy_markliff.formats.columnar import (
+    COLUMNS,
+    ColumnarStats,
+    export_corpus,
+    iter_corpus_records,
+    unit_records,
+    write_jsonl,
+)
+
+
+@pytest.fixture
+def corpus(tmp_path: Path) -> Path:
+    """A small corpus with Markdown, HTML, an empty and a non-input file."""
+    root = tmp_path / "docs"
+    (root / "sub").mkdir(parents=True)
+    (root / "a.md").write_text("# Title\n\nFirst paragraph.\n\nSecond paragraph.\n", encoding="utf-8")
+    (root / "sub" / "b.md").write_text("First paragraph.\n", encoding="utf-8")
+    (root / "c.html").write_text("<h1>Hello</h1><p>World</p>", encoding="utf-8")
+    (root / "empty.md").write_text("  \n", encoding="utf-8")
+    (root / "notes.txt").write_text("not extracted", encoding="utf-8")
+    return root
+
+
+class TestRecords:
+    """Tests for record extraction."""
+
+    def test_unit_records(self) -> None:
+        """Records carry ids, element, offsets and hashes from the pipeline."""
+        content = "<h1>Hello</h1><p>World</p>"
+        records = list(unit_records("c.html", content, "html", VexyMarkliff()))
+
+        assert [list(r) for r in records] == [list(COLUMNS)] * 2
+        first, second = records
+        assert (first["file_id"], first["unit_id"], first["source"], first["element"]) == (
+            "c.html",
+            "unit_1",
+            "Hello",
+            "h1",
+        )
+        assert (second["offset"], second["length"]) == (content.index("World"), 5)
+        assert second["source_hash"] == segment_digest("World").hex()
+        assert (second["target"], second["target_hash"], second["state"]) == (None, None, "new")
+
+    def test_corpus_streams_files_in_order(self, corpus: Path) -> None:
+        """Matching files are extracted in sorted order; empty files are skipped."""
+        stats = ColumnarStats()
+        records = list(iter_corpus_records(corpus, pattern="*", stats=stats))
+
+        assert [r["file_id"] for r in records] == ["a.md"] * 3 + ["c.html"] * 2 + ["sub/b.md"]
+        assert (stats.files, stats.units, stats.failed) == (3, 6, {})
+        # Same text in different files hashes identically
+        assert records[1]["source_hash"] == records[-1]["source_hash"]
+
+    def test_missing_directory(self, tmp_path: Path) -> None:
+        """A missing input directory is reported as a file error."""
+        with pytest.raises(FileOperationError):
+            list(iter_corpus_records(tmp_path / "missing"))
+
+
+class TestWriters:
+    """Tests for the JSON Lines and Arrow writers."""
+
+    def test_jsonl_batches(self, corpus: Path) -> None:
+        """JSON Lines output holds one UTF-8 object per unit regardless of batch size."""
+        out = BytesIO()
+        count = write_jsonl(iter_corpus_records(corpus), out, batch_size=2)
+        rows = [json.loads(line) for line in out.getvalue().decode("utf-8").splitlines()]
+
+        assert count == len(rows) == 4
+        assert rows[0]["source"] == "Title"
+
+    def test_export_corpus_jsonl(self, corpus: Path, tmp_path: Path) -> None:
+        """Unknown suffixes default to JSON Lines; unknown formats are rejected."""
+        output = tmp_path / "units.out"
+        stats = export_corpus(corpus, output, pattern="*.md")
+
+        assert stats.units == len(output.read_text(encoding="utf-8").splitlines()) == 4
+        with pytest.raises(ValidationError):
+            export_corpus(corpus, output, fmt="csv")
+
+    def test_parquet_without_pyarrow(self, corpus: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Parquet export explains how to install pyarrow and writes nothing."""
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+        output = tmp_path / "units.parquet"
+
+        with pytest.raises(ConfigurationError, match="pyarrow"):
+            export_corpus(corpus, output)
+        assert not output.exists()
+
+    @pytest.mark.parametrize("suffix", [".parquet", ".arrow"])
+    def test_arrow_formats(self, corpus: Path, tmp_path: Path, suffix: str) -> None:
+        """Parquet and Arrow IPC files read back with the unit schema."""
+        pa = pytest.importorskip("pyarrow")
+        output = tmp_path / f"units{suffix}"
+
+        export_corpus(corpus, output, batch_size=2)
+
+        if suffix == ".parquet":
+            table = pytest.importorskip("pyarrow.parquet").read_table(output)
+        else:
+            table = pa.ipc.open_file(output).read_all()
+        assert table.column_names == list(COLUMNS)
+        assert table.num_rows == 4
+
+
+class TestCLI:
+    """Tests for the export_columns command."""
+
+    def test_export_columns(self, corpus: Path, tmp_path: Path) -> None:
+        """The command writes JSON Lines and returns counts."""
+        output = tmp_path / "units.jsonl"
+
+        result = VexyMarkliffCLI().export_columns(str(corpus), str(output), pattern="*.html")
+
+        assert result == {"files": 1, "units": 2, "failed": {}}
+        assert json.loads(output.read_text(encoding="utf-8").splitlines()[1])["source"] == "World"
@@ -0,0 +1,167 @@
+"""Tests for the structural XLIFF diff."""
+# this_file: tests/test_diff.py
+
+import json
+from pathlib import Path
+
+import pytest
+
+from vexy_markliff.cli import VexyMarkliffCLI
+from vexy_markliff.core.diff import diff_files, diff_xliff
+from vexy_markliff.exceptions import ParsingError, ValidationError
+
+
+def xliff(*units: tuple[str, str, str | None, str]) -> str:
+    """Build an XLIFF file from (id, source, target, state) tuples."""
+    body = "".join(
+        f'<trans-unit id="{uid}" state="{state}"><source>{source}</source>'
+        + (f"<target>{target}</target>" if target is not None else "")
+        + "</trans-unit>"
+        for uid, source, target, state in units
+    )
+    return (
+        '<xliff xmlns="urn:oasis:names:tc:xliff:document:2.1" version="2.1">'
+        f'<file id="f1" source-language="en" target-language="de">{body}</file></xliff>'
+    )
+
+
+SENT = xliff(
+    ("u1", "Hello", None, "new"),
+    ("u2", "Install it.", None, "new"),
+    ("u3", "Run it.", "Ausführen.", "translated"),
+    ("u4", "Obsolete.", None, "new"),
+    ("u5", "Done.", "Fertig.", "translated"),
+)
+RETURNED = xliff(
+    ("u1", "Hello", "Hallo", "translated"),
+    ("u2", "Install it now.", "Jetzt installieren.", "translated"),
+    ("u3", "Run it.", "Ausführen.", "final"),
+    ("u5", "Done.", "Fertig.", "translated"),
+    ("u6", "Extra.", "Extra.", "translated"),
+)
+
+
+@pytest.fixture
+def files(tmp_path: Path) -> tuple[Path, Path]:
+    """A sent file and the vendor's return."""
+    sent, returned = tmp_path / "sent.xlf", tmp_path / "returned.xlf"
+    sent.write_text(SENT, encoding="utf-8")
+    returned.write_text(RETURNED, encoding="utf-8")
+    return sent, returned
+
+
+class TestDiff:
+    """Tests for diffing."""
+
+    def test_statuses(self, files: tuple[Path, Path]) -> None:
+        """Each kind of difference is reported with old and new values."""
+        report = diff_xliff(*files)
+        by_id = {diff.unit_id: diff for diff in report.differences}
+
+        assert (report.units_a, report.units_b) == (5, 5)
+        assert [d.unit_id for d in report.differences] == ["u1", "u2", "u3", "u6", "u4"]
+        assert by_id["u1"].status == "changed-target"
+        assert (by_id["u1"].old_target, by_id["u1"].target) == (None, "Hallo")
+        assert by_id["u2"].status == "changed-source"
+        assert (by_id["u2"].old_source, by_id["u2"].source) == ("Install it.", "Install it now.")
+        assert by_id["u3"].status == "changed-state"
+        assert (by_id["u3"].old_state, by_id["u3"].state) == ("translated", "final")
+        assert (by_id["u4"].status, by_id["u4"].old_source) == ("removed", "Obsolete.")
+        assert (by_id["u6"].status, by_id["u6"].source) == ("added", "Extra.")
+
+    def test_identical(self, files: tuple[Path, Path]) -> None:
+        """A file has no differences with itself."""
+        report = diff_xliff(files[0], files[0])
+
+        assert report.differences == []
+        assert report.to_dict()["units_a"] == 5
+
+    def test_content_key(self, tmp_path: Path) -> None:
+        """Content alignment ignores regenerated IDs."""
+        a, b = tmp_path / "a.xlf", tmp_path / "b.xlf"
+        a.write_text(xliff(("x1", "Hello", None, "new"), ("x2", "Bye", None, "new")), encoding="utf-8")
+        b.write_text(xliff(("y1", "Hello", "Hallo", "new"), ("y2", "Bye", None, "new")), encoding="utf-8")
+
+        by_id = diff_xliff(a, b, key="id").counts
+        by_content = diff_xliff(a, b, key="content")
+
+        assert (by_id["added"], by_id["removed"]) == (2, 2)
+        assert [(d.status, d.unit_id) for d in by_content.differences] == [("changed-target", "y1")]
+
+    def test_inline_codes(self, tmp_path: Path) -> None:
+        """Changed markup is a difference even when the plain text is the same."""
+        a, b = tmp_path / "a.xlf", tmp_path / "b.xlf"
+        a.write_text(xliff(("u1", 'See <pc id="1">docs</pc>', 'Siehe <pc id="1">Doku</pc>', "new")), encoding="utf-8")
+        b.write_text(xliff(("u1", 'See <pc id="1">docs</pc>', "Siehe Doku", "new")), encoding="utf-8")
+
+        [diff] = diff_xliff(a, b).differences
+
+        assert (diff.status, diff.old_target, diff.target) == ("changed-target", "Siehe Doku", "Siehe Doku")
+        assert diff_xliff(a, a).differences == []
+
+    def test_changed_code_data(self, tmp_path: Path) -> None:
+        """A changed link target is a difference even when text and code spans are the same."""
+
+        def linked(href: str) -> str:
+            return (
+                '<xliff xmlns="urn:oasis:names:tc:xliff:document:2.1" version="2.1">'
+                '<file id="f1" source-language="en" target-language="de"><originalData>'
+                f'<data id="d1">&lt;a href="{href}"&gt;</data><data id="d2">&lt;/a&gt;</data></originalData>'
+                '<trans-unit id="u1" state="new">'
+                '<source>See <pc id="1" dataRefStart="d1" dataRefEnd="d2">docs</pc></source>'
+                "</trans-unit></file></xliff>"
+            )
+
+        a, b = tmp_path / "a.xlf", tmp_path / "b.xlf"
+        a.write_text(linked("/old"), encoding="utf-8")
+        b.write_text(linked("/new"), encoding="utf-8")
+
+        assert [d.status for d in diff_xliff(a, b).differences] == ["changed-source"]
+        assert diff_xliff(a, a).differences == []
+
+    def test_errors(self, files: tuple[Path, Path], tmp_path: Path) -> None:
+        """Unknown keys, duplicate IDs and malformed files are rejected."""
+        duplicate = tmp_path / "dup.xlf"
+        duplicate.write_text(xliff(("u1", "a", None, "new"), ("u1", "b", None, "new")), encoding="utf-8")
+        broken = tmp_path / "broken.xlf"
+        broken.write_text("<xliff><file>", encoding="utf-8")
+
+        with pytest.raises(ValidationError):
+            diff_xliff(*files, key="xml")
+        with pytest.raises(ValidationError):
+            diff_xliff(duplicate, files[1])
+        with pytest.raises(ParsingError):
+            diff_xliff(broken, files[1])
+
+
+class TestOutput:
+    """Tests for JSON Lines output and the CLI."""
+
+    def test_jsonl(self, files: tuple[Path, Path], tmp_path: Path) -> None:
+        """Differences are written one JSON object per line."""
+        output = tmp_path / "diff.jsonl"
+
+        diff_files(*files, output_file=output)
+        lines = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+
+        assert [line["status"] for line in lines] == [
+            "changed-target",
+            "changed-source",
+            "changed-state",
+            "added",
+            "removed",
+        ]
+
+    def test_cli(self, files: tuple[Path, Path]) -> None:
+        """The diff command reports counts per status."""
+        result = VexyMarkliffCLI().diff(str(files[0]), str(files[1]))
+
+        assert result == {
+            "units_a": 5,
+            "units_b": 5,
+            "added": 1,
+            "removed": 1,
+            "changed-source": 1,
+            "changed-target": 1,
+            "changed-state": 1,
+        }
@@ -0,0 +1,138 @@
+"""Tests for Format Style (fs:fs/fs:subFs) generation."""
+# this_file: tests/test_format_style.py
+
+from pathlib import Path
+
+import pytest
+from lxml import etree
+
+from vexy_markliff.core.align import pair_to_xliff
+from vexy_markliff.core.align_batch import AlignmentRunner
+from vexy_markliff.core.converter import VexyMarkliff
+from vexy_markliff.core.format_style import fs_name, parse_sub_fs, sub_fs
+from vexy_markliff.core.package import pack_files
+from vexy_markliff.core.parser import HTMLParser
+from vexy_markliff.models.document_pair import TwoDocumentPair
+from vexy_markliff.models.inline import FS_ATTR, FS_NS, SUB_FS_ATTR
+from vexy_markliff.models.xliff import XLIFFDocument
+
+NS = {"x": "urn:oasis:names:tc:xliff:document:2.1", "fs": FS_NS}
+
+
+def units(xml: str) -> list[etree._Element]:
+    """Return the trans-unit elements of an XLIFF string."""
+    return etree.fromstring(xml.encode("utf-8")).findall(".//x:trans-unit", NS)
+
+
+class TestSubFs:
+    """Tests for the fs:subFs encoding."""
+
+    @pytest.mark.parametrize(
+        "pairs",
+        [
+            [("href", "/a,b")],
+            [("title", "C:\\path\\")],
+            [("alt", ""), ("src", "i.png")],
+            [("data-x", ",\\,"), ("class", "a b")],
+            [("title", "")],
+        ],
+    )
+    def test_round_trip(self, pairs: list[tuple[str, str]]) -> None:
+        """Commas, backslashes and empty values survive encoding."""
+        assert parse_sub_fs(sub_fs("span", pairs)) == pairs
+
+    def test_escaping(self) -> None:
+        """Literal commas and backslashes are escaped, pairs joined by a backslash."""
+        assert sub_fs("a", [("href", "x,y"), ("title", "a\\b")]) == "href,x\\,y\\title,a\\\\b"
+        assert sub_fs("img", [("alt", "")]) == "alt,"
+
+    def test_no_attributes(self) -> None:
+        """Elements without attributes have no fs:subFs."""
+        assert sub_fs("p", []) is None
+
+    def test_implied_attributes(self) -> None:
+        """bdi and bdo record their implied direction unless the author set one."""
+        assert sub_fs("bdi", []) == "dir,auto"
+        assert sub_fs("bdo", [("dir", "rtl")]) == "dir,rtl"
+
+
+class TestFsName:
+    """Tests for fs:fs values."""
+
+    def test_html5_element(self) -> None:
+        """HTML5 elements keep their own name."""
+        assert fs_name("blockquote") == "blockquote"
+
+    def test_legacy_element(self) -> None:
+        """Obsolete elements map to their modern counterpart."""
+        assert [fs_name(tag) for tag in ("center", "font", "tt", "strike")] == ["div", "span", "code", "s"]
+
+    def test_custom_element(self) -> None:
+        """Custom elements keep their own name."""
+        assert fs_name("my-widget") == "my-widget"
+
+
+class TestExtraction:
+    """Tests for Format Style values written during extraction."""
+
+    def test_every_unit_has_fs(self) -> None:
+        """Every unit records the element its text came from."""
+        xml = VexyMarkliff().markdown_to_xliff("# Title\n\nText.\n\n- item\n", "en", "es")
+
+        assert [unit.get(FS_ATTR) for unit in units(xml)] == ["h1", "p", "li"]
+        assert '<xliff version="2.1" xmlns="urn:oasis:names:tc:xliff:document:2.1" xmlns:fs=' in xml
+
+    def test_block_attributes(self) -> None:
+        """Block attributes become the unit's fs:subFs."""
+        xml = VexyMarkliff().html_to_xliff('<p class="lead" lang="en">Hi</p>', "en", "es")
+        [unit] = units(xml)
+
+        assert (unit.get(FS_ATTR), unit.get(SUB_FS_ATTR)) == ("p", "class,lead\\lang,en")
+
+    def test_inline_codes(self) -> None:
+        """pc and ph codes carry fs:fs and fs:subFs."""
+        xml = VexyMarkliff().html_to_xliff('<p><font color="red">Hi</font><img src="a,b.png"></p>', "en", "es")
+        codes = units(xml)[0].find("x:source", NS)
+
+        assert [(c.get(FS_ATTR), c.get(SUB_FS_ATTR)) for c in codes] == [
+            ("span", "color,red"),
+            ("img", "src,a\\,b.png"),
+        ]
+
+    def test_round_trip(self) -> None:
+        """Format Style values are read back from XLIFF."""
+        xml = VexyMarkliff().html_to_xliff('<p lang="en">Go <a href="/x">there</a></p>', "en", "es")
+        [unit] = XLIFFDocument.from_xml(xml).files[0].units
+
+        assert (unit.fs, unit.sub_fs) == ("p", "lang,en")
+        assert (unit.codes[0].fs, unit.codes[0].sub_fs) == ("a", "href,/x")
+
+    def test_repeated_markup_shares_strings(self) -> None:
+        """Repeated tag and attribute combinations reuse one computed value."""
+        segments = HTMLParser().parse('<div><p><a href="/x">a</a></p><p><a href="/x">b</a></p></div>')["segments"]
+        first, second = (segment["codes"][0] for segment in segments)
+
+        assert first.sub_fs == "href,/x"
+        assert first.sub_fs is second.sub_fs
+        assert first.data_start is second.data_start
+
+    def test_package(self, tmp_path: Path) -> None:
+        """Packages declare the namespace once, on the root."""
+        (tmp_path / "a.md").write_text("# T\n\nSee <span class='k'>this</span>.\n", encoding="utf-8")
+        pack_files([tmp_path / "a.md"], tmp_path / "p.xlf")
+        xml = (tmp_path / "p.xlf").read_text(encoding="utf-8")
+
+        assert xml.count(f'xmlns:fs="{FS_NS}"') == 1
+        assert [unit.get(FS_ATTR) for unit in units(xml)] == ["h1", "p"]
+
+    def test_aligned_units(self) -> None:
+        """Aligned units record the element of their source text."""
+        pair = TwoDocumentPair(
+            source_lang="en",
+            target_lang="es",
+            source_content="# Hello\n\nGood day.\n",
+            target_content="# Hola\n\nBuen día.\n",
+        )
+        xml = pair_to_xliff(AlignmentRunner().align(pair))
+
+        assert [unit.get(FS_ATTR) for unit in units(xml)] == ["h1", "p"]
@@ -0,0 +1,71 @@
+"""Tests for fuzzy translation memory lookup."""
+# this_file: tests/test_fuzzy_match.py
+
+from vexy_markliff.models.xliff import XLIFFDocument
+from vexy_markliff.tm.fuzzy import FuzzyIndex, bounded_levenshtein
+from vexy_markliff.tm.memory import TranslationMemory
+
+
+class TestBoundedLevenshtein:
+    """Tests for the banded edit distance."""
+
+    def test_distances_within_bound(self) -> None:
+        """Distances within the bound are exact."""
+        assert bounded_levenshtein("kitten", "sitting", 5) == 3
+        assert bounded_levenshtein("", "abc", 3) == 3
+        assert bounded_levenshtein("same", "same", 0) == 0
+
+    def test_distance_beyond_bound(self) -> None:
+        """Distances beyond the bound report bound + 1."""
+        assert bounded_levenshtein("kitten", "sitting", 2) == 3
+        assert bounded_levenshtein("a", "abcdef", 2) == 3
+
+
+class TestFuzzyIndex:
+    """Tests for FuzzyIndex."""
+
+    def test_lookup_ranks_by_similarity(self) -> None:
+        """Close sources are returned above the threshold, best first."""
+        index = FuzzyIndex.from_entries(
+            [
+                ("Click the Save button to continue.", "Haga clic en Guardar para continuar."),
+                ("Click the Open button to continue.", "Haga clic en Abrir para continuar."),
+                ("Completely unrelated sentence here.", "Otra cosa."),
+            ]
+        )
+
+        matches = index.lookup("Click the Save button to proceed.", threshold=70)
+
+        assert [m.target for m in matches][:1] == ["Haga clic en Guardar para continuar."]
+        assert all(m.similarity >= 70 for m in matches)
+        assert "Otra cosa." not in [m.target for m in matches]
+
+    def test_lookup_batch_preserves_order(self) -> None:
+        """Batch lookup returns one result list per query in order."""
+        index = FuzzyIndex.from_entries([("Hello world", "Hola mundo")])
+
+        results = index.lookup_batch(["Hello world!", "Nothing alike", "Hello world!"], threshold=80)
+
+        assert len(results) == 3
+        assert results[0][0].target == "Hola mundo"
+        assert results[1] == []
+        assert results[2] == results[0]
+
+
+class TestFuzzyPrefill:
+    """Tests for attaching fuzzy candidates during pre-fill."""
+
+    def test_prefill_attaches_matches(self) -> None:
+        """Units without exact matches receive mtc:match candidates."""
+        tm = TranslationMemory(fuzzy_threshold=75)
+        tm.add("The quick brown fox jumps.", "El rápido zorro marrón salta.", "en", "es")
+        doc = XLIFFDocument(content={"segments": [{"content": "The quick brown fox jumped."}]})
+
+        assert tm.prefill(doc) == 0
+        unit = doc.files[0].units[0]
+        assert unit.target is None
+        assert unit.matches[0].target == "El rápido zorro marrón salta."
+
+        xml = doc.to_xml()
+        assert "<mtc:match " in xml
+        assert 'similarity="' in xml
@@ -0,0 +1,142 @@
+"""Tests for inline code extraction and the per-file originalData table."""
+# this_file: tests/test_inline_codes.py
+
+from pathlib import Path
+
+import pytest
+from lxml import etree
+
+from vexy_markliff.core.converter import VexyMarkliff
+from vexy_markliff.core.package import pack_files
+from vexy_markliff.core.parser import HTMLParser, MarkdownParser
+from vexy_markliff.core.split import join_files, split_xliff
+from vexy_markliff.exceptions import ValidationError
+from vexy_markliff.models.inline import InlineCode, read_inline, render_inline
+from vexy_markliff.models.xliff import TranslationUnit, XLIFFDocument
+
+NS = {"x": "urn:oasis:names:tc:xliff:document:2.1"}
+HTML = '<p>Please <b>click <a href="/go?a=1&amp;b=2">here</a></b> to continue.<br>Then <img src="i.png"> wait.</p>'
+
+
+def source_markup(xml: str, index: int = 0) -> str:
+    """Serialize the children of a unit's <source> without namespaces."""
+    root = etree.fromstring(xml.encode("utf-8"))
+    source = root.findall(".//x:trans-unit", NS)[index].find("x:source", NS)
+    etree.cleanup_namespaces(source)
+    inner = etree.tostring(source, encoding="unicode", with_tail=False)
+    return inner[inner.index(">") + 1 : inner.rindex("<")]
+
+
+class TestExtraction:
+    """Tests for the parser."""
+
+    def test_block_is_one_segment(self) -> None:
+        """Inline markup stays within its paragraph's segment as codes."""
+        [segment] = HTMLParser().parse(HTML)["segments"]
+
+        assert segment["content"] == "Please click here to continue.Then wait."
+        assert [(c.kind, c.start, c.end, c.parent) for c in segment["codes"]] == [
+            ("pc", 7, 17, None),
+            ("pc", 13, 17, "1"),
+            ("ph", 30, 30, None),
+            ("ph", 35, 35, None),
+        ]
+        assert segment["codes"][1].data_start == '<a href="/go?a=1&amp;b=2">'
+
+    def test_blocks_still_split(self) -> None:
+        """Block children end a segment; whitespace collapses across codes."""
+        segments = HTMLParser().parse("<div>Intro <em> text </em> here<p>Para</p>tail</div>")["segments"]
+
+        assert [(s["content"], s["element"]) for s in segments] == [
+            ("Intro text here", "div"),
+            ("Para", "p"),
+            ("tail", "text"),
+        ]
+        assert render_inline(segments[0]["content"], segments[0]["codes"]) == "Intro <em>text </em>here"
+
+    def test_translate_no_marker(self) -> None:
+        """Inline markup with translate="no" wraps its text in a locked marker."""
+        xml = VexyMarkliff().html_to_xliff('<p>Use <span translate="no">ACME</span> now.</p>', "en", "de")
+
+        assert source_markup(xml) == (
+            'Use <pc id="1" dataRefStart="d1" dataRefEnd="d2" fs:fs="span" fs:subFs="translate,no">'
+            '<mrk id="2" translate="no">ACME</mrk></pc> now.'
+        )
+
+    def test_markdown(self) -> None:
+        """Markdown emphasis and code spans become paired codes."""
+        [segment] = MarkdownParser().parse("Run **now** with `pip`.")["segments"]
+
+        assert segment["content"] == "Run now with pip."
+        assert render_inline(segment["content"], segment["codes"]) == "Run <strong>now</strong> with <code>pip</code>."
+
+
+class TestOriginalData:
+    """Tests for writing and reading the originalData table."""
+
+    def test_payloads_are_deduplicated_per_file(self) -> None:
+        """Repeated markup is stored once per file and referenced by every unit."""
+        html = "".join(f'<p>Item {i} <a href="/docs">docs</a></p>' for i in range(50))
+        xml = VexyMarkliff().html_to_xliff(html, "en", "de")
+        root = etree.fromstring(xml.encode("utf-8"))
+
+        assert len(root.findall(".//x:originalData/x:data", NS)) == 2
+        assert len(root.findall(".//x:trans-unit//x:pc[@dataRefStart='d1']", NS)) == 50
+
+    def test_round_trip(self) -> None:
+        """Reading and rewriting a document restores the same markup and codes."""
+        xml = VexyMarkliff(storage="both").html_to_xliff(HTML, "en", "de")
+        document = XLIFFDocument.from_xml(xml)
+        unit = document.files[0].units[0]
+
+        assert document.to_xml() == xml
+        assert document.files[0].storage == "both"
+        assert (unit.target, unit.target_codes) == (None, [])
+        assert VexyMarkliff().xliff_to_html(xml) == HTML.replace("> wait", ">wait")
+
+    def test_unit_level_table(self) -> None:
+        """A unit serialized on its own carries its own originalData."""
+        unit = TranslationUnit(
+            id="u1",
+            source="Hi",
+            codes=[InlineCode(id="1", start=0, end=2, data_start="<b>", data_end="</b>")],
+        )
+        elem = unit.to_element()
+
+        assert [child.tag for child in elem] == ["originalData", "source"]
+        assert read_inline(elem.find("source"), {"d1": "<b>", "d2": "</b>"})[1] == unit.codes
+
+    def test_undefined_reference(self) -> None:
+        """A code referencing a missing data entry is rejected."""
+        source = etree.fromstring('<source>A <ph id="1" dataRef="d9"/></source>')
+
+        with pytest.raises(ValidationError):
+            read_inline(source, {})
+
+
+class TestStructureCommands:
+    """Tests for commands that restructure files."""
+
+    def test_split_repeats_table(self, tmp_path: Path) -> None:
+        """Every part carries the table; joining writes it once."""
+        html = "".join(f'<p>Para {i} has a <a href="/x">link</a>.</p>' for i in range(9))
+        source = tmp_path / "doc.xlf"
+        source.write_text(VexyMarkliff().html_to_xliff(html, "en", "de"), encoding="utf-8")
+
+        parts = split_xliff(source, tmp_path / "parts", parts=3)
+        join_files(parts, tmp_path / "joined.xlf")
+        joined = (tmp_path / "joined.xlf").read_text(encoding="utf-8")
+
+        assert all(XLIFFDocument.from_xml(p.read_text(encoding="utf-8")).files[0].units[0].codes for p in parts)
+        assert joined.count("<originalData") == 1
+        assert XLIFFDocument.from_xml(joined).to_xml() == XLIFFDocument.from_xml(source.read_text("utf-8")).to_xml()
+
+    def test_package_has_table_per_file(self, tmp_path: Path) -> None:
+        """Packages write one table per document."""
+        for name in ("a.html", "b.html"):
+            (tmp_path / name).write_text('<p>See <a href="/x">this</a>.</p>', encoding="utf-8")
+
+        pack_files([tmp_path / "a.html", tmp_path / "b.html"], tmp_path / "pack.xlf")
+        document = XLIFFDocument.from_xml((tmp_path / "pack.xlf").read_text(encoding="utf-8"))
+
+        assert [f.units[0].codes[0].data_start for f in document.files] == ['<a href="/x">', '<a href="/x">']
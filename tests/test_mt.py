@@ -0,0 +1,280 @@
+"""Tests for machine-translation pre-translation against a local HTTP server."""
+# this_file: tests/test_mt.py
+
+import json
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from vexy_markliff.cli import VexyMarkliffCLI
+from vexy_markliff.core.converter import VexyMarkliff
+from vexy_markliff.exceptions import ConfigurationError, ConversionError
+from vexy_markliff.models.inline import render_inline
+from vexy_markliff.models.xliff import XLIFFDocument
+from vexy_markliff.mt.pretranslate import MTPretranslator, decode_segment, encode_segment, pretranslate_file
+from vexy_markliff.mt.provider import HTTPProvider, MTProvider
+
+
+class StandIn(ThreadingHTTPServer):
+    """MT stand-in that prefixes every text node with the target language."""
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.batches: list[list[str]] = []
+        self.clients: set[tuple[str, int]] = set()
+        self.headers_seen: list[dict[str, str]] = []
+        self.failures: list[int] = []
+        self.reply: str | None = None
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/translate"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_POST(self) -> None:
+        server: StandIn = self.server
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with server.lock:
+            server.clients.add(self.client_address)
+            server.headers_seen.append(dict(self.headers))
+            status = server.failures.pop(0) if server.failures else 200
+            if status == 200:
+                server.batches.append(request["texts"])
+        if server.reply is not None:
+            body = server.reply.encode("utf-8")
+        elif status == 200:
+            prefix = request["target_lang"].upper()
+            body = json.dumps({"translations": [_translate(text, prefix) for text in request["texts"]]}).encode()
+        else:
+            body = b"busy"
+        self.send_response(status)
+        if status == 429:
+            self.send_header("Retry-After", "0")
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def _translate(fragment: str, prefix: str) -> str:
+    """Prefix the text nodes of a fragment, keeping its tags."""
+    parts = fragment.replace(">", ">\0").replace("<", "\0<").split("\0")
+    return "".join(f"{prefix}:{part}" if part.strip() and not part.startswith("<") else part for part in parts)
+
+
+@pytest.fixture
+def stand_in() -> Iterator[StandIn]:
+    """Run the MT stand-in on a free local port."""
+    server = StandIn()
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def xliff_file(tmp_path: Path, markdown: str) -> Path:
+    """Convert Markdown to an XLIFF file."""
+    path = tmp_path / "doc.xlf"
+    path.write_text(VexyMarkliff().markdown_to_xliff(markdown, "en", "de"), encoding="utf-8")
+    return path
+
+
+def units(path: Path) -> list:
+    """Return the units of an XLIFF file."""
+    return XLIFFDocument.from_xml(path.read_text(encoding="utf-8")).files[0].units
+
+
+class TestSegments:
+    """Tests for encoding units for the provider."""
+
+    def test_round_trip(self) -> None:
+        """Codes travel as elements and take their markup back from the source."""
+        unit = XLIFFDocument.from_xml(VexyMarkliff().markdown_to_xliff("Read [the *docs*](/d) & more", "en", "de"))
+        [unit] = unit.files[0].units
+        encoded = encode_segment(unit.source, unit.codes)
+
+        assert encoded == 'Read <pc id="1">the <pc id="2">docs</pc></pc> &amp; more'
+        text, codes = decode_segment('Lies <pc id="1">die <pc id="2">Doku</pc></pc> &amp; mehr', unit.codes)
+        assert render_inline(text, codes) == 'Lies <a href="/d">die <em>Doku</em></a> & mehr'
+
+    def test_rejected_translations(self) -> None:
+        """Malformed fragments, empty text and unknown codes are rejected."""
+        assert decode_segment("a < b", []) is None
+        assert decode_segment("  ", []) is None
+        assert decode_segment('Hallo <ph id="9"/>', []) is None
+        assert decode_segment("a &lt; b", []) == ("a < b", [])
+
+
+class TestPretranslation:
+    """Tests for batched, concurrent pre-translation."""
+
+    def test_targets_and_state(self, stand_in: StandIn, tmp_path: Path) -> None:
+        """Untranslated units get the translation as target with state initial."""
+        path = xliff_file(tmp_path, "# Title\n\nSee [the docs](/d)\n")
+        provider = HTTPProvider(stand_in.url, retries=0)
+        report = pretranslate_file(path, tmp_path / "out.xlf", MTPretranslator(provider))
+        provider.close()
+
+        translated = units(tmp_path / "out.xlf")
+        assert [(u.target, u.state) for u in translated] == [("DE:Title", "initial"), ("DE:See DE:the docs", "initial")]
+        assert render_inline(translated[1].target, translated[1].target_codes) == 'DE:See <a href="/d">DE:the docs</a>'
+        assert report.to_dict() == {
+            "units": 2,
+            "translated": 2,
+            "segments": 2,
+            "requests": 1,
+            "failed": 0,
+            "rejected": 0,
+        }
+
+    def test_batching_and_deduplication(self, stand_in: StandIn, tmp_path: Path) -> None:
+        """Repeated text is sent once and segments are batched."""
+        markdown = "\n\n".join(f"Paragraph {i % 10}." for i in range(40))
+        path = xliff_file(tmp_path, markdown)
+        provider = HTTPProvider(stand_in.url, max_batch=4, retries=0)
+        report = pretranslate_file(path, path, MTPretranslator(provider, concurrency=3))
+        provider.close()
+
+        assert (report.units, report.segments, report.requests, report.translated) == (40, 10, 3, 40)
+        assert sorted(len(batch) for batch in stand_in.batches) == [2, 4, 4]
+        assert all(u.target == f"DE:{u.source}" for u in units(path))
+
+    def test_existing_targets_are_kept(self, stand_in: StandIn) -> None:
+        """Units that already have a target are not sent."""
+        document = XLIFFDocument.from_xml(VexyMarkliff().markdown_to_xliff("One.\n\nTwo.\n", "en", "de"))
+        document.files[0].units[0].target = "Eins."
+        provider = HTTPProvider(stand_in.url, retries=0)
+
+        MTPretranslator(provider).prefill(document)
+
+        assert stand_in.batches == [["Two."]]
+        assert [u.target for u in document.files[0].units] == ["Eins.", "DE:Two."]
+
+    def test_connections_are_reused(self, stand_in: StandIn) -> None:
+        """Sequential requests share one keep-alive connection."""
+        provider = HTTPProvider(stand_in.url, max_batch=1, pool_size=1, retries=0)
+        for text in ("a", "b", "c"):
+            provider.translate([text], "en", "de")
+        provider.close()
+
+        assert provider.pool.created == 1
+        assert len(stand_in.clients) == 1
+
+    def test_bounded_concurrency(self) -> None:
+        """No more requests than the concurrency run at once."""
+
+        class Slow(MTProvider):
+            max_batch = 1
+
+            def __init__(self) -> None:
+                self.active = self.peak = 0
+                self.lock = threading.Lock()
+
+            def translate(self, texts, source_lang, target_lang):  # noqa: ARG002
+                with self.lock:
+                    self.active += 1
+                    self.peak = max(self.peak, self.active)
+                threading.Event().wait(0.01)
+                with self.lock:
+                    self.active -= 1
+                return [f"{target_lang}:{text}" for text in texts]
+
+        provider = Slow()
+        document = XLIFFDocument.from_xml(
+            VexyMarkliff().markdown_to_xliff("\n\n".join(f"P{i}" for i in range(12)), "en", "de")
+        )
+        report = MTPretranslator(provider, concurrency=3).prefill(document)
+
+        assert report.requests == 12
+        assert 1 <= provider.peak <= 3
+
+
+class TestFailures:
+    """Tests for retries and failed requests."""
+
+    def test_retry_with_backoff(self, stand_in: StandIn) -> None:
+        """Transient errors are retried and Retry-After is honoured."""
+        stand_in.failures = [503, 429]
+        provider = HTTPProvider(stand_in.url, retries=2, backoff=0)
+
+        assert provider.translate(["Hi"], "en", "de") == ["DE:Hi"]
+        assert len(stand_in.headers_seen) == 3
+
+    def test_retries_exhausted(self, stand_in: StandIn) -> None:
+        """A request failing on every attempt raises."""
+        stand_in.failures = [503, 503]
+        provider = HTTPProvider(stand_in.url, retries=1, backoff=0)
+
+        with pytest.raises(ConversionError, match="after 2 attempts"):
+            provider.translate(["Hi"], "en", "de")
+
+    def test_client_errors_are_not_retried(self, stand_in: StandIn) -> None:
+        """4xx responses other than 408 and 429 fail at once."""
+        stand_in.failures = [401]
+        provider = HTTPProvider(stand_in.url, retries=3, backoff=0)
+
+        with pytest.raises(ConversionError, match="HTTP 401"):
+            provider.translate(["Hi"], "en", "de")
+        assert len(stand_in.headers_seen) == 1
+
+    def test_malformed_response(self, stand_in: StandIn) -> None:
+        """Responses without one translation per segment raise."""
+        stand_in.reply = json.dumps({"translations": ["only one"]})
+        provider = HTTPProvider(stand_in.url, retries=0)
+
+        with pytest.raises(ConversionError, match="1 translations for 2 segments"):
+            provider.translate(["a", "b"], "en", "de")
+
+    def test_failed_batches_leave_units_untranslated(self, stand_in: StandIn) -> None:
+        """A failed request is reported and the other batches are still applied."""
+        stand_in.failures = [400]
+        document = XLIFFDocument.from_xml(VexyMarkliff().markdown_to_xliff("One.\n\nTwo.\n", "en", "de"))
+        provider = HTTPProvider(stand_in.url, max_batch=1, pool_size=1, retries=0)
+
+        report = MTPretranslator(provider, concurrency=1).prefill(document)
+
+        assert (report.translated, report.failed, len(report.errors)) == (1, 1, 1)
+        assert sum(u.target is None for u in document.files[0].units) == 1
+
+    def test_invalid_endpoint(self) -> None:
+        """Only http and https endpoints are accepted."""
+        with pytest.raises(ConfigurationError):
+            HTTPProvider("ftp://example.com/translate")
+
+
+class TestCli:
+    """Tests for the pretranslate command."""
+
+    def test_pretranslate(self, stand_in: StandIn, tmp_path: Path) -> None:
+        """The command fills targets and sends the API key."""
+        path = xliff_file(tmp_path, "Hello.\n")
+        output = tmp_path / "out.xlf"
+
+        report = VexyMarkliffCLI().pretranslate(str(path), str(output), stand_in.url, api_key="secret")
+
+        assert report["translated"] == 1
+        assert stand_in.headers_seen[0]["Authorization"] == "Bearer secret"
+        assert [u.target for u in units(output)] == ["DE:Hello."]
+
+    def test_unreachable_service(self, tmp_path: Path) -> None:
+        """Failed requests are reported, not fatal."""
+        path = xliff_file(tmp_path, "Hello.\n")
+
+        report = VexyMarkliffCLI().pretranslate(
+            str(path), str(tmp_path / "out.xlf"), "http://127.0.0.1:9/translate", retries=0, details=True
+        )
+
+        assert (report["translated"], report["failed"], len(report["errors"])) == (0, 1, 1)
@@ -0,0 +1,115 @@
+"""Tests for multi-document XLIFF packages."""
+# this_file: tests/test_pack.py
+
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+
+from vexy_markliff.cli import VexyMarkliffCLI
+from vexy_markliff.core.package import iter_documents, pack_documents, pack_files, unpack_package
+from vexy_markliff.core.streaming import iter_units
+from vexy_markliff.exceptions import FileOperationError, ValidationError
+from vexy_markliff.models.xliff import XLIFFDocument
+
+
+@pytest.fixture
+def docs(tmp_path: Path) -> Path:
+    """A directory with Markdown and HTML documents and an empty one."""
+    root = tmp_path / "docs"
+    (root / "guide").mkdir(parents=True)
+    (root / "index.md").write_text("# Welcome\n\nStart here.\n", encoding="utf-8")
+    (root / "guide" / "setup.html").write_text("<h1>Setup</h1><p>Install it.</p>", encoding="utf-8")
+    (root / "empty.md").write_text("", encoding="utf-8")
+    return root
+
+
+class TestPack:
+    """Tests for packing documents."""
+
+    def test_one_file_per_document(self, docs: Path) -> None:
+        """Each document becomes a <file> with its relative path as original."""
+        out = BytesIO()
+        stats = pack_documents(iter_documents([docs], pattern="*"), out, "en", "de")
+        document = XLIFFDocument.from_xml(out.getvalue().decode("utf-8"))
+
+        assert [(f.id, f.original) for f in document.files] == [("f1", "guide/setup.html"), ("f2", "index.md")]
+        assert [u.source for u in document.files[0].units] == ["Setup", "Install it."]
+        assert document.files[1].target_language == "de"
+        assert (stats.files, stats.units) == (2, 4)
+        assert list(stats.failed) == ["empty.md"]
+
+    def test_streaming_reader_sees_originals(self, docs: Path, tmp_path: Path) -> None:
+        """Units read back by the streaming reader carry their document."""
+        package = tmp_path / "release.xlf"
+        pack_files([docs / "index.md", docs / "guide"], package, pattern="*.html")
+
+        assert [(u.file_id, u.original) for u in iter_units(package)] == [("f1", "index.md")] * 2 + [
+            ("f2", "setup.html")
+        ] * 2
+
+    def test_input_errors(self, docs: Path, tmp_path: Path) -> None:
+        """Missing inputs and duplicate document paths are rejected."""
+        with pytest.raises(FileOperationError):
+            list(iter_documents([tmp_path / "missing"]))
+        with pytest.raises(ValidationError):
+            pack_documents([(docs / "index.md", "a.md"), (docs / "index.md", "a.md")], BytesIO())
+
+
+class TestUnpack:
+    """Tests for unpacking packages."""
+
+    def test_round_trip_with_translations(self, docs: Path, tmp_path: Path) -> None:
+        """Translated targets are merged into each document at its original path."""
+        package = tmp_path / "release.xlf"
+        pack_files([docs], package, pattern="*")
+        translated = package.read_text(encoding="utf-8").replace(
+            "<source>Install it.</source>", "<source>Install it.</source><target>Installieren.</target>"
+        )
+        package.write_text(translated, encoding="utf-8")
+
+        stats = unpack_package(package, tmp_path / "out")
+
+        assert (stats.files, stats.units) == (2, 4)
+        setup = (tmp_path / "out" / "guide" / "setup.html").read_text(encoding="utf-8")
+        assert setup == "<p>Setup</p>\n<p>Installieren.</p>"
+        assert (tmp_path / "out" / "index.md").exists()
+
+    def test_inline_markup(self, tmp_path: Path) -> None:
+        """Inline codes are rebuilt as their original markup."""
+        (tmp_path / "in").mkdir()
+        (tmp_path / "in" / "a.md").write_text("See [the *docs*](/d).\n", encoding="utf-8")
+        pack_files([tmp_path / "in"], tmp_path / "p.xlf")
+
+        unpack_package(tmp_path / "p.xlf", tmp_path / "out")
+
+        assert (tmp_path / "out" / "a.md").read_text(
+            encoding="utf-8"
+        ) == '<p>See <a href="/d">the <em>docs</em></a>.</p>'
+
+    def test_rejects_paths_outside_output(self, tmp_path: Path) -> None:
+        """An original escaping the output directory is refused."""
+        package = (
+            b'<xliff xmlns="urn:oasis:names:tc:xliff:document:2.1" version="2.1">'
+            b'<file id="f1" original="../evil.md" source-language="en" target-language="de">'
+            b'<trans-unit id="u1"><source>x</source></trans-unit></file></xliff>'
+        )
+
+        with pytest.raises(ValidationError):
+            unpack_package(BytesIO(package), tmp_path / "out")
+        assert not (tmp_path / "evil.md").exists()
+
+
+class TestCLI:
+    """Tests for the pack and unpack commands."""
+
+    def test_pack_and_unpack(self, docs: Path, tmp_path: Path) -> None:
+        """The commands report counts and write the package and documents."""
+        cli = VexyMarkliffCLI()
+        package = tmp_path / "release.xlf"
+
+        packed = cli.pack(str(docs), output_file=str(package))
+        unpacked = cli.unpack(str(package), str(tmp_path / "out"))
+
+        assert packed["files"] == unpacked["files"] == 1
+        assert unpacked == {"files": 1, "units": 2}
@@ -0,0 +1,92 @@
+"""Tests for gettext PO export and import."""
+# this_file: tests/test_po.py
+
+from io import StringIO
+from pathlib import Path
+
+import pytest
+
+from vexy_markliff.cli import VexyMarkliffCLI
+from vexy_markliff.core.converter import VexyMarkliff
+from vexy_markliff.exceptions import ParsingError
+from vexy_markliff.formats.po import PoEntry, iter_po, write_po
+from vexy_markliff.models.xliff import TranslationMatch, TranslationUnit
+from vexy_markliff.tm.memory import TranslationMemory
+
+SAMPLE = Path(__file__).parent.parent / "docs" / "610-samsa.po.txt"
+
+
+class TestPoReader:
+    """Tests for iter_po."""
+
+    def test_reads_sample_catalog(self) -> None:
+        """The shipped sample catalog parses without its header entry."""
+        with open(SAMPLE, encoding="utf-8") as f:
+            entries = list(iter_po(f))
+
+        assert len(entries) == 7
+        assert entries[4] == PoEntry(None, "Es war kein Traum.", "It wasn\u2019t a dream.", False)
+
+    def test_multiline_plural_fuzzy_and_obsolete(self) -> None:
+        """Continuation lines, plural forms, fuzzy flags and obsolete entries are handled."""
+        po = (
+            '#, fuzzy, c-format\nmsgctxt "u1"\nmsgid ""\n"Line one\\n"\n"Line \\"two\\""\nmsgstr "Zeile"\n\n'
+            'msgid "file"\nmsgid_plural "files"\nmsgstr[0] "Datei"\nmsgstr[1] "Dateien"\n\n'
+            '#~ msgid "old"\n#~ msgstr "alt"\n'
+        )
+
+        assert list(iter_po(po.splitlines())) == [
+            PoEntry("u1", 'Line one\nLine "two"', "Zeile", True),
+            PoEntry(None, "file", "Datei", False),
+        ]
+
+    def test_malformed_line(self) -> None:
+        """Unknown keywords raise ParsingError."""
+        with pytest.raises(ParsingError):
+            list(iter_po(['msgid "a"', 'msgtext "b"']))
+
+
+class TestPoWriter:
+    """Tests for write_po and the converter integration."""
+
+    def test_write_and_read_back(self) -> None:
+        """Written entries keep their unit ids and escapes; TM candidates become fuzzy."""
+        units = [
+            TranslationUnit(id="u1", source='Tab\there "quoted"', target="Übersetzt"),
+            TranslationUnit(
+                id="u2",
+                source="Close",
+                matches=[TranslationMatch(source="Close it", target="Schließen", similarity=80)],
+            ),
+        ]
+        out = StringIO()
+
+        assert write_po(units, out, "en", "de") == 2
+        assert list(iter_po(out.getvalue().splitlines())) == [
+            PoEntry("u1", 'Tab\there "quoted"', "Übersetzt", False),
+            PoEntry("u2", "Close", "Schließen", True),
+        ]
+
+    def test_markdown_round_trip_with_tm(self) -> None:
+        """md2po pre-fills from the TM and po2md merges translations back."""
+        tm = TranslationMemory()
+        tm.add("Hello world", "Hallo Welt", "en", "de")
+        converter = VexyMarkliff(translation_memory=tm)
+
+        po = converter.markdown_to_po("# Hello world\n\nUntranslated.", "en", "de")
+        assert 'msgctxt "unit_1"\nmsgid "Hello world"\nmsgstr "Hallo Welt"' in po
+
+        assert converter.po_to_markdown(po) == "<p>Hallo Welt</p>\n<p>Untranslated.</p>"
+
+    def test_cli_md2po_and_po2html(self, tmp_path: Path) -> None:
+        """The CLI writes a catalog and merges it back."""
+        (tmp_path / "doc.md").write_text("Some text.", encoding="utf-8")
+        cli = VexyMarkliffCLI()
+
+        cli.md2po(str(tmp_path / "doc.md"), str(tmp_path / "doc.po"), target_lang="fr")
+        po = (tmp_path / "doc.po").read_text(encoding="utf-8")
+        assert '"Language: fr\\n"' in po
+        (tmp_path / "doc.po").write_text(po.replace('msgstr ""\n\n', 'msgstr "Du texte."\n\n'), encoding="utf-8")
+
+        cli.po2html(str(tmp_path / "doc.po"), str(tmp_path / "doc.html"))
+        assert (tmp_path / "doc.html").read_text(encoding="utf-8") == "<p>Du texte.</p>"
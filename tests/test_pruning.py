@@ -0,0 +1,115 @@
+"""Tests for skipping untranslatable subtrees during extraction."""
+# this_file: tests/test_pruning.py
+
+from pathlib import Path
+from unittest.mock import patch
+
+from vexy_markliff.cli import VexyMarkliffCLI
+from vexy_markliff.config import ConversionConfig
+from vexy_markliff.core.converter import VexyMarkliff
+from vexy_markliff.core.parser import HTMLParser, MarkdownParser
+from vexy_markliff.models.inline import render_inline
+
+
+def contents(content: str, skip_classes: tuple[str, ...] = ()) -> list[str]:
+    """Return the segment texts of an HTML fragment."""
+    return [segment["content"] for segment in HTMLParser(skip_classes).parse(content)["segments"]]
+
+
+class TestBlockPruning:
+    """Tests for subtrees left out of extraction."""
+
+    def test_script_and_style(self) -> None:
+        """Script and style contents are not extracted."""
+        html = "<div><style>p { color: red }</style><p>Hello</p><script>var msg = 'Hi there';</script></div>"
+
+        assert contents(html) == ["Hello"]
+
+    def test_pre_and_code_blocks(self) -> None:
+        """Fenced code blocks are not extracted."""
+        segments = MarkdownParser().parse("Intro.\n\n```python\nprint('hi')\n```\n\n    indented code\n")["segments"]
+
+        assert [segment["content"] for segment in segments] == ["Intro."]
+
+    def test_translate_no_subtree(self) -> None:
+        """ITS translate="no" removes the element, its descendants and their attributes."""
+        html = '<div><p>Keep</p><div translate="no"><p>Brand</p><img alt="Logo"></div></div>'
+
+        assert contents(html) == ["Keep"]
+
+    def test_skip_classes(self) -> None:
+        """Elements with a configured class are skipped; other classes are not."""
+        html = '<div><nav class="site menu"><p>Home</p></nav><p class="lead">Welcome</p></div>'
+
+        assert contents(html, ("menu",)) == ["Welcome"]
+        assert contents(html) == ["Home", "Welcome"]
+
+    def test_skipped_root(self) -> None:
+        """A fragment that is one untranslatable element has no segments."""
+        assert contents("<pre>raw   text</pre>") == []
+
+    def test_comments(self) -> None:
+        """Comments are not extracted and do not split the text around them."""
+        assert contents("<p>One <!-- note --> two</p>") == ["One two"]
+
+    def test_pruned_subtree_is_not_walked(self) -> None:
+        """Descendants of a skipped element are never visited."""
+        parser = HTMLParser()
+        html = "<div><p>Text</p><script>" + "x" * 10 + "</script></div>"
+        with patch.object(HTMLParser, "_extract_segments", wraps=parser._extract_segments) as walk:
+            parser.parse(html)
+
+        assert [call.args[0].tag for call in walk.call_args_list] == ["div", "p", "script"]
+        assert parser._nodes == 2
+
+
+class TestInlineLocking:
+    """Tests for untranslatable inline markup."""
+
+    def test_inline_code_is_locked(self) -> None:
+        """Inline code stays in the sentence, locked by a marker."""
+        [segment] = MarkdownParser().parse("Run `pip install` now.")["segments"]
+
+        assert segment["content"] == "Run pip install now."
+        assert [(c.kind, c.translate, c.parent) for c in segment["codes"]] == [("pc", True, None), ("mrk", False, "1")]
+        assert render_inline(segment["content"], segment["codes"]) == "Run <code>pip install</code> now."
+
+    def test_skip_class_inline(self) -> None:
+        """Inline elements with a skip class are locked, not dropped."""
+        [segment] = HTMLParser(["product"]).parse('<p>Try <span class="product">Acme</span> today</p>')["segments"]
+
+        assert segment["content"] == "Try Acme today"
+        assert [c.kind for c in segment["codes"]] == ["pc", "mrk"]
+
+    def test_locked_attributes(self) -> None:
+        """Attributes inside locked inline markup are not extracted."""
+        segments = HTMLParser().parse('<p>See <code title="Shell">ls</code> and <abbr title="Thing">t</abbr></p>')[
+            "segments"
+        ]
+
+        assert [segment["content"] for segment in segments] == ["See ls and t", "Thing"]
+
+
+class TestConfiguration:
+    """Tests for configuring skip classes."""
+
+    def test_config(self) -> None:
+        """The converter takes skip classes from its configuration."""
+        converter = VexyMarkliff(ConversionConfig(skip_classes=["no-i18n"]))
+        xml = converter.html_to_xliff('<div><p class="no-i18n">Skip</p><p>Keep</p></div>', "en", "es")
+
+        assert "Skip" not in xml
+        assert "Keep" in xml
+
+    def test_cli(self, tmp_path: Path) -> None:
+        """html2xliff accepts comma-separated skip classes."""
+        source = tmp_path / "page.html"
+        source.write_text('<div><p class="a">One</p><p class="b">Two</p><p>Three</p></div>', encoding="utf-8")
+        output = tmp_path / "page.xlf"
+
+        VexyMarkliffCLI().html2xliff(str(source), str(output), skip_classes="a, b")
+
+        xml = output.read_text(encoding="utf-8")
+        assert "Three" in xml
+        assert "One" not in xml
+        assert "Two" not in xml
@@ -0,0 +1,208 @@
+"""Tests for translation QA checks."""
+# this_file: tests/test_qa.py
+
+import json
+from pathlib import Path
+
+import pytest
+
+from vexy_markliff.cli import VexyMarkliffCLI
+from vexy_markliff.core.qa import QAChecker, qa_file
+from vexy_markliff.core.transcode import transcode_file
+from vexy_markliff.exceptions import ParsingError, ValidationError
+
+HEADER = (
+    '<xliff version="2.1" xmlns="urn:oasis:names:tc:xliff:document:2.1">'
+    '<file id="f1" source-language="en" target-language="de">'
+)
+
+
+def write_units(path: Path, units: list[tuple[str, str | None]]) -> Path:
+    """Write (source, target) pairs as hybrid XLIFF trans-units; markup in the strings is kept."""
+    body = "".join(
+        f'<trans-unit id="u{i}"><source>{source}</source>'
+        + (f"<target>{target}</target>" if target is not None else "")
+        + "</trans-unit>"
+        for i, (source, target) in enumerate(units, 1)
+    )
+    path.write_text(f"{HEADER}{body}</file></xliff>", encoding="utf-8")
+    return path
+
+
+def findings(path: Path, **options) -> list[tuple[str, str, str]]:
+    """Return (check, unit id, message) of every finding."""
+    return [(i.check, i.unit_id, i.message) for i in QAChecker(**options).check(path).issues]
+
+
+class TestChecks:
+    """Tests for the individual checks."""
+
+    def test_clean_translation(self, tmp_path: Path) -> None:
+        """A faithful translation has no findings."""
+        path = write_units(
+            tmp_path / "ok.xlf",
+            [
+                (
+                    'Open <pc id="1">the file</pc> {name} at https://ex.com/a.',
+                    'Öffne <pc id="1">die Datei</pc> {name} unter https://ex.com/a.',
+                )
+            ],
+        )
+
+        assert findings(path) == []
+
+    def test_tags(self, tmp_path: Path) -> None:
+        """Missing and extra inline codes are reported."""
+        path = write_units(
+            tmp_path / "t.xlf",
+            [('Click <pc id="1">here</pc> <ph id="2"/>', 'Klicken Sie hier <ph id="2"/><ph id="3"/>')],
+        )
+
+        assert findings(path, checks=["tags"]) == [
+            ("tags", "u1", "Inline codes differ: missing <pc id=1>; extra <ph id=3>")
+        ]
+
+    def test_placeholders(self, tmp_path: Path) -> None:
+        """Placeholder changes are reported, reordering is not."""
+        path = write_units(
+            tmp_path / "p.xlf", [("Hello {name}, you have %d items", "%d Elemente für {Name}"), ("{a} {b}", "{b} {a}")]
+        )
+
+        assert findings(path, checks=["placeholders"]) == [
+            ("placeholders", "u1", "Placeholders differ: missing {name}; extra {Name}")
+        ]
+
+    def test_numbers(self, tmp_path: Path) -> None:
+        """Changed numbers are reported; separators and URL digits are ignored."""
+        path = write_units(
+            tmp_path / "n.xlf",
+            [
+                ("Costs 1,000.50 in 2024", "Kostet 1.000,50 im 2024"),
+                ("Version 3 of www.ex.com/v2", "Version 4 von www.ex.com/v2"),
+            ],
+        )
+
+        assert findings(path, checks=["numbers"]) == [("numbers", "u2", "Numbers differ: missing 3; extra 4")]
+
+    def test_urls(self, tmp_path: Path) -> None:
+        """Changed URLs are reported; trailing punctuation is not part of a URL."""
+        path = write_units(
+            tmp_path / "u.xlf",
+            [
+                ("See https://ex.com/en.", "Siehe https://ex.com/en"),
+                ("See https://ex.com/en", "Siehe https://ex.de/de"),
+            ],
+        )
+
+        assert findings(path, checks=["urls"]) == [
+            ("urls", "u2", "URLs differ: missing https://ex.com/en; extra https://ex.de/de")
+        ]
+
+    def test_whitespace(self, tmp_path: Path) -> None:
+        """Leading and trailing whitespace must match."""
+        path = write_units(tmp_path / "w.xlf", [(" Hello", "Hallo "), ("Hi ", "Hallo ")])
+
+        assert findings(path, checks=["whitespace"]) == [
+            ("whitespace", "u1", "Leading and trailing whitespace differs")
+        ]
+
+    def test_untranslated(self, tmp_path: Path) -> None:
+        """Missing, empty and copied targets are reported; copied numbers are not."""
+        path = write_units(tmp_path / "x.xlf", [("Hello", None), ("Hello", " "), ("Hello", "Hello"), ("42", "42")])
+
+        assert findings(path, checks=["untranslated"]) == [
+            ("untranslated", "u1", "No translation"),
+            ("untranslated", "u2", "No translation"),
+            ("untranslated", "u3", "Target is identical to source"),
+        ]
+
+    def test_length(self, tmp_path: Path) -> None:
+        """Length ratios outside the bounds are reported for long enough sources."""
+        path = write_units(
+            tmp_path / "l.xlf",
+            [("This sentence is long enough.", "Kurz."), ("Short", "Ein viel längerer Satz als die Quelle")],
+        )
+
+        assert findings(path, checks=["length"]) == [("length", "u1", "Length ratio 0.17 outside 0.5-2")]
+        assert findings(path, checks=["length"], min_ratio=0.1) == []
+
+    def test_xliff_2_segments(self, tmp_path: Path) -> None:
+        """XLIFF 2 units are checked across their segments."""
+        source = write_units(tmp_path / "h.xlf", [("Page 1", "Seite 2")])
+        transcoded = tmp_path / "two.xlf"
+        transcode_file(source, transcoded, "2.0")
+
+        assert findings(transcoded, checks=["numbers"]) == [("numbers", "u1", "Numbers differ: missing 1; extra 2")]
+
+
+class TestRunner:
+    """Tests for chunking, parallelism and reporting."""
+
+    def test_parallel_matches_serial(self, tmp_path: Path) -> None:
+        """Parallel chunks give the same findings in the same order."""
+        units = [(f"Item {i} at ex.com/{i}", f"Artikel {i + i % 3} unter ex.com/{i}") for i in range(50)]
+        path = write_units(tmp_path / "many.xlf", units)
+
+        serial = QAChecker(chunk_size=7).check(path)
+        parallel = QAChecker(parallel=2, chunk_size=7).check(path)
+
+        assert serial.units == parallel.units == 50
+        assert serial.issues == parallel.issues != []
+        assert [issue.unit_id for issue in serial.issues] == sorted(
+            (issue.unit_id for issue in serial.issues), key=lambda unit_id: int(unit_id[1:])
+        )
+
+    def test_report(self, tmp_path: Path) -> None:
+        """Reports count findings per check and flagged units."""
+        path = write_units(tmp_path / "r.xlf", [("Hello", None), ("Page 1", "Page 2"), ("Ok", "Gut")])
+        report = QAChecker().check(path).to_dict()
+
+        assert report["units"] == 3
+        assert report["flagged_units"] == 2
+        assert (report["untranslated"], report["numbers"], report["tags"]) == (1, 1, 0)
+
+    def test_jsonl_output(self, tmp_path: Path) -> None:
+        """Findings are written as JSON Lines."""
+        path = write_units(tmp_path / "j.xlf", [("Hello", None)])
+        qa_file(path, tmp_path / "qa.jsonl")
+
+        [line] = (tmp_path / "qa.jsonl").read_text(encoding="utf-8").splitlines()
+        assert json.loads(line) == {
+            "check": "untranslated",
+            "file_id": "f1",
+            "unit_id": "u1",
+            "message": "No translation",
+        }
+
+    def test_invalid_options(self, tmp_path: Path) -> None:
+        """Unknown checks, inverted ratios and malformed files raise."""
+        with pytest.raises(ValidationError):
+            QAChecker(checks=["spelling"])
+        with pytest.raises(ValidationError):
+            QAChecker(min_ratio=3, max_ratio=2)
+        bad = tmp_path / "bad.xlf"
+        bad.write_text("<xliff><file>", encoding="utf-8")
+        with pytest.raises(ParsingError):
+            QAChecker().check(bad)
+
+
+class TestCli:
+    """Tests for the qa command."""
+
+    def test_qa(self, tmp_path: Path) -> None:
+        """The command returns the report and writes findings."""
+        path = write_units(tmp_path / "c.xlf", [("Page 1", "Seite 2"), ("Hello", None)])
+
+        output = tmp_path / "qa.jsonl"
+        report = VexyMarkliffCLI().qa(str(path), str(output), checks="numbers, untranslated", details=True)
+
+        assert (report["numbers"], report["untranslated"]) == (1, 1)
+        assert len(report["issues"]) == 2
+        assert len(output.read_text(encoding="utf-8").splitlines()) == 2
+
+    def test_unknown_check(self, tmp_path: Path) -> None:
+        """Unknown checks exit with an error."""
+        path = write_units(tmp_path / "c.xlf", [("Hello", "Hallo")])
+
+        with pytest.raises(SystemExit):
+            VexyMarkliffCLI().qa(str(path), checks="spelling")
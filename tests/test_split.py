@@ -0,0 +1,162 @@
+"""Tests for word-count-balanced XLIFF splitting and joining."""
+# this_file: tests/test_split.py
+
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from lxml import etree
+
+from vexy_markliff.cli import VexyMarkliffCLI
+from vexy_markliff.core.converter import VexyMarkliff
+from vexy_markliff.core.split import join_files, join_xliff, split_xliff, unit_words
+from vexy_markliff.core.streaming import iter_units
+from vexy_markliff.exceptions import ValidationError
+
+UNITS = "".join(
+    f'<unit id="u{i}"><notes><note>n{i}</note></notes><segment><source>{"word " * (i % 5 + 1)}</source>'
+    f"<target>t{i}</target></segment></unit>\n"
+    for i in range(30)
+)
+XLIFF2 = f"""<?xml version="1.0" encoding="UTF-8"?>
+<xliff xmlns="urn:oasis:names:tc:xliff:document:2.0" version="2.0" srcLang="en" trgLang="de">
+<file id="a"><notes><note>file note</note></notes>
+<group id="g1">{UNITS}</group>
+<unit id="tail"><segment><source>one two</source></segment><ignorable><source> skip </source></ignorable></unit>
+</file>
+<file id="b"><unit id="b1"><segment><source>hello</source></segment></unit></file>
+</xliff>
+"""
+
+
+def canonical(path: Path) -> bytes:
+    """Return a whitespace-insensitive canonical form of an XML file."""
+    return etree.tostring(etree.parse(str(path), etree.XMLParser(remove_blank_text=True)), method="c14n")
+
+
+def part_words(path: Path) -> int:
+    """Sum the source words of a part."""
+    root = etree.parse(str(path)).getroot()
+    return sum(unit_words(u) for u in root.iter("{*}unit", "{*}trans-unit"))
+
+
+@pytest.fixture
+def source(tmp_path: Path) -> Path:
+    """A 2.0 document with groups, file notes and two files."""
+    path = tmp_path / "big.xlf"
+    path.write_text(XLIFF2, encoding="utf-8")
+    return path
+
+
+class TestSplit:
+    """Tests for splitting."""
+
+    def test_balanced_parts(self, source: Path, tmp_path: Path) -> None:
+        """Parts hold roughly equal word counts and every unit exactly once."""
+        paths = split_xliff(source, tmp_path / "parts", parts=4)
+        words = [part_words(p) for p in paths]
+
+        assert [p.name for p in paths] == [f"big.part00{i}.xlf" for i in range(1, 5)]
+        assert sum(words) == 93
+        assert max(words) - min(words) <= 5
+        ids = [u.unit_id for p in paths for u in iter_units(p)]
+        assert ids == [u.unit_id for u in iter_units(source)]
+
+    def test_parts_keep_structure(self, source: Path, tmp_path: Path) -> None:
+        """Each part is a standalone document with its units' file and group."""
+        paths = split_xliff(source, tmp_path / "parts", parts=2)
+        root = etree.parse(str(paths[1])).getroot()
+        ns = {"x": "urn:oasis:names:tc:xliff:document:2.0"}
+
+        assert (root.get("srcLang"), root.get("trgLang")) == ("en", "de")
+        assert root.xpath("x:file/@id", namespaces=ns) == ["a", "b"]
+        assert root.xpath("x:file/x:group/@id", namespaces=ns) == ["g1"]
+        assert b'<?vexy-markliff-split part="2" parts="2" source="big.xlf"?>' in paths[1].read_bytes()
+
+    def test_max_words(self, source: Path, tmp_path: Path) -> None:
+        """A word budget caps every part."""
+        paths = split_xliff(source, tmp_path / "parts", max_words=20)
+
+        assert all(part_words(p) <= 20 for p in paths)
+        assert len(paths) == 5
+
+    def test_more_parts_than_units(self, tmp_path: Path) -> None:
+        """Requesting more parts than units yields one unit per part."""
+        path = tmp_path / "small.xlf"
+        path.write_text(VexyMarkliff().markdown_to_xliff("# A\n\nB\n"), encoding="utf-8")
+
+        assert len(split_xliff(path, tmp_path / "parts", parts=5)) == 2
+
+    def test_namespaces_declared_once(self, tmp_path: Path) -> None:
+        """Units inherit the root's namespace declarations instead of repeating them."""
+        path = tmp_path / "doc.xlf"
+        markdown = "# Title\n\nSee [the docs](/d).\n\nOne.\n\nTwo.\n"
+        path.write_text(VexyMarkliff().markdown_to_xliff(markdown), encoding="utf-8")
+        output = tmp_path / "joined.xlf"
+
+        paths = split_xliff(path, tmp_path / "parts", parts=2)
+        join_files(paths, output)
+
+        for written in (*paths, output):
+            xml = written.read_bytes()
+            assert xml.count(b"xmlns=") == 1
+            assert xml.count(b"xmlns:fs=") == 1
+        assert canonical(output) == canonical(path)
+
+    def test_invalid_arguments(self, source: Path, tmp_path: Path) -> None:
+        """Exactly one positive split criterion is required."""
+        for kwargs in ({}, {"parts": 2, "max_words": 5}, {"parts": 0}):
+            with pytest.raises(ValidationError):
+                split_xliff(source, tmp_path / "parts", **kwargs)
+
+
+class TestJoin:
+    """Tests for joining."""
+
+    def test_round_trip(self, source: Path, tmp_path: Path) -> None:
+        """Joining parts in any order restores the original document."""
+        paths = split_xliff(source, tmp_path / "parts", parts=3)
+        output = tmp_path / "joined.xlf"
+
+        stats = join_files(reversed(paths), output)
+
+        assert (stats.parts, stats.units, stats.words) == (3, 32, 93)
+        assert canonical(output) == canonical(source)
+        assert b"vexy-markliff-split" not in output.read_bytes()
+
+    def test_round_trip_own_output(self, tmp_path: Path) -> None:
+        """XLIFF written by the converter survives split and join."""
+        path = tmp_path / "doc.xlf"
+        path.write_text(VexyMarkliff().markdown_to_xliff("# Title\n\nOne.\n\nTwo.\n\nThree.\n"), encoding="utf-8")
+        output = tmp_path / "joined.xlf"
+
+        join_files(split_xliff(path, tmp_path / "parts", parts=2), output)
+
+        assert canonical(output) == canonical(path)
+
+    def test_incomplete_sets(self, source: Path, tmp_path: Path) -> None:
+        """Missing, duplicated and foreign parts are rejected."""
+        paths = split_xliff(source, tmp_path / "parts", parts=3)
+
+        with pytest.raises(ValidationError, match="Missing"):
+            join_xliff(paths[:2], BytesIO())
+        with pytest.raises(ValidationError, match="twice"):
+            join_xliff([*paths, paths[0]], BytesIO())
+        with pytest.raises(ValidationError, match="not a part"):
+            join_xliff([source], BytesIO())
+
+
+class TestCLI:
+    """Tests for the split and join commands."""
+
+    def test_split_and_join(self, source: Path, tmp_path: Path) -> None:
+        """The commands write parts and the joined file."""
+        cli = VexyMarkliffCLI()
+        output = tmp_path / "joined.xlf"
+
+        parts = cli.split(str(source), str(tmp_path / "parts"), parts=2)
+        stats = cli.join(*parts, output_file=str(output))
+
+        assert len(parts) == 2
+        assert stats == {"parts": 2, "units": 32, "words": 93}
+        assert canonical(output) == canonical(source)
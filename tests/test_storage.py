@@ -0,0 +1,157 @@
+"""Tests for one-document storage modes."""
+# this_file: tests/test_storage.py
+
+from pathlib import Path
+
+import pytest
+from lxml import etree
+
+from vexy_markliff.cli import VexyMarkliffCLI
+from vexy_markliff.config import ConversionConfig
+from vexy_markliff.core.converter import VexyMarkliff
+from vexy_markliff.core.streaming import iter_units
+from vexy_markliff.exceptions import ValidationError
+from vexy_markliff.models.xliff import TranslationUnit, XLIFFDocument
+from vexy_markliff.mt.pretranslate import MTPretranslator
+from vexy_markliff.mt.provider import MTProvider
+from vexy_markliff.tm.harvest import import_xliff
+
+DOC = "# Guide\n\nInstall it.\n\nDone.\n"
+NS = {"x": "urn:oasis:names:tc:xliff:document:2.1"}
+
+
+def layout(xml: str) -> list[tuple[str | None, str | None]]:
+    """Return (source, target) text per unit, None where the element is absent."""
+    root = etree.fromstring(xml.encode("utf-8"))
+    return [
+        (unit.findtext("x:source", namespaces=NS), unit.findtext("x:target", namespaces=NS))
+        for unit in root.iterfind(".//x:trans-unit", NS)
+    ]
+
+
+class Prefix(MTProvider):
+    """MT stand-in that prefixes each text with the target language."""
+
+    def translate(self, texts: list[str], source_lang: str, target_lang: str) -> list[str]:  # noqa: ARG002
+        return [f"{target_lang}:{text}" for text in texts]
+
+
+class TestStorageModes:
+    """Tests for the writer and reader."""
+
+    @pytest.mark.parametrize(
+        ("storage", "expected"),
+        [
+            ("source", [("Guide", None), ("Install it.", None), ("Done.", None)]),
+            ("target", [(None, "Guide"), (None, "Install it."), (None, "Done.")]),
+            ("both", [("Guide", "Guide"), ("Install it.", "Install it."), ("Done.", "Done.")]),
+        ],
+    )
+    def test_layout(self, storage: str, expected: list) -> None:
+        """Each mode writes the text to the elements of the spec's layout table."""
+        xml = VexyMarkliff(storage=storage).markdown_to_xliff(DOC, "en", "de")
+
+        assert layout(xml) == expected
+
+    def test_text_is_stored_once(self) -> None:
+        """In ``both`` mode units hold one string; the writer emits it twice."""
+        text = "A long paragraph. " * 100
+        document = XLIFFDocument(content={"segments": [{"content": text}]}, storage="both")
+        unit = document.files[0].units[0]
+
+        assert unit.source is text
+        assert unit.target is None
+        assert layout(document.to_xml()) == [(text, text)]
+
+    def test_translation_wins_over_seed(self) -> None:
+        """A unit's own translation is written as its target in ``both`` mode."""
+        unit = TranslationUnit(id="u1", source="Hello", target="Hallo")
+
+        assert unit.to_element("both").findtext("target") == "Hallo"
+        assert unit.to_element("target").find("source") is None
+
+    def test_reading_back(self) -> None:
+        """Target-only and ``both`` files keep their storage; seeds are read as untranslated."""
+        target_only = XLIFFDocument.from_xml(VexyMarkliff(storage="target").markdown_to_xliff(DOC, "en", "de"))
+        both = XLIFFDocument.from_xml(VexyMarkliff(storage="both").markdown_to_xliff(DOC, "en", "de"))
+
+        assert target_only.files[0].storage == "target"
+        assert [u.source for u in target_only.files[0].units] == ["Guide", "Install it.", "Done."]
+        assert layout(target_only.to_xml())[0] == (None, "Guide")
+        assert both.files[0].storage == "both"
+        assert all(u.target is None for u in both.files[0].units)
+        assert layout(both.to_xml())[1] == ("Install it.", "Install it.")
+        assert "Install it." in VexyMarkliff().xliff_to_markdown(target_only.to_xml())
+
+    def test_streaming_target_only(self, tmp_path: Path) -> None:
+        """Streamed target-only units have an empty source and the text as target."""
+        path = tmp_path / "seed.xlf"
+        path.write_text(VexyMarkliff(storage="target").markdown_to_xliff(DOC, "en", "de"), encoding="utf-8")
+
+        assert [(u.source, u.target) for u in iter_units(path)][1] == ("", "Install it.")
+
+    def test_invalid_mode(self) -> None:
+        """Unknown modes are rejected by the model, the converter and the config."""
+        with pytest.raises(ValidationError, match="Unknown storage mode: xml"):
+            XLIFFDocument(storage="xml")
+        with pytest.raises(ValidationError, match="Unknown storage mode: xml"):
+            VexyMarkliff(storage="xml")
+        with pytest.raises(ValueError, match="Invalid storage: xml"):
+            ConversionConfig(storage="xml")
+        assert VexyMarkliff(ConversionConfig(storage="both")).storage == "both"
+
+
+class TestSeeds:
+    """Tests for ``both`` storage seeds in the TM and MT workflows."""
+
+    def test_identical_translation_is_kept(self) -> None:
+        """A translated unit whose target equals its source keeps its target."""
+        document = XLIFFDocument(content={"segments": [{"content": "OK"}, {"content": "Cancel"}]})
+        document.files[0].units[0].target = "OK"
+        document.files[0].units[0].state = "translated"
+        document.files[0].units[1].target = "Abbrechen"
+        document.files[0].units[1].state = "translated"
+
+        units = XLIFFDocument.from_xml(document.to_xml()).files[0].units
+
+        assert [u.target for u in units] == ["OK", "Abbrechen"]
+
+    def test_harvest_skips_seeds(self, tmp_path: Path) -> None:
+        """Importing a ``both`` seed writes no identity pairs."""
+        path = tmp_path / "seed.xlf"
+        path.write_text(VexyMarkliff(storage="both").markdown_to_xliff(DOC, "en", "de"), encoding="utf-8")
+
+        stats = import_xliff([path], tmp_path / "tm.sqlite")
+
+        assert (stats.pairs, stats.skipped, stats.written) == (0, 3, 0)
+
+    def test_pretranslate_seeds(self) -> None:
+        """Seeds, read back or built in memory, are machine-translated."""
+        document = XLIFFDocument.from_xml(VexyMarkliff(storage="both").markdown_to_xliff(DOC, "en", "de"))
+        document.files[0].units.append(TranslationUnit(id="u4", source="Next.", target="Next."))
+
+        report = MTPretranslator(Prefix()).prefill(document)
+
+        assert report.translated == 4
+        assert layout(document.to_xml())[3] == ("Next.", "de:Next.")
+
+
+class TestCli:
+    """Tests for the --storage flag."""
+
+    def test_md2xliff(self, tmp_path: Path) -> None:
+        """md2xliff writes the selected layout."""
+        source, output = tmp_path / "doc.md", tmp_path / "doc.xlf"
+        source.write_text(DOC, encoding="utf-8")
+
+        VexyMarkliffCLI().md2xliff(str(source), str(output), target_lang="de", storage="both")
+
+        assert layout(output.read_text(encoding="utf-8"))[1] == ("Install it.", "Install it.")
+
+    def test_unknown_mode_exits(self, tmp_path: Path) -> None:
+        """An unknown mode exits with an error."""
+        source = tmp_path / "doc.md"
+        source.write_text(DOC, encoding="utf-8")
+
+        with pytest.raises(SystemExit):
+            VexyMarkliffCLI().md2xliff(str(source), str(tmp_path / "doc.xlf"), storage="xml")
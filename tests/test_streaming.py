@@ -0,0 +1,74 @@
+"""Tests for the streaming XLIFF reader."""
+# this_file: tests/test_streaming.py
+
+from pathlib import Path
+
+import pytest
+
+from vexy_markliff.core.converter import VexyMarkliff
+from vexy_markliff.core.streaming import iter_units
+from vexy_markliff.exceptions import ParsingError
+from vexy_markliff.models.inline import render_inline
+
+XLIFF_21 = """<?xml version="1.0" encoding="UTF-8"?>
+<xliff xmlns="urn:oasis:names:tc:xliff:document:2.1" version="2.1" srcLang="de" trgLang="en">
+  <file id="samsa">
+    <unit id="p1">
+      <segment state="translated">
+        <source>Es war kein Traum.</source>
+        <target>It wasn't a <pc id="1">dream</pc>.</target>
+      </segment>
+      <segment>
+        <source>Zweiter Satz.</source>
+      </segment>
+    </unit>
+  </file>
+</xliff>"""
+
+
+class TestIterUnits:
+    """Tests for iter_units."""
+
+    def test_reads_xliff_21_segments(self, tmp_path: Path) -> None:
+        """XLIFF 2.x units yield one pair per segment with inline text."""
+        path = tmp_path / "doc.xlf"
+        path.write_text(XLIFF_21, encoding="utf-8")
+
+        (unit,) = iter_units(path)
+
+        assert (unit.file_id, unit.unit_id, unit.source_lang, unit.target_lang) == ("samsa", "p1", "de", "en")
+        assert unit.state == "translated"
+        assert unit.segments == (("Es war kein Traum.", "It wasn't a dream."), ("Zweiter Satz.", None))
+
+    def test_reads_converter_output(self, tmp_path: Path) -> None:
+        """The converter's trans-unit output streams with file languages."""
+        path = tmp_path / "doc.xlf"
+        path.write_text(VexyMarkliff().markdown_to_xliff("# Title\n\nBody.", "fr", "de"), encoding="utf-8")
+
+        units = list(iter_units(path))
+
+        assert [u.source for u in units] == ["Title", "Body."]
+        assert {(u.source_lang, u.target_lang) for u in units} == {("fr", "de")}
+        assert all(u.target is None for u in units)
+
+    def test_inline_codes(self, tmp_path: Path) -> None:
+        """Units carry their inline codes, shifted onto the joined text of their segments."""
+        path = tmp_path / "doc.xlf"
+        path.write_text(XLIFF_21, encoding="utf-8")
+        converted = tmp_path / "converted.xlf"
+        converted.write_text(VexyMarkliff().markdown_to_xliff("See [the docs](/d).", "en", "de"), encoding="utf-8")
+
+        (unit,) = iter_units(path)
+        (link,) = iter_units(converted)
+
+        assert [(c.kind, c.start, c.end) for c in unit.target_codes] == [("pc", 12, 17)]
+        assert unit.source_codes == []
+        assert render_inline(link.source, link.source_codes) == 'See <a href="/d">the docs</a>.'
+
+    def test_malformed_xml(self, tmp_path: Path) -> None:
+        """Malformed XML raises ParsingError."""
+        path = tmp_path / "bad.xlf"
+        path.write_text("<xliff><file><unit id='1'>", encoding="utf-8")
+
+        with pytest.raises(ParsingError):
+            list(iter_units(path))
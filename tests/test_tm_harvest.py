@@ -0,0 +1,67 @@
+"""Tests for harvesting translation memory from XLIFF."""
+# this_file: tests/test_tm_harvest.py
+
+from pathlib import Path
+
+import pytest
+
+from vexy_markliff.cli import VexyMarkliffCLI
+from vexy_markliff.exceptions import ConfigurationError
+from vexy_markliff.tm.harvest import import_xliff
+from vexy_markliff.tm.memory import TranslationMemory
+
+
+def _xliff(path: Path, pairs: list[tuple[str, str | None]], state: str = "translated") -> Path:
+    units = "".join(
+        f'<unit id="u{i}"><segment state="{state}"><source>{s}</source>'
+        + (f"<target>{t}</target>" if t is not None else "")
+        + "</segment></unit>"
+        for i, (s, t) in enumerate(pairs)
+    )
+    path.write_text(
+        '<xliff xmlns="urn:oasis:names:tc:xliff:document:2.1" version="2.1" srcLang="en" trgLang="es">'
+        f'<file id="f1">{units}</file></xliff>',
+        encoding="utf-8",
+    )
+    return path
+
+
+class TestImportXliff:
+    """Tests for import_xliff."""
+
+    def test_import_dedups_and_skips_empty_targets(self, tmp_path: Path) -> None:
+        """Duplicate pairs collapse and untranslated segments are skipped."""
+        a = _xliff(tmp_path / "a.xlf", [("Hello", "Hola"), ("Bye", None), ("Hello", "Hola")])
+        b = _xliff(tmp_path / "b.xlf", [("Thanks", "Gracias")])
+
+        stats = import_xliff([a, b], tmp_path / "tm.sqlite")
+
+        assert (stats.files, stats.pairs, stats.skipped, stats.written) == (2, 3, 1, 2)
+        tm = TranslationMemory.load(tmp_path / "tm.sqlite")
+        assert tm.lookup("Hello", "en", "es") == "Hola"
+        assert tm.lookup("Thanks", "en", "es") == "Gracias"
+
+    def test_conflict_policies(self, tmp_path: Path) -> None:
+        """keep preserves existing entries, replace overwrites them."""
+        db = tmp_path / "tm.sqlite"
+        import_xliff([_xliff(tmp_path / "old.xlf", [("Save", "Guardar")])], db)
+        new = _xliff(tmp_path / "new.xlf", [("Save", "Salvar")])
+
+        import_xliff([new], db, on_conflict="keep")
+        assert TranslationMemory.load(db).lookup("Save", "en", "es") == "Guardar"
+
+        import_xliff([new], db, on_conflict="replace")
+        assert TranslationMemory.load(db).lookup("Save", "en", "es") == "Salvar"
+
+        with pytest.raises(ConfigurationError):
+            import_xliff([new], db, on_conflict="merge")
+
+    def test_exclude_states_and_cli(self, tmp_path: Path) -> None:
+        """Excluded states are skipped; the CLI exposes `tm import`."""
+        draft = _xliff(tmp_path / "mt.xlf", [("Draft", "Borrador")], state="initial")
+
+        stats = import_xliff([draft], tmp_path / "tm.sqlite", exclude_states=["initial"])
+        assert stats.written == 0
+
+        result = getattr(VexyMarkliffCLI().tm, "import")(str(draft), db=str(tmp_path / "cli.sqlite"))
+        assert result["written"] == 1
@@ -0,0 +1,78 @@
+"""Tests for streaming TMX import and export."""
+# this_file: tests/test_tmx.py
+
+from pathlib import Path
+
+import pytest
+
+from vexy_markliff.exceptions import ParsingError
+from vexy_markliff.tm.memory import TranslationMemory
+from vexy_markliff.tm.tmx import export_tmx, import_tmx, iter_tmx, read_tmx, split_ranges
+
+TMX = """<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE tmx SYSTEM "tmx14.dtd">
+<tmx version="1.4">
+  <header srclang="en" datatype="plaintext" segtype="sentence" adminlang="en" o-tmf="x"
+          creationtool="x" creationtoolversion="1"/>
+  <body>
+{units}
+  </body>
+</tmx>
+"""
+
+
+def _tmx(path: Path, count: int) -> Path:
+    units = "\n".join(
+        f'<tu tuid="{i}"><tuv xml:lang="en"><seg>Line <ph x="1">&lt;br/&gt;</ph>{i}</seg></tuv>'
+        f'<tuv xml:lang="de"><seg>Zeile {i}</seg></tuv><tuv xml:lang="fr"><seg>Ligne {i}</seg></tuv></tu>'
+        for i in range(count)
+    )
+    path.write_text(TMX.format(units=units), encoding="utf-8")
+    return path
+
+
+class TestTMXReader:
+    """Tests for reading TMX."""
+
+    def test_iter_tmx_yields_one_row_per_target_variant(self, tmp_path: Path) -> None:
+        """Multilingual units fan out into pairs and native codes are dropped."""
+        rows = list(iter_tmx(_tmx(tmp_path / "tm.tmx", 2)))
+
+        assert rows[:2] == [
+            ("en", "de", "Line 0", "Line 0", "Zeile 0"),
+            ("en", "fr", "Line 0", "Line 0", "Ligne 0"),
+        ]
+        assert len(rows) == 4
+
+    def test_parallel_ranges_match_serial_order(self, tmp_path: Path) -> None:
+        """Byte-range parsing covers every <tu> and preserves file order."""
+        path = _tmx(tmp_path / "tm.tmx", 300)
+
+        ranges = split_ranges(path, chunk_size=2048)
+        assert len(ranges) > 3
+        assert all(path.read_bytes()[start : start + 4] == b"<tu " for start, _ in ranges)
+        assert list(read_tmx(path, parallel=2, chunk_size=2048)) == list(iter_tmx(path))
+
+    def test_malformed_tmx(self, tmp_path: Path) -> None:
+        """Malformed XML raises ParsingError."""
+        path = tmp_path / "bad.tmx"
+        path.write_text("<tmx><header/><body><tu><tuv>", encoding="utf-8")
+
+        with pytest.raises(ParsingError):
+            list(iter_tmx(path))
+
+
+class TestTMXRoundTrip:
+    """Tests for importing into and exporting from the TM store."""
+
+    def test_import_export_round_trip(self, tmp_path: Path) -> None:
+        """Imported entries are looked up and exported back per language pair."""
+        db = tmp_path / "tm.sqlite"
+        stats = import_tmx([_tmx(tmp_path / "tm.tmx", 5)], db)
+
+        assert (stats.files, stats.pairs, stats.written) == (1, 10, 10)
+        assert TranslationMemory.load(db).lookup("Line 3", "en", "de") == "Zeile 3"
+
+        out = tmp_path / "out.tmx"
+        assert export_tmx(db, out, source_lang="en", target_lang="fr") == 5
+        assert sorted(row[4] for row in iter_tmx(out)) == [f"Ligne {i}" for i in range(5)]
@@ -0,0 +1,296 @@
+"""Tests for the streaming XLIFF 1.2 ↔ 2.1 transcoder."""
+# this_file: tests/test_transcode.py
+
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from lxml import etree
+
+from vexy_markliff.cli import VexyMarkliffCLI
+from vexy_markliff.core.converter import VexyMarkliff
+from vexy_markliff.core.transcode import VERSIONS, XLIFF2_NS, XLIFF12_NS, transcode
+from vexy_markliff.exceptions import ConversionError, ParsingError, ValidationError
+from vexy_markliff.models.inline import render_inline
+from vexy_markliff.models.xliff import XLIFFDocument
+
+DOCS = Path(__file__).parent.parent / "docs"
+
+XLIFF12 = b"""<?xml version="1.0"?>
+<xliff version="1.2" xmlns="urn:oasis:names:tc:xliff:document:1.2">
+ <file original="a.md" source-language="en" target-language="de" datatype="plaintext">
+  <header><note>file note</note></header>
+  <body>
+   <group id="g1">
+    <trans-unit id="1" resname="greeting">
+     <source>Hi <g id="1">bold</g> <x id="2"/> <bpt id="3" rid="r">&lt;i&gt;</bpt>it<ept id="4" rid="r">&lt;/i&gt;</ept>
+<mrk mtype="protected" mid="p">Acme</mrk></source>
+     <target state="signed-off">Hallo <g id="1">fett</g> <x id="2"/></target>
+     <note from="dev">unit note</note>
+     <alt-trans match-quality="87"><source>Hi</source><target>Hallo</target></alt-trans>
+    </trans-unit>
+   </group>
+   <trans-unit id="2">
+    <source>One. Two.</source>
+    <seg-source><mrk mtype="seg" mid="s1">One.</mrk> <mrk mtype="seg" mid="s2">Two.</mrk></seg-source>
+    <target state="translated"><mrk mtype="seg" mid="s1">Eins.</mrk> <mrk mtype="seg" mid="s2">Zwei.</mrk></target>
+   </trans-unit>
+  </body>
+ </file>
+</xliff>"""
+
+XLIFF2 = b"""<?xml version="1.0"?>
+<xliff version="2.0" xmlns="urn:oasis:names:tc:xliff:document:2.0" srcLang="en" trgLang="de">
+ <file id="f1" original="a.md">
+  <notes><note>file note</note></notes>
+  <unit id="1" name="greeting">
+   <notes><note category="dev">unit note</note></notes>
+   <originalData><data id="d1">&lt;b&gt;</data><data id="d2">&lt;/b&gt;</data><data id="d3">{br}</data></originalData>
+   <segment state="reviewed">
+    <source>Hi <pc id="1" dataRefStart="d1" dataRefEnd="d2">bold</pc> <ph id="2" dataRef="d3"/> <pc id="3">plain</pc> \
+<sc id="4" dataRef="d1"/>open<ec startRef="4" dataRef="d2"/> <mrk id="m1" translate="no">Acme</mrk></source>
+    <target>Hallo <pc id="1" dataRefStart="d1" dataRefEnd="d2">fett</pc> <ph id="2" dataRef="d3"/></target>
+   </segment>
+  </unit>
+ </file>
+</xliff>"""
+
+MARKDOWN = "# Title\n\nSee [the *docs*](/d) ![logo](y.png) and `code`.\n"
+
+
+def package_xliff() -> bytes:
+    """This package's own hybrid output, with inline codes and a translated unit."""
+    document = XLIFFDocument.from_xml(VexyMarkliff().markdown_to_xliff(MARKDOWN, "en", "de"))
+    unit = document.files[0].units[1]
+    unit.target, unit.state = f"DE {unit.source}", "translated"
+    unit.target_codes = [c.model_copy(update={"start": c.start + 3, "end": c.end + 3}) for c in unit.codes]
+    return document.to_xml().encode("utf-8")
+
+
+INPUTS = {
+    "1.2": lambda: XLIFF12,
+    "2.0": lambda: XLIFF2,
+    "2.1": lambda: XLIFF2.replace(b'version="2.0"', b'version="2.1"'),
+    "package": package_xliff,
+}
+
+
+def run(data: bytes, to_version: str) -> etree._Element:
+    """Transcode bytes and return the parsed result."""
+    out = BytesIO()
+    transcode(BytesIO(data), out, to_version)
+    return etree.fromstring(out.getvalue())
+
+
+def _flat(elem: etree._Element) -> str:
+    """Render inline content with code names but without IDs, which transcoding may renumber."""
+    children = "".join(f"<{etree.QName(c).localname}>{_flat(c)}</>{c.tail or ''}" for c in elem)
+    return (elem.text or "") + children
+
+
+def content(data: bytes) -> list[tuple[str, str, str | None, str | None]]:
+    """Return (id, source, target, state) of every unit, read through 1.2."""
+    ns = {"x": XLIFF12_NS}
+    units = []
+    for unit in run(data, "1.2").iter(f"{{{XLIFF12_NS}}}trans-unit"):
+        target = unit.find("x:target", ns)
+        units.append(
+            (
+                unit.get("id"),
+                _flat(unit.find("x:source", ns)),
+                _flat(target) if target is not None else None,
+                target.get("state") if target is not None else None,
+            )
+        )
+    return units
+
+
+class TestTo2:
+    """Tests for 1.2 → 2.1 transcoding."""
+
+    def test_structure_and_languages(self) -> None:
+        """Files, groups, notes and units map onto the 2.x layout."""
+        root = run(XLIFF12, "2.1")
+        ns = {"x": XLIFF2_NS}
+
+        assert root.tag == f"{{{XLIFF2_NS}}}xliff"
+        assert (root.get("version"), root.get("srcLang"), root.get("trgLang")) == ("2.1", "en", "de")
+        assert root.xpath("x:file/x:notes/x:note/text()", namespaces=ns) == ["file note"]
+        unit = root.xpath("x:file/x:group/x:unit", namespaces=ns)[0]
+        assert unit.get("name") == "greeting"
+        assert unit.xpath("x:segment/@state", namespaces=ns) == ["reviewed"]
+        assert unit.xpath("x:notes/x:note/@category", namespaces=ns) == ["dev"]
+        assert unit.xpath("*[local-name()='matches']/*/@similarity") == ["87"]
+
+    def test_inline_codes(self) -> None:
+        """Inline codes map to pc/ph/sc/ec with native data in originalData."""
+        root = run(XLIFF12, "2.1")
+        source = root.xpath("//x:unit[@id='1']/x:segment/x:source", namespaces={"x": XLIFF2_NS})[0]
+
+        assert [etree.QName(e).localname for e in source] == ["pc", "ph", "sc", "ec", "mrk"]
+        sc, ec, mrk = source[2], source[3], source[4]
+        assert ec.get("startRef") == sc.get("id")
+        data = {d.get("id"): d.text for d in root.iter(f"{{{XLIFF2_NS}}}data")}
+        assert (data[sc.get("dataRef")], data[ec.get("dataRef")]) == ("<i>", "</i>")
+        assert mrk.get("translate") == "no"
+
+    def test_pairs_without_rid(self) -> None:
+        """bpt/ept and bx/ex without rid pair by id."""
+        data = XLIFF12.replace(
+            b'<x id="2"/> <bpt id="3" rid="r">&lt;i&gt;</bpt>it<ept id="4" rid="r">&lt;/i&gt;</ept>',
+            b'<bx id="2"/>a<ex id="2"/> <bpt id="3">&lt;i&gt;</bpt>it<ept id="3">&lt;/i&gt;</ept>',
+        )
+        source = run(data, "2.1").xpath("//x:unit[@id='1']/x:segment/x:source", namespaces={"x": XLIFF2_NS})[0]
+
+        codes = [(etree.QName(e).localname, e.get("id"), e.get("startRef"), e.get("isolated")) for e in source[1:5]]
+        assert codes == [
+            ("sc", "2", None, None),
+            ("ec", None, "2", None),
+            ("sc", "3", None, None),
+            ("ec", None, "3", None),
+        ]
+
+    def test_match_original_data(self) -> None:
+        """Match content references originalData of its own and survives a round trip."""
+        data = XLIFF12.replace(
+            b'<alt-trans match-quality="87"><source>Hi</source><target>Hallo</target></alt-trans>',
+            b'<alt-trans match-quality="87"><source>Hi <ph id="1">{br}</ph></source>'
+            b'<target>Hallo <ph id="1">{br}</ph></target></alt-trans>',
+        )
+        root = run(data, "2.1")
+        [match] = root.xpath("//*[local-name()='match']")
+
+        assert etree.QName(match[0]).localname == "originalData"
+        assert [(d.get("id"), d.text) for d in match[0]] == [("d1", "{br}"), ("d2", "{br}")]
+        assert [ph.get("dataRef") for ph in match.iter(f"{{{XLIFF2_NS}}}ph")] == ["d1", "d2"]
+        back = run(etree.tostring(root), "1.2")
+        assert back.xpath("//x:alt-trans/x:target/x:ph/text()", namespaces={"x": XLIFF12_NS}) == ["{br}"]
+
+    def test_segments(self) -> None:
+        """A seg-source splits into segments with the separator kept as an ignorable."""
+        unit = run(XLIFF12, "2.1").xpath("//x:unit[@id='2']", namespaces={"x": XLIFF2_NS})[0]
+
+        assert [etree.QName(e).localname for e in unit] == ["segment", "ignorable", "segment"]
+        assert [s.findtext(f"{{{XLIFF2_NS}}}target") for s in unit[::2]] == ["Eins.", "Zwei."]
+
+    def test_converts_own_output(self) -> None:
+        """XLIFF written by the converter transcodes to standard 2.x."""
+        xliff = VexyMarkliff().markdown_to_xliff("# Title\n\nSome text.\n", "en", "fr")
+        root = run(xliff.encode("utf-8"), "2.0")
+
+        assert (root.get("srcLang"), root.get("trgLang")) == ("en", "fr")
+        sources = root.xpath("//x:segment/x:source/text()", namespaces={"x": XLIFF2_NS})
+        assert sources == ["Title", "Some text."]
+
+    def test_rejects_mixed_languages(self) -> None:
+        """2.x documents have a single language pair."""
+        data = XLIFF12.replace(b"</file>\n</xliff>", b'</file><file original="b" source-language="fr"/></xliff>')
+
+        with pytest.raises(ConversionError):
+            run(data, "2.1")
+
+
+class TestTo12:
+    """Tests for 2.1 → 1.2 transcoding and round trips."""
+
+    def test_sample_segments(self) -> None:
+        """Multi-segment units become one trans-unit with a seg-source."""
+        out = BytesIO()
+        stats = transcode(DOCS / "609-samsa.xlf.xml", out, "1.2")
+        root = etree.fromstring(out.getvalue())
+        ns = {"x": XLIFF12_NS}
+
+        assert root.tag == f"{{{XLIFF12_NS}}}xliff"
+        assert root.xpath("x:file/@source-language", namespaces=ns) == ["de"]
+        unit = root.xpath("//x:trans-unit", namespaces=ns)[0]
+        marks = unit.xpath("x:seg-source/x:mrk[@mtype='seg']", namespaces=ns)
+        assert len(marks) == 3
+        assert unit.findtext(f"{{{XLIFF12_NS}}}source") == "".join(m.text for m in marks)
+        assert stats.units == len(root.xpath("//x:trans-unit", namespaces=ns))
+
+    def test_round_trip(self) -> None:
+        """1.2 → 2.1 → 1.2 keeps text, codes, states and notes."""
+        root = run(etree.tostring(run(XLIFF12, "2.1")), "1.2")
+        ns = {"x": XLIFF12_NS}
+        unit = root.xpath("//x:trans-unit[@id='1']", namespaces=ns)[0]
+
+        source = unit.find(f"{{{XLIFF12_NS}}}source")
+        assert [etree.QName(e).localname for e in source] == ["g", "x", "bpt", "ept", "mrk"]
+        assert (source[2].text, source[3].text, source[3].get("rid")) == ("<i>", "</i>", source[2].get("rid"))
+        assert source[4].get("mtype") == "protected"
+        assert unit.xpath("x:target/@state", namespaces=ns) == ["signed-off"]
+        assert unit.xpath("x:note/text()", namespaces=ns) == ["unit note"]
+        assert unit.xpath("x:alt-trans/x:target/text()", namespaces=ns) == ["Hallo"]
+        assert root.xpath("//x:header/x:note/text()", namespaces=ns) == ["file note"]
+        segmented = root.xpath("//x:trans-unit[@id='2']/x:target/x:mrk/text()", namespaces=ns)
+        assert segmented == ["Eins.", "Zwei."]
+
+
+class TestRoundTrip:
+    """Tests over every pair of input layout and output version."""
+
+    @pytest.mark.parametrize("to_version", VERSIONS)
+    @pytest.mark.parametrize("layout", list(INPUTS))
+    def test_round_trip(self, layout: str, to_version: str) -> None:
+        """Text, codes, native data, targets and states survive transcoding and coming back."""
+        data = INPUTS[layout]()
+        out = BytesIO()
+        transcode(BytesIO(data), out, to_version)
+
+        assert content(out.getvalue()) == content(data)
+        assert all(source for _, source, _, _ in content(data))
+
+    @pytest.mark.parametrize("layout", ["1.2", "2.0"])
+    def test_same_version(self, layout: str) -> None:
+        """Transcoding into the input's own version keeps sources, targets and notes."""
+        root = run(INPUTS[layout](), layout)
+
+        assert root.xpath("//*[local-name()='target']")
+        assert "file note" in root.xpath("//*[local-name()='note']/text()")
+        assert content(etree.tostring(root)) == content(INPUTS[layout]())
+
+    def test_package_codes_to_2(self) -> None:
+        """Codes of the package's output keep their markup, moved into each unit's originalData."""
+        root = run(package_xliff(), "2.1")
+        ns = {"x": XLIFF2_NS}
+        [source] = root.xpath("//x:unit[@id='unit_2']//x:source", namespaces=ns)
+
+        assert [etree.QName(e).localname for e in source.iter()] == ["source", "pc", "pc", "ph", "pc", "mrk"]
+        data = {d.get("id"): d.text for d in root.iter(f"{{{XLIFF2_NS}}}data")}
+        assert data[source[0].get("dataRefStart")] == '<a href="/d">'
+        assert data[source[1].get("dataRef")] == '<img src="y.png" alt="logo">'
+        assert source[0].get("{urn:oasis:names:tc:xliff:fs:2.0}fs") == "a"
+        assert root.xpath("//x:unit[@id='unit_3']/@*[local-name()='attribute']", namespaces=ns) == ["alt"]
+
+    def test_package_codes_to_12(self) -> None:
+        """Codes with original data become native-code elements whose text restores the markup."""
+        root = run(package_xliff(), "1.2")
+        [unit] = root.xpath("//x:trans-unit[@id='unit_2']", namespaces={"x": XLIFF12_NS})
+        document = XLIFFDocument.from_xml(package_xliff().decode("utf-8"))
+        expected = document.files[0].units[1]
+
+        assert "".join(unit[0].itertext()) == render_inline(expected.source, expected.codes)
+        assert "".join(unit[1].itertext()) == render_inline(expected.target, expected.target_codes)
+        assert unit[1].get("state") == "translated"
+
+
+class TestErrors:
+    """Tests for error handling and the CLI."""
+
+    def test_invalid_input(self) -> None:
+        """Unsupported versions and malformed XML raise package errors."""
+        with pytest.raises(ValidationError):
+            transcode(BytesIO(XLIFF12), BytesIO(), "3.0")
+        with pytest.raises(ParsingError):
+            transcode(BytesIO(b'<xliff><file srcLang="en"><unit id="1"></xliff>'), BytesIO(), "2.1")
+
+    def test_cli(self, tmp_path: Path) -> None:
+        """The CLI writes the transcoded file and reports counts."""
+        source = tmp_path / "in.xlf"
+        source.write_bytes(XLIFF12)
+        output = tmp_path / "out.xlf"
+
+        stats = VexyMarkliffCLI().transcode(str(source), str(output), to_version=2.1)
+
+        assert stats == {"files": 1, "units": 2, "skipped": 0}
+        assert etree.parse(str(output)).getroot().get("version") == "2.1"
@@ -0,0 +1,91 @@
+"""Tests for the exact-match translation memory."""
+# this_file: tests/test_translation_memory.py
+
+from pathlib import Path
+
+import pytest
+
+from vexy_markliff.cli import VexyMarkliffCLI
+from vexy_markliff.core.converter import VexyMarkliff
+from vexy_markliff.exceptions import FileOperationError
+from vexy_markliff.models.xliff import XLIFFDocument
+from vexy_markliff.tm.memory import TranslationMemory, normalize_source
+
+
+class TestTranslationMemory:
+    """Tests for TranslationMemory."""
+
+    def test_lookup_is_normalized_and_pair_scoped(self) -> None:
+        """Lookups ignore whitespace differences but respect the language pair."""
+        tm = TranslationMemory()
+        tm.add("Hello   world", "Hola mundo", "en", "es")
+
+        assert tm.lookup(" Hello world\n", "en", "es") == "Hola mundo"
+        assert tm.lookup("Hello world", "en", "fr") is None
+        assert tm.lookup("Hello", "en", "es") is None
+        assert normalize_source("Café") == "Café"
+
+    def test_prefill_sets_target_and_state(self) -> None:
+        """Exact matches fill targets and mark units translated."""
+        tm = TranslationMemory()
+        tm.add("Hello world", "Hola mundo", "en", "es")
+        doc = XLIFFDocument(
+            source_lang="en",
+            target_lang="es",
+            content={"segments": [{"content": "Hello world"}, {"content": "Unknown"}]},
+        )
+
+        assert tm.prefill(doc) == 1
+        first, second = doc.files[0].units
+        assert (first.target, first.state) == ("Hola mundo", "translated")
+        assert (second.target, second.state) == (None, "new")
+
+    def test_prefill_skips_coded_units(self) -> None:
+        """Units with inline codes are not filled with a plain stored target."""
+        tm = TranslationMemory()
+        tm.add("See the docs", "Siehe die Doku", "en", "de")
+        tm.add("Some bold text.", "Etwas fetter Text.", "en", "de")
+        tm.add("Plain text.", "Schlichter Text.", "en", "de")
+        xliff = VexyMarkliff().markdown_to_xliff(
+            "See [the docs](/d)\n\nSome **bold** text.\n\nPlain text.\n", "en", "de"
+        )
+        doc = XLIFFDocument.from_xml(xliff)
+
+        assert tm.prefill(doc) == 1
+        link, bold, plain = doc.files[0].units
+        assert link.codes
+        assert bold.codes
+        assert (link.target, link.state) == (None, "new")
+        assert (bold.target, bold.state) == (None, "new")
+        assert (plain.target, plain.state) == ("Schlichter Text.", "translated")
+
+    def test_save_and_load_roundtrip(self, tmp_path: Path) -> None:
+        """Entries survive a SQLite round trip."""
+        tm = TranslationMemory()
+        tm.add_many([("One", "Uno", "en", "es"), ("Two", "Dos", "en", "es"), ("One", "Un", "en", "fr")])
+        tm.save(tmp_path / "tm.sqlite")
+
+        loaded = TranslationMemory.load(tmp_path / "tm.sqlite")
+        assert len(loaded) == 3
+        assert loaded.lookup("One", "en", "fr") == "Un"
+        assert sorted(loaded.entries()) == sorted(tm.entries())
+
+    def test_load_missing_database(self, tmp_path: Path) -> None:
+        """Loading a missing database raises FileOperationError."""
+        with pytest.raises(FileOperationError):
+            TranslationMemory.load(tmp_path / "missing.sqlite")
+
+    def test_converter_prefills_from_memory(self, tmp_path: Path) -> None:
+        """Converters and the CLI pre-fill exact matches."""
+        tm = TranslationMemory()
+        tm.add("Hello World", "Hola Mundo", "en", "es")
+
+        xliff = VexyMarkliff(translation_memory=tm).markdown_to_xliff("# Hello World\n\nNew text.", "en", "es")
+        assert "<target>Hola Mundo</target>" in xliff
+        assert 'state="translated"' in xliff
+
+        tm.save(tmp_path / "tm.sqlite")
+        input_file = tmp_path / "doc.html"
+        input_file.write_text("<p>Hello World</p>", encoding="utf-8")
+        VexyMarkliffCLI().html2xliff(str(input_file), str(tmp_path / "out.xlf"), tm=str(tmp_path / "tm.sqlite"))
+        assert "Hola Mundo" in (tmp_path / "out.xlf").read_text(encoding="utf-8")
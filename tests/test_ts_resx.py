@@ -0,0 +1,108 @@
+"""Tests for Qt TS and .NET resx export and import."""
+# this_file: tests/test_ts_resx.py
+
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+
+from vexy_markliff.cli import VexyMarkliffCLI
+from vexy_markliff.core.converter import VexyMarkliff
+from vexy_markliff.exceptions import ParsingError, ValidationError
+from vexy_markliff.formats.resx import ResxEntry, iter_resx, write_resx
+from vexy_markliff.formats.ts import TsMessage, iter_ts, write_ts
+from vexy_markliff.models.xliff import TranslationMatch, TranslationUnit
+
+DOCS = Path(__file__).parent.parent / "docs"
+
+UNITS = [
+    TranslationUnit(id="u1", source="Open <file> & save", target="Öffnen <Datei> & speichern"),
+    TranslationUnit(
+        id="u2",
+        source="Close",
+        matches=[TranslationMatch(source="Close it", target="Schließen", similarity=80)],
+    ),
+]
+
+
+class TestTS:
+    """Tests for the Qt TS format."""
+
+    def test_reads_sample(self) -> None:
+        """The shipped sample TS file streams its messages with context."""
+        messages = list(iter_ts(DOCS / "611-samsa.ts.xml"))
+
+        assert len(messages) == 7
+        assert messages[4] == TsMessage("s5", "Es war kein Traum.", "It wasn\u2019t a dream.", False, "Kafka")
+
+    def test_write_and_read_back(self) -> None:
+        """Translations round-trip; TM candidates stay unfinished."""
+        out = BytesIO()
+        assert write_ts(UNITS, out, "en", "de") == 2
+        out.seek(0)
+
+        messages = list(iter_ts(out))
+        assert messages[0] == TsMessage(
+            "u1", "Open <file> & save", "Öffnen <Datei> & speichern", False, "vexy-markliff"
+        )
+        assert messages[1].translation == "Schließen"
+        assert messages[1].unfinished
+
+    def test_malformed(self) -> None:
+        """Malformed XML raises ParsingError."""
+        with pytest.raises(ParsingError):
+            list(iter_ts(BytesIO(b"<TS><context><message>")))
+
+
+class TestResx:
+    """Tests for the .NET resx format."""
+
+    def test_reads_sample(self) -> None:
+        """The shipped sample resx file streams value and comment."""
+        entries = list(iter_resx(DOCS / "612-samsa.resx.xml"))
+
+        assert len(entries) == 7
+        assert entries[4] == ResxEntry("s5", "It wasn\u2019t a dream.", "Es war kein Traum.")
+
+    def test_write_and_read_back(self) -> None:
+        """Untranslated units keep their source as value; non-string data is skipped."""
+        out = BytesIO()
+        assert write_resx(UNITS, out) == 2
+        binary = b'<data name="icon" type="System.Byte[]"><value>AAA=</value></data>'
+        xml = out.getvalue().replace(b"</root>", binary + b"</root>")
+
+        assert list(iter_resx(BytesIO(xml))) == [
+            ResxEntry("u1", "Öffnen <Datei> & speichern", "Open <file> & save"),
+            ResxEntry("u2", "Close", "Close"),
+        ]
+
+
+class TestExchangeFormats:
+    """Tests for the converter and CLI integration."""
+
+    def test_unknown_format(self) -> None:
+        """Unknown exchange formats are rejected."""
+        with pytest.raises(ValidationError):
+            VexyMarkliff().export_units("Text", BytesIO(), "markdown", "csv")
+
+    @pytest.mark.parametrize("fmt", ["ts", "resx"])
+    def test_cli_round_trip(self, tmp_path: Path, fmt: str) -> None:
+        """Markdown exports to the format and merges back unchanged."""
+        (tmp_path / "doc.md").write_text("# Title\n\nBody text.", encoding="utf-8")
+        cli = VexyMarkliffCLI()
+
+        getattr(cli, f"md2{fmt}")(str(tmp_path / "doc.md"), str(tmp_path / f"doc.{fmt}"), target_lang="de")
+        getattr(cli, f"{fmt}2html")(str(tmp_path / f"doc.{fmt}"), str(tmp_path / "doc.html"))
+
+        assert (tmp_path / "doc.html").read_text(encoding="utf-8") == "<p>Title</p>\n<p>Body text.</p>"
+
+    @pytest.mark.parametrize("fmt", ["po", "ts", "resx"])
+    def test_inline_markup_round_trip(self, fmt: str) -> None:
+        """Inline codes are exported as their markup and merged back with it."""
+        converter = VexyMarkliff()
+        out = BytesIO()
+
+        converter.export_units("Read [the *docs*](/d) now", out, "markdown", fmt)
+
+        merged = converter.merge_units(out.getvalue().decode("utf-8"), fmt, "html")
+        assert merged == '<p>Read <a href="/d">the <em>docs</em></a> now</p>'
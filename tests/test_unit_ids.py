@@ -0,0 +1,101 @@
+"""Tests for content-derived translation unit IDs."""
+# this_file: tests/test_unit_ids.py
+
+from pathlib import Path
+
+import pytest
+
+from vexy_markliff.cli import VexyMarkliffCLI
+from vexy_markliff.config import ConversionConfig
+from vexy_markliff.core.converter import VexyMarkliff
+from vexy_markliff.core.ids import UnitIdAllocator, content_unit_id
+from vexy_markliff.exceptions import ValidationError
+from vexy_markliff.models.xliff import XLIFFDocument
+
+DOC = "# Guide\n\nInstall it.\n\n- Step one\n- Step two\n\nDone.\n"
+
+
+def unit_ids(content: str, converter: VexyMarkliff) -> dict[str, str]:
+    """Map unit source text to ID for a converted Markdown document."""
+    document = XLIFFDocument.from_xml(converter.markdown_to_xliff(content, "en", "de"))
+    return {unit.source: unit.id for unit in document.files[0].units}
+
+
+class TestContentIds:
+    """Tests for the content ID strategy."""
+
+    def test_insertion_keeps_other_ids(self) -> None:
+        """Inserting a paragraph only adds one ID; every other unit keeps its ID."""
+        converter = VexyMarkliff(id_strategy="content")
+        before = unit_ids(DOC, converter)
+        after = unit_ids(DOC.replace("Install it.\n", "New intro.\n\nInstall it.\n"), converter)
+
+        assert set(after) - set(before) == {"New intro."}
+        assert all(after[source] == unit_id for source, unit_id in before.items())
+
+    def test_position_ids_shift(self) -> None:
+        """The default position strategy renumbers later units."""
+        converter = VexyMarkliff()
+        before = unit_ids(DOC, converter)
+        after = unit_ids(DOC.replace("Install it.\n", "New intro.\n\nInstall it.\n"), converter)
+
+        assert before["Done."] == "unit_5"
+        assert after["Done."] == "unit_6"
+
+    def test_path_and_occurrence_disambiguate(self) -> None:
+        """Repeated text gets distinct IDs by structural path and occurrence."""
+        ids = UnitIdAllocator("content")
+
+        first = ids.allocate("Note", "div/p")
+        second = ids.allocate("Note", "div/p")
+        other_path = ids.allocate("Note", "div/li")
+
+        assert len({first, second, other_path}) == 3
+        assert first == content_unit_id("Note", "div/p", 0)
+        assert second == content_unit_id("Note", "div/p", 1)
+        assert first == content_unit_id("  Note ", "div/p", 0)
+
+    def test_collision_policies(self) -> None:
+        """Colliding hashes get suffixes, or raise under the error policy."""
+        ids = UnitIdAllocator("content", length=1)
+        issued = [ids.allocate(f"text {i}") for i in range(40)]
+
+        assert len(set(issued)) == 40
+        assert ids.collisions > 0
+        assert any("-" in unit_id for unit_id in issued)
+
+        strict = UnitIdAllocator("content", on_collision="error", length=1)
+        first = next(i for i, unit_id in enumerate(issued) if "-" in unit_id)
+        for i in range(first):
+            strict.allocate(f"text {i}")
+        with pytest.raises(ValidationError, match="collision"):
+            strict.allocate(f"text {first}")
+
+    def test_unknown_strategy(self) -> None:
+        """Unknown strategies and policies are rejected."""
+        with pytest.raises(ValidationError, match="Unknown ID strategy: random"):
+            VexyMarkliff(id_strategy="random")
+        with pytest.raises(ValidationError, match="Unknown collision policy: ignore"):
+            UnitIdAllocator("content", on_collision="ignore")
+        with pytest.raises(ValueError, match="Invalid id_strategy: random"):
+            ConversionConfig(id_strategy="random")
+
+
+class TestConfiguration:
+    """Tests for selecting the strategy."""
+
+    def test_config_selects_strategy(self) -> None:
+        """The converter takes the strategy from its configuration."""
+        converter = VexyMarkliff(config=ConversionConfig(id_strategy="content"))
+
+        assert all(unit_id.startswith("u") and "_" not in unit_id for unit_id in unit_ids(DOC, converter).values())
+
+    def test_cli_flag(self, tmp_path: Path) -> None:
+        """The ids flag switches conversion commands to content IDs."""
+        source = tmp_path / "doc.md"
+        source.write_text(DOC, encoding="utf-8")
+        output = tmp_path / "doc.xlf"
+
+        VexyMarkliffCLI().md2xliff(str(source), str(output), target_lang="de", ids="content")
+
+        assert 'id="unit_1"' not in output.read_text(encoding="utf-8")
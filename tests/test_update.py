@@ -0,0 +1,135 @@
+"""Tests for merging translations forward into re-extracted documents."""
+# this_file: tests/test_update.py
+
+from pathlib import Path
+
+import pytest
+
+from vexy_markliff.cli import VexyMarkliffCLI
+from vexy_markliff.core.converter import VexyMarkliff
+from vexy_markliff.core.update import REVIEW_STATE, update_file
+from vexy_markliff.exceptions import ValidationError
+from vexy_markliff.models.inline import render_inline
+from vexy_markliff.models.xliff import XLIFFDocument
+
+OLD = "# Guide\n\nInstall it.\n\nRun it.\n\nObsolete step.\n\nDone.\n"
+NEW = "# Guide\n\nFirst, a new intro.\n\nInstall it.\n\nRun it twice.\n\nDone.\n"
+TARGETS = {"Guide": "Anleitung", "Install it.": "Installieren.", "Run it.": "Ausführen.", "Done.": "Fertig."}
+
+
+def translated(converter: VexyMarkliff, content: str = OLD) -> str:
+    """Return the XLIFF of ``content`` with German targets filled in."""
+    document = XLIFFDocument.from_xml(converter.markdown_to_xliff(content, "en", "de"))
+    for unit in document.files[0].units:
+        if unit.source in TARGETS:
+            unit.target = TARGETS[unit.source]
+            unit.state = "translated"
+    return document.to_xml()
+
+
+def units(xliff: str) -> dict[str, tuple[str | None, str]]:
+    """Map source text to (target, state)."""
+    document = XLIFFDocument.from_xml(xliff)
+    return {unit.source: (unit.target, unit.state) for unit in document.files[0].units}
+
+
+class TestMergeForward:
+    """Tests for carrying translations into a new extraction."""
+
+    @pytest.mark.parametrize("strategy", ["position", "content"])
+    def test_carries_and_flags(self, strategy: str) -> None:
+        """Unchanged units keep targets, changed ones are flagged and new ones stay empty."""
+        converter = VexyMarkliff(id_strategy=strategy)
+
+        xliff, report = converter.update_xliff(translated(converter), NEW, "markdown")
+        result = units(xliff)
+
+        assert result["Guide"] == ("Anleitung", "translated")
+        assert result["Install it."] == ("Installieren.", "translated")
+        assert result["Done."] == ("Fertig.", "translated")
+        assert result["Run it twice."] == ("Ausführen.", REVIEW_STATE)
+        assert result["First, a new intro."] == (None, "new")
+        counts = report.to_dict()
+        assert counts["changed"] == 1
+        assert counts["added"] == 1
+        assert counts["removed"] == 1
+        assert counts["unchanged"] + counts["moved"] == 3
+
+    def test_content_ids_report_unchanged(self) -> None:
+        """With content IDs an insertion leaves the other units unchanged, not moved."""
+        converter = VexyMarkliff(id_strategy="content")
+
+        _, report = converter.update_xliff(translated(converter), NEW, "markdown")
+
+        assert report.to_dict()["unchanged"] == 3
+
+    def test_report_details(self) -> None:
+        """The detailed report names old and new sources of changed units."""
+        converter = VexyMarkliff()
+
+        _, report = converter.update_xliff(translated(converter), NEW, "markdown")
+        details = {(c["status"], c["old_source"], c["source"]) for c in report.to_dict(details=True)["units"]}
+
+        assert ("changed", "Run it.", "Run it twice.") in details
+        assert ("removed", "Obsolete step.", None) in details
+        assert ("added", None, "First, a new intro.") in details
+
+    def test_reordered_units(self) -> None:
+        """Swapped paragraphs are matched by text and keep their translations."""
+        converter = VexyMarkliff()
+        reordered = "# Guide\n\nRun it.\n\nInstall it.\n\nObsolete step.\n\nDone.\n"
+
+        xliff, report = converter.update_xliff(translated(converter), reordered, "markdown")
+
+        assert units(xliff)["Run it."] == ("Ausführen.", "translated")
+        assert report.to_dict()["moved"] == 2
+
+    def test_target_codes(self) -> None:
+        """Inline markup of carried targets survives the update."""
+        converter = VexyMarkliff()
+        document = XLIFFDocument.from_xml(converter.markdown_to_xliff("See [the docs](/d).\n", "en", "de"))
+        [unit] = document.files[0].units
+        unit.target = "Siehe die Doku."
+        unit.target_codes = [code.model_copy(update={"start": 6, "end": 14}) for code in unit.codes]
+
+        xliff, _ = converter.update_xliff(document.to_xml(), "# New\n\nSee [the docs](/d).\n", "markdown")
+        carried = XLIFFDocument.from_xml(xliff).files[0].units[1]
+
+        assert render_inline(carried.target, carried.target_codes) == 'Siehe <a href="/d">die Doku</a>.'
+
+    def test_empty_xliff(self) -> None:
+        """An XLIFF without units cannot be updated."""
+        empty = '<xliff xmlns="urn:oasis:names:tc:xliff:document:2.1" version="2.1"/>'
+
+        with pytest.raises(ValidationError):
+            VexyMarkliff().update_xliff(empty, NEW, "markdown")
+
+
+class TestUpdateFile:
+    """Tests for the file-level update and the CLI command."""
+
+    def test_update_file(self, tmp_path: Path) -> None:
+        """The kind comes from the source suffix and the output is written."""
+        old = tmp_path / "guide.xlf"
+        old.write_text(translated(VexyMarkliff()), encoding="utf-8")
+        source = tmp_path / "guide.md"
+        source.write_text(NEW, encoding="utf-8")
+        output = tmp_path / "out" / "guide.xlf"
+
+        report = update_file(old, source, output)
+
+        assert units(output.read_text(encoding="utf-8"))["Done."] == ("Fertig.", "translated")
+        assert report.counts["removed"] == 1
+        with pytest.raises(ValidationError):
+            update_file(old, tmp_path / "guide.txt", output)
+
+    def test_cli(self, tmp_path: Path) -> None:
+        """The update command reports counts per status."""
+        old = tmp_path / "guide.xlf"
+        old.write_text(translated(VexyMarkliff()), encoding="utf-8")
+        source = tmp_path / "guide.md"
+        source.write_text(NEW, encoding="utf-8")
+
+        result = VexyMarkliffCLI().update(str(old), str(source), str(tmp_path / "new.xlf"))
+
+        assert result == {"unchanged": 2, "moved": 1, "changed": 1, "added": 1, "removed": 1}
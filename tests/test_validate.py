@@ -0,0 +1,182 @@
+"""Tests for streaming XLIFF validation."""
+# this_file: tests/test_validate.py
+
+from pathlib import Path
+
+import pytest
+
+from vexy_markliff.cli import VexyMarkliffCLI
+from vexy_markliff.core.converter import VexyMarkliff
+from vexy_markliff.core.package import pack_files
+from vexy_markliff.core.transcode import transcode_file
+from vexy_markliff.core.validate import compile_rules, load_schema, validate
+from vexy_markliff.exceptions import FileOperationError, ParsingError, ValidationError
+
+HTML = '<h1>Title</h1><p>See <img src="a.png" alt="Map"> and <b>this</b>.</p>'
+
+# Accepts any trans-unit with an id: enough to exercise per-unit schema validation
+SCHEMA = """<?xml version="1.0"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"
+           targetNamespace="urn:oasis:names:tc:xliff:document:2.1" elementFormDefault="qualified">
+  <xs:element name="trans-unit">
+    <xs:complexType>
+      <xs:sequence><xs:any minOccurs="0" maxOccurs="unbounded" processContents="skip"/></xs:sequence>
+      <xs:attribute name="id" type="xs:string" use="required"/>
+      <xs:attribute name="state" type="xs:string" fixed="new"/>
+      <xs:anyAttribute processContents="skip"/>
+    </xs:complexType>
+  </xs:element>
+</xs:schema>
+"""
+
+
+@pytest.fixture
+def xliff(tmp_path: Path) -> Path:
+    """An XLIFF file written by the converter."""
+    path = tmp_path / "doc.xlf"
+    path.write_text(VexyMarkliff().html_to_xliff(HTML, "en", "de"), encoding="utf-8")
+    return path
+
+
+def edited(path: Path, old: str, new: str) -> Path:
+    """Return a copy of an XLIFF file with one replacement applied."""
+    content = path.read_text(encoding="utf-8")
+    assert old in content
+    out = path.with_name(f"edited-{path.name}")
+    out.write_text(content.replace(old, new, 1), encoding="utf-8")
+    return out
+
+
+class TestRules:
+    """Tests for the built-in rules."""
+
+    def test_converter_output_is_valid(self, xliff: Path) -> None:
+        """Extracted XLIFF passes every rule."""
+        report = validate(xliff)
+
+        assert report.valid
+        assert (report.files, report.units) == (1, 3)
+
+    def test_package_is_valid(self, tmp_path: Path) -> None:
+        """Packages with file-level originalData pass every rule."""
+        (tmp_path / "a.md").write_text("# A\n\nUse ![icon](i.png) **now**.\n", encoding="utf-8")
+        pack_files([tmp_path / "a.md"], tmp_path / "p.xlf")
+
+        assert validate(tmp_path / "p.xlf").valid
+
+    def test_undefined_data_ref(self, xliff: Path) -> None:
+        """References to missing data entries are reported."""
+        report = validate(edited(xliff, 'dataRef="d1"', 'dataRef="d9"'))
+
+        assert [(i.rule, i.unit_id, i.message) for i in report.issues] == [
+            ("data-ref", "unit_2", "<ph id=1> references undefined data d9")
+        ]
+
+    def test_ph_without_data(self, xliff: Path) -> None:
+        """A ph without dataRef is reported."""
+        report = validate(edited(xliff, ' dataRef="d1"', ""))
+
+        assert [i.message for i in report.issues] == ["<ph id=1> does not reference originalData"]
+
+    def test_missing_fs(self, xliff: Path) -> None:
+        """Units without fs:fs are reported."""
+        report = validate(edited(xliff, ' fs:fs="h1"', ""))
+
+        assert [(i.rule, i.unit_id) for i in report.issues] == [("format-style", "unit_1")]
+
+    def test_structure(self, xliff: Path) -> None:
+        """Duplicate unit IDs and units without text are reported."""
+        report = validate(edited(edited(xliff, 'id="unit_2"', 'id="unit_1"'), "<source>Title</source>", ""))
+
+        assert sorted(i.message for i in report.issues) == ["Duplicate unit id unit_1", "Unit has no source or target"]
+
+    def test_rule_selection(self, xliff: Path) -> None:
+        """Only the selected rules run."""
+        broken = edited(xliff, ' fs:fs="h1"', "")
+
+        assert validate(broken, rules=["structure", "data-ref"]).valid
+        with pytest.raises(ValidationError):
+            validate(broken, rules=["spelling"])
+
+    def test_issue_cap(self, xliff: Path) -> None:
+        """Issues beyond the cap are counted but not stored."""
+        content = xliff.read_text(encoding="utf-8")
+        broken = xliff.with_name("broken.xlf")
+        broken.write_text(content.replace(' fs:fs="h1"', "").replace(' fs:fs="p"', ""), encoding="utf-8")
+        report = validate(broken, max_issues=1)
+
+        assert report.issue_count == 2
+        assert len(report.issues) == 1
+
+    def test_xliff_2_units(self, xliff: Path, tmp_path: Path) -> None:
+        """Transcoded 2.x units with segments are checked by local name."""
+        transcoded = tmp_path / "doc-20.xlf"
+        transcode_file(xliff, transcoded, "2.0")
+        report = validate(transcoded, rules=["structure"])
+
+        assert report.valid
+        assert report.units == 3
+
+    def test_malformed(self, tmp_path: Path) -> None:
+        """Malformed XML raises ParsingError."""
+        path = tmp_path / "bad.xlf"
+        path.write_text("<xliff version='2.1'><file id='f'>", encoding="utf-8")
+
+        with pytest.raises(ParsingError):
+            validate(path)
+
+
+class TestSchema:
+    """Tests for per-unit schema validation."""
+
+    def test_schema_violations(self, xliff: Path, tmp_path: Path) -> None:
+        """Units are validated against the schema one by one."""
+        schema = tmp_path / "units.xsd"
+        schema.write_text(SCHEMA, encoding="utf-8")
+
+        assert validate(xliff, schema).valid
+        report = validate(edited(xliff, 'state="new"', 'state="final"'), schema)
+        assert [(i.rule, i.unit_id) for i in report.issues] == [("schema", "unit_1")]
+
+    def test_schema_is_cached(self, tmp_path: Path) -> None:
+        """A schema is parsed once per process."""
+        schema = tmp_path / "units.xsd"
+        schema.write_text(SCHEMA, encoding="utf-8")
+
+        assert load_schema(str(schema)) is load_schema(str(schema))
+        assert compile_rules(("structure",)) is compile_rules(("structure",))
+
+    def test_schema_errors(self, xliff: Path, tmp_path: Path) -> None:
+        """Missing and invalid schemas raise."""
+        with pytest.raises(FileOperationError):
+            validate(xliff, tmp_path / "missing.xsd")
+        bad = tmp_path / "bad.xsd"
+        bad.write_text("<notaschema/>", encoding="utf-8")
+        with pytest.raises(ParsingError):
+            validate(xliff, bad)
+
+
+class TestCli:
+    """Tests for the validate command."""
+
+    def test_validate(self, xliff: Path) -> None:
+        """Each file gets its own report."""
+        broken = edited(xliff, ' fs:fs="h1"', "")
+
+        reports = VexyMarkliffCLI().validate(str(xliff), str(broken), details=True)
+
+        assert [report["valid"] for report in reports] == [True, False]
+        assert reports[1]["details"][0]["rule"] == "format-style"
+
+    def test_rules(self, xliff: Path) -> None:
+        """Rules are given as a comma-separated list."""
+        broken = edited(xliff, ' fs:fs="h1"', "")
+
+        [report] = VexyMarkliffCLI().validate(str(broken), rules="structure, data-ref")
+
+        assert report["valid"]
+
+    def test_unknown_rule(self, xliff: Path) -> None:
+        """Unknown rules exit with an error."""
+        with pytest.raises(SystemExit):
+            VexyMarkliffCLI().validate(str(xliff), rules="spelling")